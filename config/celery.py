@@ -8,6 +8,7 @@ with separate task queues for crawl and search operations.
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown, worker_shutdown
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
@@ -87,6 +88,15 @@ app.conf.beat_schedule = {
         "schedule": crontab(minute="*/10"),  # Every 10 minutes
         "kwargs": {"max_urls": 100},
     },
+    # Return expired URL frontier leases to their queues
+    "reap-frontier-leases-every-5-minutes": {
+        "task": "crawler.tasks.reap_frontier_leases",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+    },
+    "schedule-recrawls-every-15-minutes": {
+        "task": "crawler.tasks.schedule_recrawls",
+        "schedule": crontab(minute="*/15"),  # Every 15 minutes
+    },
     # Unified scheduling task
     "check-due-schedules-every-5-minutes": {
         "task": "crawler.tasks.check_due_schedules",
@@ -95,6 +105,33 @@ app.conf.beat_schedule = {
 }
 
 
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_shared_fetchers(**kwargs):
+    """Close pooled fetcher clients (crawler.fetchers.client_registry) on shutdown."""
+    from crawler.fetchers.client_registry import shutdown_fetchers
+
+    shutdown_fetchers()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def flush_domain_profiles(**kwargs):
+    """Write pending domain profile updates (CachedDomainIntelligenceStore) on shutdown."""
+    from crawler.fetchers.domain_intelligence import get_domain_intelligence_store
+
+    get_domain_intelligence_store().flush()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_extraction_workers(**kwargs):
+    """Stop extraction worker processes (crawler.services.extraction_executor) on shutdown."""
+    from crawler.services.extraction_executor import shutdown_extraction_executor
+
+    shutdown_extraction_executor()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     """Debug task for testing Celery configuration."""
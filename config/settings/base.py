@@ -187,6 +187,16 @@ CELERY_BEAT_SCHEDULE = {
         "task": "crawler.tasks.check_due_sources",
         "schedule": crontab(minute="*/5"),
     },
+    # Return expired URL frontier leases (crashed workers) every 5 minutes
+    "reap-frontier-leases": {
+        "task": "crawler.tasks.reap_frontier_leases",
+        "schedule": crontab(minute="*/5"),
+    },
+    # Re-admit URLs due for a change-rate-driven recrawl every 15 minutes
+    "schedule-recrawls": {
+        "task": "crawler.tasks.schedule_recrawls",
+        "schedule": crontab(minute="*/15"),
+    },
     # Check due keywords every 10 minutes
     "check-due-keywords": {
         "task": "crawler.tasks.check_due_keywords",
@@ -282,6 +292,37 @@ SERPAPI_HOURLY_LIMIT = int(os.getenv("SERPAPI_HOURLY_LIMIT", "1000"))  # Plan-ba
 # ScrapingBee for Tier 3 fetching
 SCRAPINGBEE_API_KEY = os.getenv("SCRAPINGBEE_API_KEY", "")
 
+# Concurrent ScrapingBee requests: at most CRAWLER_SCRAPINGBEE_CONCURRENCY,
+# further capped by how many requests the remaining credits (API usage
+# endpoint, QuotaManager) still pay for; credits are re-read every
+# CRAWLER_SCRAPINGBEE_CREDIT_REFRESH_SECONDS
+CRAWLER_SCRAPINGBEE_CONCURRENCY = int(os.getenv("CRAWLER_SCRAPINGBEE_CONCURRENCY", "5"))
+CRAWLER_SCRAPINGBEE_CREDIT_REFRESH_SECONDS = float(
+    os.getenv("CRAWLER_SCRAPINGBEE_CREDIT_REFRESH_SECONDS", "60")
+)
+
+# Content extraction and AI preprocessing of pages of at least
+# CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES run in a pool of
+# CRAWLER_EXTRACTION_WORKERS processes (crawler.services.extraction_executor)
+# instead of on the event loop; 0 workers runs everything inline
+CRAWLER_EXTRACTION_WORKERS = int(
+    os.getenv("CRAWLER_EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES = int(
+    os.getenv("CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES", "100000")
+)
+
+# AI extraction responses are cached (crawler.services.extraction_cache) by
+# preprocessed content, product type and extraction schema, so unchanged
+# recrawls and mirrored pages skip the AI service; entries expire after
+# CRAWLER_EXTRACTION_CACHE_TTL_DAYS and the least recently used are evicted
+# beyond CRAWLER_EXTRACTION_CACHE_MAX_ENTRIES
+CRAWLER_EXTRACTION_CACHE_ENABLED = os.getenv("CRAWLER_EXTRACTION_CACHE_ENABLED", "True") == "True"
+CRAWLER_EXTRACTION_CACHE_TTL_DAYS = int(os.getenv("CRAWLER_EXTRACTION_CACHE_TTL_DAYS", "30"))
+CRAWLER_EXTRACTION_CACHE_MAX_ENTRIES = int(
+    os.getenv("CRAWLER_EXTRACTION_CACHE_MAX_ENTRIES", "50000")
+)
+
 
 # Sentry Configuration
 # https://docs.sentry.io/platforms/python/guides/django/
@@ -323,6 +364,88 @@ CRAWLER_MAX_RETRIES = int(os.getenv("CRAWLER_MAX_RETRIES", "3"))
 # Rate limiting: minimum delay between requests to same domain (seconds)
 CRAWLER_RATE_LIMIT_DELAY = float(os.getenv("CRAWLER_RATE_LIMIT_DELAY", "1.0"))
 
+# Maximum URLs processed concurrently within a single source crawl
+CRAWLER_SOURCE_CONCURRENCY = int(os.getenv("CRAWLER_SOURCE_CONCURRENCY", "4"))
+
+# Concurrent fetches against a single domain: each domain's window starts at
+# CRAWLER_DOMAIN_CONCURRENCY and adapts (AIMD) between 1 and
+# CRAWLER_DOMAIN_CONCURRENCY_MAX from rate limiting, timeouts and latency
+CRAWLER_DOMAIN_CONCURRENCY = int(os.getenv("CRAWLER_DOMAIN_CONCURRENCY", "2"))
+CRAWLER_DOMAIN_CONCURRENCY_MAX = int(os.getenv("CRAWLER_DOMAIN_CONCURRENCY_MAX", "8"))
+
+# Maximum concurrent fetches in one SmartRouter.fetch_many() batch
+CRAWLER_FETCH_CONCURRENCY = int(os.getenv("CRAWLER_FETCH_CONCURRENCY", "8"))
+
+# Hedged Tier 1/Tier 2 fetching for domains with an uncertain Tier 1 history:
+# Tier 2 starts if Tier 1 has not answered within CRAWLER_HEDGE_DELAY_MS
+CRAWLER_HEDGED_FETCH_ENABLED = os.getenv("CRAWLER_HEDGED_FETCH_ENABLED", "True") == "True"
+CRAWLER_HEDGE_DELAY_MS = int(os.getenv("CRAWLER_HEDGE_DELAY_MS", "1500"))
+
+# SmartRouter learns per-domain profiles (tier, timeouts, HTTP/2, body cap,
+# concurrency window) in the shared store; False fetches with defaults each time
+CRAWLER_DOMAIN_INTELLIGENCE_ENABLED = os.getenv("CRAWLER_DOMAIN_INTELLIGENCE_ENABLED", "True") == "True"
+
+# In-process LRU of domain profiles (CachedDomainIntelligenceStore): local
+# changes are merged into the Redis copy every CRAWLER_DOMAIN_PROFILE_FLUSH_INTERVAL
+# seconds; clean profiles are re-read after CRAWLER_DOMAIN_PROFILE_LOCAL_TTL seconds
+CRAWLER_DOMAIN_PROFILE_CACHE_SIZE = int(os.getenv("CRAWLER_DOMAIN_PROFILE_CACHE_SIZE", "1000"))
+CRAWLER_DOMAIN_PROFILE_FLUSH_INTERVAL = float(os.getenv("CRAWLER_DOMAIN_PROFILE_FLUSH_INTERVAL", "5"))
+CRAWLER_DOMAIN_PROFILE_LOCAL_TTL = float(os.getenv("CRAWLER_DOMAIN_PROFILE_LOCAL_TTL", "60"))
+
+# Tier 1 HTTP/2: probed per domain and used where the domain profile has learned
+# it works (HTTP/1.1 otherwise); idle keep-alive connections live for
+# CRAWLER_TIER1_KEEPALIVE_EXPIRY seconds
+CRAWLER_TIER1_HTTP2_ENABLED = os.getenv("CRAWLER_TIER1_HTTP2_ENABLED", "True") == "True"
+CRAWLER_TIER1_KEEPALIVE_EXPIRY = float(os.getenv("CRAWLER_TIER1_KEEPALIVE_EXPIRY", "30"))
+
+# Tier 1 streaming reads: bodies are read up to CRAWLER_TIER1_MAX_BODY_BYTES
+# (per-domain override: DomainProfile.manual_override_max_body_bytes) and
+# non-HTML responses, CAPTCHA pages and age gates are abandoned early
+CRAWLER_TIER1_STREAMING_ENABLED = os.getenv("CRAWLER_TIER1_STREAMING_ENABLED", "True") == "True"
+CRAWLER_TIER1_MAX_BODY_BYTES = int(os.getenv("CRAWLER_TIER1_MAX_BODY_BYTES", str(5 * 1024 * 1024)))
+
+# Warm Tier 2 (Playwright) browser contexts kept per domain, reused across fetches;
+# a context is recycled after CRAWLER_TIER2_CONTEXT_MAX_USES fetches (0 pool = no reuse)
+CRAWLER_TIER2_CONTEXT_POOL_SIZE = int(os.getenv("CRAWLER_TIER2_CONTEXT_POOL_SIZE", "8"))
+CRAWLER_TIER2_CONTEXT_MAX_USES = int(os.getenv("CRAWLER_TIER2_CONTEXT_MAX_USES", "50"))
+
+# Lifetime of stored ETag/Last-Modified validators for conditional re-crawls
+CRAWLER_VALIDATOR_TTL_DAYS = int(os.getenv("CRAWLER_VALIDATOR_TTL_DAYS", "30"))
+
+# Content-addressed archive of fetched pages; CRAWLER_FETCH_REPLAY serves
+# SmartRouter fetches from the archive without network access
+CRAWLER_RESPONSE_ARCHIVE_ENABLED = os.getenv("CRAWLER_RESPONSE_ARCHIVE_ENABLED", "False") == "True"
+CRAWLER_RESPONSE_ARCHIVE_DIR = os.getenv(
+    "CRAWLER_RESPONSE_ARCHIVE_DIR", str(BASE_DIR / "var" / "response_archive")
+)
+CRAWLER_FETCH_REPLAY = os.getenv("CRAWLER_FETCH_REPLAY", "False") == "True"
+
+# Abort image/font/media and tracker requests in Tier 2 (per-domain allowlist on DomainProfile)
+CRAWLER_TIER2_BLOCK_RESOURCES = os.getenv("CRAWLER_TIER2_BLOCK_RESOURCES", "True") == "True"
+
+# URL frontier store: "redis" or "memory" (in-process, for local runs/benchmarks)
+CRAWLER_FRONTIER_BACKEND = os.getenv("CRAWLER_FRONTIER_BACKEND", "redis")
+
+# Seconds a dequeued frontier URL stays leased before it is returned to the queue
+CRAWLER_FRONTIER_LEASE_TTL = int(os.getenv("CRAWLER_FRONTIER_LEASE_TTL", "600"))
+
+# Global seen-URL store: "set" (exact Redis set) or "bloom" (scalable Bloom filter)
+CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND = os.getenv("CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND", "set")
+
+# Bloom filter target false-positive rate and first-slice capacity
+CRAWLER_FRONTIER_BLOOM_ERROR_RATE = float(os.getenv("CRAWLER_FRONTIER_BLOOM_ERROR_RATE", "0.001"))
+CRAWLER_FRONTIER_BLOOM_CAPACITY = int(os.getenv("CRAWLER_FRONTIER_BLOOM_CAPACITY", "1000000"))
+
+# Per-URL recrawl scheduling from observed content change rates
+CRAWLER_RECRAWL_MIN_INTERVAL_HOURS = float(os.getenv("CRAWLER_RECRAWL_MIN_INTERVAL_HOURS", "6"))
+CRAWLER_RECRAWL_MAX_INTERVAL_HOURS = float(os.getenv("CRAWLER_RECRAWL_MAX_INTERVAL_HOURS", "720"))
+# Interval before a URL has any change history
+CRAWLER_RECRAWL_DEFAULT_INTERVAL_HOURS = float(
+    os.getenv("CRAWLER_RECRAWL_DEFAULT_INTERVAL_HOURS", "168")
+)
+# Maximum URLs re-admitted to the frontier per schedule_recrawls run
+CRAWLER_RECRAWL_BATCH_SIZE = int(os.getenv("CRAWLER_RECRAWL_BATCH_SIZE", "500"))
+
 # Age gate detection content length threshold
 CRAWLER_AGE_GATE_CONTENT_THRESHOLD = int(
     os.getenv("CRAWLER_AGE_GATE_CONTENT_THRESHOLD", "500")
@@ -93,3 +93,6 @@ SENTRY_DSN = ""
 CRAWLER_REQUEST_TIMEOUT = 30  # Increased for E2E tests with real external services
 CRAWLER_MAX_RETRIES = 1  # At least 1 for E2E tests (0 means no attempts at all)
 CRAWLER_RATE_LIMIT_DELAY = 0
+CRAWLER_EXTRACTION_WORKERS = 0  # Extraction inline; no worker processes in unit tests
+CRAWLER_EXTRACTION_CACHE_ENABLED = False  # Every test extraction calls the (mocked) AI service
+CRAWLER_DOMAIN_INTELLIGENCE_ENABLED = False  # No domain profiles shared between tests
@@ -40,6 +40,7 @@ class AIExtractorV2:
         self,
         url: str,
         context: Dict[str, Any],
+        content: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Extract product data from a URL.
@@ -47,13 +48,15 @@ class AIExtractorV2:
         Args:
             url: Detail page URL to extract from
             context: Dict with source, year, medal_hint, score_hint, product_type_hint
+            content: Already-fetched page content (skips fetching when provided)
 
         Returns:
             Dict with extracted product data including field confidences
         """
         try:
             # Fetch page content
-            content = await self._fetch_content(url)
+            if not content:
+                content = await self._fetch_content(url)
             if not content:
                 return {
                     "error": "Failed to fetch content",
@@ -9,7 +9,7 @@ Age gates are detected by:
 
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Collection, Optional
 
 from django.conf import settings
 
@@ -50,6 +50,7 @@ class AgeGateDetectionResult:
 def detect_age_gate(
     content: str,
     threshold: Optional[int] = None,
+    keywords_found: Optional[Collection[str]] = None,
 ) -> AgeGateDetectionResult:
     """
     Detect if content represents an age gate page.
@@ -61,6 +62,8 @@ def detect_age_gate(
     Args:
         content: The page content to analyze
         threshold: Content length threshold (defaults to settings value)
+        keywords_found: AGE_GATE_KEYWORDS already known to be in the content
+            (from ResponseClassifier); skips scanning the content again
 
     Returns:
         AgeGateDetectionResult with detection status and reason
@@ -86,9 +89,10 @@ def detect_age_gate(
         )
 
     # Check 2: Keyword detection
-    content_lower = content.lower()
+    # Membership in the pre-matched keywords, or a substring search of the page
+    haystack = keywords_found if keywords_found is not None else content.lower()
     for keyword in AGE_GATE_KEYWORDS:
-        if keyword in content_lower:
+        if keyword in haystack:
             logger.debug(f"Age gate detected: keyword '{keyword}' found")
             return AgeGateDetectionResult(
                 is_age_gate=True,
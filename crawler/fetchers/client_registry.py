@@ -0,0 +1,175 @@
+"""
+Fetcher Registry - process-wide shared HTTP clients and SmartRouters.
+
+Services that fetch a page at a time (discovery, sitemap parsing, the AI
+service client) used to build a new SmartRouter or httpx.AsyncClient per
+call, throwing away connection pools, TLS sessions and DNS results each
+time. The registry hands out one pooled instance per name instead.
+
+httpx clients and the fetchers inside SmartRouter are bound to the event
+loop they first run on, so instances are kept per event loop. Code that
+owns a loop must await close_fetchers() on it before closing it so
+connections shut down cleanly; entries left behind on a closed loop are
+dropped on the next lookup. Celery workers call shutdown_fetchers() on
+process shutdown.
+
+Usage:
+    client = get_http_client()
+    response = await client.get(url, timeout=10.0, follow_redirects=True)
+
+    router = get_smart_router(timeout=30.0)
+    result = await router.fetch(url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from .smart_router import SmartRouter
+
+logger = logging.getLogger(__name__)
+
+
+class FetcherRegistry:
+    """
+    Per-event-loop registry of shared fetch clients.
+
+    Attributes:
+        KEEPALIVE_EXPIRY: Seconds an idle pooled connection is kept open
+    """
+
+    KEEPALIVE_EXPIRY = 30.0
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _loop_instances(self) -> Dict[Any, Any]:
+        """Get the instances bound to the running event loop."""
+        self._evict_closed_loops()
+        loop = asyncio.get_running_loop()
+        instances = self._by_loop.get(loop)
+        if instances is None:
+            instances = {}
+            self._by_loop[loop] = instances
+        return instances
+
+    def _evict_closed_loops(self) -> None:
+        """
+        Drop instances bound to loops that were closed without close_fetchers().
+
+        The pooled connections hold references to their loop, so the weak
+        keys alone never expire. Their transports cannot be shut down through
+        a closed loop; the instances are dropped and their sockets closed
+        when garbage collected. Loop owners should close them with
+        close_fetchers() first.
+        """
+        for loop in [loop for loop in self._by_loop.keys() if loop.is_closed()]:
+            instances = self._by_loop.pop(loop, {})
+            if instances:
+                logger.warning(
+                    f"Dropping {len(instances)} shared fetchers of an event loop "
+                    f"closed without close_fetchers(): {list(instances)}"
+                )
+
+    def get_http_client(self, name: str = "default") -> httpx.AsyncClient:
+        """
+        Get the shared httpx client for a name on the running event loop.
+
+        The client has no default timeout, headers or redirect policy;
+        callers pass those per request so one pool serves all of them.
+
+        Args:
+            name: Client name (separate pools for separate purposes)
+
+        Returns:
+            Pooled httpx.AsyncClient
+        """
+        instances = self._loop_instances()
+        key = ("http", name)
+        client = instances.get(key)
+        if client is None or client.is_closed is True:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(keepalive_expiry=self.KEEPALIVE_EXPIRY),
+            )
+            instances[key] = client
+        return client
+
+    def get_smart_router(self, timeout: Optional[float] = None) -> "SmartRouter":
+        """
+        Get the shared SmartRouter for a timeout on the running event loop.
+
+        Args:
+            timeout: Router timeout (default from settings)
+
+        Returns:
+            SmartRouter whose tier fetchers are reused across calls
+        """
+        from .smart_router import SmartRouter
+
+        instances = self._loop_instances()
+        key = ("router", timeout)
+        router = instances.get(key)
+        if router is None:
+            router = SmartRouter(timeout=timeout)
+            instances[key] = router
+        return router
+
+    async def aclose(self) -> None:
+        """Close and forget all instances bound to the running event loop."""
+        instances = self._by_loop.pop(asyncio.get_running_loop(), {})
+        for key, instance in instances.items():
+            try:
+                # Keys are ("http", name) or ("router", timeout)
+                if key[0] == "http":
+                    await instance.aclose()
+                else:
+                    await instance.close()
+            except Exception as e:
+                logger.warning(f"Failed to close shared fetcher {key}: {e}")
+
+    def shutdown(self) -> None:
+        """
+        Close instances on every loop that is still open (for worker shutdown).
+
+        Must be called from synchronous code, outside any running loop.
+        Instances on closed loops cannot be closed gracefully and are
+        dropped.
+        """
+        self._evict_closed_loops()
+        for loop in list(self._by_loop.keys()):
+            if loop.is_running():
+                self._by_loop.pop(loop, None)
+                continue
+            loop.run_until_complete(self.aclose())
+
+
+_registry = FetcherRegistry()
+
+
+def get_http_client(name: str = "default") -> httpx.AsyncClient:
+    """Get the shared httpx client (see FetcherRegistry.get_http_client)."""
+    return _registry.get_http_client(name)
+
+
+def get_smart_router(timeout: Optional[float] = None) -> "SmartRouter":
+    """Get the shared SmartRouter (see FetcherRegistry.get_smart_router)."""
+    return _registry.get_smart_router(timeout)
+
+
+async def close_fetchers() -> None:
+    """Close the shared fetchers bound to the running event loop."""
+    await _registry.aclose()
+
+
+def shutdown_fetchers() -> None:
+    """Close the shared fetchers on all open event loops."""
+    _registry.shutdown()
@@ -0,0 +1,179 @@
+"""
+Browser Context Pool - warm Playwright contexts for Tier 2 fetching.
+
+Creating a browser context and priming it with cookies dominates Tier 2
+latency on short pages. The pool keeps idle contexts (each with one open
+page) keyed by domain, so repeated fetches against the same site reuse the
+live context, and the cookies it already holds, instead of rebuilding them.
+
+Policies:
+- Bounded: at most max_contexts pooled contexts. When a new domain needs a
+  slot, the least recently used idle context is evicted.
+- Recycled: a context is closed after max_uses fetches so long-lived sessions
+  do not accumulate memory or stale state.
+- Overflow: when every pooled context is busy, a transient context is created
+  and closed after use, so callers never wait for a slot.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledContext:
+    """A browser context and its page, leased to one fetch at a time."""
+
+    domain: str
+    context: Any
+    page: Any
+    uses: int = 0
+    pooled: bool = True
+    generation: int = 0
+    # Source cookies already added to the context
+    source_cookies: Dict[str, str] = field(default_factory=dict)
+
+
+class BrowserContextPool:
+    """
+    LRU pool of Playwright browser contexts keyed by domain.
+
+    Usage:
+        entry = await pool.acquire(browser, domain, setup=prime_cookies)
+        try:
+            await entry.page.goto(url)
+        finally:
+            await pool.release(entry, reusable=ok)
+    """
+
+    def __init__(
+        self,
+        max_contexts: Optional[int] = None,
+        max_uses: Optional[int] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_contexts: Maximum pooled contexts, busy or idle
+                (default: CRAWLER_TIER2_CONTEXT_POOL_SIZE, 0 disables reuse)
+            max_uses: Fetches before a context is recycled
+                (default: CRAWLER_TIER2_CONTEXT_MAX_USES)
+        """
+        self.max_contexts = (
+            max_contexts
+            if max_contexts is not None
+            else getattr(settings, "CRAWLER_TIER2_CONTEXT_POOL_SIZE", 8)
+        )
+        self.max_uses = max_uses or getattr(settings, "CRAWLER_TIER2_CONTEXT_MAX_USES", 50)
+
+        # Idle contexts, least recently used first
+        self._idle: List[PooledContext] = []
+        self._busy = 0
+        self._generation = 0
+
+    @property
+    def size(self) -> int:
+        """Number of pooled contexts, busy or idle."""
+        return self._busy + len(self._idle)
+
+    async def acquire(
+        self,
+        browser,
+        domain: str,
+        setup: Optional[Callable[[Any], Awaitable[None]]] = None,
+    ) -> PooledContext:
+        """
+        Lease a context for a domain, reusing a warm one when available.
+
+        Args:
+            browser: Playwright browser used to create new contexts
+            domain: Domain the context is keyed by
+            setup: Coroutine function called with each new context
+                (e.g. to load cached cookies); skipped on reuse
+
+        Returns:
+            PooledContext to pass back to release()
+        """
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].domain == domain:
+                entry = self._idle.pop(index)
+                self._busy += 1
+                logger.debug(f"Reusing warm browser context for {domain} (uses={entry.uses})")
+                return entry
+
+        pooled = self.max_contexts > 0
+        if pooled and self.size >= self.max_contexts:
+            if self._idle:
+                evicted = self._idle.pop(0)
+                logger.debug(f"Evicting browser context for {evicted.domain}")
+                await self._discard(evicted)
+            else:
+                pooled = False
+        if pooled:
+            # Claim the slot before awaiting so concurrent acquires see it
+            self._busy += 1
+
+        try:
+            context = await browser.new_context()
+            try:
+                if setup:
+                    await setup(context)
+                page = await context.new_page()
+            except Exception:
+                await context.close()
+                raise
+        except Exception:
+            if pooled:
+                self._busy -= 1
+            raise
+
+        return PooledContext(
+            domain=domain,
+            context=context,
+            page=page,
+            pooled=pooled,
+            generation=self._generation,
+        )
+
+    async def release(self, entry: PooledContext, reusable: bool = True) -> None:
+        """
+        Return a leased context to the pool.
+
+        The context is closed instead of pooled if it is transient, marked
+        not reusable (e.g. after a page error), has reached max_uses, or
+        predates the last close().
+
+        Args:
+            entry: Context returned by acquire()
+            reusable: Whether the context is healthy enough to reuse
+        """
+        entry.uses += 1
+        current = entry.generation == self._generation
+        if entry.pooled and current:
+            self._busy -= 1
+
+        if entry.pooled and current and reusable and entry.uses < self.max_uses:
+            self._idle.append(entry)
+            return
+
+        await self._discard(entry)
+
+    async def close(self) -> None:
+        """Close all idle contexts; busy contexts are closed on release."""
+        idle, self._idle = self._idle, []
+        self._busy = 0
+        self._generation += 1
+        for entry in idle:
+            await self._discard(entry)
+
+    async def _discard(self, entry: PooledContext) -> None:
+        """Close a context, ignoring errors from an already-closed browser."""
+        try:
+            await entry.context.close()
+        except Exception as e:
+            logger.debug(f"Failed to close browser context for {entry.domain}: {e}")
@@ -0,0 +1,135 @@
+"""
+Per-domain concurrency limiting with learned (AIMD) windows.
+
+FeedbackRecorder adjusts each DomainProfile's concurrency_window with
+additive increase / multiplicative decrease: clean successes grow it slowly,
+429/503 responses, timeouts and Tier 1 latency inflation halve it. The
+limiter here enforces the current window: a fetch waits until fewer than
+that many fetches for its domain are in flight.
+
+Slots are re-entrant within a task, so SmartRouter.fetch_many() can hold a
+domain slot while calling SmartRouter.fetch(), which acquires one itself.
+
+Usage:
+    limiter = DomainConcurrencyLimiter()
+    async with limiter.slot(domain, profile):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Dict, FrozenSet, Optional
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from .domain_intelligence import DomainProfile
+
+logger = logging.getLogger(__name__)
+
+# Domains whose slot the current task already holds
+_held_domains: contextvars.ContextVar[FrozenSet[str]] = contextvars.ContextVar(
+    "held_domain_slots", default=frozenset()
+)
+
+
+def get_concurrency_window(profile: "DomainProfile") -> float:
+    """
+    Get a domain's concurrency window, or the starting window if unlearned.
+
+    Args:
+        profile: Domain profile
+
+    Returns:
+        Concurrency window (may be fractional)
+    """
+    window = profile.concurrency_window
+    if window is None:
+        window = getattr(settings, "CRAWLER_DOMAIN_CONCURRENCY", 2)
+    return window
+
+
+@dataclass
+class _DomainSlots:
+    """Slot bookkeeping for one domain with fetches in flight."""
+
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+    in_flight: int = 0
+    waiting: int = 0
+    # Profile the window is read from: the one of the last fetch to finish,
+    # which carries the latest recorded feedback
+    profile: Optional["DomainProfile"] = None
+
+
+class DomainConcurrencyLimiter:
+    """
+    Limits fetches in flight per domain to the domain's concurrency window.
+
+    Bound to the event loop it is used on while fetches are in flight;
+    per-domain state is dropped whenever a domain goes idle.
+    """
+
+    def __init__(self):
+        """Initialize with no domains in flight."""
+        self._domains: Dict[str, _DomainSlots] = {}
+
+    def limit(self, profile: "DomainProfile") -> int:
+        """Get the number of concurrent fetches allowed for a domain."""
+        return max(1, int(get_concurrency_window(profile)))
+
+    def in_flight(self, domain: str) -> int:
+        """Get the number of fetches in flight for a domain."""
+        slots = self._domains.get(domain)
+        return slots.in_flight if slots else 0
+
+    @asynccontextmanager
+    async def slot(self, domain: str, profile: "DomainProfile") -> AsyncIterator[None]:
+        """
+        Hold one of the domain's concurrency slots.
+
+        The window is re-read whenever a slot is released, from the profile
+        of the fetch that released it, so changes recorded by finishing
+        fetches apply to waiting ones even if each fetch loaded its own copy
+        of the profile.
+
+        Args:
+            domain: Domain being fetched
+            profile: Domain profile (its concurrency_window is the limit)
+        """
+        held = _held_domains.get()
+        if domain in held:
+            yield
+            return
+
+        slots = self._domains.get(domain)
+        if slots is None:
+            slots = _DomainSlots(profile=profile)
+            self._domains[domain] = slots
+
+        async with slots.condition:
+            slots.waiting += 1
+            try:
+                await slots.condition.wait_for(
+                    lambda: slots.in_flight < self.limit(slots.profile)
+                )
+            finally:
+                slots.waiting -= 1
+            slots.in_flight += 1
+
+        token = _held_domains.set(held | {domain})
+        try:
+            yield
+        finally:
+            _held_domains.reset(token)
+            async with slots.condition:
+                slots.in_flight -= 1
+                slots.profile = profile
+                if slots.in_flight == 0 and slots.waiting == 0:
+                    del self._domains[domain]
+                else:
+                    slots.condition.notify_all()
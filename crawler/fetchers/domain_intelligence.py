@@ -7,6 +7,8 @@ fetch strategies based on historical success/failure patterns.
 Components:
 - DomainProfile: Dataclass storing domain-specific metrics and settings
 - DomainIntelligenceStore: Redis-backed storage for domain profiles
+- CachedDomainIntelligenceStore: In-process LRU with write-behind, merge-safe
+  flushes to the Redis-backed store
 
 Usage:
     from crawler.fetchers.domain_intelligence import (
@@ -24,16 +26,24 @@ Usage:
     # Update after fetch
     profile.success_count += 1
     store.save_profile(profile)
+
+    # Hot paths share one process-wide cached store
+    store = get_domain_intelligence_store()
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
-from dataclasses import dataclass, field, asdict
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from django.conf import settings
 from django.core.cache import caches
 
 logger = logging.getLogger(__name__)
@@ -65,6 +75,19 @@ class DomainProfile:
         last_successful_fetch: When the last successful fetch occurred
         manual_override_tier: Force specific tier (for competition sites)
         manual_override_timeout_ms: Force specific timeout (for competition sites)
+        manual_override_max_body_bytes: Tier 1 body size cap for the domain
+            (for sites with legitimately huge pages)
+        tier2_allowed_resource_types: Resource types Tier 2 loads despite
+            resource blocking (e.g. ["image"])
+        tier2_allowed_hosts: Hosts Tier 2 loads despite tracker blocking
+        http2_compatible: Tier 1 HTTP/2 works for the domain (None = not yet
+            probed)
+        http2_fallback_count: HTTP/2 failures recovered over HTTP/1.1
+        concurrency_window: AIMD concurrency window for the domain (None =
+            not yet learned; starts at CRAWLER_DOMAIN_CONCURRENCY)
+        concurrency_baseline_ms: Moving average of Tier 1 response times,
+            the baseline for latency inflation
+        concurrency_decreased_at: Unix time of the last window decrease
     """
 
     domain: str
@@ -96,6 +119,20 @@ class DomainProfile:
     # Manual overrides (for competition sites like IWSC, DWWA)
     manual_override_tier: Optional[int] = None
     manual_override_timeout_ms: Optional[int] = None
+    manual_override_max_body_bytes: Optional[int] = None
+
+    # Tier 2 resource blocking allowlist (for sites that break without them)
+    tier2_allowed_resource_types: List[str] = field(default_factory=list)
+    tier2_allowed_hosts: List[str] = field(default_factory=list)
+
+    # Tier 1 HTTP/2 compatibility (learned from probes and fallbacks)
+    http2_compatible: Optional[bool] = None
+    http2_fallback_count: int = 0
+
+    # Adaptive per-domain concurrency (see FeedbackRecorder.update_concurrency_window)
+    concurrency_window: Optional[float] = None
+    concurrency_baseline_ms: float = 0.0
+    concurrency_decreased_at: float = 0.0
 
     @property
     def total_fetches(self) -> int:
@@ -180,6 +217,14 @@ class DomainProfile:
             "last_successful_fetch",
             "manual_override_tier",
             "manual_override_timeout_ms",
+            "manual_override_max_body_bytes",
+            "tier2_allowed_resource_types",
+            "tier2_allowed_hosts",
+            "http2_compatible",
+            "http2_fallback_count",
+            "concurrency_window",
+            "concurrency_baseline_ms",
+            "concurrency_decreased_at",
         }
         filtered_data = {k: v for k, v in data.items() if k in known_fields}
 
@@ -318,3 +363,314 @@ class DomainIntelligenceStore:
                 "Failed to delete domain profile for %s: %s", domain, str(e)
             )
             return False
+
+
+@dataclass
+class _CachedProfile:
+    """Local copy of a profile plus the remote state it was derived from."""
+
+    profile: DomainProfile
+    base: DomainProfile  # Snapshot as last read from / written to the store
+    loaded_at: float  # time.monotonic() of the last read or flush
+    dirty: bool = False
+
+
+class CachedDomainIntelligenceStore(DomainIntelligenceStore):
+    """
+    Domain profile store with an in-process LRU and write-behind flushes.
+
+    get_profile() serves profiles from a local LRU and hands out the same
+    DomainProfile object to every caller in the process; save_profile()
+    only marks it dirty. Dirty profiles are flushed in a batch once
+    FLUSH_INTERVAL has passed (or on flush()), merging the local changes
+    into the stored profile instead of overwriting it:
+
+    - Counters are applied as deltas since the last read
+    - Success rates and response time are shifted by the local change
+    - Other fields take the local value only if it changed locally
+    - Timestamps keep the latest value
+
+    so concurrent workers no longer clobber each other's updates. With
+    django-redis the read-merge-write of a profile runs under a cache lock.
+    Clean profiles are re-read after LOCAL_TTL to pick up other workers'
+    changes.
+
+    Attributes:
+        COUNTER_FIELDS: Fields merged as additive deltas
+        SHIFT_FIELDS: Fields merged by shifting the stored value
+    """
+
+    COUNTER_FIELDS = (
+        "timeout_count",
+        "success_count",
+        "failure_count",
+        "http2_fallback_count",
+    )
+    SHIFT_FIELDS = (
+        "tier1_success_rate",
+        "tier2_success_rate",
+        "tier3_success_rate",
+        "avg_response_time_ms",
+        "concurrency_baseline_ms",
+    )
+    TIMESTAMP_FIELDS = ("last_updated", "last_successful_fetch", "concurrency_decreased_at")
+    LOCK_TIMEOUT_SECONDS = 10
+    LOCK_WAIT_SECONDS = 2
+
+    def __init__(
+        self,
+        cache_alias: str = None,
+        max_profiles: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        local_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            cache_alias: Optional Django cache alias override
+            max_profiles: LRU size (default: CRAWLER_DOMAIN_PROFILE_CACHE_SIZE)
+            flush_interval: Seconds between write-behind flushes
+                (default: CRAWLER_DOMAIN_PROFILE_FLUSH_INTERVAL)
+            local_ttl: Seconds before a clean local profile is re-read
+                (default: CRAWLER_DOMAIN_PROFILE_LOCAL_TTL)
+        """
+        super().__init__(cache_alias)
+        self.max_profiles = max_profiles or getattr(
+            settings, "CRAWLER_DOMAIN_PROFILE_CACHE_SIZE", 1000
+        )
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else getattr(settings, "CRAWLER_DOMAIN_PROFILE_FLUSH_INTERVAL", 5.0)
+        )
+        self.local_ttl = (
+            local_ttl
+            if local_ttl is not None
+            else getattr(settings, "CRAWLER_DOMAIN_PROFILE_LOCAL_TTL", 60.0)
+        )
+        self._local: "OrderedDict[str, _CachedProfile]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._last_flush = time.monotonic()
+
+    def get_profile(self, domain: str) -> DomainProfile:
+        """
+        Get profile for a domain from the local LRU, reading through on a miss.
+
+        Args:
+            domain: Domain name to look up
+
+        Returns:
+            Shared DomainProfile for the domain
+        """
+        key = self._get_cache_key(domain)
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                if time.monotonic() - entry.loaded_at < self.local_ttl:
+                    self._local.move_to_end(key)
+                    return entry.profile
+                if entry.dirty:
+                    self._flush_entry(entry)  # Flushing also refreshes it
+                else:
+                    self._refresh_entry(entry)
+                self._local.move_to_end(key)
+                return entry.profile
+
+            profile = super().get_profile(domain)
+            self._local[key] = _CachedProfile(
+                profile=profile,
+                base=copy.deepcopy(profile),
+                loaded_at=time.monotonic(),
+            )
+            self._evict()
+            return profile
+
+    def save_profile(self, profile: DomainProfile) -> bool:
+        """
+        Mark a profile dirty; flushes all dirty profiles once due.
+
+        Args:
+            profile: DomainProfile to save (normally from get_profile)
+
+        Returns:
+            True (the write happens in a later flush)
+        """
+        key = self._get_cache_key(profile.domain)
+        profile.last_updated = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                # Not read through this store: treat everything as local change
+                entry = _CachedProfile(
+                    profile=profile,
+                    base=DomainProfile(domain=profile.domain),
+                    loaded_at=time.monotonic(),
+                )
+                self._local[key] = entry
+            else:
+                entry.profile = profile
+            entry.dirty = True
+            self._local.move_to_end(key)
+            self._evict()
+
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+        return True
+
+    def delete_profile(self, domain: str) -> bool:
+        """
+        Delete profile locally and from cache.
+
+        Args:
+            domain: Domain name to delete
+
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        with self._lock:
+            self._local.pop(self._get_cache_key(domain), None)
+        return super().delete_profile(domain)
+
+    def flush(self) -> int:
+        """
+        Merge all dirty profiles into the store.
+
+        Returns:
+            Number of profiles written
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            dirty = [entry for entry in self._local.values() if entry.dirty]
+            return sum(1 for entry in dirty if self._flush_entry(entry))
+
+    def _flush_entry(self, entry: _CachedProfile) -> bool:
+        """Read-merge-write one dirty profile; keeps it dirty on failure."""
+        domain = entry.profile.domain
+        lock = self._acquire_remote_lock(domain)
+        if lock is False:
+            logger.debug("Domain profile for %s is locked, flushing later", domain)
+            return False
+        try:
+            remote = super().get_profile(domain)
+            merged = self.merge_profiles(remote, entry.base, entry.profile)
+            if not super().save_profile(merged):
+                return False
+        finally:
+            self._release_remote_lock(lock)
+
+        self._apply(entry, merged)
+        return True
+
+    def _refresh_entry(self, entry: _CachedProfile) -> None:
+        """Re-read a clean profile from the store."""
+        self._apply(entry, super().get_profile(entry.profile.domain))
+
+    def _apply(self, entry: _CachedProfile, remote: DomainProfile) -> None:
+        """Update the shared local profile in place to the stored state."""
+        for f in fields(DomainProfile):
+            setattr(entry.profile, f.name, copy.deepcopy(getattr(remote, f.name)))
+        entry.base = copy.deepcopy(remote)
+        entry.loaded_at = time.monotonic()
+        entry.dirty = False
+
+    def _evict(self) -> None:
+        """Drop least recently used profiles beyond max_profiles."""
+        while len(self._local) > self.max_profiles:
+            key, entry = next(iter(self._local.items()))
+            if entry.dirty:
+                self._flush_entry(entry)
+            self._local.pop(key, None)
+
+    def _acquire_remote_lock(self, domain: str):
+        """
+        Acquire the cache lock for a profile, if the backend provides one.
+
+        Returns:
+            Lock to release, None if the backend has no locks, or False if
+            the lock is held elsewhere
+        """
+        lock_factory = getattr(self._cache, "lock", None)
+        if lock_factory is None:
+            return None
+        try:
+            lock = lock_factory(
+                f"{self._get_cache_key(domain)}:lock", timeout=self.LOCK_TIMEOUT_SECONDS
+            )
+            if not lock.acquire(blocking_timeout=self.LOCK_WAIT_SECONDS):
+                return False
+            return lock
+        except Exception as e:
+            logger.warning("Failed to lock domain profile for %s: %s", domain, str(e))
+            return None
+
+    @staticmethod
+    def _release_remote_lock(lock) -> None:
+        """Release a lock from _acquire_remote_lock."""
+        if not lock:
+            return
+        try:
+            lock.release()
+        except Exception as e:
+            logger.warning("Failed to release domain profile lock: %s", str(e))
+
+    @classmethod
+    def merge_profiles(
+        cls,
+        remote: DomainProfile,
+        base: DomainProfile,
+        local: DomainProfile,
+    ) -> DomainProfile:
+        """
+        Merge local changes (local - base) into the stored profile.
+
+        Args:
+            remote: Profile currently in the store
+            base: Profile as this process last read it
+            local: Profile with this process's changes
+
+        Returns:
+            New merged DomainProfile
+        """
+        merged = copy.deepcopy(remote)
+        for f in fields(DomainProfile):
+            name = f.name
+            if name == "domain":
+                continue
+            local_value = getattr(local, name)
+            base_value = getattr(base, name)
+            remote_value = getattr(remote, name)
+
+            if name in cls.COUNTER_FIELDS:
+                value = max(0, remote_value + local_value - base_value)
+            elif name in cls.SHIFT_FIELDS:
+                value = max(0.0, remote_value + local_value - base_value)
+                if name.endswith("_success_rate"):
+                    value = min(1.0, value)
+            elif name in cls.TIMESTAMP_FIELDS:
+                candidates = [v for v in (remote_value, local_value) if v is not None]
+                value = max(candidates) if candidates else None
+            elif local_value != base_value:
+                value = copy.deepcopy(local_value)
+            else:
+                continue
+            setattr(merged, name, value)
+        return merged
+
+
+_domain_store: Optional[CachedDomainIntelligenceStore] = None
+_domain_store_lock = threading.Lock()
+
+
+def get_domain_intelligence_store() -> CachedDomainIntelligenceStore:
+    """
+    Get the process-wide cached domain intelligence store.
+
+    Returns:
+        Shared CachedDomainIntelligenceStore
+    """
+    global _domain_store
+    with _domain_store_lock:
+        if _domain_store is None:
+            _domain_store = CachedDomainIntelligenceStore()
+        return _domain_store
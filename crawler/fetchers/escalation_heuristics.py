@@ -25,6 +25,7 @@ from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from crawler.fetchers.domain_intelligence import DomainProfile
+    from crawler.fetchers.response_classifier import ResponseSignals
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,56 @@ class EscalationHeuristics:
     # Status codes that trigger immediate escalation
     ESCALATION_STATUS_CODES = {403, 429, 503}
 
+    # Content patterns (lowercase). Also compiled into the single-pass
+    # ResponseClassifier, which should_escalate() uses.
+
+    # High-confidence Cloudflare challenge patterns
+    CLOUDFLARE_PATTERNS = [
+        "checking your browser",
+        "just a moment...",
+        "cf_chl_opt",
+        "cf_chl_prog",
+        "cf-browser-verification",
+        "challenge-platform",
+        "__cf_chl_tk",
+    ]
+    # Lower-confidence pattern: only counts on very short, sparse pages
+    CLOUDFLARE_RAY_PATTERN = "cloudflare ray id"
+
+    CAPTCHA_PATTERNS = [
+        "g-recaptcha",
+        "h-captcha",
+        "recaptcha/api",
+        "hcaptcha.com",
+        'name="captcha',
+        "captcha_token",
+        "captcha-challenge",
+        "data-sitekey",
+    ]
+
+    # Common SPA shells (React, Next.js, Vue, Angular)
+    SPA_PATTERNS = [
+        '<div id="root"></div>',
+        '<div id="__next"></div>',
+        '<div id="app"></div>',
+        "<app-root></app-root>",
+        "<app-root>",
+    ]
+
+    NOSCRIPT_PATTERNS = [
+        "you need to enable javascript",
+        "please enable javascript",
+        "javascript is required",
+        "this app requires javascript",
+    ]
+
+    LOADING_PATTERNS = [
+        "loading...",
+        "please wait",
+        "loading-spinner",
+        "loading-indicator",
+    ]
+
     @classmethod
     def should_escalate(
         cls,
@@ -64,6 +115,7 @@ class EscalationHeuristics:
         content: str,
         domain_profile: "DomainProfile",
         current_tier: int,
+        signals: Optional["ResponseSignals"] = None,
     ) -> EscalationResult:
         """
         Determine if we should escalate to the next tier.
@@ -73,6 +125,8 @@ class EscalationHeuristics:
             content: Response body content
             domain_profile: Domain's historical performance profile
             current_tier: Current fetch tier (1, 2, or 3)
+            signals: Content signals already computed for this response
+                (computed with ResponseClassifier if not given)
 
         Returns:
             EscalationResult with should_escalate flag and reason
@@ -91,8 +145,13 @@ class EscalationHeuristics:
 
         # Check content-based escalation (only for 200 responses)
         if status_code == 200:
+            if signals is None:
+                from crawler.fetchers.response_classifier import get_response_classifier
+
+                signals = get_response_classifier().classify(content)
+
             # Cloudflare challenge
-            if cls.is_cloudflare_challenge(content):
+            if signals.cloudflare_challenge:
                 return EscalationResult(
                     should_escalate=True,
                     reason="Cloudflare challenge detected",
@@ -100,7 +159,7 @@ class EscalationHeuristics:
                 )
 
             # CAPTCHA page
-            if cls.is_captcha_page(content):
+            if signals.captcha:
                 return EscalationResult(
                     should_escalate=True,
                     reason="CAPTCHA challenge detected",
@@ -108,7 +167,7 @@ class EscalationHeuristics:
                 )
 
             # JavaScript placeholder
-            if cls.is_javascript_placeholder(content):
+            if signals.javascript_placeholder:
                 return EscalationResult(
                     should_escalate=True,
                     reason="JavaScript placeholder page - requires JS rendering",
@@ -116,7 +175,7 @@ class EscalationHeuristics:
                 )
 
             # Empty or loading page
-            if cls.is_empty_or_loading(content):
+            if signals.empty_or_loading:
                 return EscalationResult(
                     should_escalate=True,
                     reason="Empty or loading page detected",
@@ -170,23 +229,13 @@ class EscalationHeuristics:
         content_lower = content.lower()
 
         # High-confidence patterns (definitely a challenge)
-        challenge_patterns = [
-            "checking your browser",
-            "just a moment...",
-            "cf_chl_opt",
-            "cf_chl_prog",
-            "cf-browser-verification",
-            "challenge-platform",
-            "__cf_chl_tk",
-        ]
-
-        for pattern in challenge_patterns:
+        for pattern in EscalationHeuristics.CLOUDFLARE_PATTERNS:
             if pattern in content_lower:
                 return True
 
         # Lower-confidence pattern: only flag if content is very short
         # (under 10KB, which is typical for challenge pages)
-        if len(content) < 10000 and "cloudflare ray id" in content_lower:
+        if len(content) < 10000 and EscalationHeuristics.CLOUDFLARE_RAY_PATTERN in content_lower:
             # Additional check: real challenge pages have minimal text content
             import re
             text_content = re.sub(r"<[^>]+>", "", content).strip()
@@ -207,18 +256,7 @@ class EscalationHeuristics:
         """
         content_lower = content.lower()
 
-        captcha_patterns = [
-            "g-recaptcha",
-            "h-captcha",
-            "recaptcha/api",
-            "hcaptcha.com",
-            'name="captcha',
-            "captcha_token",
-            "captcha-challenge",
-            "data-sitekey",
-        ]
-
-        for pattern in captcha_patterns:
+        for pattern in EscalationHeuristics.CAPTCHA_PATTERNS:
             if pattern in content_lower:
                 return True
 
@@ -241,18 +279,7 @@ class EscalationHeuristics:
         content_lower = content.lower()
 
         # Check for common SPA patterns
-        spa_patterns = [
-            # React
-            '<div id="root"></div>',
-            '<div id="__next"></div>',
-            # Vue
-            '<div id="app"></div>',
-            # Angular
-            "<app-root></app-root>",
-            "<app-root>",
-        ]
-
-        for pattern in spa_patterns:
+        for pattern in EscalationHeuristics.SPA_PATTERNS:
             if pattern in content_lower:
                 # Check if the div is actually empty (no content after it before closing)
                 # This differentiates between placeholder and rendered content
@@ -266,14 +293,7 @@ class EscalationHeuristics:
                         return True
 
         # Check for noscript messages
-        noscript_patterns = [
-            "you need to enable javascript",
-            "please enable javascript",
-            "javascript is required",
-            "this app requires javascript",
-        ]
-
-        for pattern in noscript_patterns:
+        for pattern in EscalationHeuristics.NOSCRIPT_PATTERNS:
             if pattern in content_lower:
                 return True
 
@@ -292,15 +312,8 @@ class EscalationHeuristics:
         text_content = re.sub(r"\s+", " ", text_content)  # Normalize whitespace
 
         # Check for loading indicators
-        loading_patterns = [
-            "loading...",
-            "please wait",
-            "loading-spinner",
-            "loading-indicator",
-        ]
-
         content_lower = content.lower()
-        for pattern in loading_patterns:
+        for pattern in EscalationHeuristics.LOADING_PATTERNS:
             if pattern in content_lower:
                 # If loading pattern is present and content is sparse
                 if len(text_content) < 200:
@@ -9,14 +9,20 @@ Updates Include:
 - Timeout counts and slow domain detection
 - Behavior flags (JS-heavy, bot-protected)
 - Success/failure counts
+- Tier 1 HTTP/2 compatibility
+- Per-domain concurrency window (AIMD)
 """
 
 from __future__ import annotations
 
 import logging
+import re
+import time
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
 
+from django.conf import settings
+
 if TYPE_CHECKING:
     from crawler.fetchers.domain_intelligence import DomainProfile
 
@@ -37,6 +43,20 @@ class FeedbackRecorder:
     # Timeouts before marking domain as slow
     SLOW_THRESHOLD = 3
 
+    # Consecutive HTTP/2 fallbacks before a compatible domain is downgraded
+    HTTP2_FALLBACK_THRESHOLD = 2
+
+    # AIMD concurrency window: grows by 1 per window of clean fetches, and is
+    # multiplied by CONCURRENCY_DECREASE_FACTOR on congestion (at most once
+    # per CONCURRENCY_DECREASE_COOLDOWN_SECONDS, so a burst of 429s from
+    # fetches that were already in flight counts once)
+    CONCURRENCY_DECREASE_FACTOR = 0.5
+    CONCURRENCY_DECREASE_COOLDOWN_SECONDS = 2.0
+    # Tier 1 response time above this multiple of the baseline is congestion
+    LATENCY_INFLATION_FACTOR = 2.0
+    # Rate limiting / overload statuses in error and escalation reasons
+    CONGESTION_STATUS_PATTERN = re.compile(r"\bHTTP (429|503)\b")
+
     # Keywords in escalation reasons that indicate JS rendering needed
     JS_KEYWORDS = [
         "javascript",
@@ -103,6 +123,10 @@ class FeedbackRecorder:
         if escalation_reason:
             cls._process_escalation_reason(profile, escalation_reason)
 
+        cls.update_concurrency_window(
+            profile, tier, success, response_time_ms, timed_out, escalation_reason
+        )
+
         # Update last_updated timestamp
         profile.last_updated = datetime.now(timezone.utc)
 
@@ -186,6 +210,113 @@ class FeedbackRecorder:
                 )
                 break
 
+    @classmethod
+    def update_concurrency_window(
+        cls,
+        profile: "DomainProfile",
+        tier: int,
+        success: bool,
+        response_time_ms: int,
+        timed_out: bool = False,
+        escalation_reason: Optional[str] = None,
+    ) -> "DomainProfile":
+        """
+        Adjust the domain's concurrency window (additive increase,
+        multiplicative decrease).
+
+        Congestion is a 429/503 response, a timeout, or a Tier 1 response
+        slower than LATENCY_INFLATION_FACTOR times the domain's Tier 1
+        baseline. Other failures (blocks, JS pages) say nothing about load
+        and leave the window alone.
+
+        Args:
+            profile: Domain profile to update
+            tier: Tier used for this fetch
+            success: Whether the fetch succeeded
+            response_time_ms: Response time in milliseconds
+            timed_out: Whether the fetch timed out
+            escalation_reason: Error or escalation reason (if any)
+
+        Returns:
+            Updated profile (modified in place, also returned)
+        """
+        from .domain_concurrency import get_concurrency_window
+
+        window = get_concurrency_window(profile)
+        max_window = getattr(settings, "CRAWLER_DOMAIN_CONCURRENCY_MAX", 8)
+
+        congested = timed_out or bool(
+            escalation_reason and cls.CONGESTION_STATUS_PATTERN.search(escalation_reason)
+        )
+        if tier == 1 and success and response_time_ms > 0:
+            baseline = profile.concurrency_baseline_ms
+            if baseline and response_time_ms > cls.LATENCY_INFLATION_FACTOR * baseline:
+                congested = True
+            profile.concurrency_baseline_ms = (
+                cls.EMA_ALPHA * response_time_ms + (1 - cls.EMA_ALPHA) * baseline
+                if baseline else float(response_time_ms)
+            )
+
+        now = time.time()
+        if congested:
+            if now - profile.concurrency_decreased_at < cls.CONCURRENCY_DECREASE_COOLDOWN_SECONDS:
+                return profile
+            profile.concurrency_window = max(1.0, window * cls.CONCURRENCY_DECREASE_FACTOR)
+            profile.concurrency_decreased_at = now
+            logger.debug(
+                "Decreased concurrency window for %s: %.2f -> %.2f",
+                profile.domain,
+                window,
+                profile.concurrency_window,
+            )
+        elif success:
+            profile.concurrency_window = min(float(max_window), window + 1.0 / window)
+
+        return profile
+
+    @classmethod
+    def record_http2_result(
+        cls,
+        profile: "DomainProfile",
+        outcome: Optional[str],
+    ) -> "DomainProfile":
+        """
+        Record the outcome of a Tier 1 HTTP/2 attempt.
+
+        A successful HTTP/2 fetch marks the domain compatible. A server that
+        only negotiates HTTP/1.1 or a failed probe marks it incompatible,
+        as do HTTP2_FALLBACK_THRESHOLD consecutive fallbacks on a domain
+        that was compatible. Incompatible domains are re-probed once their
+        profile expires.
+
+        Args:
+            profile: Domain profile to update
+            outcome: FetchResponse.http2_outcome ("ok", "unsupported",
+                "fallback", or None if HTTP/2 was not attempted)
+
+        Returns:
+            Updated profile (modified in place, also returned)
+        """
+        if outcome == "ok":
+            profile.http2_compatible = True
+            profile.http2_fallback_count = 0
+        elif outcome == "unsupported":
+            profile.http2_compatible = False
+        elif outcome == "fallback":
+            profile.http2_fallback_count += 1
+            if (
+                profile.http2_compatible is None
+                or profile.http2_fallback_count >= cls.HTTP2_FALLBACK_THRESHOLD
+            ):
+                profile.http2_compatible = False
+                logger.debug(
+                    "Marking %s as not HTTP/2 compatible (fallbacks=%d)",
+                    profile.domain,
+                    profile.http2_fallback_count,
+                )
+
+        return profile
+
     @classmethod
     def calculate_recommended_tier(cls, profile: "DomainProfile") -> int:
         """
@@ -0,0 +1,145 @@
+"""
+Resource Blocking - lean Tier 2 rendering without images, fonts and trackers.
+
+Extraction only needs the rendered DOM, so Tier 2 pages do not have to
+download images, fonts, video or analytics beacons. Tier2PlaywrightFetcher
+routes every request of a context through ResourceBlocker.handle_route(),
+which aborts blocked resource types and known tracker hosts. This cuts
+bandwidth and lets "networkidle" settle much sooner.
+
+Scripts, stylesheets and XHR/fetch requests are never blocked by type.
+Tier 2 exists to run JavaScript, and age gate buttons are located by
+visibility, which depends on CSS.
+
+Sites that break without some resources can be given a per-domain allowlist
+on their DomainProfile (tier2_allowed_resource_types, tier2_allowed_hosts).
+"""
+
+import logging
+from typing import TYPE_CHECKING, FrozenSet, Iterable, Optional
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from .domain_intelligence import DomainProfile
+
+logger = logging.getLogger(__name__)
+
+# Playwright resource types that never affect extracted DOM text
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Analytics, advertising and session-replay hosts (subdomains included)
+TRACKER_HOSTS = frozenset({
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.net",
+    "analytics.tiktok.com",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "newrelic.com",
+    "nr-data.net",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "klaviyo.com",
+})
+
+
+def _host_matches(host: str, hosts: Iterable[str]) -> bool:
+    """Check if host equals or is a subdomain of any of hosts."""
+    return any(host == h or host.endswith(f".{h}") for h in hosts)
+
+
+class ResourceBlocker:
+    """
+    Decides which Tier 2 sub-resource requests to abort.
+
+    Usage:
+        blocker = ResourceBlocker.for_profile(profile)
+        await context.route("**/*", blocker.handle_route)
+    """
+
+    def __init__(
+        self,
+        allowed_resource_types: Iterable[str] = (),
+        allowed_hosts: Iterable[str] = (),
+    ):
+        """
+        Initialize the blocker.
+
+        Args:
+            allowed_resource_types: Resource types to load despite
+                BLOCKED_RESOURCE_TYPES (e.g. "image")
+            allowed_hosts: Hosts to load despite TRACKER_HOSTS
+                (subdomains included)
+        """
+        self.blocked_types: FrozenSet[str] = BLOCKED_RESOURCE_TYPES - {
+            t.lower() for t in allowed_resource_types
+        }
+        self.allowed_hosts: FrozenSet[str] = frozenset(h.lower() for h in allowed_hosts)
+
+    @classmethod
+    def for_profile(cls, profile: Optional["DomainProfile"]) -> "ResourceBlocker":
+        """
+        Create a blocker applying a domain's allowlist.
+
+        Args:
+            profile: Domain profile (None = no overrides)
+
+        Returns:
+            ResourceBlocker for the domain
+        """
+        if profile is None:
+            return cls()
+        return cls(
+            allowed_resource_types=profile.tier2_allowed_resource_types,
+            allowed_hosts=profile.tier2_allowed_hosts,
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Check if a request should be aborted.
+
+        Args:
+            resource_type: Playwright request resource type
+            url: Request URL
+
+        Returns:
+            True if the request should be aborted
+        """
+        if resource_type == "document":
+            return False
+        if resource_type in self.blocked_types:
+            return True
+
+        host = (urlparse(url).hostname or "").lower()
+        if not host or _host_matches(host, self.allowed_hosts):
+            return False
+        return _host_matches(host, TRACKER_HOSTS)
+
+    async def handle_route(self, route) -> None:
+        """
+        Playwright route handler: abort blocked requests, continue the rest.
+
+        Args:
+            route: Playwright Route for an intercepted request
+        """
+        request = route.request
+        try:
+            if self.should_block(request.resource_type, request.url):
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception as e:
+            # Page closed or request already handled
+            logger.debug(f"Route handling failed for {request.url}: {e}")
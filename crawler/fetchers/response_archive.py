@@ -0,0 +1,245 @@
+"""
+Response Archive - content-addressed on-disk store of fetched pages.
+
+SmartRouter writes every successfully fetched page here (when
+CRAWLER_RESPONSE_ARCHIVE_ENABLED), so re-extraction experiments and schema
+changes can run over stored HTML instead of re-fetching it through all three
+tiers. In replay mode (SmartRouter(replay=True) or CRAWLER_FETCH_REPLAY)
+fetches are served from the archive without touching the network.
+
+Layout under CRAWLER_RESPONSE_ARCHIVE_DIR:
+
+    bodies/ab/cd/<sha256>.html.gz   gzip-compressed body, named by its hash
+    index/ab/<sha256(url)>.jsonl    one JSON line per fetch of the URL
+
+Bodies are content-addressed, so identical pages (and unchanged re-fetches)
+are stored once. Index lines hold the URL, content hash, status code,
+headers, tier and fetch time; the line with the latest fetch time is the
+latest fetch (lines may be appended out of order, e.g. when old raw content
+is archived after newer live fetches). Both trees are sharded on hash
+prefixes to keep directories small.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+from .validator_cache import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ArchivedResponse:
+    """One archived fetch of a URL."""
+
+    url: str
+    content_hash: str
+    status_code: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    tier: int = 1  # 0 = unknown (archived from stored raw content)
+    fetched_at: Optional[str] = None  # ISO format
+    content: Optional[str] = None  # Loaded on demand, not stored in the index
+
+
+class ResponseArchive:
+    """
+    Sharded, compressed, content-addressed archive of fetched responses.
+
+    Usage:
+        archive = ResponseArchive()
+        archive.store(url, html, status_code=200, headers={}, tier=1)
+        archived = archive.lookup(url)  # latest fetch, with content
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the archive.
+
+        Args:
+            root: Archive directory (default: CRAWLER_RESPONSE_ARCHIVE_DIR)
+        """
+        self.root = Path(root or getattr(
+            settings,
+            "CRAWLER_RESPONSE_ARCHIVE_DIR",
+            Path(settings.BASE_DIR) / "var" / "response_archive",
+        ))
+
+    @staticmethod
+    def compute_hash(value: str) -> str:
+        """Compute SHA-256 hash used for body and index names."""
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    def _body_path(self, content_hash: str) -> Path:
+        """Get the sharded body path for a content hash."""
+        return self.root / "bodies" / content_hash[:2] / content_hash[2:4] / f"{content_hash}.html.gz"
+
+    def _index_path(self, url: str) -> Path:
+        """Get the sharded index path for a URL (by canonical URL hash)."""
+        url_hash = self.compute_hash(canonicalize_url(url))
+        return self.root / "index" / url_hash[:2] / f"{url_hash}.jsonl"
+
+    def store(
+        self,
+        url: str,
+        content: str,
+        status_code: int,
+        headers: Optional[Dict[str, str]] = None,
+        tier: int = 1,
+        fetched_at: Optional[datetime] = None,
+    ) -> str:
+        """
+        Archive a fetched response.
+
+        The body is written once per distinct content; the fetch itself is
+        appended to the URL's index.
+
+        Args:
+            url: Fetched URL
+            content: Response body
+            status_code: HTTP status code
+            headers: Response headers
+            tier: Tier that fetched the page
+            fetched_at: Fetch time (default: now)
+
+        Returns:
+            SHA-256 content hash of the body
+        """
+        content_hash = self.compute_hash(content)
+        body_path = self._body_path(content_hash)
+        if not body_path.exists():
+            self._write_atomic(body_path, gzip.compress(content.encode()))
+
+        record = ArchivedResponse(
+            url=url,
+            content_hash=content_hash,
+            status_code=status_code,
+            headers=dict(headers or {}),
+            tier=tier,
+            fetched_at=(fetched_at or datetime.now(timezone.utc)).isoformat(),
+        )
+        line = asdict(record)
+        del line["content"]
+
+        index_path = self._index_path(url)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(line) + "\n")
+
+        return content_hash
+
+    def history(self, url: str) -> List[ArchivedResponse]:
+        """
+        Get all archived fetches of a URL, oldest first (without content).
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            List of ArchivedResponse records
+        """
+        index_path = self._index_path(url)
+        if not index_path.exists():
+            return []
+        return self._read_index(index_path)
+
+    def lookup(self, url: str) -> Optional[ArchivedResponse]:
+        """
+        Get the latest archived fetch of a URL, with its content.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            ArchivedResponse, or None if the URL is not archived
+        """
+        latest = self._latest(self.history(url))
+        if latest is None:
+            return None
+        latest.content = self.load_body(latest.content_hash)
+        return latest if latest.content is not None else None
+
+    def load_body(self, content_hash: str) -> Optional[str]:
+        """
+        Load an archived body by content hash.
+
+        Args:
+            content_hash: SHA-256 of the body
+
+        Returns:
+            Body text, or None if missing
+        """
+        try:
+            return gzip.decompress(self._body_path(content_hash).read_bytes()).decode()
+        except FileNotFoundError:
+            return None
+
+    def iter_latest(self) -> Iterator[ArchivedResponse]:
+        """
+        Iterate the latest fetch of every archived URL (without content).
+
+        Use load_body() on the records that are needed; re-extraction over
+        the archive streams this instead of loading all bodies up front.
+
+        Yields:
+            ArchivedResponse per URL
+        """
+        index_root = self.root / "index"
+        if not index_root.exists():
+            return
+        for index_path in sorted(index_root.glob("*/*.jsonl")):
+            latest = self._latest(self._read_index(index_path))
+            if latest is not None:
+                yield latest
+
+    @staticmethod
+    def _latest(records: List[ArchivedResponse]) -> Optional[ArchivedResponse]:
+        """Get the record with the latest fetch time (the last one on ties)."""
+        def fetched_at(record: ArchivedResponse) -> datetime:
+            try:
+                value = datetime.fromisoformat(record.fetched_at)
+            except (TypeError, ValueError):
+                return datetime.min.replace(tzinfo=timezone.utc)
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value
+
+        latest = None
+        for record in records:
+            if latest is None or fetched_at(record) >= fetched_at(latest):
+                latest = record
+        return latest
+
+    def _read_index(self, index_path: Path) -> List[ArchivedResponse]:
+        """Read all records of an index file, skipping unparseable lines."""
+        records = []
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(ArchivedResponse(**json.loads(line)))
+                except (ValueError, TypeError) as e:
+                    # Torn write from a crashed worker
+                    logger.warning(f"Skipping bad archive index line in {index_path}: {e}")
+        return records
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write a file via rename so readers never see a partial body."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
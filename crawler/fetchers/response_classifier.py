@@ -0,0 +1,213 @@
+"""
+Response Classifier - single-pass detection of soft-failure signals.
+
+After a fetch, SmartRouter needs to know whether a page is a Cloudflare or
+CAPTCHA challenge, an unrendered JavaScript shell, an empty/loading page,
+an age gate or a members-only wall. Running EscalationHeuristics,
+detect_age_gate and MembersOnlyDetector one after another lowercases and
+scans the page once per pattern list.
+
+ResponseClassifier lowercases the page once, finds every pattern of those
+checks in it, and applies the per-check rules (size limits, sparse-text
+checks) to the matches. Sparse-text checks stop as soon as enough text has
+been seen instead of stripping every tag from the page.
+
+Usage:
+    signals = get_response_classifier().classify(content)
+    if signals.captcha or signals.age_gate.is_age_gate:
+        ...
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import string
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from .age_gate import AGE_GATE_KEYWORDS, AgeGateDetectionResult, detect_age_gate
+from .escalation_heuristics import EscalationHeuristics
+
+logger = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_DELETE_WHITESPACE = str.maketrans("", "", string.whitespace)
+
+
+@dataclass
+class ResponseSignals:
+    """Every soft-failure signal found in one response."""
+
+    cloudflare_challenge: bool = False
+    captcha: bool = False
+    javascript_placeholder: bool = False
+    empty_or_loading: bool = False
+    age_gate: Optional[AgeGateDetectionResult] = None
+    members_only: bool = False
+    # Category -> patterns found in the content
+    matched_patterns: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _has_text(content: str, min_chars: int, normalize_whitespace: bool = True) -> bool:
+    """
+    Check whether the tag-stripped text of content has at least min_chars.
+
+    Equivalent to measuring re.sub(r"<[^>]+>", "", content).strip() (with
+    whitespace runs collapsed if normalize_whitespace), but counts non-space
+    text between tags and stops once the minimum is reached; only pages
+    with little text pay for the exact computation.
+    """
+    found = 0
+    pos = 0
+    for match in _TAG_RE.finditer(content):
+        found += len(content[pos:match.start()].translate(_DELETE_WHITESPACE))
+        if found >= min_chars:
+            return True
+        pos = match.end()
+    found += len(content[pos:].translate(_DELETE_WHITESPACE))
+    if found >= min_chars:
+        return True
+
+    text = _TAG_RE.sub("", content).strip()
+    if normalize_whitespace:
+        text = re.sub(r"\s+", " ", text)
+    return len(text) >= min_chars
+
+
+class ResponseClassifier:
+    """
+    Single-pass classifier for fetched pages.
+
+    Patterns come from EscalationHeuristics, AGE_GATE_KEYWORDS and
+    MembersOnlyDetector, so the lists stay defined in one place.
+    """
+
+    def __init__(self):
+        """Collect the literal patterns and compile the members-only regexes."""
+        from crawler.services.members_only_detector import MembersOnlyDetector
+
+        self._literals: List[Tuple[str, str]] = []
+        for category, patterns in [
+            ("cloudflare", EscalationHeuristics.CLOUDFLARE_PATTERNS),
+            ("cloudflare_ray", [EscalationHeuristics.CLOUDFLARE_RAY_PATTERN]),
+            ("captcha", EscalationHeuristics.CAPTCHA_PATTERNS),
+            ("spa", EscalationHeuristics.SPA_PATTERNS),
+            ("noscript", EscalationHeuristics.NOSCRIPT_PATTERNS),
+            ("loading", EscalationHeuristics.LOADING_PATTERNS),
+            ("age_gate", AGE_GATE_KEYWORDS),
+        ]:
+            self._literals.extend((category, pattern) for pattern in patterns)
+
+        # Patterns are lowercase and run on lowercased content; case-sensitive
+        # matching is much faster than re.IGNORECASE on large pages
+        self._members_only = [
+            re.compile(pattern)
+            for pattern in (
+                MembersOnlyDetector.LOGIN_FORM_PATTERNS
+                + MembersOnlyDetector.SIGN_IN_PATTERNS
+                + MembersOnlyDetector.MEMBERSHIP_PATTERNS
+                + MembersOnlyDetector.PAYWALL_PATTERNS
+                + MembersOnlyDetector.ACCESS_DENIED_PATTERNS
+            )
+        ]
+
+    def find_patterns(self, content: str) -> Dict[Tuple[str, str], int]:
+        """
+        Find pattern occurrences in the content, lowercasing it once.
+
+        Members-only regexes stop at the first match, as in
+        MembersOnlyDetector.is_members_only.
+
+        Args:
+            content: Page content
+
+        Returns:
+            Dict of (category, pattern) -> first match position
+        """
+        content_lower = content.lower()
+        found: Dict[Tuple[str, str], int] = {}
+        for category, pattern in self._literals:
+            index = content_lower.find(pattern)
+            if index >= 0:
+                found[(category, pattern)] = index
+        for regex in self._members_only:
+            match = regex.search(content_lower)
+            if match:
+                found[("members_only", regex.pattern)] = match.start()
+                break
+        return found
+
+    def classify(self, content: str, age_gate_threshold: Optional[int] = None) -> ResponseSignals:
+        """
+        Classify a response in one pass over its content.
+
+        Rules match EscalationHeuristics.is_* checks, detect_age_gate and
+        MembersOnlyDetector.is_members_only.
+
+        Args:
+            content: Page content
+            age_gate_threshold: Age gate content length threshold
+                (defaults to settings value)
+
+        Returns:
+            ResponseSignals for the content
+        """
+        content = content or ""
+        found = self.find_patterns(content)
+        matched: Dict[str, List[str]] = {}
+        for category, pattern in found:
+            matched.setdefault(category, []).append(pattern)
+
+        def _present(category: str) -> Set[str]:
+            return set(matched.get(category, ()))
+
+        signals = ResponseSignals(matched_patterns=matched)
+
+        # Cloudflare: short pages only; the ray ID footer counts only on very
+        # short pages with sparse text
+        if len(content) <= 50000:
+            signals.cloudflare_challenge = bool(matched.get("cloudflare")) or (
+                len(content) < 10000
+                and bool(matched.get("cloudflare_ray"))
+                and not _has_text(content, 1000, normalize_whitespace=False)
+            )
+
+        signals.captcha = bool(matched.get("captcha"))
+
+        # JS placeholder: an SPA shell with (almost) no text after it, or a
+        # noscript message
+        spa_present = _present("spa")
+        for pattern in EscalationHeuristics.SPA_PATTERNS:
+            if pattern in spa_present:
+                after = content[found[("spa", pattern)] + len(pattern):]
+                if not _has_text(after, 100, normalize_whitespace=False):
+                    signals.javascript_placeholder = True
+                    break
+        if matched.get("noscript"):
+            signals.javascript_placeholder = True
+
+        signals.empty_or_loading = not _has_text(content, 50) or (
+            bool(matched.get("loading")) and not _has_text(content, 200)
+        )
+
+        signals.age_gate = detect_age_gate(
+            content,
+            threshold=age_gate_threshold,
+            keywords_found=_present("age_gate"),
+        )
+        signals.members_only = bool(matched.get("members_only"))
+
+        return signals
+
+
+# Singleton instance (the compiled matcher is reused across responses)
+_response_classifier: Optional[ResponseClassifier] = None
+
+
+def get_response_classifier() -> ResponseClassifier:
+    """Get singleton ResponseClassifier instance."""
+    global _response_classifier
+    if _response_classifier is None:
+        _response_classifier = ResponseClassifier()
+    return _response_classifier
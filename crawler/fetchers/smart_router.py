@@ -15,26 +15,35 @@ Features:
 - Age gate detection and bypass
 - Error logging to CrawlError model
 - Monitoring integration (Task Group 9)
+- Concurrent multi-URL fetching with global and per-domain limits (fetch_many)
+- Adaptive (AIMD) per-domain concurrency windows learned from feedback
+- Hedged Tier 1/Tier 2 races for domains with an uncertain Tier 1 history
+- Conditional Tier 1 re-fetches with stored ETag/Last-Modified validators
+- On-disk response archive and offline replay mode (see response_archive)
 """
 
+import asyncio
+import contextlib
 import logging
 import traceback
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple, TYPE_CHECKING
 from urllib.parse import urlparse
 
 from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.utils import timezone
 
-from .age_gate import detect_age_gate
+from .domain_concurrency import DomainConcurrencyLimiter
 from .tier1_httpx import Tier1HttpxFetcher, FetchResponse
 from .tier2_playwright import Tier2PlaywrightFetcher
 from .tier3_scrapingbee import Tier3ScrapingBeeFetcher
 
 if TYPE_CHECKING:
     from .domain_intelligence import DomainIntelligenceStore, DomainProfile
+    from .response_archive import ResponseArchive
+    from .validator_cache import HTTPValidators
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +85,15 @@ class FetchResult:
     error: Optional[str] = None
     age_gate_detected: bool = False
     age_gate_bypassed: bool = False
+    # Page unchanged since the last conditional fetch (content may be empty)
+    not_modified: bool = False
+    # Served from the response archive (replay mode)
+    replayed: bool = False
+    # Content cut off at the Tier 1 body size cap
+    truncated: bool = False
+    # Validators of a full conditional Tier 1 response, not yet stored; the
+    # caller saves them (SmartRouter.save_validators) once the page is processed
+    validators: Optional["HTTPValidators"] = None
 
 
 class SmartRouter:
@@ -100,6 +118,9 @@ class SmartRouter:
         redis_client=None,
         timeout: Optional[float] = None,
         domain_store: Optional["DomainIntelligenceStore"] = None,
+        archive: Optional["ResponseArchive"] = None,
+        replay: Optional[bool] = None,
+        domain_intelligence: Optional[bool] = None,
     ):
         """
         Initialize Smart Router.
@@ -108,20 +129,49 @@ class SmartRouter:
             redis_client: Redis client for cookie caching
             timeout: Request timeout (shared across tiers, used as fallback)
             domain_store: DomainIntelligenceStore for adaptive behavior
+                (default: the process-wide cached store when domain
+                intelligence is enabled)
+            archive: ResponseArchive to write fetched pages to (default: a
+                ResponseArchive when CRAWLER_RESPONSE_ARCHIVE_ENABLED)
+            replay: Serve fetches from the archive only, without network
+                access (default: CRAWLER_FETCH_REPLAY)
+            domain_intelligence: Learn and persist per-domain profiles when no
+                domain_store is given; False fetches with a default profile
+                each time (default: CRAWLER_DOMAIN_INTELLIGENCE_ENABLED)
         """
         self.timeout = timeout or getattr(
             settings, "CRAWLER_REQUEST_TIMEOUT", 30
         )
         self.redis_client = redis_client
+
+        if domain_intelligence is None:
+            domain_intelligence = getattr(settings, "CRAWLER_DOMAIN_INTELLIGENCE_ENABLED", True)
+        if domain_store is None and domain_intelligence:
+            from .domain_intelligence import get_domain_intelligence_store
+            domain_store = get_domain_intelligence_store()
         self._domain_store = domain_store
 
+        self.replay = (
+            replay if replay is not None else getattr(settings, "CRAWLER_FETCH_REPLAY", False)
+        )
+        if archive is None and (
+            self.replay or getattr(settings, "CRAWLER_RESPONSE_ARCHIVE_ENABLED", False)
+        ):
+            from .response_archive import ResponseArchive
+            archive = ResponseArchive()
+        self._archive = archive
+
         # Lazy initialization of fetchers
         self._tier1_fetcher: Optional[Tier1HttpxFetcher] = None
         self._tier2_fetcher: Optional[Tier2PlaywrightFetcher] = None
         self._tier3_fetcher: Optional[Tier3ScrapingBeeFetcher] = None
 
-        # Lazy initialization of failure tracker
+        # Lazy initialization of failure tracker and validator store
         self._failure_tracker = None
+        self._validator_store = None
+
+        # Per-domain concurrency windows learned by FeedbackRecorder
+        self._concurrency = DomainConcurrencyLimiter()
 
     def _get_tier1_fetcher(self) -> Tier1HttpxFetcher:
         """Get or create Tier 1 fetcher."""
@@ -154,12 +204,22 @@ class SmartRouter:
                 logger.warning(f"Failed to initialize failure tracker: {e}")
         return self._failure_tracker
 
+    def _get_validator_store(self):
+        """Get or create HTTP validator store."""
+        if self._validator_store is None:
+            from .validator_cache import ValidatorStore
+            self._validator_store = ValidatorStore()
+        return self._validator_store
+
     async def close(self):
-        """Close all fetcher connections."""
+        """Close all fetcher connections and flush write-behind profile updates."""
         if self._tier1_fetcher:
             await self._tier1_fetcher.close()
         if self._tier2_fetcher:
             await self._tier2_fetcher.close()
+        flush = getattr(self._domain_store, "flush", None)
+        if flush is not None:
+            flush()
 
     def _get_domain_profile(self, domain: str) -> "DomainProfile":
         """Get domain profile from store or create default."""
@@ -180,6 +240,8 @@ class SmartRouter:
         source=None,
         crawl_job=None,
         force_tier: Optional[int] = None,
+        profile: Optional["DomainProfile"] = None,
+        conditional: bool = False,
     ) -> FetchResult:
         """
         Fetch URL content using Smart Router tier escalation.
@@ -195,22 +257,53 @@ class SmartRouter:
             source: CrawlerSource instance (for cookies and tier3 flag)
             crawl_job: CrawlJob instance (for cost tracking)
             force_tier: Force specific tier (1, 2, or 3)
+            profile: Pre-loaded DomainProfile for the URL's domain (shared
+                by concurrent fetches so feedback accumulates on one object)
+            conditional: Send stored ETag/Last-Modified validators with Tier 1;
+                an unchanged page returns not_modified=True (and no content
+                when the server answers 304). New validators come back on
+                the result; store them with save_validators()
 
         Returns:
             FetchResult with content and metadata
         """
-        # Import domain intelligence components
-        from .smart_tier_selector import SmartTierSelector
-        from .adaptive_timeout import AdaptiveTimeout
-        from .escalation_heuristics import EscalationHeuristics
-        from .feedback_recorder import FeedbackRecorder
+        if self.replay:
+            return await self._replay(url)
 
         # Add Sentry breadcrumb for this fetch
         self._add_fetch_breadcrumb(url, source)
 
         # Extract domain and get profile
         domain = extract_domain(url)
-        profile = self._get_domain_profile(domain)
+        if profile is None:
+            profile = self._get_domain_profile(domain)
+
+        # Stay within the domain's learned concurrency window
+        async with self._concurrency.slot(domain, profile):
+            return await self._fetch_tiers(
+                url, source, crawl_job, force_tier, profile, conditional
+            )
+
+    async def _fetch_tiers(
+        self,
+        url: str,
+        source,
+        crawl_job,
+        force_tier: Optional[int],
+        profile: "DomainProfile",
+        conditional: bool,
+    ) -> FetchResult:
+        """
+        Fetch URL content, escalating through the tiers (see fetch()).
+
+        Returns:
+            FetchResult with content and metadata
+        """
+        from .smart_tier_selector import SmartTierSelector
+        from .adaptive_timeout import AdaptiveTimeout
+        from .feedback_recorder import FeedbackRecorder
+
+        domain = extract_domain(url)
 
         # Get source configuration
         cookies = {}
@@ -237,8 +330,29 @@ class SmartRouter:
         last_error = None
         tier_used = start_tier
         escalation_reason = None
+        tiers = range(start_tier, 4)
+
+        # Race Tier 1 against a delayed Tier 2 when Tier 1 is unreliable here
+        if (
+            not force_tier
+            and getattr(settings, "CRAWLER_HEDGED_FETCH_ENABLED", True)
+            and SmartTierSelector.should_hedge(profile, start_tier)
+        ):
+            hedge_delay = getattr(settings, "CRAWLER_HEDGE_DELAY_MS", 1500) / 1000.0
+            tier_used, result, last_error = await self._fetch_hedged(
+                url, cookies, profile, hedge_delay, conditional=conditional
+            )
+            if result is not None:
+                if not result.success:
+                    return self._unusable_result(url, result, tier_used, profile)
+                return await self._complete_success(
+                    url, result, tier_used, source, profile, conditional
+                )
+
+            # Both browserless tiers failed - continue with Tier 3
+            tiers = range(3, 4)
 
-        for tier in range(start_tier, 4):
+        for tier in tiers:
             tier_used = tier
             attempt = tier - start_tier
 
@@ -251,57 +365,27 @@ class SmartRouter:
 
             try:
                 if tier == 1:
-                    result = await self._try_tier1(url, cookies)
+                    result = await self._try_tier1(url, cookies, conditional, profile)
                 elif tier == 2:
-                    result = await self._try_tier2(url, cookies)
+                    result = await self._try_tier2(url, cookies, profile)
                 elif tier == 3:
                     result = await self._try_tier3(url, cookies, crawl_job, source)
 
                 response_time_ms = int((time.time() - start_time) * 1000)
 
                 if result and result.success:
-                    # Check for soft failures using heuristics
-                    if tier < 3:
-                        escalation = EscalationHeuristics.should_escalate(
-                            status_code=result.status_code,
-                            content=result.content,
-                            domain_profile=profile,
-                            current_tier=tier,
+                    # Check for soft failures (heuristics and age gates)
+                    escalation_reason = self._check_soft_failure(url, result, tier, profile)
+                    if escalation_reason:
+                        # Record this as a "soft failure" and escalate
+                        profile = FeedbackRecorder.record_fetch_result(
+                            profile=profile,
+                            tier=tier,
+                            success=False,
+                            response_time_ms=response_time_ms,
+                            escalation_reason=escalation_reason,
                         )
-
-                        if escalation.should_escalate:
-                            escalation_reason = escalation.reason
-                            logger.info(
-                                f"Heuristic escalation at Tier {tier} for {url}: "
-                                f"{escalation.reason}"
-                            )
-                            # Record this as a "soft failure" and escalate
-                            profile = FeedbackRecorder.record_fetch_result(
-                                profile=profile,
-                                tier=tier,
-                                success=False,
-                                response_time_ms=response_time_ms,
-                                escalation_reason=escalation.reason,
-                            )
-                            continue
-
-                    # Also check for age gate (existing logic)
-                    if tier < 3:
-                        age_gate = detect_age_gate(result.content)
-                        if age_gate.is_age_gate:
-                            logger.info(
-                                f"Age gate detected at Tier {tier} for {url}: "
-                                f"{age_gate.reason}"
-                            )
-                            # Record and escalate
-                            profile = FeedbackRecorder.record_fetch_result(
-                                profile=profile,
-                                tier=tier,
-                                success=False,
-                                response_time_ms=response_time_ms,
-                                escalation_reason=f"age_gate: {age_gate.reason}",
-                            )
-                            continue
+                        continue
 
                     # Success - record feedback and save profile
                     profile = FeedbackRecorder.record_fetch_result(
@@ -310,20 +394,14 @@ class SmartRouter:
                         success=True,
                         response_time_ms=response_time_ms,
                     )
-                    self._save_domain_profile(profile)
-
-                    # Reset failure counter in monitoring
-                    await self._record_success(source)
-
-                    return FetchResult(
-                        content=result.content,
-                        status_code=result.status_code,
-                        headers=result.headers,
-                        success=True,
-                        tier_used=tier,
+                    return await self._complete_success(
+                        url, result, tier, source, profile, conditional
                     )
 
                 else:
+                    if result is not None and result.aborted == Tier1HttpxFetcher.ABORT_NOT_HTML:
+                        return self._unusable_result(url, result, tier, profile)
+
                     # Fetch failed - record feedback and escalate
                     last_error = result.error if result else "Unknown error"
                     timed_out = "timeout" in last_error.lower() if last_error else False
@@ -377,6 +455,383 @@ class SmartRouter:
             error=last_error,
         )
 
+    async def _complete_success(
+        self,
+        url: str,
+        result: FetchResponse,
+        tier: int,
+        source,
+        profile: "DomainProfile",
+        conditional: bool,
+    ) -> FetchResult:
+        """
+        Finish an accepted fetch: persist learning, archive and build the result.
+
+        Args:
+            url: Fetched URL
+            result: Accepted tier response
+            tier: Tier that produced the response
+            source: CrawlerSource instance (for monitoring)
+            profile: Domain profile with the success already recorded
+            conditional: Whether validators should be returned for storing
+
+        Returns:
+            Successful FetchResult
+        """
+        self._save_domain_profile(profile)
+        validators = None
+        if conditional and tier == 1 and result.status_code != 304:
+            from .validator_cache import HTTPValidators
+
+            validators = HTTPValidators.from_response(url, result.headers, result.content)
+        if self._archive is not None and result.status_code != 304:
+            await self._archive_response(url, result, tier)
+
+        # Reset failure counter in monitoring
+        await self._record_success(source)
+
+        return FetchResult(
+            content=result.content,
+            status_code=result.status_code,
+            headers=result.headers,
+            success=True,
+            tier_used=tier,
+            not_modified=result.not_modified is True,
+            truncated=result.truncated is True,
+            validators=validators,
+        )
+
+    def _unusable_result(
+        self,
+        url: str,
+        result: FetchResponse,
+        tier: int,
+        profile: "DomainProfile",
+    ) -> FetchResult:
+        """
+        Finish a fetch whose response is not a page (e.g. a PDF or image).
+
+        Higher tiers would fetch the same resource, so the fetch fails
+        without escalating and without counting against the source.
+
+        Args:
+            url: Fetched URL
+            result: Aborted tier response
+            tier: Tier that produced the response
+            profile: Domain profile (saved for any learning so far)
+
+        Returns:
+            Failed FetchResult
+        """
+        logger.info(f"Not escalating {url}: {result.error}")
+        self._save_domain_profile(profile)
+        return FetchResult(
+            content="",
+            status_code=result.status_code,
+            headers=result.headers,
+            success=False,
+            tier_used=tier,
+            error=result.error,
+        )
+
+    async def _archive_response(self, url: str, result: FetchResponse, tier: int) -> None:
+        """Write an accepted response to the archive (off the event loop)."""
+        try:
+            await asyncio.to_thread(
+                self._archive.store,
+                url,
+                result.content,
+                status_code=result.status_code,
+                headers=dict(result.headers or {}),
+                tier=tier,
+            )
+        except Exception as e:
+            # Archiving must never fail a fetch
+            logger.warning(f"Failed to archive response for {url}: {e}")
+
+    async def _replay(self, url: str) -> FetchResult:
+        """
+        Serve a fetch from the response archive (replay mode).
+
+        Args:
+            url: URL to replay
+
+        Returns:
+            FetchResult from the latest archived fetch, or a failed result
+            if the URL is not archived
+        """
+        archived = await asyncio.to_thread(self._archive.lookup, url)
+        if archived is None:
+            return FetchResult(
+                content="",
+                status_code=0,
+                headers={},
+                success=False,
+                tier_used=0,
+                error="Not in response archive",
+                replayed=True,
+            )
+        return FetchResult(
+            content=archived.content,
+            status_code=archived.status_code,
+            headers=archived.headers,
+            success=True,
+            tier_used=archived.tier,
+            replayed=True,
+        )
+
+    def _check_soft_failure(
+        self,
+        url: str,
+        result: FetchResponse,
+        tier: int,
+        profile: "DomainProfile",
+    ) -> Optional[str]:
+        """
+        Check a successful Tier 1/2 response for soft failures.
+
+        Args:
+            url: Fetched URL (for logging)
+            result: Successful fetch response
+            tier: Tier that produced the response
+            profile: Domain profile used by the escalation heuristics
+
+        Returns:
+            Escalation reason, or None if the response is usable
+        """
+        from .escalation_heuristics import EscalationHeuristics
+        from .response_classifier import get_response_classifier
+
+        # Tier 3 is final; a 304 has no body to inspect
+        if tier >= 3 or result.status_code == 304:
+            return None
+
+        # One pass over the content serves both the escalation and age gate checks
+        signals = get_response_classifier().classify(result.content)
+
+        escalation = EscalationHeuristics.should_escalate(
+            status_code=result.status_code,
+            content=result.content,
+            domain_profile=profile,
+            current_tier=tier,
+            signals=signals,
+        )
+        if escalation.should_escalate:
+            logger.info(
+                f"Heuristic escalation at Tier {tier} for {url}: "
+                f"{escalation.reason}"
+            )
+            return escalation.reason
+
+        age_gate = signals.age_gate
+        if age_gate.is_age_gate:
+            logger.info(
+                f"Age gate detected at Tier {tier} for {url}: "
+                f"{age_gate.reason}"
+            )
+            return f"age_gate: {age_gate.reason}"
+
+        return None
+
+    async def _fetch_hedged(
+        self,
+        url: str,
+        cookies: Dict[str, str],
+        profile: "DomainProfile",
+        hedge_delay: float,
+        conditional: bool = False,
+    ) -> Tuple[int, Optional[FetchResponse], Optional[str]]:
+        """
+        Race Tier 1 against a Tier 2 fetch started after hedge_delay.
+
+        Tier 2 starts as soon as Tier 1 fails or once hedge_delay elapses
+        without a Tier 1 answer. The first usable response wins and the other
+        attempt is cancelled. Every completed attempt is recorded on the
+        profile; a cancelled attempt is not, since it says nothing about the
+        tier.
+
+        Args:
+            url: URL to fetch
+            cookies: Cookies for both tiers
+            profile: Domain profile (updated in place)
+            hedge_delay: Seconds to wait for Tier 1 before starting Tier 2
+            conditional: Make the Tier 1 request conditional
+
+        Returns:
+            Tuple of (tier, response, last_error); response is None if
+            neither tier produced a usable response, or the failed Tier 1
+            response if it is not a page (not worth escalating)
+        """
+        from .feedback_recorder import FeedbackRecorder
+
+        async def _attempt(tier: int):
+            start_time = time.time()
+            error = None
+            result = None
+            try:
+                if tier == 1:
+                    result = await self._try_tier1(url, cookies, conditional, profile)
+                else:
+                    result = await self._try_tier2(url, cookies, profile)
+            except Exception as e:
+                error = str(e)
+                logger.error(f"Tier {tier} exception for {url}: {e}")
+            return tier, result, error, int((time.time() - start_time) * 1000)
+
+        tasks = {asyncio.ensure_future(_attempt(1))}
+        tier2_started = False
+        timeout = hedge_delay
+        last_tier = 1
+        last_error = None
+
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for tier, result, error, response_time_ms in sorted(
+                    (task.result() for task in done), key=lambda attempt: attempt[0]
+                ):
+                    last_tier = tier
+                    if result and result.success:
+                        reason = self._check_soft_failure(url, result, tier, profile)
+                        if not reason:
+                            FeedbackRecorder.record_fetch_result(
+                                profile=profile,
+                                tier=tier,
+                                success=True,
+                                response_time_ms=response_time_ms,
+                            )
+                            return tier, result, None
+                        FeedbackRecorder.record_fetch_result(
+                            profile=profile,
+                            tier=tier,
+                            success=False,
+                            response_time_ms=response_time_ms,
+                            escalation_reason=reason,
+                        )
+                        continue
+
+                    if result is not None and result.aborted == Tier1HttpxFetcher.ABORT_NOT_HTML:
+                        return tier, result, result.error
+
+                    last_error = error or (result.error if result else None) or "Unknown error"
+                    FeedbackRecorder.record_fetch_result(
+                        profile=profile,
+                        tier=tier,
+                        success=False,
+                        response_time_ms=response_time_ms,
+                        timed_out="timeout" in last_error.lower(),
+                        escalation_reason=last_error,
+                    )
+                    logger.warning(f"Tier {tier} failed for {url}: {last_error}")
+
+                if not tier2_started:
+                    logger.info(
+                        f"Hedging {url}: starting Tier 2 "
+                        f"({'Tier 1 failed' if done else f'no Tier 1 answer after {hedge_delay}s'})"
+                    )
+                    tasks.add(asyncio.ensure_future(_attempt(2)))
+                    tier2_started = True
+                    timeout = None
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return last_tier, None, last_error
+
+    async def fetch_many(
+        self,
+        urls: Iterable[str],
+        source=None,
+        crawl_job=None,
+        force_tier: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        domain_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, FetchResult]]:
+        """
+        Fetch many URLs concurrently, yielding results as they complete.
+
+        Each URL goes through fetch() under a global semaphore and its
+        domain's learned concurrency window. Domain profiles are loaded once
+        per domain and shared by that domain's fetches, so the window adapts
+        as the batch runs. Closing the iterator early (e.g.
+        breaking out of ``async for``) cancels the fetches still pending.
+
+        Usage:
+            async for url, result in router.fetch_many(urls):
+                ...
+
+        Args:
+            urls: URLs to fetch
+            source: CrawlerSource instance (for cookies and tier3 flag)
+            crawl_job: CrawlJob instance (for cost tracking)
+            force_tier: Force specific tier (1, 2, or 3)
+            concurrency: Maximum fetches in flight
+                (default: CRAWLER_FETCH_CONCURRENCY)
+            domain_concurrency: Fixed cap on fetches in flight per domain for
+                this batch, on top of the learned window (default: no cap)
+
+        Yields:
+            Tuples of (url, FetchResult) in completion order
+        """
+        urls = list(urls)
+        if not urls:
+            return
+
+        concurrency = concurrency or getattr(settings, "CRAWLER_FETCH_CONCURRENCY", 8)
+        global_semaphore = asyncio.Semaphore(concurrency)
+        domain_semaphores: Dict[str, Any] = {}
+        profiles: Dict[str, "DomainProfile"] = {}
+
+        for url in urls:
+            domain = extract_domain(url)
+            if domain not in profiles:
+                profiles[domain] = self._get_domain_profile(domain)
+                domain_semaphores[domain] = (
+                    asyncio.Semaphore(domain_concurrency)
+                    if domain_concurrency else contextlib.nullcontext()
+                )
+
+        async def _fetch_one(url: str) -> Tuple[str, FetchResult]:
+            domain = extract_domain(url)
+            # Domain slots first, so a throttled domain never holds a global
+            # slot; fetch() reuses the window slot held here
+            async with domain_semaphores[domain], self._concurrency.slot(domain, profiles[domain]):
+                async with global_semaphore:
+                    try:
+                        result = await self.fetch(
+                            url,
+                            source=source,
+                            crawl_job=crawl_job,
+                            force_tier=force_tier,
+                            profile=profiles[domain],
+                        )
+                    except Exception as e:
+                        logger.error(f"Unexpected error fetching {url}: {e}")
+                        result = FetchResult(
+                            content="",
+                            status_code=0,
+                            headers={},
+                            success=False,
+                            tier_used=force_tier or 1,
+                            error=str(e),
+                        )
+            return url, result
+
+        tasks = [asyncio.ensure_future(_fetch_one(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     def _add_fetch_breadcrumb(self, url: str, source) -> None:
         """Add Sentry breadcrumb for fetch operation."""
         try:
@@ -442,23 +897,85 @@ class SmartRouter:
         self,
         url: str,
         cookies: Dict[str, str],
+        conditional: bool = False,
+        profile: Optional["DomainProfile"] = None,
     ) -> FetchResponse:
-        """Attempt Tier 1 fetch."""
+        """
+        Attempt Tier 1 fetch.
+
+        When conditional, sends the URL's stored validators (see
+        save_validators for how they are recorded). Uses HTTP/2 unless the
+        domain profile has learned it is incompatible, and records the
+        outcome on the profile. With streaming enabled the body is capped at
+        the domain's byte limit.
+        """
+        from .feedback_recorder import FeedbackRecorder
+
         logger.debug(f"Trying Tier 1 for {url}")
         fetcher = self._get_tier1_fetcher()
+        validators = None
+        if conditional:
+            validators = self._get_validator_store().get_validators(url)
+
+        http2 = (
+            profile is not None
+            and profile.http2_compatible is not False
+            and getattr(settings, "CRAWLER_TIER1_HTTP2_ENABLED", True)
+        )
+
+        # Stream the body under the domain's size cap
+        max_bytes = None
+        if getattr(settings, "CRAWLER_TIER1_STREAMING_ENABLED", True):
+            max_bytes = (
+                profile.manual_override_max_body_bytes if profile is not None else None
+            ) or getattr(settings, "CRAWLER_TIER1_MAX_BODY_BYTES", 5 * 1024 * 1024)
+
         # Don't use default cookies - some sites respond differently when they see
         # age gate cookies they don't recognize. Only use source-specific cookies.
-        return await fetcher.fetch(url, cookies=cookies, use_default_cookies=False)
+        result = await fetcher.fetch(
+            url,
+            cookies=cookies,
+            use_default_cookies=False,
+            validators=validators,
+            http2=http2,
+            max_bytes=max_bytes,
+        )
+        if http2:
+            FeedbackRecorder.record_http2_result(profile, result.http2_outcome)
+        return result
+
+    def save_validators(self, result: FetchResult) -> None:
+        """
+        Store the validators of a conditional fetch for the next crawl.
+
+        Call once the page has been processed successfully. Only responses
+        that passed the soft-failure checks carry validators, so an age gate
+        or challenge page never becomes the "unchanged" baseline, and a page
+        whose extraction failed is fetched and processed again next time.
+
+        Args:
+            result: FetchResult from fetch(conditional=True)
+        """
+        if result.validators is not None:
+            self._get_validator_store().save_validators(result.validators)
 
     async def _try_tier2(
         self,
         url: str,
         cookies: Dict[str, str],
+        profile: Optional["DomainProfile"] = None,
     ) -> FetchResponse:
-        """Attempt Tier 2 fetch."""
+        """Attempt Tier 2 fetch, applying the domain's resource allowlist."""
+        from .resource_blocking import ResourceBlocker
+
         logger.debug(f"Trying Tier 2 for {url}")
         fetcher = self._get_tier2_fetcher()
-        return await fetcher.fetch(url, cookies=cookies, solve_age_gate=True)
+        return await fetcher.fetch(
+            url,
+            cookies=cookies,
+            solve_age_gate=True,
+            resource_blocker=ResourceBlocker.for_profile(profile),
+        )
 
     async def _try_tier3(
         self,
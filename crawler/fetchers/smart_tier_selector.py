@@ -43,6 +43,10 @@ class SmartTierSelector:
     # Minimum success rate to consider a tier viable
     MIN_VIABLE_SUCCESS_RATE = 0.50  # 50%
 
+    # Tier 1 success rates in [MIN_VIABLE, HEDGE_MAX) are "uncertain":
+    # Tier 1 is still tried, but hedged with a delayed Tier 2
+    HEDGE_MAX_SUCCESS_RATE = 0.85
+
     @classmethod
     def select_starting_tier(
         cls,
@@ -153,6 +157,32 @@ class SmartTierSelector:
         # Default to tier 3 if lower tiers aren't viable
         return 3
 
+    @classmethod
+    def should_hedge(
+        cls,
+        domain_profile: "DomainProfile",
+        start_tier: int,
+    ) -> bool:
+        """
+        Check if a Tier 1 fetch should be hedged with a delayed Tier 2.
+
+        Hedging applies when Tier 1 is the starting tier, no manual override
+        pins the tier, and the Tier 1 success rate is viable but uncertain
+        (between MIN_VIABLE_SUCCESS_RATE and HEDGE_MAX_SUCCESS_RATE).
+
+        Args:
+            domain_profile: Domain's historical performance profile
+            start_tier: Starting tier chosen by select_starting_tier()
+
+        Returns:
+            True if Tier 1 and Tier 2 should be raced
+        """
+        if start_tier != 1 or domain_profile.manual_override_tier:
+            return False
+
+        rate = domain_profile.tier1_success_rate
+        return cls.MIN_VIABLE_SUCCESS_RATE <= rate < cls.HEDGE_MAX_SUCCESS_RATE
+
     @classmethod
     def should_retry_lower_tier(
         cls,
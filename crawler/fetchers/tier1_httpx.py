@@ -3,20 +3,61 @@ Tier 1 Content Fetcher - httpx with cookie injection.
 
 The fastest and lowest cost fetching tier. Uses async httpx with HTTP/2 support.
 Injects age gate cookies from CrawlerSource configuration or default fallbacks.
+Supports conditional re-fetches with stored ETag/Last-Modified validators.
+Advertises brotli and zstd transfer encodings when httpx can decode them.
+Domains learned to be HTTP/2 compatible are fetched over a separate
+multiplexed HTTP/2 client; everything else stays on HTTP/1.1.
+Streamed reads cap the body size and abandon non-HTML responses, CAPTCHA
+pages and age gates before reading them in full.
 """
 
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import httpx
 
 from django.conf import settings
 
+if TYPE_CHECKING:
+    from .validator_cache import HTTPValidators
+
 logger = logging.getLogger(__name__)
 
 
+def supported_content_encodings() -> str:
+    """
+    Build the Accept-Encoding value from the decoders httpx has available.
+
+    httpx only registers the brotli and zstd decoders when the optional
+    brotli/zstandard packages are installed (httpx[brotli,zstd]). Servers
+    must never be offered an encoding httpx would pass through undecoded.
+
+    Returns:
+        Accept-Encoding header value, preferred encodings first
+    """
+    from httpx._decoders import SUPPORTED_DECODERS
+
+    preferred = ("zstd", "br", "gzip", "deflate")
+    return ", ".join(e for e in preferred if e in SUPPORTED_DECODERS)
+
+
+class ResponseAborted(Exception):
+    """A streamed response was abandoned before its body was read in full."""
+
+    def __init__(self, reason: str, message: str, response: httpx.Response):
+        """
+        Args:
+            reason: Abort reason (Tier1HttpxFetcher.ABORT_*)
+            message: Error message for the fetch result
+            response: The abandoned response (status and headers only)
+        """
+        super().__init__(message)
+        self.reason = reason
+        self.response = response
+
+
 @dataclass
 class FetchResponse:
     """Response from a fetch operation."""
@@ -27,6 +68,14 @@ class FetchResponse:
     success: bool
     error: Optional[str] = None
     tier: int = 1
+    # Page unchanged since the validators were stored (304, or same body hash)
+    not_modified: bool = False
+    # Outcome of an HTTP/2 attempt, for per-domain learning (see HTTP2_*)
+    http2_outcome: Optional[str] = None
+    # Body cut off at the byte cap of a streamed read
+    truncated: bool = False
+    # Why a streamed read was abandoned (see ABORT_*)
+    aborted: Optional[str] = None
 
 
 class Tier1HttpxFetcher:
@@ -39,8 +88,32 @@ class Tier1HttpxFetcher:
     - Cookie injection for age gate bypass
     - Configurable timeout and retry logic
     - Default fallback cookies for unknown domains
+    - Conditional requests (If-None-Match / If-Modified-Since)
+    - zstd/brotli/gzip transfer decoding with undecoded-body rejection
+    - Opt-in HTTP/2 per fetch with HTTP/1.1 fallback
+    - Opt-in streamed reads with a body size cap and early abort
     """
 
+    # http2_outcome values
+    HTTP2_OK = "ok"  # Request multiplexed over HTTP/2
+    HTTP2_UNSUPPORTED = "unsupported"  # Server only negotiated HTTP/1.1
+    HTTP2_FALLBACK = "fallback"  # HTTP/2 failed where HTTP/1.1 succeeded
+
+    # Statuses that point at HTTP/2 trouble rather than at the page
+    # (misdirected request, HTTP version not supported); only these and
+    # transport errors are retried over HTTP/1.1
+    HTTP2_RETRY_STATUSES = frozenset({421, 505})
+
+    # aborted values for streamed reads
+    ABORT_NOT_HTML = "not_html"  # Content type is not a page (no tier can help)
+    ABORT_CHALLENGE = "challenge"  # CAPTCHA markers in the first chunks
+    ABORT_AGE_GATE = "age_gate"  # Age gate keywords in the first chunks
+
+    # Content types a streamed read accepts (substring match)
+    STREAM_CONTENT_TYPES = ("html", "xml", "text/plain")
+    # Body prefix checked for challenge and age gate markers
+    EARLY_CHECK_BYTES = 32 * 1024
+
     # Use a browser User-Agent to avoid bot detection
     # Many sites serve different content or block crawler user agents
     DEFAULT_USER_AGENT = (
@@ -49,13 +122,13 @@ class Tier1HttpxFetcher:
         "Chrome/120.0.0.0 Safari/537.36"
     )
 
-    # Note: Removed 'br' (brotli) from Accept-Encoding because httpx doesn't
-    # decompress brotli by default, resulting in garbled content with null chars.
-    # Only request gzip/deflate which httpx handles correctly.
+    # Only offer encodings httpx can decode: without the brotli package a 'br'
+    # body is passed through undecoded, resulting in garbled content with null
+    # chars. _check_decoded_body() rejects any such body that still gets through.
     DEFAULT_HEADERS = {
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate",
+        "Accept-Encoding": supported_content_encodings(),
         "Connection": "keep-alive",
         "Cache-Control": "max-age=0",
     }
@@ -83,6 +156,7 @@ class Tier1HttpxFetcher:
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
 
         self._http_client: Optional[httpx.AsyncClient] = None
+        self._http2_client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -93,28 +167,43 @@ class Tier1HttpxFetcher:
         """Async context manager exit."""
         await self.close()
 
-    async def _init_http_client(self):
-        """Initialize HTTP client."""
-        if self._http_client is None:
-            headers = {
+    def _build_client(self, http2: bool) -> httpx.AsyncClient:
+        """Build an HTTP client; connections are kept alive for reuse."""
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            headers={
                 **self.DEFAULT_HEADERS,
                 "User-Agent": self.user_agent,
-            }
+            },
+            follow_redirects=True,
+            http2=http2,
+            limits=httpx.Limits(
+                keepalive_expiry=getattr(settings, "CRAWLER_TIER1_KEEPALIVE_EXPIRY", 30),
+            ),
+        )
 
+    async def _init_http_client(self):
+        """Initialize HTTP client."""
+        if self._http_client is None:
             # Note: http2=False to match original enrichment pipeline behavior
-            # Some sites handle HTTP/2 differently and may block H2 requests
-            self._http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                headers=headers,
-                follow_redirects=True,
-                http2=False,
-            )
+            # Some sites handle HTTP/2 differently and may block H2 requests;
+            # H2 is only used via the separate client for domains learned to
+            # handle it (see fetch(http2=True))
+            self._http_client = self._build_client(http2=False)
+
+    async def _init_http2_client(self):
+        """Initialize the HTTP/2 client (one multiplexed connection per host)."""
+        if self._http2_client is None:
+            self._http2_client = self._build_client(http2=True)
 
     async def close(self):
-        """Close HTTP client connection."""
+        """Close HTTP client connections."""
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        if self._http2_client:
+            await self._http2_client.aclose()
+            self._http2_client = None
 
     def _get_default_cookies(self) -> Dict[str, str]:
         """Get default age gate cookies from settings."""
@@ -137,6 +226,9 @@ class Tier1HttpxFetcher:
         cookies: Optional[Dict[str, str]] = None,
         custom_headers: Optional[Dict[str, str]] = None,
         use_default_cookies: bool = True,
+        validators: Optional["HTTPValidators"] = None,
+        http2: bool = False,
+        max_bytes: Optional[int] = None,
     ) -> FetchResponse:
         """
         Fetch URL content with cookie injection.
@@ -146,6 +238,14 @@ class Tier1HttpxFetcher:
             cookies: Source-specific cookies to inject
             custom_headers: Additional headers to include
             use_default_cookies: Whether to merge default cookies if source cookies are empty
+            validators: Stored validators; makes the request conditional and
+                sets not_modified on a 304 or an unchanged body
+            http2: Try HTTP/2 first, falling back to HTTP/1.1 if it fails;
+                the result's http2_outcome reports what happened
+            max_bytes: Stream the body and keep at most this many (decoded)
+                bytes, setting truncated if the cap is hit. Non-HTML content
+                types, CAPTCHA pages and age gates abort the read and return
+                a failure with aborted set.
 
         Returns:
             FetchResponse with content, status, and metadata
@@ -162,15 +262,40 @@ class Tier1HttpxFetcher:
 
         # Build headers
         request_headers = {}
+        if validators:
+            request_headers.update(validators.conditional_headers())
         if custom_headers:
             request_headers.update(custom_headers)
 
         try:
-            response = await self._fetch_with_retry(
-                url=url,
-                cookies=request_cookies,
-                headers=request_headers,
-            )
+            response = None
+            http2_outcome = None
+            if http2:
+                response, http2_outcome = await self._fetch_http2(
+                    url, request_cookies, request_headers, max_bytes=max_bytes
+                )
+
+            if response is None:
+                response = await self._fetch_with_retry(
+                    url=url,
+                    cookies=request_cookies,
+                    headers=request_headers,
+                    max_bytes=max_bytes,
+                )
+                if http2 and response.status_code < 400:
+                    http2_outcome = self.HTTP2_FALLBACK
+
+            if response.status_code == 304 and validators:
+                logger.debug(f"Tier 1 not modified: {url}")
+                return FetchResponse(
+                    content="",
+                    status_code=304,
+                    headers=dict(response.headers),
+                    success=True,
+                    tier=1,
+                    not_modified=True,
+                    http2_outcome=http2_outcome,
+                )
 
             is_success = 200 <= response.status_code < 400
             error_msg = None
@@ -178,13 +303,52 @@ class Tier1HttpxFetcher:
                 error_msg = f"HTTP {response.status_code}"
                 logger.warning(f"Tier 1 HTTP {response.status_code} for {url}")
 
+            if is_success:
+                decode_error = self._check_decoded_body(response)
+                if decode_error:
+                    logger.warning(f"Tier 1 {decode_error} for {url}")
+                    return FetchResponse(
+                        content="",
+                        status_code=response.status_code,
+                        headers=dict(response.headers),
+                        success=False,
+                        error=decode_error,
+                        tier=1,
+                        http2_outcome=http2_outcome,
+                    )
+
+            content = response.text
+            truncated = max_bytes is not None and len(response.content) >= max_bytes
+            if truncated:
+                logger.info(f"Tier 1 body of {url} truncated at {max_bytes} bytes")
+            not_modified = False
+            if is_success and validators and validators.content_hash:
+                from .validator_cache import compute_content_hash
+
+                not_modified = compute_content_hash(content) == validators.content_hash
+
             return FetchResponse(
-                content=response.text,
+                content=content,
                 status_code=response.status_code,
                 headers=dict(response.headers),
                 success=is_success,
                 error=error_msg,
                 tier=1,
+                not_modified=not_modified,
+                http2_outcome=http2_outcome,
+                truncated=truncated,
+            )
+
+        except ResponseAborted as e:
+            logger.info(f"Tier 1 aborted {url}: {e}")
+            return FetchResponse(
+                content="",
+                status_code=e.response.status_code,
+                headers=dict(e.response.headers),
+                success=False,
+                error=str(e),
+                tier=1,
+                aborted=e.reason,
             )
 
         except httpx.TimeoutException as e:
@@ -220,11 +384,187 @@ class Tier1HttpxFetcher:
                 tier=1,
             )
 
+    async def _fetch_http2(
+        self,
+        url: str,
+        cookies: Dict[str, str],
+        headers: Dict[str, str],
+        max_bytes: Optional[int] = None,
+    ) -> Tuple[Optional[httpx.Response], Optional[str]]:
+        """
+        Attempt a single fetch over the HTTP/2 client.
+
+        Protocol errors and HTTP2_RETRY_STATUSES are not retried here; the
+        caller falls back to HTTP/1.1, which tells apart hosts that misbehave
+        with H2 from pages that are simply failing. Other error statuses
+        (404, 429, 503, ...) are returned as they are, so a rate-limited host
+        is not hit again at once. Timeouts propagate, as they say nothing
+        about H2 support.
+
+        Returns:
+            Tuple of (response, http2_outcome); response is None when the
+            caller should fall back to HTTP/1.1
+        """
+        await self._init_http2_client()
+        try:
+            response = await self._get(self._http2_client, url, cookies, headers, max_bytes)
+        except httpx.TimeoutException:
+            raise
+        except httpx.TransportError as e:
+            logger.info(f"Tier 1 HTTP/2 failed for {url}, retrying over HTTP/1.1: {e}")
+            return None, None
+
+        if response.status_code in self.HTTP2_RETRY_STATUSES:
+            logger.info(
+                f"Tier 1 HTTP/2 got HTTP {response.status_code} for {url}, "
+                f"retrying over HTTP/1.1"
+            )
+            return None, None
+
+        if response.http_version == "HTTP/2":
+            return response, self.HTTP2_OK
+        return response, self.HTTP2_UNSUPPORTED
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        cookies: Dict[str, str],
+        headers: Dict[str, str],
+        max_bytes: Optional[int] = None,
+    ) -> httpx.Response:
+        """
+        GET a URL, reading the whole body or streaming at most max_bytes.
+
+        Raises:
+            ResponseAborted: If the streamed response is not worth reading
+        """
+        if max_bytes is None:
+            return await client.get(url, cookies=cookies, headers=headers)
+
+        request = client.build_request("GET", url, cookies=cookies, headers=headers)
+        response = await client.send(request, stream=True)
+        try:
+            await self._read_capped(response, max_bytes)
+        finally:
+            # Closes the connection if the body was not read to the end
+            await response.aclose()
+        return response
+
+    async def _read_capped(self, response: httpx.Response, max_bytes: int) -> None:
+        """
+        Read a streamed body up to max_bytes, aborting unusable responses.
+
+        The content type is checked before reading; the first
+        EARLY_CHECK_BYTES of a 200 response are checked for CAPTCHA and age
+        gate markers.
+
+        Args:
+            response: Response opened with stream=True
+            max_bytes: Maximum decoded body size to keep
+
+        Raises:
+            ResponseAborted: For non-HTML content, CAPTCHA pages and age gates
+        """
+        if 200 <= response.status_code < 300:
+            content_type = response.headers.get("content-type", "").lower()
+            if content_type and not any(t in content_type for t in self.STREAM_CONTENT_TYPES):
+                raise ResponseAborted(
+                    self.ABORT_NOT_HTML,
+                    f"Non-HTML content type: {content_type.split(';')[0].strip()}",
+                    response,
+                )
+
+        chunks = []
+        size = 0
+        checked = response.status_code != 200
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+            if not checked and size >= self.EARLY_CHECK_BYTES:
+                checked = True
+                self._check_early_markers(b"".join(chunks), response)
+
+        # Make .content/.text return the (possibly capped) decoded body
+        response._content = b"".join(chunks)[:max_bytes]
+
+    def _check_early_markers(self, prefix: bytes, response: httpx.Response) -> None:
+        """
+        Abort a body whose first chunks show it is a CAPTCHA page or age gate.
+
+        Both are decided by marker presence alone, so the full body would be
+        rejected by the router's soft-failure checks too. Cloudflare
+        challenges are left to those checks, since their rule depends on the
+        full page size.
+
+        Raises:
+            ResponseAborted: If markers were found
+        """
+        from .response_classifier import get_response_classifier
+
+        signals = get_response_classifier().classify(prefix.decode("utf-8", errors="replace"))
+        if signals.captcha:
+            raise ResponseAborted(
+                self.ABORT_CHALLENGE, "CAPTCHA challenge detected", response
+            )
+        if signals.age_gate.keyword_matched:
+            raise ResponseAborted(
+                self.ABORT_AGE_GATE,
+                f"Age gate detected: '{signals.age_gate.keyword_matched}'",
+                response,
+            )
+
+    # Share of control bytes above which a text body is considered binary
+    BINARY_CONTROL_RATIO = 0.1
+    BINARY_SNIFF_BYTES = 2048
+    TEXT_CONTROL_BYTES = frozenset(b"\t\n\r\f\x1b")
+
+    def _check_decoded_body(self, response: httpx.Response) -> Optional[str]:
+        """
+        Check that a text response body was actually transfer-decoded.
+
+        Catches bodies in an encoding httpx has no decoder for (passed
+        through as-is) and servers that compress without announcing it.
+
+        Args:
+            response: httpx response with the body read
+
+        Returns:
+            Error message if the body is undecoded binary, None otherwise
+        """
+        from httpx._decoders import SUPPORTED_DECODERS
+
+        content_encoding = response.headers.get("content-encoding", "").lower()
+        for encoding in filter(None, (e.strip() for e in content_encoding.split(","))):
+            if encoding not in SUPPORTED_DECODERS:
+                return f"Undecoded body (unsupported content-encoding: {encoding})"
+
+        content_type = response.headers.get("content-type", "").lower()
+        if content_type and not any(
+            t in content_type for t in ("text/", "xml", "json", "javascript")
+        ):
+            return None
+
+        sample = response.content[: self.BINARY_SNIFF_BYTES]
+        if not sample or sample.startswith((b"\xff\xfe", b"\xfe\xff")):
+            # Empty, or UTF-16 (which legitimately contains null bytes)
+            return None
+        control = sum(
+            1 for b in sample if b < 0x20 and b not in self.TEXT_CONTROL_BYTES
+        )
+        if b"\x00" in sample or control / len(sample) > self.BINARY_CONTROL_RATIO:
+            encoding_note = content_encoding or "none"
+            return f"Undecoded binary body (content-encoding: {encoding_note})"
+        return None
+
     async def _fetch_with_retry(
         self,
         url: str,
         cookies: Dict[str, str],
         headers: Dict[str, str],
+        max_bytes: Optional[int] = None,
     ) -> httpx.Response:
         """
         Fetch with exponential backoff retry logic.
@@ -235,19 +575,21 @@ class Tier1HttpxFetcher:
 
         for attempt in range(self.max_retries):
             try:
-                response = await self._http_client.get(
-                    url,
-                    cookies=cookies,
-                    headers=headers,
+                response = await self._get(
+                    self._http_client, url, cookies, headers, max_bytes
                 )
 
-                # Don't retry on 4xx client errors
-                if 400 <= response.status_code < 500:
+                # Don't retry on 4xx client errors; 304 answers a conditional request
+                if 400 <= response.status_code < 500 or response.status_code == 304:
                     return response
 
                 response.raise_for_status()
                 return response
 
+            except ResponseAborted:
+                # Deliberate; retrying would get the same response
+                raise
+
             except httpx.TimeoutException as e:
                 last_error = e
                 logger.warning(
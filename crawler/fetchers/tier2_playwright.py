@@ -2,7 +2,9 @@
 Tier 2 Content Fetcher - Playwright headless browser.
 
 Used when Tier 1 fails due to JavaScript requirements or age gates.
-Features semantic age gate click solving and session cookie persistence.
+Features semantic age gate click solving, session cookie persistence,
+warm per-domain browser contexts (see context_pool) and blocking of
+images, fonts, media and trackers (see resource_blocking).
 """
 
 import asyncio
@@ -14,6 +16,8 @@ from typing import Dict, List, Optional
 from django.conf import settings
 
 from .age_gate import get_age_gate_button_selectors
+from .context_pool import BrowserContextPool
+from .resource_blocking import ResourceBlocker
 from .tier1_httpx import FetchResponse
 
 logger = logging.getLogger(__name__)
@@ -43,6 +47,8 @@ class Tier2PlaywrightFetcher:
     - Lazy Playwright initialization (import on first use)
     - Age gate semantic click solver
     - Session cookie persistence to Redis
+    - Warm browser contexts reused per domain (BrowserContextPool)
+    - Image/font/media/tracker request blocking (ResourceBlocker)
     - JavaScript-rendered content capture
     """
 
@@ -65,6 +71,10 @@ class Tier2PlaywrightFetcher:
 
         self._playwright = None
         self._browser = None
+        self._context_pool = BrowserContextPool()
+        self.block_resources = getattr(settings, "CRAWLER_TIER2_BLOCK_RESOURCES", True)
+        # Current ResourceBlocker per domain, read by the contexts' route handlers
+        self._resource_blockers: Dict[str, ResourceBlocker] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -111,6 +121,8 @@ class Tier2PlaywrightFetcher:
         """Close browser and Playwright instance."""
         global _playwright, _browser
 
+        await self._context_pool.close()
+
         if _browser:
             await _browser.close()
             _browser = None
@@ -203,6 +215,7 @@ class Tier2PlaywrightFetcher:
         url: str,
         cookies: Optional[Dict[str, str]] = None,
         solve_age_gate: bool = True,
+        resource_blocker: Optional[ResourceBlocker] = None,
     ) -> FetchResponse:
         """
         Fetch URL content using headless browser.
@@ -211,6 +224,8 @@ class Tier2PlaywrightFetcher:
             url: URL to fetch
             cookies: Initial cookies to set
             solve_age_gate: Whether to attempt age gate solving
+            resource_blocker: Blocker with the domain's allowlist
+                (default: ResourceBlocker() when resource blocking is enabled)
 
         Returns:
             FetchResponse with rendered content
@@ -223,18 +238,49 @@ class Tier2PlaywrightFetcher:
         parsed = urlparse(url)
         domain = parsed.netloc
 
-        # Create new browser context with cookies
-        context = await self._browser.new_context()
+        if self.block_resources:
+            self._resource_blockers[domain] = resource_blocker or ResourceBlocker()
 
-        try:
-            # Load cached cookies from Redis
+        async def _route(route):
+            blocker = self._resource_blockers.get(domain)
+            if blocker:
+                await blocker.handle_route(route)
+            else:
+                await route.continue_()
+
+        async def _prime_context(context):
+            if self.block_resources:
+                await context.route("**/*", _route)
+
+            # Load cached cookies from Redis into a new context
             cached_cookies = await self._load_cookies_from_redis(domain)
             if cached_cookies:
                 await context.add_cookies(cached_cookies)
                 logger.debug(f"Loaded {len(cached_cookies)} cached cookies for {domain}")
 
-            # Add provided cookies
-            if cookies:
+        # Lease a warm context for the domain (created and primed on first use)
+        try:
+            entry = await self._context_pool.acquire(
+                self._browser, domain, setup=_prime_context
+            )
+        except Exception as e:
+            logger.error(f"Tier 2 context error for {url}: {e}")
+            return FetchResponse(
+                content="",
+                status_code=0,
+                headers={},
+                success=False,
+                error=str(e),
+                tier=2,
+            )
+
+        context = entry.context
+        page = entry.page
+        reusable = False
+
+        try:
+            # Add provided cookies unless the live context already has them
+            if cookies and entry.source_cookies != cookies:
                 cookie_list = [
                     {
                         "name": name,
@@ -245,59 +291,43 @@ class Tier2PlaywrightFetcher:
                     for name, value in cookies.items()
                 ]
                 await context.add_cookies(cookie_list)
+                entry.source_cookies = dict(cookies)
 
-            # Create page and navigate
-            page = await context.new_page()
+            response = await page.goto(
+                url,
+                wait_until="networkidle",
+                timeout=self.timeout * 1000,
+            )
 
-            try:
-                response = await page.goto(
-                    url,
-                    wait_until="networkidle",
-                    timeout=self.timeout * 1000,
-                )
-
-                # Attempt age gate solving if enabled
-                if solve_age_gate:
-                    age_gate_clicked = await self._try_click_age_gate(page)
-                    if age_gate_clicked:
-                        logger.info(f"Age gate solved for {url}")
-
-                # Wait for content to stabilize
-                await page.wait_for_load_state("domcontentloaded")
-
-                # Get rendered content
-                content = await page.content()
-                status_code = response.status if response else 200
-
-                # Save session cookies to Redis
-                cookies_to_save = await context.cookies()
-                if cookies_to_save:
-                    await self._save_cookies_to_redis(domain, cookies_to_save)
-
-                return FetchResponse(
-                    content=content,
-                    status_code=status_code,
-                    headers=dict(response.headers) if response else {},
-                    success=200 <= status_code < 400,
-                    tier=2,
-                )
+            # Attempt age gate solving if enabled
+            if solve_age_gate:
+                age_gate_clicked = await self._try_click_age_gate(page)
+                if age_gate_clicked:
+                    logger.info(f"Age gate solved for {url}")
 
-            except Exception as e:
-                logger.error(f"Tier 2 page error for {url}: {e}")
-                return FetchResponse(
-                    content="",
-                    status_code=0,
-                    headers={},
-                    success=False,
-                    error=str(e),
-                    tier=2,
-                )
-
-            finally:
-                await page.close()
+            # Wait for content to stabilize
+            await page.wait_for_load_state("domcontentloaded")
+
+            # Get rendered content
+            content = await page.content()
+            status_code = response.status if response else 200
+
+            # Save session cookies to Redis
+            cookies_to_save = await context.cookies()
+            if cookies_to_save:
+                await self._save_cookies_to_redis(domain, cookies_to_save)
+
+            reusable = True
+            return FetchResponse(
+                content=content,
+                status_code=status_code,
+                headers=dict(response.headers) if response else {},
+                success=200 <= status_code < 400,
+                tier=2,
+            )
 
         except Exception as e:
-            logger.error(f"Tier 2 context error for {url}: {e}")
+            logger.error(f"Tier 2 page error for {url}: {e}")
             return FetchResponse(
                 content="",
                 status_code=0,
@@ -308,4 +338,5 @@ class Tier2PlaywrightFetcher:
             )
 
         finally:
-            await context.close()
+            # A context that hit a page error is closed rather than reused
+            await self._context_pool.release(entry, reusable=reusable)
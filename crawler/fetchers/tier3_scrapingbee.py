@@ -4,6 +4,9 @@ Tier 3 Content Fetcher - ScrapingBee API.
 Used as a last resort when Tier 1 and Tier 2 fail due to anti-bot protections.
 Provides premium proxy rotation and JavaScript rendering.
 Tracks costs per request for budget monitoring.
+
+Requests go through ScrapingBeeClient's async path: a shared connection
+pool, and a credit budget that caps how many Tier 3 fetches overlap.
 """
 
 import logging
@@ -27,6 +30,7 @@ class Tier3ScrapingBeeFetcher:
     - JavaScript rendering
     - Cost tracking per request
     - Automatic retry handling by ScrapingBee
+    - Non-blocking requests, capped by the remaining credit budget
     """
 
     # Cost per request in cents (based on ScrapingBee pricing)
@@ -60,15 +64,10 @@ class Tier3ScrapingBeeFetcher:
                 "Set SCRAPINGBEE_API_KEY in settings."
             )
 
-        try:
-            from scrapingbee import ScrapingBeeClient
-            self._client = ScrapingBeeClient(api_key=self.api_key)
-            logger.info("ScrapingBee client initialized for Tier 3 fetching")
-        except ImportError:
-            raise RuntimeError(
-                "ScrapingBee package not installed. "
-                "Install with: pip install scrapingbee"
-            )
+        from crawler.services.scrapingbee_client import ScrapingBeeClient
+
+        self._client = ScrapingBeeClient(api_key=self.api_key)
+        logger.info("ScrapingBee client initialized for Tier 3 fetching")
 
     async def fetch(
         self,
@@ -115,19 +114,16 @@ class Tier3ScrapingBeeFetcher:
                 )
                 params["cookies"] = cookie_str
 
-            # Make request (ScrapingBee client is synchronous)
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._client.get(url, params=params)
+            # ScrapingBee's own timeout covers rendering; allow for transfer
+            response = await self._client.aget(
+                url, params=params, timeout=self.timeout + 30
             )
 
             # Track cost
             await self._track_cost(crawl_job)
 
             # Parse response
-            if response.ok:
+            if response.is_success:
                 return FetchResponse(
                     content=response.text,
                     status_code=response.status_code,
@@ -0,0 +1,199 @@
+"""
+HTTP Validator Cache for conditional Tier 1 re-fetches.
+
+Stores the ETag, Last-Modified and content hash of each fetched page, keyed
+by canonical URL, so recurring crawls can send If-None-Match /
+If-Modified-Since and let the server answer 304 Not Modified instead of
+re-sending the body. The content hash also catches servers that ignore
+validators but return an identical body.
+
+Components:
+- HTTPValidators: Dataclass with the validators for one URL
+- ValidatorStore: Cache-backed storage (same backend as DomainIntelligenceStore)
+
+Usage:
+    store = ValidatorStore()
+    validators = store.get_validators(url)
+    headers = validators.conditional_headers() if validators else {}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize a URL for validator lookups.
+
+    Lowercases scheme and host, drops default ports, the fragment and a
+    trailing slash. Path and query are kept as-is since they are case
+    sensitive.
+
+    Args:
+        url: URL to canonicalize
+
+    Returns:
+        Canonical URL string
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rsplit(":", 1)[-1]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    path = parts.path.rstrip("/")
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+def compute_content_hash(content: str) -> str:
+    """Compute SHA-256 hash of page content."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+@dataclass
+class HTTPValidators:
+    """
+    Cache validators from the last full fetch of a URL.
+
+    Attributes:
+        url: Canonical URL
+        etag: ETag response header
+        last_modified: Last-Modified response header
+        content_hash: SHA-256 of the last fetched body
+    """
+
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, url: str, headers: Dict[str, str], content: str) -> HTTPValidators:
+        """
+        Build validators from a full (200) response.
+
+        Args:
+            url: Fetched URL
+            headers: Response headers
+            content: Response body
+
+        Returns:
+            HTTPValidators for the URL
+        """
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        return cls(
+            url=canonicalize_url(url),
+            etag=lowered.get("etag"),
+            last_modified=lowered.get("last-modified"),
+            content_hash=compute_content_hash(content),
+        )
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Get the conditional request headers for these validators.
+
+        Returns:
+            Dict with If-None-Match and/or If-Modified-Since
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_json(self) -> str:
+        """Serialize validators to JSON string."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, json_str: str) -> HTTPValidators:
+        """Deserialize validators from JSON string."""
+        return cls(**json.loads(json_str))
+
+
+class ValidatorStore:
+    """
+    Cache-backed storage for HTTP validators.
+
+    Attributes:
+        CACHE_ALIAS: Django cache alias to use (default: "default")
+        KEY_PREFIX: Prefix for cache keys
+    """
+
+    CACHE_ALIAS = "default"
+    KEY_PREFIX = "http_validators:"
+
+    def __init__(self, cache_alias: str = None, ttl_seconds: Optional[int] = None):
+        """
+        Initialize the store.
+
+        Args:
+            cache_alias: Optional Django cache alias override
+            ttl_seconds: Validator lifetime (default: CRAWLER_VALIDATOR_TTL_DAYS)
+        """
+        self._cache_alias = cache_alias or self.CACHE_ALIAS
+        self.ttl_seconds = ttl_seconds or (
+            getattr(settings, "CRAWLER_VALIDATOR_TTL_DAYS", 30) * 24 * 60 * 60
+        )
+
+    @property
+    def _cache(self):
+        """Get the cache backend."""
+        return caches[self._cache_alias]
+
+    def _get_cache_key(self, url: str) -> str:
+        """Generate cache key for a URL."""
+        canonical = canonicalize_url(url)
+        return f"{self.KEY_PREFIX}{hashlib.sha256(canonical.encode()).hexdigest()}"
+
+    def get_validators(self, url: str) -> Optional[HTTPValidators]:
+        """
+        Get stored validators for a URL.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            HTTPValidators, or None if the URL has not been fetched
+        """
+        try:
+            cached = self._cache.get(self._get_cache_key(url))
+            if cached:
+                return HTTPValidators.from_json(cached)
+        except Exception as e:
+            logger.warning("Failed to get HTTP validators for %s: %s", url, str(e))
+        return None
+
+    def save_validators(self, validators: HTTPValidators) -> bool:
+        """
+        Save validators for a URL.
+
+        Args:
+            validators: HTTPValidators to save
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            self._cache.set(
+                self._get_cache_key(validators.url),
+                validators.to_json(),
+                timeout=self.ttl_seconds,
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to save HTTP validators for %s: %s", validators.url, str(e)
+            )
+            return False
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-16 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("crawler", "0050_add_manual_tier_timeout_overrides"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="crawledurl",
+            name="change_rate",
+            field=models.FloatField(
+                blank=True, help_text="Estimated content changes per day", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="crawledurl",
+            name="next_recrawl_at",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="crawledurl",
+            name="recrawl_changes",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of re-fetches where the content hash changed",
+            ),
+        ),
+        migrations.AddField(
+            model_name="crawledurl",
+            name="recrawl_checks",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of re-fetches compared against the previous content hash",
+            ),
+        ),
+        migrations.AddField(
+            model_name="crawledurl",
+            name="recrawl_observed_seconds",
+            field=models.FloatField(
+                default=0, help_text="Total time covered by the compared re-fetches"
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("crawler", "0051_add_recrawl_schedule_to_crawled_url"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExtractionCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "cache_key",
+                    models.CharField(
+                        help_text="SHA-256 of content hash, product type/category and schema hash.",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(
+                        help_text="SHA-256 of the preprocessed content sent to the AI service.",
+                        max_length=64,
+                    ),
+                ),
+                ("product_type", models.CharField(max_length=50)),
+                (
+                    "schema_hash",
+                    models.CharField(
+                        db_index=True,
+                        help_text="SHA-256 of the extraction schema (FieldDefinition based).",
+                        max_length=64,
+                    ),
+                ),
+                ("response", models.JSONField(help_text="AI service response body.")),
+                ("hit_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_used_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="When the entry was stored or last served (size eviction order).",
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name": "Extraction Cache Entry",
+                "verbose_name_plural": "Extraction Cache Entries",
+                "db_table": "extraction_cache_entry",
+            },
+        ),
+    ]
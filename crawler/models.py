@@ -2047,6 +2047,26 @@ class CrawledURL(models.Model):
     content_hash = models.CharField(max_length=64, blank=True)
     content_changed = models.BooleanField(default=False)
 
+    # Recrawl scheduling (see crawler.queue.recrawl_scheduler)
+    recrawl_checks = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of re-fetches compared against the previous content hash",
+    )
+    recrawl_changes = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of re-fetches where the content hash changed",
+    )
+    recrawl_observed_seconds = models.FloatField(
+        default=0,
+        help_text="Total time covered by the compared re-fetches",
+    )
+    change_rate = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Estimated content changes per day",
+    )
+    next_recrawl_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
     class Meta:
         db_table = "crawled_urls"
         indexes = [
@@ -2074,12 +2094,12 @@ class CrawledURL(models.Model):
         return hashlib.sha256(content.encode()).hexdigest()
 
     def update_content(self, content: str):
-        """Update content hash and detect changes."""
-        new_hash = self.compute_content_hash(content)
-        self.content_changed = self.content_hash != new_hash
-        self.content_hash = new_hash
-        self.last_crawled_at = timezone.now()
-        self.save(update_fields=["content_hash", "content_changed", "last_crawled_at"])
+        """Update content hash, detect changes and reschedule the next recrawl."""
+        from crawler.queue.recrawl_scheduler import RecrawlScheduler
+
+        RecrawlScheduler().observe(self, self.compute_content_hash(content))
+        self.save(update_fields=["content_hash", "content_changed", "last_crawled_at"]
+                  + RecrawlScheduler.SCHEDULE_FIELDS)
 
 
 class DiscoveredProduct(models.Model):
@@ -6768,3 +6788,49 @@ class APICrawlJob(models.Model):
             return 0
         end = self.completed_at or timezone.now()
         return int((end - self.started_at).total_seconds())
+
+
+class ExtractionCacheEntry(models.Model):
+    """
+    Cached AI extraction response.
+
+    Keyed by the preprocessed content, product type and extraction schema
+    sent to the AI service, so recrawls, mirrors and syndicated listings
+    with identical content skip the AI round trip. Managed by
+    crawler.services.extraction_cache.ExtractionCache (TTL and size eviction).
+    """
+
+    cache_key = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of content hash, product type/category and schema hash.",
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the preprocessed content sent to the AI service.",
+    )
+    product_type = models.CharField(max_length=50)
+    schema_hash = models.CharField(
+        max_length=64,
+        db_index=True,
+        help_text="SHA-256 of the extraction schema (FieldDefinition based).",
+    )
+    response = models.JSONField(
+        help_text="AI service response body.",
+    )
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        help_text="When the entry was stored or last served (size eviction order).",
+    )
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "extraction_cache_entry"
+        verbose_name = "Extraction Cache Entry"
+        verbose_name_plural = "Extraction Cache Entries"
+
+    def __str__(self):
+        return f"{self.product_type}/{self.content_hash[:12]} ({self.hit_count} hits)"
@@ -4,8 +4,16 @@ URL Queue Management - Redis-based URL frontier and queue management.
 Provides priority-based URL queuing with deduplication for the web crawler.
 """
 
-from .url_frontier import URLFrontier
+from .bloom_filter import ScalableBloomFilter
+from .memory_backend import FrontierBackend, InMemoryRedis
+from .recrawl_scheduler import RecrawlScheduler
+from .url_frontier import FrontierPrefetcher, URLFrontier
 
 __all__ = [
+    "FrontierBackend",
+    "FrontierPrefetcher",
+    "InMemoryRedis",
+    "RecrawlScheduler",
+    "ScalableBloomFilter",
     "URLFrontier",
 ]
@@ -0,0 +1,219 @@
+"""
+Scalable Bloom Filter - Redis-bitmap-backed probabilistic seen set.
+
+Used by URLFrontier as an optional replacement for the exact global seen
+set (GLOBAL_SEEN_KEY), which stores a 64-char hash per URL and grows without
+bound. A Bloom filter answers "definitely new" or "probably seen" using a
+few bits per URL. Redis memory still grows linearly with the number of
+URLs crawled, but at a small fraction of the exact set's rate.
+
+Scaling follows Almeida et al. ("Scalable Bloom Filters"): when the active
+slice reaches its capacity a new slice is added with GROWTH_FACTOR times the
+capacity and TIGHTENING_RATIO times the error rate, keeping the compound
+false-positive rate below the configured target.
+
+False positives mean a genuinely new URL is occasionally treated as seen;
+there are no false negatives.
+"""
+
+import logging
+import math
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ScalableBloomFilter:
+    """
+    Scalable Bloom filter stored in Redis bitmaps.
+
+    Keys:
+        {key}:meta      - hash with "slices", "count:{i}" and "grown:{i}" fields
+        {key}:slice:{i} - bitmap for slice i
+
+    Members are URL hashes (SHA-256 hex digests as produced by
+    URLFrontier._hash_url); bit positions are derived from the digest with
+    double hashing, so no extra hashing is needed.
+    """
+
+    GROWTH_FACTOR = 2
+    TIGHTENING_RATIO = 0.5
+
+    def __init__(
+        self,
+        redis_client,
+        key: str,
+        error_rate: Optional[float] = None,
+        initial_capacity: Optional[int] = None,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            redis_client: Redis client (decode_responses=True)
+            key: Redis key prefix for this filter
+            error_rate: Target compound false-positive rate
+                (default: CRAWLER_FRONTIER_BLOOM_ERROR_RATE)
+            initial_capacity: Number of items in the first slice
+                (default: CRAWLER_FRONTIER_BLOOM_CAPACITY)
+        """
+        self._redis = redis_client
+        self.key = key
+        self.meta_key = f"{key}:meta"
+        self.error_rate = error_rate or getattr(
+            settings, "CRAWLER_FRONTIER_BLOOM_ERROR_RATE", 0.001
+        )
+        self.initial_capacity = initial_capacity or getattr(
+            settings, "CRAWLER_FRONTIER_BLOOM_CAPACITY", 1_000_000
+        )
+
+    def _slice_key(self, index: int) -> str:
+        return f"{self.key}:slice:{index}"
+
+    def _slice_capacity(self, index: int) -> int:
+        return self.initial_capacity * (self.GROWTH_FACTOR ** index)
+
+    def _slice_params(self, index: int) -> Tuple[int, int]:
+        """
+        Get (num_bits, num_hashes) for a slice.
+
+        Args:
+            index: Slice index
+
+        Returns:
+            Tuple of bitmap size in bits and number of hash functions
+        """
+        error = self.error_rate * (1 - self.TIGHTENING_RATIO) * (self.TIGHTENING_RATIO ** index)
+        capacity = self._slice_capacity(index)
+        num_bits = int(math.ceil(-capacity * math.log(error) / (math.log(2) ** 2)))
+        num_hashes = max(1, int(math.ceil(-math.log2(error))))
+        return num_bits, num_hashes
+
+    def _positions(self, item_hash: str, index: int) -> List[int]:
+        """
+        Get bit positions for an item in a slice using double hashing.
+
+        Args:
+            item_hash: Hex digest (at least 32 hex chars)
+            index: Slice index
+
+        Returns:
+            List of bit offsets
+        """
+        num_bits, num_hashes = self._slice_params(index)
+        h1 = int(item_hash[:16], 16)
+        h2 = int(item_hash[16:32], 16) | 1
+        return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+    def _get_slice_count(self) -> int:
+        """Get number of slices (at least 1)."""
+        slices = self._redis.hget(self.meta_key, "slices")
+        return max(1, int(slices or 1))
+
+    def contains_many(self, item_hashes: List[str]) -> List[bool]:
+        """
+        Check membership for a batch of items in one pipelined round trip.
+
+        Args:
+            item_hashes: Hex digests to check
+
+        Returns:
+            List of booleans aligned with item_hashes (True = probably seen)
+        """
+        if not item_hashes:
+            return []
+
+        slice_count = self._get_slice_count()
+        layout: List[List[int]] = []
+
+        pipe = self._redis.pipeline(transaction=False)
+        for item_hash in item_hashes:
+            per_slice = []
+            for index in range(slice_count):
+                positions = self._positions(item_hash, index)
+                for position in positions:
+                    pipe.getbit(self._slice_key(index), position)
+                per_slice.append(len(positions))
+            layout.append(per_slice)
+        bits = pipe.execute()
+
+        results = []
+        offset = 0
+        for per_slice in layout:
+            found = False
+            for num_hashes in per_slice:
+                if all(bits[offset:offset + num_hashes]):
+                    found = True
+                offset += num_hashes
+            results.append(found)
+        return results
+
+    def contains(self, item_hash: str) -> bool:
+        """
+        Check whether an item has probably been added.
+
+        Args:
+            item_hash: Hex digest to check
+
+        Returns:
+            True if probably seen, False if definitely new
+        """
+        return self.contains_many([item_hash])[0]
+
+    def add_many(self, item_hashes: List[str]) -> None:
+        """
+        Add a batch of items to the active slice.
+
+        Callers are expected to add only items that contains_many() reported
+        as new; re-adding an item is harmless but inflates the slice count.
+
+        Args:
+            item_hashes: Hex digests to add
+        """
+        if not item_hashes:
+            return
+
+        index = self._get_slice_count() - 1
+        slice_key = self._slice_key(index)
+
+        pipe = self._redis.pipeline(transaction=False)
+        for item_hash in item_hashes:
+            for position in self._positions(item_hash, index):
+                pipe.setbit(slice_key, position, 1)
+        pipe.hincrby(self.meta_key, f"count:{index}", len(item_hashes))
+        count = pipe.execute()[-1]
+
+        if int(count) >= self._slice_capacity(index):
+            # HSETNX elects a single worker to grow the filter
+            if self._redis.hsetnx(self.meta_key, f"grown:{index}", 1):
+                self._redis.hset(self.meta_key, "slices", index + 2)
+                logger.info(
+                    f"Bloom filter {self.key} grew to {index + 2} slices "
+                    f"(slice {index} reached {count} items)"
+                )
+
+    def add(self, item_hash: str) -> None:
+        """
+        Add a single item.
+
+        Args:
+            item_hash: Hex digest to add
+        """
+        self.add_many([item_hash])
+
+    def count(self) -> int:
+        """
+        Get approximate number of items added.
+
+        Returns:
+            Sum of slice insert counters
+        """
+        meta: Dict[str, str] = self._redis.hgetall(self.meta_key) or {}
+        return sum(int(v) for k, v in meta.items() if k.startswith("count:"))
+
+    def clear(self) -> None:
+        """Delete all slices and metadata."""
+        keys = [self._slice_key(i) for i in range(self._get_slice_count())]
+        self._redis.delete(self.meta_key, *keys)
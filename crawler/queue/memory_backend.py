@@ -0,0 +1,466 @@
+"""
+In-Memory Frontier Backend - pure-Python stand-in for Redis.
+
+URLFrontier (and ScalableBloomFilter) talk to their store through the subset
+of the redis-py client API listed in FrontierBackend. InMemoryRedis
+implements that subset in-process with heaps, dicts and sets, so local
+pipeline runs, profiling and throughput benchmarks need no Redis server.
+
+Select it with CRAWLER_FRONTIER_BACKEND = "memory". State lives in the
+current process only and is lost on exit; it is not shared between Celery
+worker processes.
+"""
+
+import fnmatch
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Set, Tuple
+
+
+class FrontierBackend(Protocol):
+    """Redis client subset required by URLFrontier and ScalableBloomFilter."""
+
+    def sadd(self, key: str, *members: str) -> int: ...
+
+    def sismember(self, key: str, member: str) -> bool: ...
+
+    def smismember(self, key: str, members: List[str]) -> List[int]: ...
+
+    def scard(self, key: str) -> int: ...
+
+    def zadd(self, key: str, mapping: Dict[str, float], nx: bool = False,
+             xx: bool = False, ch: bool = False) -> int: ...
+
+    def zpopmin(self, key: str, count: Optional[int] = None) -> List[Tuple[str, float]]: ...
+
+    def zrange(self, key: str, start: int, end: int, withscores: bool = False) -> List[Any]: ...
+
+    def zrangebyscore(self, key: str, min: Any, max: Any) -> List[str]: ...
+
+    def zrem(self, key: str, *members: str) -> int: ...
+
+    def zcard(self, key: str) -> int: ...
+
+    def hset(self, key: str, field: str, value: Any) -> int: ...
+
+    def hget(self, key: str, field: str) -> Optional[str]: ...
+
+    def delete(self, *keys: str) -> int: ...
+
+    def pipeline(self, transaction: bool = True) -> Any: ...
+
+    def register_script(self, script: str) -> Callable[..., Any]: ...
+
+
+class _SortedSet:
+    """Sorted set with O(log n) pop-min via a lazily-invalidated heap."""
+
+    def __init__(self):
+        self.scores: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def add(self, member: str, score: float):
+        self.scores[member] = score
+        heapq.heappush(self._heap, (score, member))
+        if len(self._heap) > 2 * len(self.scores) + 64:
+            self._compact()
+
+    def remove(self, member: str) -> bool:
+        return self.scores.pop(member, None) is not None
+
+    def _compact(self):
+        self._heap = [(score, member) for member, score in self.scores.items()]
+        heapq.heapify(self._heap)
+
+    def _prune(self):
+        # Drop heap entries for removed members or superseded scores
+        while self._heap:
+            score, member = self._heap[0]
+            if self.scores.get(member) == score:
+                return
+            heapq.heappop(self._heap)
+
+    def pop_min(self) -> Optional[Tuple[str, float]]:
+        self._prune()
+        if not self._heap:
+            return None
+        score, member = heapq.heappop(self._heap)
+        del self.scores[member]
+        return member, score
+
+    def first(self) -> Optional[Tuple[str, float]]:
+        self._prune()
+        if not self._heap:
+            return None
+        score, member = self._heap[0]
+        return member, score
+
+    def ordered(self) -> List[Tuple[str, float]]:
+        return sorted(self.scores.items(), key=lambda item: (item[1], item[0]))
+
+
+class _Pipeline:
+    """Buffers commands and runs them under one lock acquisition."""
+
+    def __init__(self, client: "InMemoryRedis"):
+        self._client = client
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not hasattr(self._client, name):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs) -> "_Pipeline":
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> List[Any]:
+        with self._client._lock:
+            results = [
+                getattr(self._client, name)(*args, **kwargs)
+                for name, args, kwargs in self._commands
+            ]
+        self._commands = []
+        return results
+
+    def __enter__(self) -> "_Pipeline":
+        return self
+
+    def __exit__(self, *exc):
+        self._commands = []
+
+
+class _LocalScript:
+    """Python implementation standing in for a registered Lua script."""
+
+    def __init__(self, client: "InMemoryRedis", handler: Callable[..., List[Any]]):
+        self._client = client
+        self._handler = handler
+
+    def __call__(self, keys=None, args=None, client=None) -> List[Any]:
+        with self._client._lock:
+            return self._handler(
+                self._client, [str(k) for k in keys or []], [str(a) for a in args or []]
+            )
+
+
+def _run_add_urls(client: "InMemoryRedis", keys: List[str], argv: List[str]) -> List[int]:
+    """Mirror of URLFrontier.ADD_URLS_LUA (see there for the ARGV layout)."""
+    seen_key, global_key, queue_key, ready_key = keys
+    now, host_prefix, use_global = float(argv[0]), argv[1], argv[2] == "1"
+
+    results = []
+    for i in range(3, len(argv), 5):
+        url_hash, entry, score, host, state = argv[i:i + 5]
+        flag = 0
+        if (
+            state != "2"
+            and not client.sismember(seen_key, url_hash)
+            and (not use_global or not client.sismember(global_key, url_hash))
+        ):
+            client.sadd(seen_key, url_hash)
+            if use_global:
+                client.sadd(global_key, url_hash)
+            if state == "0":
+                client.zadd(queue_key, {entry: float(score)})
+                client.zadd(host_prefix + host, {entry: float(score)})
+                client.zadd(ready_key, {host: now}, nx=True)
+                flag = 1
+            else:
+                flag = 2
+        results.append(flag)
+    return results
+
+
+def _run_pop_ready(client: "InMemoryRedis", keys: List[str], argv: List[str]) -> Optional[List[Any]]:
+    """Mirror of URLFrontier.POP_READY_LUA (see there for KEYS/ARGV)."""
+    ready_key, queue_key, crawl_delay_key = keys
+    now, host_prefix, default_delay = float(argv[0]), argv[1], float(argv[2])
+
+    while True:
+        head = client.zrange(ready_key, 0, 0, withscores=True)
+        if not head:
+            legacy = client.zpopmin(queue_key, count=1)
+            if not legacy:
+                return None
+            entry, score = legacy[0]
+            return [entry, str(score), "1"]
+
+        host, next_allowed = head[0]
+        if float(next_allowed) > now:
+            return None
+
+        popped = client.zpopmin(host_prefix + host, count=1)
+        if not popped:
+            client.zrem(ready_key, host)
+            continue
+
+        entry, score = popped[0]
+        client.zrem(queue_key, entry)
+        try:
+            delay = float(client.hget(crawl_delay_key, host))
+        except (TypeError, ValueError):
+            delay = default_delay
+        client.zadd(ready_key, {host: now + delay})
+        return [entry, str(score), "0"]
+
+
+class InMemoryRedis:
+    """
+    In-process implementation of the FrontierBackend command subset.
+
+    Thread-safe (one re-entrant lock) so it can be driven from
+    asyncio.to_thread() consumers such as FrontierPrefetcher. Returns str
+    values like a decode_responses=True redis-py client.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._sets: Dict[str, Set[str]] = {}
+        self._zsets: Dict[str, _SortedSet] = {}
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._strings: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._bitmaps: Dict[str, Set[int]] = {}
+
+    # Sets
+
+    def sadd(self, key: str, *members: Any) -> int:
+        with self._lock:
+            target = self._sets.setdefault(key, set())
+            before = len(target)
+            target.update(str(m) for m in members)
+            return len(target) - before
+
+    def sismember(self, key: str, member: Any) -> bool:
+        with self._lock:
+            return str(member) in self._sets.get(key, ())
+
+    def smismember(self, key: str, members: List[Any]) -> List[int]:
+        with self._lock:
+            members_set = self._sets.get(key, ())
+            return [int(str(member) in members_set) for member in members]
+
+    def scard(self, key: str) -> int:
+        with self._lock:
+            return len(self._sets.get(key, ()))
+
+    # Sorted sets
+
+    def zadd(
+        self,
+        key: str,
+        mapping: Dict[str, float],
+        nx: bool = False,
+        xx: bool = False,
+        ch: bool = False,
+    ) -> int:
+        with self._lock:
+            zset = self._zsets.setdefault(key, _SortedSet())
+            added = changed = 0
+            for member, score in mapping.items():
+                member, score = str(member), float(score)
+                current = zset.scores.get(member)
+                if (nx and current is not None) or (xx and current is None):
+                    continue
+                if current is None:
+                    added += 1
+                elif current != score:
+                    changed += 1
+                else:
+                    continue
+                zset.add(member, score)
+            self._drop_if_empty(self._zsets, key)
+            return added + changed if ch else added
+
+    def zpopmin(self, key: str, count: Optional[int] = None) -> List[Tuple[str, float]]:
+        with self._lock:
+            zset = self._zsets.get(key)
+            popped = []
+            while zset is not None and len(popped) < (count or 1):
+                item = zset.pop_min()
+                if item is None:
+                    break
+                popped.append(item)
+            self._drop_if_empty(self._zsets, key)
+            return popped
+
+    def zrange(self, key: str, start: int, end: int, withscores: bool = False) -> List[Any]:
+        with self._lock:
+            zset = self._zsets.get(key)
+            if zset is None:
+                return []
+            if start == 0 and end == 0:
+                first = zset.first()
+                items = [first] if first else []
+            else:
+                items = zset.ordered()
+                items = items[start:] if end == -1 else items[start:end + 1]
+            return list(items) if withscores else [member for member, _ in items]
+
+    def zrangebyscore(self, key: str, min: Any, max: Any) -> List[str]:
+        with self._lock:
+            zset = self._zsets.get(key)
+            if zset is None:
+                return []
+            low, high = float(min), float(max)
+            return [m for m, score in zset.ordered() if low <= score <= high]
+
+    def zrem(self, key: str, *members: Any) -> int:
+        with self._lock:
+            zset = self._zsets.get(key)
+            if zset is None:
+                return 0
+            removed = sum(1 for m in members if zset.remove(str(m)))
+            self._drop_if_empty(self._zsets, key)
+            return removed
+
+    def zcard(self, key: str) -> int:
+        with self._lock:
+            zset = self._zsets.get(key)
+            return len(zset) if zset else 0
+
+    # Hashes
+
+    def hset(self, key: str, field: str, value: Any) -> int:
+        with self._lock:
+            target = self._hashes.setdefault(key, {})
+            is_new = field not in target
+            target[field] = str(value)
+            return int(is_new)
+
+    def hsetnx(self, key: str, field: str, value: Any) -> int:
+        with self._lock:
+            if field in self._hashes.get(key, {}):
+                return 0
+            return self.hset(key, field, value)
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        with self._lock:
+            return self._hashes.get(key, {}).get(field)
+
+    def hgetall(self, key: str) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._hashes.get(key, {}))
+
+    def hdel(self, key: str, *fields: str) -> int:
+        with self._lock:
+            target = self._hashes.get(key, {})
+            removed = sum(1 for f in fields if target.pop(f, None) is not None)
+            self._drop_if_empty(self._hashes, key)
+            return removed
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        with self._lock:
+            value = int(self._hashes.get(key, {}).get(field, 0)) + amount
+            self.hset(key, field, value)
+            return value
+
+    # Strings
+
+    def setex(self, key: str, ttl_seconds: int, value: Any) -> bool:
+        with self._lock:
+            self._strings[key] = (str(value), time.time() + ttl_seconds)
+            return True
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            stored = self._strings.get(key)
+            if stored is None:
+                return None
+            value, expires_at = stored
+            if expires_at is not None and expires_at <= time.time():
+                del self._strings[key]
+                return None
+            return value
+
+    # Bitmaps
+
+    def getbit(self, key: str, offset: int) -> int:
+        with self._lock:
+            return int(offset in self._bitmaps.get(key, ()))
+
+    def setbit(self, key: str, offset: int, value: int) -> int:
+        with self._lock:
+            bits = self._bitmaps.setdefault(key, set())
+            previous = int(offset in bits)
+            if value:
+                bits.add(offset)
+            else:
+                bits.discard(offset)
+            return previous
+
+    # Keys
+
+    def _all_stores(self) -> List[Dict[str, Any]]:
+        return [self._sets, self._zsets, self._hashes, self._strings, self._bitmaps]
+
+    def _drop_if_empty(self, store: Dict[str, Any], key: str):
+        if key in store and not store[key]:
+            del store[key]
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                for store in self._all_stores():
+                    if store.pop(key, None) is not None:
+                        removed += 1
+            return removed
+
+    def exists(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if any(key in s for s in self._all_stores()))
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        with self._lock:
+            names = set().union(*(s.keys() for s in self._all_stores()))
+            return sorted(k for k in names if fnmatch.fnmatchcase(k, pattern))
+
+    def scan_iter(self, match: str = "*", count: Optional[int] = None) -> Iterator[str]:
+        return iter(self.keys(match))
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            for store in self._all_stores():
+                store.clear()
+            return True
+
+    # Pipelines and scripts
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self)
+
+    def register_script(self, script: str) -> _LocalScript:
+        from .url_frontier import URLFrontier
+
+        if script == URLFrontier.ADD_URLS_LUA:
+            return _LocalScript(self, _run_add_urls)
+        if script == URLFrontier.POP_READY_LUA:
+            return _LocalScript(self, _run_pop_ready)
+        raise NotImplementedError("InMemoryRedis only supports URLFrontier scripts")
+
+    def ping(self) -> bool:
+        return True
+
+
+# Process-wide instance shared by all frontiers using the memory backend
+_memory_backend: Optional[InMemoryRedis] = None
+
+
+def get_memory_backend() -> InMemoryRedis:
+    """
+    Get the process-wide in-memory frontier backend.
+
+    Returns:
+        InMemoryRedis singleton instance
+    """
+    global _memory_backend
+    if _memory_backend is None:
+        _memory_backend = InMemoryRedis()
+    return _memory_backend
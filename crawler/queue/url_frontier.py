@@ -3,6 +3,7 @@ URL Frontier - Redis-based URL queue management.
 
 Implements a priority queue for URLs to be crawled with:
 - Priority-based ordering (lower score = higher priority)
+- Per-host politeness scheduling (host sub-queues + ready heap)
 - URL deduplication via seen URL tracking
 - Domain-specific cookie caching
 - Persistence across restarts via database fallback
@@ -10,11 +11,15 @@ Implements a priority queue for URLs to be crawled with:
 Reference: ai_enhancement_engine/crawlers/url_frontier.py
 """
 
+import asyncio
 import json
 import hashlib
 import logging
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from django.conf import settings
 
@@ -36,30 +41,179 @@ class URLFrontier:
     2. DiscoveredProduct.source_url (URLs that yielded products)
 
     When a URL is found in the database, we add it to Redis for future checks.
+
+    Global Seen Filter:
+    With CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND = "bloom", the unbounded global
+    seen set is replaced by a Redis-bitmap ScalableBloomFilter so memory stays
+    flat as the catalog grows. Per-queue seen sets remain exact.
+
+    Politeness Scheduling:
+    Every entry is also stored in a per-host sub-queue, and each queue keeps a
+    "ready heap" (sorted set) of hosts scored by the next time they may be
+    fetched. get_next_ready_url() claims the earliest ready host, pops its
+    best URL and pushes the host back with score now + crawl delay, so
+    concurrent workers spread across hosts instead of hammering one.
+
+    Leases:
+    lease_urls()/lease_next_ready_url() move entries into a per-queue lease
+    set scored by expiry. ack() drops the lease, nack() and the reaper put
+    the original entry back, so URLs held by a crashed worker are not lost
+    even though their hashes are already in the seen sets.
+
+    Recrawls:
+    readmit_urls() re-enqueues known URLs that RecrawlScheduler has found
+    due, bypassing the seen sets that would otherwise reject them.
     """
 
     # Redis key patterns
     QUEUE_KEY_PATTERN = "crawler:frontier:{queue_id}"
+    HOST_QUEUE_KEY_PATTERN = "crawler:frontier:{queue_id}:host:{host}"
+    READY_KEY_PATTERN = "crawler:frontier:{queue_id}:ready"
+    LEASE_KEY_PATTERN = "crawler:frontier:{queue_id}:leases"
+    LEASE_DATA_KEY_PATTERN = "crawler:frontier:{queue_id}:lease_data"
+    CRAWL_DELAY_KEY = "crawler:crawl_delay"
     SEEN_KEY_PATTERN = "crawler:seen:{queue_id}"
     GLOBAL_SEEN_KEY = "crawler:seen:global"
+    GLOBAL_SEEN_BLOOM_KEY = "crawler:seen:global:bloom"
     COOKIE_KEY_PATTERN = "crawler:cookies:{domain}"
 
-    def __init__(self, redis_client=None):
+    # Batch sizes for bulk add (URLs per Lua call / per DB IN-query)
+    ADD_BATCH_SIZE = 1000
+    DB_CHECK_CHUNK_SIZE = 400
+
+    # Atomic batch add: KEYS = [seen, global_seen, queue, ready]
+    # ARGV = [now, host_key_prefix, use_global_set,
+    #         (url_hash, entry_json, score, host, state)*]
+    # state: URL_NEW, URL_KNOWN (in database: mark seen only) or
+    #        URL_GLOBALLY_SEEN (seen set or Bloom filter hit on the pre-check: reject)
+    # Returns one flag per URL: ADD_REJECTED, ADD_ENQUEUED or ADD_MARKED_SEEN.
+    ADD_URLS_LUA = """
+local now = ARGV[1]
+local host_prefix = ARGV[2]
+local use_global = ARGV[3] == '1'
+local results = {}
+for i = 4, #ARGV, 5 do
+    local url_hash, state = ARGV[i], ARGV[i + 4]
+    local flag = 0
+    if state ~= '2'
+        and redis.call('SISMEMBER', KEYS[1], url_hash) == 0
+        and (not use_global or redis.call('SISMEMBER', KEYS[2], url_hash) == 0) then
+        redis.call('SADD', KEYS[1], url_hash)
+        if use_global then
+            redis.call('SADD', KEYS[2], url_hash)
+        end
+        if state == '0' then
+            local entry, score, host = ARGV[i + 1], ARGV[i + 2], ARGV[i + 3]
+            redis.call('ZADD', KEYS[3], score, entry)
+            redis.call('ZADD', host_prefix .. host, score, entry)
+            redis.call('ZADD', KEYS[4], 'NX', now, host)
+            flag = 1
+        else
+            flag = 2
+        end
+    end
+    results[#results + 1] = flag
+end
+return results
+"""
+    # Atomically claim the next ready host and pop its best entry.
+    # KEYS: ready heap, main queue, crawl delay hash
+    # ARGV: now, host sub-queue key prefix, default crawl delay
+    # Returns {entry, score, legacy} or nil if the earliest host is in its
+    # crawl delay. legacy = '1' means the ready heap was empty and the entry
+    # came straight off the main queue (entries added before the heap).
+    POP_READY_LUA = """
+local now = tonumber(ARGV[1])
+while true do
+    local head = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    if #head == 0 then
+        local legacy = redis.call('ZPOPMIN', KEYS[2])
+        if #legacy == 0 then
+            return nil
+        end
+        return {legacy[1], legacy[2], '1'}
+    end
+    local host = head[1]
+    if tonumber(head[2]) > now then
+        return nil
+    end
+    local popped = redis.call('ZPOPMIN', ARGV[2] .. host)
+    if #popped == 0 then
+        redis.call('ZREM', KEYS[1], host)
+    else
+        redis.call('ZREM', KEYS[2], popped[1])
+        local delay = tonumber(redis.call('HGET', KEYS[3], host)) or tonumber(ARGV[3])
+        redis.call('ZADD', KEYS[1], now + delay, host)
+        return {popped[1], popped[2], '0'}
+    end
+end
+"""
+    URL_NEW, URL_KNOWN, URL_GLOBALLY_SEEN = 0, 1, 2
+    ADD_REJECTED, ADD_ENQUEUED, ADD_MARKED_SEEN = 0, 1, 2
+
+    def __init__(
+        self,
+        redis_client=None,
+        crawl_delay: Optional[float] = None,
+        lease_ttl: Optional[int] = None,
+        global_seen_filter=None,
+    ):
         """
         Initialize URL frontier.
 
         Args:
-            redis_client: Optional pre-configured Redis client
+            redis_client: Optional pre-configured Redis client (or any
+                FrontierBackend, e.g. InMemoryRedis)
+            crawl_delay: Default seconds between fetches to the same host
+                (default: CRAWLER_RATE_LIMIT_DELAY)
+            lease_ttl: Default lease time-to-live in seconds
+                (default: CRAWLER_FRONTIER_LEASE_TTL)
+            global_seen_filter: Optional ScalableBloomFilter replacing the
+                exact global seen set (default: built when
+                CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND == "bloom")
         """
         self._redis = redis_client
+        self._add_urls_script = None
+        self._pop_ready_script = None
+        self.crawl_delay = (
+            crawl_delay
+            if crawl_delay is not None
+            else getattr(settings, "CRAWLER_RATE_LIMIT_DELAY", 1.0)
+        )
+        self.lease_ttl = (
+            lease_ttl
+            if lease_ttl is not None
+            else getattr(settings, "CRAWLER_FRONTIER_LEASE_TTL", 600)
+        )
 
         if self._redis is None:
             self._init_redis()
 
+        self._global_filter = global_seen_filter
+        if self._global_filter is None and getattr(
+            settings, "CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND", "set"
+        ) == "bloom":
+            from .bloom_filter import ScalableBloomFilter
+
+            self._global_filter = ScalableBloomFilter(
+                self._redis, self.GLOBAL_SEEN_BLOOM_KEY
+            )
+
         logger.info("URL Frontier initialized")
 
     def _init_redis(self):
-        """Initialize Redis connection from settings."""
+        """
+        Initialize the frontier store from settings.
+
+        CRAWLER_FRONTIER_BACKEND selects "redis" (default) or "memory", the
+        process-local InMemoryRedis used for local runs and benchmarks.
+        """
+        if getattr(settings, "CRAWLER_FRONTIER_BACKEND", "redis") == "memory":
+            from .memory_backend import get_memory_backend
+
+            self._redis = get_memory_backend()
+            return
+
         import redis
 
         redis_url = getattr(settings, "REDIS_URL", None)
@@ -82,6 +236,36 @@ class URLFrontier:
         """
         return url.lower().strip().rstrip("/")
 
+    def _global_seen_contains(self, url_hash: str) -> bool:
+        """Check the global seen set (or Bloom filter) for a URL hash."""
+        if self._global_filter is not None:
+            return self._global_filter.contains(url_hash)
+        return bool(self._redis.sismember(self.GLOBAL_SEEN_KEY, url_hash))
+
+    def _global_seen_add(self, url_hash: str):
+        """Add a URL hash to the global seen set (or Bloom filter)."""
+        if self._global_filter is not None:
+            if not self._global_filter.contains(url_hash):
+                self._global_filter.add(url_hash)
+        else:
+            self._redis.sadd(self.GLOBAL_SEEN_KEY, url_hash)
+
+    def _get_host(self, url: str) -> str:
+        """
+        Extract the politeness host for a URL.
+
+        Args:
+            url: URL to inspect
+
+        Returns:
+            Lowercase host name without port
+        """
+        try:
+            host = urlparse(url.strip()).netloc.split("@")[-1].split(":")[0]
+        except Exception:
+            host = ""
+        return host.lower() or "unknown"
+
     def _check_crawled_source(self, url: str, url_hash: str, seen_key: str) -> bool:
         """
         Check if URL exists in CrawledSource table.
@@ -105,7 +289,7 @@ class URLFrontier:
                CrawledSource.objects.filter(url=normalized).exists():
                 # URL was crawled before - add to Redis for future checks
                 self._redis.sadd(seen_key, url_hash)
-                self._redis.sadd(self.GLOBAL_SEEN_KEY, url_hash)
+                self._global_seen_add(url_hash)
                 logger.debug(f"URL already in CrawledSource, skipping: {url[:50]}...")
                 return True
         except Exception as e:
@@ -136,7 +320,7 @@ class URLFrontier:
                DiscoveredProduct.objects.filter(source_url=normalized).exists():
                 # URL already used for a product - add to Redis for future checks
                 self._redis.sadd(seen_key, url_hash)
-                self._redis.sadd(self.GLOBAL_SEEN_KEY, url_hash)
+                self._global_seen_add(url_hash)
                 logger.debug(f"URL already in DiscoveredProduct, skipping: {url[:50]}...")
                 return True
         except Exception as e:
@@ -144,6 +328,184 @@ class URLFrontier:
 
         return False
 
+    def _find_known_urls(self, urls: List[str]) -> set:
+        """
+        Bulk-check which URLs already exist in the database.
+
+        Looks up both the exact and normalized form of every URL in
+        CrawledSource and DiscoveredProduct.source_url with one query per
+        table per chunk, instead of up to four queries per URL.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            Set of input URLs found in either table
+        """
+        known = set()
+        for start in range(0, len(urls), self.DB_CHECK_CHUNK_SIZE):
+            chunk = urls[start:start + self.DB_CHECK_CHUNK_SIZE]
+            candidates = set(chunk) | {self._normalize_url(url) for url in chunk}
+            found = set()
+
+            try:
+                from crawler.models import CrawledSource
+
+                found.update(
+                    CrawledSource.objects.filter(url__in=candidates)
+                    .values_list("url", flat=True)
+                )
+            except Exception as e:
+                logger.warning(f"CrawledSource check failed: {e}")
+
+            try:
+                from crawler.models import DiscoveredProduct
+
+                found.update(
+                    DiscoveredProduct.objects.filter(source_url__in=candidates)
+                    .values_list("source_url", flat=True)
+                )
+            except Exception as e:
+                logger.warning(f"DiscoveredProduct check failed: {e}")
+
+            known.update(
+                url for url in chunk
+                if url in found or self._normalize_url(url) in found
+            )
+        return known
+
+    def _find_seen_hashes(self, seen_key: str, url_hashes: List[str]) -> List[bool]:
+        """
+        Check URL hashes against the queue and global seen sets.
+
+        Args:
+            seen_key: Queue-specific seen key
+            url_hashes: Hashes to check
+
+        Returns:
+            List of booleans aligned with ``url_hashes``: True if seen
+        """
+        seen = [bool(flag) for flag in self._redis.smismember(seen_key, url_hashes)]
+        if self._global_filter is not None:
+            globally_seen = self._global_filter.contains_many(url_hashes)
+        else:
+            globally_seen = [
+                bool(flag) for flag in self._redis.smismember(self.GLOBAL_SEEN_KEY, url_hashes)
+            ]
+        return [a or b for a, b in zip(seen, globally_seen)]
+
+    def _get_add_urls_script(self):
+        """Get (and lazily register) the batch add Lua script."""
+        if self._add_urls_script is None:
+            self._add_urls_script = self._redis.register_script(self.ADD_URLS_LUA)
+        return self._add_urls_script
+
+    def _get_pop_ready_script(self):
+        """Register POP_READY_LUA on first use."""
+        if self._pop_ready_script is None:
+            self._pop_ready_script = self._redis.register_script(self.POP_READY_LUA)
+        return self._pop_ready_script
+
+    def add_url_batch(
+        self,
+        queue_id: str,
+        urls: List[str],
+        priority: int = 5,
+        source_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[bool]:
+        """
+        Add a batch of URLs to the frontier in a single Redis round trip.
+
+        The Redis seen sets (or the Bloom filter for the global check) are
+        read first, and only URLs not seen there go to the database fallback
+        checks (CrawledSource, DiscoveredProduct) as bulk queries. A
+        server-side Lua script then atomically re-checks both seen sets and,
+        for each new URL, marks it seen and enqueues it (main queue, host
+        sub-queue, ready heap). URLs found only in the database are marked
+        seen but not queued, as with add_url().
+
+        With the Bloom filter enabled, accepted hashes are added to the
+        filter after the script; the per-queue seen set stays exact and
+        atomic. Duplicates within the batch are rejected after the first
+        occurrence.
+
+        Args:
+            queue_id: Queue identifier (typically source slug)
+            urls: URLs to add
+            priority: Priority 1-10 (higher = more important) for all URLs
+            source_id: Optional source UUID
+            metadata: Optional metadata dict for all URLs
+
+        Returns:
+            List of booleans aligned with ``urls``: True if added,
+            False if already seen
+        """
+        if not urls:
+            return []
+
+        seen_key = self.SEEN_KEY_PATTERN.format(queue_id=queue_id)
+        queue_key = self.QUEUE_KEY_PATTERN.format(queue_id=queue_id)
+        ready_key = self.READY_KEY_PATTERN.format(queue_id=queue_id)
+        host_prefix = self.HOST_QUEUE_KEY_PATTERN.format(queue_id=queue_id, host="")
+
+        script = self._get_add_urls_script()
+        use_global_set = 0 if self._global_filter is not None else 1
+
+        # Priority inversion: lower score = fetched first
+        # Priority 10 (highest) -> score 0, Priority 1 -> score 9
+        score = 10 - priority
+        added_at = datetime.utcnow().isoformat()
+
+        results: List[bool] = []
+        for start in range(0, len(urls), self.ADD_BATCH_SIZE):
+            chunk = urls[start:start + self.ADD_BATCH_SIZE]
+            hashes = [self._hash_url(url) for url in chunk]
+            already_seen = self._find_seen_hashes(seen_key, hashes)
+            # Database lookups only for URLs Redis has not seen
+            unseen = [url for url, seen in zip(chunk, already_seen) if not seen]
+            known_urls = self._find_known_urls(unseen) if unseen else set()
+
+            args: List[Any] = [time.time(), host_prefix, use_global_set]
+            for url, url_hash, seen in zip(chunk, hashes, already_seen):
+                if seen:
+                    state = self.URL_GLOBALLY_SEEN
+                elif url in known_urls:
+                    state = self.URL_KNOWN
+                else:
+                    state = self.URL_NEW
+                entry = {
+                    "url": url,
+                    "url_hash": url_hash,
+                    "source_id": source_id,
+                    "added_at": added_at,
+                    "metadata": metadata or {},
+                }
+                args.extend([
+                    url_hash,
+                    json.dumps(entry),
+                    score,
+                    self._get_host(url),
+                    state,
+                ])
+
+            flags = [
+                int(flag) for flag in
+                script(keys=[seen_key, self.GLOBAL_SEEN_KEY, queue_key, ready_key], args=args)
+            ]
+            if self._global_filter is not None:
+                self._global_filter.add_many([
+                    url_hash for url_hash, flag in zip(hashes, flags)
+                    if flag != self.ADD_REJECTED
+                ])
+            results.extend(flag == self.ADD_ENQUEUED for flag in flags)
+
+        logger.debug(
+            f"Added {sum(results)}/{len(urls)} URLs to frontier {queue_id} "
+            f"(priority={priority})"
+        )
+        return results
+
     def add_url(
         self,
         queue_id: str,
@@ -155,10 +517,10 @@ class URLFrontier:
         """
         Add URL to frontier if not already seen.
 
-        Checks in order (fast to slow):
-        1. Redis seen set (fastest, may be stale after restart)
-        2. CrawledSource table (persistent)
-        3. DiscoveredProduct.source_url (persistent)
+        Checks (see add_url_batch):
+        1. CrawledSource table (persistent)
+        2. DiscoveredProduct.source_url (persistent)
+        3. Redis queue-specific and global seen sets, atomically with the insert
 
         Args:
             queue_id: Queue identifier (typically source slug)
@@ -170,47 +532,29 @@ class URLFrontier:
         Returns:
             True if URL was added, False if already seen
         """
-        url_hash = self._hash_url(url)
-        queue_key = self.QUEUE_KEY_PATTERN.format(queue_id=queue_id)
-        seen_key = self.SEEN_KEY_PATTERN.format(queue_id=queue_id)
+        return self.add_url_batch(queue_id, [url], priority, source_id, metadata)[0]
 
-        # Check 1: Redis queue-specific seen set (fast, may be stale)
-        if self._redis.sismember(seen_key, url_hash):
-            return False
+    def _enqueue_entry(self, queue_id: str, url: str, entry_json: str, score: float):
+        """
+        Store an entry in the main queue and its host sub-queue.
 
-        # Check 2: Redis global seen set (fast, may be stale)
-        if self._redis.sismember(self.GLOBAL_SEEN_KEY, url_hash):
-            return False
+        The host is registered in the ready heap with NX so an existing
+        crawl-delay score is never moved earlier.
 
-        # Check 3: CrawledSource table (persistent)
-        if self._check_crawled_source(url, url_hash, seen_key):
-            return False
-
-        # Check 4: DiscoveredProduct.source_url (persistent)
-        if self._check_discovered_product(url, url_hash, seen_key):
-            return False
-
-        # Truly new URL - add to seen sets
-        self._redis.sadd(seen_key, url_hash)
-        self._redis.sadd(self.GLOBAL_SEEN_KEY, url_hash)
-
-        # Create URL entry
-        entry = {
-            "url": url,
-            "url_hash": url_hash,
-            "source_id": source_id,
-            "added_at": datetime.utcnow().isoformat(),
-            "metadata": metadata or {},
-        }
-
-        # Add to priority queue
-        # Priority inversion: lower score = fetched first
-        # Priority 10 (highest) -> score 0, Priority 1 -> score 9
-        score = 10 - priority
-        self._redis.zadd(queue_key, {json.dumps(entry): score})
+        Args:
+            queue_id: Queue identifier
+            url: URL of the entry
+            entry_json: Serialized entry (identical member in both sets)
+            score: Priority score
+        """
+        host = self._get_host(url)
+        queue_key = self.QUEUE_KEY_PATTERN.format(queue_id=queue_id)
+        host_key = self.HOST_QUEUE_KEY_PATTERN.format(queue_id=queue_id, host=host)
+        ready_key = self.READY_KEY_PATTERN.format(queue_id=queue_id)
 
-        logger.debug(f"Added URL to frontier: {url[:80]}... (priority={priority})")
-        return True
+        self._redis.zadd(queue_key, {entry_json: score})
+        self._redis.zadd(host_key, {entry_json: score})
+        self._redis.zadd(ready_key, {host: time.time()}, nx=True)
 
     def add_urls(
         self,
@@ -231,35 +575,492 @@ class URLFrontier:
         Returns:
             Number of URLs actually added (excluding duplicates)
         """
-        added = 0
-        for url in urls:
-            if self.add_url(queue_id, url, priority, source_id):
-                added += 1
-        return added
+        return sum(self.add_url_batch(queue_id, urls, priority, source_id))
 
-    def get_next_url(self, queue_id: str) -> Optional[Dict[str, Any]]:
+    def readmit_urls(
+        self,
+        queue_id: str,
+        urls: List[str],
+        priority: int = 5,
+        source_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
         """
-        Get highest priority URL from frontier.
+        Re-enqueue already-crawled URLs that are due for a recrawl.
+
+        Unlike add_url_batch(), the seen sets and database checks are
+        bypassed (the URLs are expected to be known); the URLs stay marked
+        seen so discovery does not enqueue them a second time. URLs that are
+        currently leased or still queued are skipped, so repeated recrawl
+        passes never enqueue the same URL twice.
+
+        Args:
+            queue_id: Queue identifier (typically source slug)
+            urls: URLs to re-admit
+            priority: Priority 1-10 (higher = more important) for all URLs
+            source_id: Optional source UUID
+            metadata: Optional metadata dict for all URLs
+
+        Returns:
+            Number of URLs re-admitted
+        """
+        if not urls:
+            return 0
+
+        seen_key = self.SEEN_KEY_PATTERN.format(queue_id=queue_id)
+        lease_data_key = self.LEASE_DATA_KEY_PATTERN.format(queue_id=queue_id)
+        urls = list(dict.fromkeys(urls))
+        hashes = [self._hash_url(url) for url in urls]
+
+        pipe = self._redis.pipeline(transaction=False)
+        for url_hash in hashes:
+            pipe.hget(lease_data_key, url_hash)
+        leased = pipe.execute()
+        queued = self._find_queued_hashes(queue_id, urls)
+
+        score = 10 - priority
+        added_at = datetime.utcnow().isoformat()
+        readmitted = []
+        for url, url_hash, lease in zip(urls, hashes, leased):
+            if lease is not None or url_hash in queued:
+                continue
+            entry = {
+                "url": url,
+                "url_hash": url_hash,
+                "source_id": source_id,
+                "added_at": added_at,
+                "metadata": metadata or {},
+            }
+            self._enqueue_entry(queue_id, url, json.dumps(entry), score)
+            readmitted.append(url_hash)
+
+        if readmitted:
+            self._redis.sadd(seen_key, *readmitted)
+            if self._global_filter is not None:
+                self._global_filter.add_many(readmitted)
+            else:
+                self._redis.sadd(self.GLOBAL_SEEN_KEY, *readmitted)
+
+        logger.debug(f"Re-admitted {len(readmitted)}/{len(urls)} URLs to frontier {queue_id}")
+        return len(readmitted)
+
+    def _find_queued_hashes(self, queue_id: str, urls: List[str]) -> set:
+        """
+        Find which URLs' hosts already have them queued.
+
+        Reads the host sub-queues of the given URLs in one pipeline; every
+        queued entry is also in its host sub-queue.
 
         Args:
             queue_id: Queue identifier
+            urls: URLs to check
 
         Returns:
-            URL entry dict or None if queue is empty
+            Set of url_hashes of entries waiting in those host sub-queues
+        """
+        hosts = list(dict.fromkeys(self._get_host(url) for url in urls))
+        pipe = self._redis.pipeline(transaction=False)
+        for host in hosts:
+            pipe.zrange(
+                self.HOST_QUEUE_KEY_PATTERN.format(queue_id=queue_id, host=host), 0, -1
+            )
+
+        queued = set()
+        for entries in pipe.execute():
+            for entry_json in entries or []:
+                try:
+                    queued.add(json.loads(entry_json).get("url_hash"))
+                except (TypeError, ValueError):
+                    continue
+        return queued
+
+    def _pop_entries(self, queue_id: str, count: int = 1) -> List[Tuple[str, float]]:
+        """
+        Pop the highest priority raw entries from the main queue.
+
+        Also removes the popped entries from their host sub-queues.
+
+        Args:
+            queue_id: Queue identifier
+            count: Maximum number of entries to pop
+
+        Returns:
+            List of (entry_json, score) tuples
         """
         queue_key = self.QUEUE_KEY_PATTERN.format(queue_id=queue_id)
 
         # Pop from sorted set (lowest score = highest priority)
-        result = self._redis.zpopmin(queue_key, count=1)
+        result = self._redis.zpopmin(queue_key, count=count)
+
+        popped = [(entry_json, score) for entry_json, score in result or []]
+        if not popped:
+            return popped
+
+        # Drop the host sub-queue copies in one round trip
+        pipe = self._redis.pipeline(transaction=False)
+        for entry_json, _ in popped:
+            host_key = self.HOST_QUEUE_KEY_PATTERN.format(
+                queue_id=queue_id, host=self._get_host(json.loads(entry_json)["url"])
+            )
+            pipe.zrem(host_key, entry_json)
+        pipe.execute()
+        return popped
+
+    def _pop_ready_entry(self, queue_id: str) -> Optional[Tuple[str, float]]:
+        """
+        Pop the best raw entry whose host is outside its crawl delay.
 
-        if result:
-            entry_json, score = result[0]
-            entry = json.loads(entry_json)
+        Args:
+            queue_id: Queue identifier
+
+        Returns:
+            (entry_json, score) tuple, or None if no host is ready
+        """
+        queue_key = self.QUEUE_KEY_PATTERN.format(queue_id=queue_id)
+        ready_key = self.READY_KEY_PATTERN.format(queue_id=queue_id)
+        host_prefix = self.HOST_QUEUE_KEY_PATTERN.format(queue_id=queue_id, host="")
+
+        # One script call so concurrent consumers never see a host that is
+        # half-claimed (popped from the heap but not yet rescheduled)
+        result = self._get_pop_ready_script()(
+            keys=[ready_key, queue_key, self.CRAWL_DELAY_KEY],
+            args=[time.time(), host_prefix, self.crawl_delay],
+        )
+        if not result:
+            return None
+
+        entry_json, score, legacy = result
+        if str(legacy) == "1":
+            # Legacy entry without a ready-heap host - drop any host copy
+            host = self._get_host(json.loads(entry_json)["url"])
+            self._redis.zrem(host_prefix + host, entry_json)
+        return entry_json, float(score)
+
+    def get_next_url(self, queue_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get highest priority URL from frontier.
+
+        Args:
+            queue_id: Queue identifier
+
+        Returns:
+            URL entry dict or None if queue is empty
+        """
+        popped = self._pop_entries(queue_id, count=1)
+
+        if popped:
+            entry = json.loads(popped[0][0])
             logger.debug(f"Got URL from frontier: {entry['url'][:80]}...")
             return entry
 
         return None
 
+    def get_next_urls(self, queue_id: str, n: int) -> List[Dict[str, Any]]:
+        """
+        Pop up to n highest priority URLs atomically.
+
+        Args:
+            queue_id: Queue identifier
+            n: Maximum number of URLs to pop
+
+        Returns:
+            List of URL entry dicts in priority order (may be shorter than n)
+        """
+        return [
+            json.loads(entry_json)
+            for entry_json, _ in self._pop_entries(queue_id, count=n)
+        ]
+
+    def get_next_ready_url(self, queue_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the best URL whose host is outside its crawl delay.
+
+        Hosts are claimed from the ready heap with ZPOPMIN, so two workers
+        never receive the same host at once. Drained hosts are dropped from
+        the heap; the claimed host is re-scored to now + crawl delay.
+
+        Entries queued before host partitioning existed live only in the main
+        queue; they are served in priority order once the ready heap is empty.
+
+        Args:
+            queue_id: Queue identifier
+
+        Returns:
+            URL entry dict, or None if no host is ready (or queue is empty)
+        """
+        popped = self._pop_ready_entry(queue_id)
+
+        if popped:
+            entry = json.loads(popped[0])
+            logger.debug(f"Got ready URL from frontier: {entry['url'][:80]}...")
+            return entry
+
+        return None
+
+    # Lease-based dequeue (at-least-once delivery)
+
+    def _lease_entries(
+        self, queue_id: str, popped: List[Tuple[str, float]], ttl: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Record leases for popped entries so they can be restored if never acked.
+
+        Args:
+            queue_id: Queue identifier
+            popped: List of (entry_json, score) tuples
+            ttl: Lease time-to-live in seconds (default: lease_ttl)
+
+        Returns:
+            Parsed entry dicts with lease_expires_at added
+        """
+        if not popped:
+            return []
+
+        expires_at = time.time() + (ttl if ttl is not None else self.lease_ttl)
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        lease_data_key = self.LEASE_DATA_KEY_PATTERN.format(queue_id=queue_id)
+
+        entries = []
+        pipe = self._redis.pipeline(transaction=False)
+        for entry_json, score in popped:
+            entry = json.loads(entry_json)
+            pipe.hset(
+                lease_data_key,
+                entry["url_hash"],
+                json.dumps({"entry": entry_json, "score": score}),
+            )
+            pipe.zadd(lease_key, {entry["url_hash"]: expires_at})
+            entry["lease_expires_at"] = expires_at
+            entries.append(entry)
+        pipe.execute()
+        return entries
+
+    def lease_urls(
+        self, queue_id: str, n: int = 1, ttl: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lease up to n highest priority URLs.
+
+        Leased URLs leave the queue but are returned to it by
+        reap_expired_leases() unless ack()ed before the lease expires, so a
+        worker that dies mid-fetch does not lose them.
+
+        Args:
+            queue_id: Queue identifier
+            n: Maximum number of URLs to lease
+            ttl: Lease time-to-live in seconds (default: CRAWLER_FRONTIER_LEASE_TTL)
+
+        Returns:
+            List of URL entry dicts (may be shorter than n)
+        """
+        return self._lease_entries(queue_id, self._pop_entries(queue_id, count=n), ttl)
+
+    def lease_next_ready_url(
+        self, queue_id: str, ttl: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Lease the best URL whose host is outside its crawl delay.
+
+        Combines get_next_ready_url() politeness with lease semantics.
+
+        Args:
+            queue_id: Queue identifier
+            ttl: Lease time-to-live in seconds (default: CRAWLER_FRONTIER_LEASE_TTL)
+
+        Returns:
+            URL entry dict, or None if no host is ready (or queue is empty)
+        """
+        leased = self.lease_ready_urls(queue_id, 1, ttl)
+        return leased[0] if leased else None
+
+    def lease_ready_urls(
+        self, queue_id: str, n: int, ttl: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lease up to n URLs from hosts that are outside their crawl delay.
+
+        Each claimed host yields one URL and is pushed back by its crawl
+        delay, so a batch spreads across distinct ready hosts.
+
+        Args:
+            queue_id: Queue identifier
+            n: Maximum number of URLs to lease
+            ttl: Lease time-to-live in seconds (default: CRAWLER_FRONTIER_LEASE_TTL)
+
+        Returns:
+            List of URL entry dicts (may be shorter than n)
+        """
+        popped = []
+        while len(popped) < n:
+            entry = self._pop_ready_entry(queue_id)
+            if entry is None:
+                break
+            popped.append(entry)
+        return self._lease_entries(queue_id, popped, ttl)
+
+    def ack(self, queue_id: str, url_hash: str) -> bool:
+        """
+        Acknowledge a leased URL as done, releasing its lease.
+
+        Args:
+            queue_id: Queue identifier
+            url_hash: url_hash of the leased entry
+
+        Returns:
+            True if the lease was still held
+        """
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        lease_data_key = self.LEASE_DATA_KEY_PATTERN.format(queue_id=queue_id)
+
+        released = self._redis.zrem(lease_key, url_hash)
+        self._redis.hdel(lease_data_key, url_hash)
+        return bool(released)
+
+    def nack(self, queue_id: str, url_hash: str) -> bool:
+        """
+        Return a leased URL to the queue with its original priority.
+
+        Args:
+            queue_id: Queue identifier
+            url_hash: url_hash of the leased entry
+
+        Returns:
+            True if the URL was re-queued, False if the lease was already gone
+        """
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        lease_data_key = self.LEASE_DATA_KEY_PATTERN.format(queue_id=queue_id)
+
+        # ZREM is the claim: only one caller (ack, nack or reaper) wins it
+        if not self._redis.zrem(lease_key, url_hash):
+            return False
+
+        lease_data = self._redis.hget(lease_data_key, url_hash)
+        self._redis.hdel(lease_data_key, url_hash)
+        if not lease_data:
+            return False
+
+        data = json.loads(lease_data)
+        entry_json = data["entry"]
+        url = json.loads(entry_json)["url"]
+        self._enqueue_entry(queue_id, url, entry_json, data["score"])
+
+        logger.debug(f"Re-queued leased URL: {url[:80]}...")
+        return True
+
+    def extend_lease(self, queue_id: str, url_hash: str, ttl: Optional[int] = None) -> bool:
+        """
+        Extend a held lease (e.g. for slow Tier 3 fetches).
+
+        Args:
+            queue_id: Queue identifier
+            url_hash: url_hash of the leased entry
+            ttl: New time-to-live from now in seconds (default: lease_ttl)
+
+        Returns:
+            True if the lease was still held and has been extended
+        """
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        expires_at = time.time() + (ttl if ttl is not None else self.lease_ttl)
+        return bool(self._redis.zadd(lease_key, {url_hash: expires_at}, xx=True, ch=True))
+
+    def reap_expired_leases(self, queue_id: str) -> int:
+        """
+        Return every expired lease in a queue back to the queue.
+
+        Args:
+            queue_id: Queue identifier
+
+        Returns:
+            Number of URLs re-queued
+        """
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        expired = self._redis.zrangebyscore(lease_key, "-inf", time.time())
+
+        requeued = sum(1 for url_hash in expired if self.nack(queue_id, url_hash))
+        if requeued:
+            logger.info(f"Re-queued {requeued} expired leases for queue: {queue_id}")
+        return requeued
+
+    def reap_all_expired_leases(self) -> int:
+        """
+        Reap expired leases across all queues.
+
+        Returns:
+            Total number of URLs re-queued
+        """
+        prefix, suffix = self.LEASE_KEY_PATTERN.split("{queue_id}")
+        requeued = 0
+        for lease_key in self._redis.scan_iter(match=f"{prefix}*{suffix}"):
+            queue_id = lease_key[len(prefix):-len(suffix)]
+            requeued += self.reap_expired_leases(queue_id)
+        return requeued
+
+    def get_leased_count(self, queue_id: str) -> int:
+        """
+        Get number of URLs currently leased out for a queue.
+
+        Args:
+            queue_id: Queue identifier
+
+        Returns:
+            Number of outstanding leases
+        """
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        return self._redis.zcard(lease_key)
+
+    def seconds_until_ready(self, queue_id: str) -> Optional[float]:
+        """
+        Get seconds until the next host in a queue may be fetched.
+
+        Lets workers sleep exactly as long as needed instead of polling.
+
+        Args:
+            queue_id: Queue identifier
+
+        Returns:
+            Seconds to wait (0.0 if a host is ready now), or None if the
+            queue has nothing left to schedule
+        """
+        ready_key = self.READY_KEY_PATTERN.format(queue_id=queue_id)
+        result = self._redis.zrange(ready_key, 0, 0, withscores=True)
+
+        if result:
+            _, next_allowed = result[0]
+            return max(0.0, float(next_allowed) - time.time())
+
+        if not self.is_empty(queue_id):
+            return 0.0
+
+        return None
+
+    def set_host_crawl_delay(self, host: str, delay_seconds: float):
+        """
+        Override the crawl delay for a host (e.g. from robots.txt).
+
+        Args:
+            host: Host name
+            delay_seconds: Minimum seconds between fetches to the host
+        """
+        self._redis.hset(self.CRAWL_DELAY_KEY, host.lower(), delay_seconds)
+
+    def get_host_crawl_delay(self, host: str) -> float:
+        """
+        Get the crawl delay for a host.
+
+        Args:
+            host: Host name
+
+        Returns:
+            Per-host override if set, otherwise the frontier default
+        """
+        override = self._redis.hget(self.CRAWL_DELAY_KEY, host.lower())
+        if override is not None:
+            try:
+                return float(override)
+            except (TypeError, ValueError):
+                pass
+        return float(self.crawl_delay)
+
     def peek_next_url(self, queue_id: str) -> Optional[Dict[str, Any]]:
         """
         Peek at next URL without removing it.
@@ -324,7 +1125,7 @@ class URLFrontier:
         # Check Redis first (fast)
         if self._redis.sismember(seen_key, url_hash):
             return True
-        if self._redis.sismember(self.GLOBAL_SEEN_KEY, url_hash):
+        if self._global_seen_contains(url_hash):
             return True
 
         # Check database (persistent)
@@ -347,7 +1148,7 @@ class URLFrontier:
         seen_key = self.SEEN_KEY_PATTERN.format(queue_id=queue_id)
 
         self._redis.sadd(seen_key, url_hash)
-        self._redis.sadd(self.GLOBAL_SEEN_KEY, url_hash)
+        self._global_seen_add(url_hash)
 
     def clear_queue(self, queue_id: str):
         """
@@ -357,7 +1158,15 @@ class URLFrontier:
             queue_id: Queue identifier
         """
         queue_key = self.QUEUE_KEY_PATTERN.format(queue_id=queue_id)
-        self._redis.delete(queue_key)
+        ready_key = self.READY_KEY_PATTERN.format(queue_id=queue_id)
+
+        host_keys = [
+            self.HOST_QUEUE_KEY_PATTERN.format(queue_id=queue_id, host=host)
+            for host in self._redis.zrange(ready_key, 0, -1)
+        ]
+        lease_key = self.LEASE_KEY_PATTERN.format(queue_id=queue_id)
+        lease_data_key = self.LEASE_DATA_KEY_PATTERN.format(queue_id=queue_id)
+        self._redis.delete(queue_key, ready_key, lease_key, lease_data_key, *host_keys)
         logger.info(f"Cleared queue: {queue_id}")
 
     def clear_seen(self, queue_id: str):
@@ -400,8 +1209,10 @@ class URLFrontier:
         Get count of all globally seen URLs.
 
         Returns:
-            Number of globally seen URLs
+            Number of globally seen URLs (approximate with the Bloom filter)
         """
+        if self._global_filter is not None:
+            return self._global_filter.count()
         return self._redis.scard(self.GLOBAL_SEEN_KEY)
 
     # Domain-specific cookie caching
@@ -468,6 +1279,133 @@ class URLFrontier:
         return hashlib.sha256(normalized.encode()).hexdigest()
 
 
+class FrontierPrefetcher:
+    """
+    Async prefetching consumer for a URL frontier queue.
+
+    Keeps a local buffer of leased entries topped up from a background
+    refill (run in a worker thread so Redis latency never blocks the event
+    loop), so concurrent crawl coroutines pull the next URL from memory.
+    When ready_only is set, batches come from lease_ready_urls() and the
+    per-host crawl delay is honoured; get() waits until a host is ready.
+
+    Entries are leased: consumers ack() them on the frontier as usual, and
+    close() nacks whatever is still buffered so nothing is lost.
+
+    Usage:
+        prefetcher = FrontierPrefetcher(frontier, "my-source", batch_size=10)
+        while (entry := await prefetcher.get()) is not None:
+            ...
+            frontier.ack("my-source", entry["url_hash"])
+        await prefetcher.close()
+    """
+
+    def __init__(
+        self,
+        frontier: URLFrontier,
+        queue_id: str,
+        batch_size: int = 10,
+        low_watermark: Optional[int] = None,
+        ready_only: bool = True,
+        ttl: Optional[int] = None,
+    ):
+        """
+        Initialize prefetcher.
+
+        Args:
+            frontier: URLFrontier to consume from
+            queue_id: Queue identifier
+            batch_size: URLs leased per refill
+            low_watermark: Refill when the buffer drops to this size
+                (default: half of batch_size)
+            ready_only: Respect per-host crawl delays
+            ttl: Lease time-to-live in seconds (default: frontier lease_ttl)
+        """
+        self.frontier = frontier
+        self.queue_id = queue_id
+        self.batch_size = max(1, batch_size)
+        self.low_watermark = (
+            low_watermark if low_watermark is not None else self.batch_size // 2
+        )
+        self.ready_only = ready_only
+        self.ttl = ttl
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._exhausted = False
+
+    def _lease_batch(self) -> List[Dict[str, Any]]:
+        if self.ready_only:
+            return self.frontier.lease_ready_urls(self.queue_id, self.batch_size, self.ttl)
+        return self.frontier.lease_urls(self.queue_id, self.batch_size, self.ttl)
+
+    async def _refill(self) -> int:
+        entries = await asyncio.to_thread(self._lease_batch)
+        self._buffer.extend(entries)
+        return len(entries)
+
+    def _ensure_refill(self) -> asyncio.Task:
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.ensure_future(self._refill())
+        return self._refill_task
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the next leased URL entry.
+
+        Returns:
+            URL entry dict, or None once the queue has nothing left
+        """
+        while not self._buffer:
+            if self._exhausted:
+                return None
+
+            # Another consumer may drain a shared refill first - re-check
+            if await self._ensure_refill():
+                continue
+
+            wait_seconds = await asyncio.to_thread(
+                self.frontier.seconds_until_ready, self.queue_id
+            )
+            if wait_seconds is None:
+                self._exhausted = True
+                return None
+            await asyncio.sleep(max(wait_seconds, 0.05))
+
+        entry = self._buffer.popleft()
+        if len(self._buffer) <= self.low_watermark and not self._exhausted:
+            self._ensure_refill()
+        return entry
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        entry = await self.get()
+        if entry is None:
+            raise StopAsyncIteration
+        return entry
+
+    async def close(self) -> int:
+        """
+        Stop prefetching and return buffered leases to the queue.
+
+        Returns:
+            Number of entries returned to the queue
+        """
+        self._exhausted = True
+        if self._refill_task is not None and not self._refill_task.done():
+            try:
+                await self._refill_task
+            except Exception as e:
+                logger.warning(f"Frontier prefetch failed during close: {e}")
+
+        pending = list(self._buffer)
+        self._buffer.clear()
+        for entry in pending:
+            self.frontier.nack(self.queue_id, entry["url_hash"])
+        return len(pending)
+
+
 # Singleton instance for convenience
 _frontier_instance: Optional[URLFrontier] = None
 
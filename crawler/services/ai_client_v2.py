@@ -10,6 +10,7 @@ Features:
 - Content preprocessing integration (93% token savings)
 - Schema-driven extraction requests with full field definitions
 - Retry with exponential backoff
+- Extraction result cache for byte-identical preprocessed content
 - Graceful error handling for API failures
 """
 
@@ -28,6 +29,7 @@ from crawler.services.content_preprocessor import (
     PreprocessedContent,
     get_content_preprocessor,
 )
+from crawler.services.extraction_cache import get_extraction_cache
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +151,8 @@ class ExtractionResultV2:
     error: Optional[str] = None
     token_usage: Optional[Dict[str, int]] = None
     is_list_page: bool = False
+    # Served from the extraction cache without calling the AI service
+    cached: bool = False
 
 
 class AIClientV2:
@@ -261,7 +265,7 @@ class AIClientV2:
 
         try:
             # Preprocess content to reduce token usage
-            preprocessed = self._preprocess_content(content, source_url)
+            preprocessed = await self._apreprocess_content(content, source_url)
 
             logger.debug(
                 "Content preprocessed: type=%s, original=%d, preprocessed=%d, tokens=%d",
@@ -318,11 +322,26 @@ class AIClientV2:
                 full_schema=full_schema,
             )
 
+            # Identical content, product type and schema were extracted before:
+            # reuse the stored response instead of calling the AI service
+            cache = get_extraction_cache()
+            cache_key = cache.make_key(payload) if cache.enabled else None
+            if cache_key is not None:
+                cached_response = await cache.aget(cache_key)
+                if cached_response is not None:
+                    result = self._parse_response(httpx.Response(200, json=cached_response), schema)
+                    result.cached = True
+                    result.token_usage = None
+                    return result
+
             # Send request with retry logic
             response = await self._send_request(payload)
 
             # Parse response and validate enum fields
-            return self._parse_response(response, schema)
+            result = self._parse_response(response, schema)
+            if cache_key is not None and result.success:
+                await cache.aset(cache_key, response.json())
+            return result
 
         except AIClientError as e:
             logger.error("AI Client V2 error for %s: %s", source_url, str(e))
@@ -355,6 +374,25 @@ class AIClientV2:
         preprocessor = get_content_preprocessor(self.max_tokens)
         return preprocessor.preprocess(content, url=url)
 
+    async def _apreprocess_content(self, content: str, url: str) -> PreprocessedContent:
+        """
+        Preprocess content without blocking the event loop.
+
+        Large pages are cleaned and truncated in an ExtractionExecutor
+        worker process; small ones inline, as in _preprocess_content().
+
+        Args:
+            content: Raw HTML content
+            url: Source URL for list page detection heuristics
+
+        Returns:
+            PreprocessedContent with optimized content
+        """
+        from crawler.services.extraction_executor import get_extraction_executor
+
+        preprocessor = get_content_preprocessor(self.max_tokens)
+        return await get_extraction_executor().run(preprocessor.preprocess, content, url=url)
+
     def _build_request(
         self,
         preprocessed: PreprocessedContent,
@@ -461,28 +499,31 @@ class AIClientV2:
         Raises:
             AIClientError: If all retries are exhausted
         """
+        from crawler.fetchers.client_registry import get_http_client
+
         last_error: Optional[str] = None
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        self.extract_endpoint,
-                        json=payload,
-                        headers=self._get_headers(),
-                    )
+                # Shared pooled client: keeps the connection to the AI service warm
+                response = await get_http_client("ai_service").post(
+                    self.extract_endpoint,
+                    json=payload,
+                    headers=self._get_headers(),
+                    timeout=self.timeout,
+                )
 
-                    # Return immediately for non-retryable status codes
-                    if response.status_code not in self.RETRY_CODES:
-                        return response
+                # Return immediately for non-retryable status codes
+                if response.status_code not in self.RETRY_CODES:
+                    return response
 
-                    last_error = f"HTTP {response.status_code}: {response.text[:200]}"
-                    logger.warning(
-                        "Retryable error on attempt %d/%d: %s",
-                        attempt + 1,
-                        self.max_retries,
-                        last_error,
-                    )
+                last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+                logger.warning(
+                    "Retryable error on attempt %d/%d: %s",
+                    attempt + 1,
+                    self.max_retries,
+                    last_error,
+                )
 
             except httpx.TimeoutException as e:
                 last_error = f"Request timeout after {self.timeout}s: {str(e)}"
@@ -900,13 +941,15 @@ class AIClientV2:
         Returns:
             True if service responds, False otherwise
         """
+        from crawler.fetchers.client_registry import get_http_client
+
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/health/",
-                    headers=self._get_headers(),
-                )
-                return response.status_code == 200
+            response = await get_http_client("ai_service").get(
+                f"{self.base_url}/health/",
+                headers=self._get_headers(),
+                timeout=5.0,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.warning("AI Service V2 health check failed: %s", str(e))
             return False
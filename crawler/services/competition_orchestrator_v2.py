@@ -13,6 +13,7 @@ Features:
 """
 
 import logging
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -168,6 +169,7 @@ class CompetitionOrchestratorV2:
         score_hint: Optional[str] = None,
         product_type: str = "whiskey",
         product_category: Optional[str] = None,
+        content: Optional[str] = None,
     ) -> CompetitionExtractionResult:
         """
         Process a single competition URL with V2 components.
@@ -180,6 +182,7 @@ class CompetitionOrchestratorV2:
             score_hint: Optional score hint
             product_type: Product type (whiskey, port_wine)
             product_category: Optional category (bourbon, single_malt, etc.)
+            content: Already-fetched page content (skips fetching when provided)
 
         Returns:
             CompetitionExtractionResult with extraction and quality data
@@ -198,7 +201,7 @@ class CompetitionOrchestratorV2:
             }
 
             # Extract using AIExtractorV2
-            extracted = await self.ai_extractor.extract(url=url, context=context)
+            extracted = await self.ai_extractor.extract(url=url, context=context, content=content)
 
             if "error" in extracted and not extracted.get("name"):
                 return CompetitionExtractionResult(
@@ -257,6 +260,12 @@ class CompetitionOrchestratorV2:
         """
         Process a batch of competition URLs.
 
+        Detail pages are fetched concurrently via SmartRouter.fetch_many and
+        extracted as each fetch completes, so results are in completion
+        order. A failed batch fetch is recorded as a failed entry; the page
+        is not fetched again, since fetch_many already escalated through all
+        tiers.
+
         Args:
             urls: List of dicts with url, medal_hint, score_hint
             source: Competition source
@@ -266,40 +275,108 @@ class CompetitionOrchestratorV2:
         Returns:
             CompetitionBatchResult with batch statistics
         """
+        from crawler.fetchers.smart_router import SmartRouter
+
         result = CompetitionBatchResult(success=True)
 
+        infos_by_url: Dict[Optional[str], List[Dict[str, Any]]] = {}
         for url_info in urls:
-            try:
-                extraction_result = await self.process_competition_url(
-                    url=url_info.get("url") or url_info.get("detail_url"),
-                    source=source,
-                    year=year,
-                    medal_hint=url_info.get("medal_hint"),
-                    score_hint=url_info.get("score_hint"),
-                    product_type=product_type,
-                )
+            url = url_info.get("url") or url_info.get("detail_url")
+            infos_by_url.setdefault(url, []).append(url_info)
 
-                result.total_processed += 1
-                result.results.append(extraction_result)
+        # Entries without a URL still go through extraction (and fail there)
+        for url_info in infos_by_url.pop(None, []):
+            await self._process_batch_entry(result, None, url_info, source, year, product_type)
 
-                if extraction_result.success:
-                    result.successful += 1
-                    if extraction_result.needs_enrichment:
-                        result.needs_enrichment += 1
-                    else:
-                        result.complete += 1
-                else:
-                    result.failed += 1
-                    if extraction_result.error:
-                        result.errors.append(extraction_result.error)
-
-            except Exception as e:
-                result.failed += 1
-                result.errors.append(str(e))
-                result.total_processed += 1
+        router = SmartRouter()
+        try:
+            fetches = router.fetch_many(list(infos_by_url))
+            async with aclosing(fetches):
+                async for url, fetch_result in fetches:
+                    if not fetch_result.success:
+                        logger.warning("Failed to fetch competition URL %s: %s", url, fetch_result.error)
+                        for _ in infos_by_url[url]:
+                            self._add_batch_result(result, CompetitionExtractionResult(
+                                success=False,
+                                error=f"Fetch failed for {url}: {fetch_result.error}",
+                                source_url=url,
+                            ))
+                        continue
+                    for url_info in infos_by_url[url]:
+                        await self._process_batch_entry(
+                            result, url, url_info, source, year, product_type,
+                            fetch_result.content,
+                        )
+        finally:
+            await router.close()
 
         return result
 
+    async def _process_batch_entry(
+        self,
+        result: CompetitionBatchResult,
+        url: Optional[str],
+        url_info: Dict[str, Any],
+        source: str,
+        year: int,
+        product_type: str,
+        content: Optional[str] = None,
+    ) -> None:
+        """
+        Process one batch entry and add its outcome to the batch result.
+
+        Args:
+            result: Batch result to update
+            url: Detail page URL
+            url_info: Dict with medal_hint, score_hint
+            source: Competition source
+            year: Competition year
+            product_type: Product type
+            content: Already-fetched page content, if any
+        """
+        try:
+            extraction_result = await self.process_competition_url(
+                url=url,
+                source=source,
+                year=year,
+                medal_hint=url_info.get("medal_hint"),
+                score_hint=url_info.get("score_hint"),
+                product_type=product_type,
+                content=content,
+            )
+            self._add_batch_result(result, extraction_result)
+
+        except Exception as e:
+            result.failed += 1
+            result.errors.append(str(e))
+            result.total_processed += 1
+
+    @staticmethod
+    def _add_batch_result(
+        result: CompetitionBatchResult,
+        extraction_result: CompetitionExtractionResult,
+    ) -> None:
+        """
+        Add one entry's extraction outcome to the batch result.
+
+        Args:
+            result: Batch result to update
+            extraction_result: Outcome of the entry
+        """
+        result.total_processed += 1
+        result.results.append(extraction_result)
+
+        if extraction_result.success:
+            result.successful += 1
+            if extraction_result.needs_enrichment:
+                result.needs_enrichment += 1
+            else:
+                result.complete += 1
+        else:
+            result.failed += 1
+            if extraction_result.error:
+                result.errors.append(extraction_result.error)
+
     async def run_competition_discovery(
         self,
         competition_url: str,
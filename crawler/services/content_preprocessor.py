@@ -11,7 +11,9 @@ Processing Pipeline:
 4. Estimate token count
 5. Truncate oversized content while preserving boundaries
 
-Uses trafilatura for clean text extraction with BeautifulSoup fallback.
+Uses trafilatura for clean text extraction with a regex fallback. The page
+is parsed once (see html_document.HTMLDocument) and every step reads the
+same tree.
 """
 
 import logging
@@ -20,24 +22,16 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Tuple
 
+import lxml.html
+from lxml import etree
+
+from crawler.services.html_document import TRAFILATURA_AVAILABLE, get_html_document
+
 logger = logging.getLogger(__name__)
 
-# Optional dependency: trafilatura for clean text extraction
-try:
-    import trafilatura
-    TRAFILATURA_AVAILABLE = True
-except ImportError:
-    TRAFILATURA_AVAILABLE = False
+if not TRAFILATURA_AVAILABLE:
     logger.warning("trafilatura not available, will use basic text extraction")
 
-# Optional dependency: BeautifulSoup for HTML parsing
-try:
-    from bs4 import BeautifulSoup, Comment
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-    logger.warning("bs4 not available, structured HTML cleaning disabled")
-
 
 class ContentType(str, Enum):
     """Content type returned by preprocessor."""
@@ -194,15 +188,9 @@ class ContentPreprocessor:
         """
         headings = []
 
-        if BS4_AVAILABLE:
-            try:
-                soup = BeautifulSoup(html, 'html.parser')
-                for tag in soup.find_all(['h1', 'h2', 'h3']):
-                    text = tag.get_text(separator=' ', strip=True)
-                    if text and len(text) < 200:
-                        headings.append(text)
-            except Exception as e:
-                logger.debug("BeautifulSoup heading extraction failed: %s", str(e))
+        document = get_html_document(html)
+        if document.tree is not None:
+            headings = [text for text in document.headings if len(text) < 200]
         else:
             heading_pattern = re.compile(r'<h[123][^>]*>(.*?)</h[123]>', re.IGNORECASE | re.DOTALL)
             for match in heading_pattern.finditer(html):
@@ -288,13 +276,8 @@ class ContentPreprocessor:
             return self._basic_text_extract(html)
 
         try:
-            extracted = trafilatura.extract(
-                html,
-                include_links=False,
-                include_images=False,
-                include_tables=True,
-                output_format="txt",
-            )
+            document = get_html_document(html)
+            extracted = document.main_text
 
             if not extracted:
                 logger.debug("trafilatura returned empty, using fallback")
@@ -306,17 +289,10 @@ class ContentPreprocessor:
                 if first_heading and first_heading.lower() not in extracted.lower()[:500]:
                     prefix_parts.append(first_heading)
 
-            if BS4_AVAILABLE:
-                try:
-                    soup = BeautifulSoup(html, 'html.parser')
-                    title_tag = soup.find('title')
-                    if title_tag:
-                        title_text = title_tag.get_text(separator=' ', strip=True)
-                        if title_text and title_text not in prefix_parts:
-                            if title_text.lower() not in extracted.lower()[:500]:
-                                prefix_parts.insert(0, title_text)
-                except Exception:
-                    pass
+            title_text = document.title
+            if title_text and title_text not in prefix_parts:
+                if title_text.lower() not in extracted.lower()[:500]:
+                    prefix_parts.insert(0, title_text)
 
             if prefix_parts:
                 extracted = "\n".join(prefix_parts) + "\n\n" + extracted
@@ -348,69 +324,63 @@ class ContentPreprocessor:
         Returns:
             Cleaned structured HTML
         """
-        if not BS4_AVAILABLE:
-            cleaned = html
-            for tag in self.REMOVE_TAGS:
-                cleaned = re.sub(
-                    rf'<{tag}[^>]*>.*?</{tag}>',
-                    '',
-                    cleaned,
-                    flags=re.IGNORECASE | re.DOTALL
-                )
-            cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
-            cleaned = re.sub(r'\s+', ' ', cleaned)
-            return cleaned.strip()
-
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            for tag_name in self.REMOVE_TAGS:
-                for tag in soup.find_all(tag_name):
-                    tag.decompose()
-
-            for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-                comment.extract()
-
-            for tag in soup.find_all(True):
-                attrs_to_remove = []
-                for attr in tag.attrs:
-                    if attr not in self.PRESERVE_ATTRIBUTES:
-                        if attr.startswith('on'):
-                            attrs_to_remove.append(attr)
-                        elif attr in ['style', 'class', 'id']:
-                            if attr == 'class':
-                                classes = tag.get('class', [])
-                                useful_classes = [
-                                    c for c in classes
-                                    if any(kw in c.lower() for kw in ['product', 'item', 'card', 'price', 'name', 'title'])
-                                ]
-                                if useful_classes:
-                                    tag['class'] = useful_classes
-                                else:
-                                    attrs_to_remove.append(attr)
-                            else:
-                                attrs_to_remove.append(attr)
-
-                for attr in attrs_to_remove:
-                    del tag[attr]
-
-            cleaned = str(soup)
-            cleaned = re.sub(r'\s+', ' ', cleaned)
-            return cleaned.strip()
-
+            root = get_html_document(html).copy_tree()
         except Exception as e:
-            logger.warning("BeautifulSoup cleaning failed: %s, using regex fallback", str(e))
-            cleaned = html
-            for tag in self.REMOVE_TAGS:
-                cleaned = re.sub(
-                    rf'<{tag}[^>]*>.*?</{tag}>',
-                    '',
-                    cleaned,
-                    flags=re.IGNORECASE | re.DOTALL
-                )
-            cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
-            cleaned = re.sub(r'\s+', ' ', cleaned)
-            return cleaned.strip()
+            logger.warning("HTML parsing failed: %s, using regex fallback", str(e))
+            root = None
+
+        if root is None:
+            return self._regex_clean_html(html)
+
+        for element in list(root.iter(*self.REMOVE_TAGS)):
+            if element.getparent() is not None:
+                element.drop_tree()
+
+        for comment in list(root.iter(etree.Comment)):
+            comment.drop_tree()
+
+        for element in root.iter(etree.Element):
+            for attr in list(element.attrib):
+                if attr in self.PRESERVE_ATTRIBUTES:
+                    continue
+                if attr == 'class':
+                    useful_classes = [
+                        c for c in element.get('class', '').split()
+                        if any(kw in c.lower() for kw in ['product', 'item', 'card', 'price', 'name', 'title'])
+                    ]
+                    if useful_classes:
+                        element.set('class', ' '.join(useful_classes))
+                    else:
+                        del element.attrib[attr]
+                elif attr.startswith('on') or attr in ['style', 'id']:
+                    del element.attrib[attr]
+
+        cleaned = lxml.html.tostring(root, encoding='unicode')
+        cleaned = re.sub(r'\s+', ' ', cleaned)
+        return cleaned.strip()
+
+    def _regex_clean_html(self, html: str) -> str:
+        """
+        Regex fallback for _clean_structured_html when HTML cannot be parsed.
+
+        Args:
+            html: Raw HTML content
+
+        Returns:
+            HTML with noise tags and comments removed
+        """
+        cleaned = html
+        for tag in self.REMOVE_TAGS:
+            cleaned = re.sub(
+                rf'<{tag}[^>]*>.*?</{tag}>',
+                '',
+                cleaned,
+                flags=re.IGNORECASE | re.DOTALL
+            )
+        cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
+        cleaned = re.sub(r'\s+', ' ', cleaned)
+        return cleaned.strip()
 
     def _basic_text_extract(self, html: str) -> str:
         """
@@ -83,21 +83,11 @@ from crawler.validators.whiskey import normalize_whiskey_type
 
 logger = logging.getLogger(__name__)
 
-# Trafilatura import with fallback
-try:
-    import trafilatura
-    TRAFILATURA_AVAILABLE = True
-except ImportError:
-    TRAFILATURA_AVAILABLE = False
-    logger.warning("trafilatura not available, will use raw content")
+# Parsed-page views (title, h1, trafilatura text) shared with other stages
+from crawler.services.html_document import TRAFILATURA_AVAILABLE, get_html_document
 
-# BeautifulSoup for fallback extraction of title/h1
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-    logger.warning("bs4 not available, may miss title/h1 in sparse content")
+if not TRAFILATURA_AVAILABLE:
+    logger.warning("trafilatura not available, will use raw content")
 
 
 # =============================================================================
@@ -1565,6 +1555,83 @@ class ProcessingResult:
     provenance_records_created: int = 0
     whiskey_details_created: bool = False
     port_wine_details_created: bool = False
+    # Skipped because the page is unchanged since the last crawl
+    not_modified: bool = False
+
+
+def extract_main_content(raw_html: str) -> str:
+    """
+    Extract main content from raw HTML using trafilatura.
+
+    Module-level so ExtractionExecutor can run it in a worker process.
+
+    SPARSE_CONTENT_FIX: When trafilatura strips headings from sparse main content
+    (e.g., when sidebar has more detailed content), we manually extract and prepend
+    the title and h1 to ensure the product name is always present.
+
+    Args:
+        raw_html: Raw HTML content from crawler
+
+    Returns:
+        Cleaned text content with title/h1 preserved
+    """
+    if not raw_html:
+        return raw_html or ""
+
+    # SPARSE_CONTENT_FIX: Extract title and h1 from the parsed page as well
+    # Trafilatura may strip these when main content is sparse
+    title_text = None
+    h1_text = None
+    document = get_html_document(raw_html)
+
+    try:
+        title_text = document.title
+        # Handle h1 with nested elements or direct text
+        h1_text = document.h1
+    except Exception as e:
+        logger.debug(f"Title/h1 extraction failed: {e}")
+
+    if not TRAFILATURA_AVAILABLE:
+        # Fall back to raw HTML if trafilatura not available
+        return raw_html
+
+    try:
+        # Use trafilatura to extract main content (same parse as title/h1)
+        extracted = document.main_text
+
+        # SPARSE_CONTENT_FIX: Check if title/h1 are missing from trafilatura output
+        # If so, prepend them to ensure product name is available to AI
+        prefix_parts = []
+
+        if title_text:
+            # Clean title - remove common suffixes like "| Store Name"
+            clean_title = title_text.split("|")[0].strip()
+            if clean_title and (not extracted or clean_title.lower() not in extracted.lower()):
+                prefix_parts.append(f"[Page Title: {clean_title}]")
+
+        if h1_text:
+            if h1_text and (not extracted or h1_text.lower() not in extracted.lower()):
+                prefix_parts.append(f"[Main Heading: {h1_text}]")
+
+        if extracted and len(extracted) >= 50:
+            if prefix_parts:
+                # Prepend title/h1 to trafilatura output
+                combined = "\n".join(prefix_parts) + "\n" + extracted
+                logger.debug(
+                    f"Extracted {len(extracted)} chars, prepended title/h1 from {len(raw_html)} char HTML"
+                )
+                return combined
+            else:
+                logger.debug(f"Extracted {len(extracted)} chars from {len(raw_html)} char HTML")
+                return extracted
+
+        # If extraction is too short, fall back to raw HTML
+        logger.debug("Trafilatura extraction too short, using raw HTML")
+        return raw_html
+
+    except Exception as e:
+        logger.warning(f"Trafilatura extraction failed: {e}, using raw HTML")
+        return raw_html
 
 
 class ContentProcessor:
@@ -1604,9 +1671,7 @@ class ContentProcessor:
         """
         Extract main content from raw HTML using trafilatura.
 
-        SPARSE_CONTENT_FIX: When trafilatura strips headings from sparse main content
-        (e.g., when sidebar has more detailed content), we manually extract and prepend
-        the title and h1 to ensure the product name is always present.
+        See extract_main_content().
 
         Args:
             raw_html: Raw HTML content from crawler
@@ -1614,72 +1679,7 @@ class ContentProcessor:
         Returns:
             Cleaned text content with title/h1 preserved
         """
-        if not raw_html:
-            return raw_html or ""
-
-        # SPARSE_CONTENT_FIX: Extract title and h1 using BeautifulSoup before trafilatura
-        # Trafilatura may strip these when main content is sparse
-        title_text = None
-        h1_text = None
-
-        if BS4_AVAILABLE:
-            try:
-                soup = BeautifulSoup(raw_html, 'html.parser')
-                if soup.title and soup.title.string:
-                    title_text = soup.title.string.strip()
-                if soup.h1:
-                    # Handle h1 with nested elements or direct text
-                    h1_text = soup.h1.get_text(strip=True)
-            except Exception as e:
-                logger.debug(f"BeautifulSoup extraction failed: {e}")
-
-        if not TRAFILATURA_AVAILABLE:
-            # Fall back to raw HTML if trafilatura not available
-            return raw_html
-
-        try:
-            # Use trafilatura to extract main content
-            extracted = trafilatura.extract(
-                raw_html,
-                include_links=False,
-                include_images=False,
-                include_tables=True,
-                output_format="txt",
-            )
-
-            # SPARSE_CONTENT_FIX: Check if title/h1 are missing from trafilatura output
-            # If so, prepend them to ensure product name is available to AI
-            prefix_parts = []
-
-            if title_text:
-                # Clean title - remove common suffixes like "| Store Name"
-                clean_title = title_text.split("|")[0].strip()
-                if clean_title and (not extracted or clean_title.lower() not in extracted.lower()):
-                    prefix_parts.append(f"[Page Title: {clean_title}]")
-
-            if h1_text:
-                if h1_text and (not extracted or h1_text.lower() not in extracted.lower()):
-                    prefix_parts.append(f"[Main Heading: {h1_text}]")
-
-            if extracted and len(extracted) >= 50:
-                if prefix_parts:
-                    # Prepend title/h1 to trafilatura output
-                    combined = "\n".join(prefix_parts) + "\n" + extracted
-                    logger.debug(
-                        f"Extracted {len(extracted)} chars, prepended title/h1 from {len(raw_html)} char HTML"
-                    )
-                    return combined
-                else:
-                    logger.debug(f"Extracted {len(extracted)} chars from {len(raw_html)} char HTML")
-                    return extracted
-
-            # If extraction is too short, fall back to raw HTML
-            logger.debug("Trafilatura extraction too short, using raw HTML")
-            return raw_html
-
-        except Exception as e:
-            logger.warning(f"Trafilatura extraction failed: {e}, using raw HTML")
-            return raw_html
+        return extract_main_content(raw_html)
 
     def determine_product_type_hint(self, source: Optional[CrawlerSource]) -> str:
         """
@@ -1709,6 +1709,7 @@ class ContentProcessor:
         source: Optional[CrawlerSource] = None,
         crawl_job: Optional[CrawlJob] = None,
         crawled_source: Optional[CrawledSource] = None,
+        not_modified: bool = False,
     ) -> ProcessingResult:
         """
         Process crawled content through the AI Enhancement pipeline.
@@ -1722,14 +1723,24 @@ class ContentProcessor:
             source: CrawlerSource instance (the source configuration)
             crawl_job: CrawlJob instance for tracking
             crawled_source: CrawledSource instance (the actual crawled page)
+            not_modified: Page is unchanged since it was last processed
+                (FetchResult.not_modified); AI extraction is skipped
 
         Returns:
             ProcessingResult with outcome
         """
+        if not_modified:
+            logger.info(f"Skipping unchanged content from {url}")
+            await self._record_unchanged_fetch(url)
+            return ProcessingResult(success=True, not_modified=True)
+
         logger.info(f"Processing content from {url}")
 
-        # Step 1: Extract content using trafilatura
-        extracted_content = self.extract_content(raw_content)
+        # Step 1: Extract content using trafilatura (large pages in a worker
+        # process so the event loop keeps serving fetches)
+        from crawler.services.extraction_executor import get_extraction_executor
+
+        extracted_content = await get_extraction_executor().run(extract_main_content, raw_content)
 
         # Limit content size
         max_content_length = 50000
@@ -1782,6 +1793,39 @@ class ContentProcessor:
             port_wine_details_created=port_wine_details_created,
         )
 
+    async def _record_unchanged_fetch(self, url: str) -> None:
+        """
+        Record an unchanged re-fetch on the URL's CrawledURL record.
+
+        Counts as a no-change observation for recrawl scheduling, so pages
+        answering 304 drift towards longer revisit intervals.
+
+        Args:
+            url: Re-fetched URL
+        """
+        from crawler.models import CrawledURL
+        from crawler.queue.recrawl_scheduler import RecrawlScheduler
+
+        try:
+            @sync_to_async
+            def observe():
+                crawled_url = CrawledURL.objects.filter(
+                    url_hash=CrawledURL.compute_url_hash(url)
+                ).first()
+                if crawled_url is None or not crawled_url.content_hash:
+                    return
+                RecrawlScheduler().observe(crawled_url, crawled_url.content_hash)
+                crawled_url.save(
+                    update_fields=["content_hash", "content_changed", "last_crawled_at"]
+                    + RecrawlScheduler.SCHEDULE_FIELDS
+                )
+
+            await observe()
+
+        except Exception as e:
+            # Don't fail if recrawl tracking fails
+            logger.warning(f"Failed to record unchanged fetch for {url}: {e}")
+
     async def _track_cost(
         self,
         crawl_job: Optional[CrawlJob],
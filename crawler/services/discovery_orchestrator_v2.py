@@ -32,9 +32,11 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
-import httpx
-
-from crawler.fetchers.smart_router import SmartRouter
+from crawler.fetchers.client_registry import (
+    close_fetchers,
+    get_http_client,
+    get_smart_router,
+)
 from crawler.services.ai_client_v2 import AIClientV2, ExtractionResultV2, get_ai_client_v2
 from crawler.services.quality_gate_v2 import ProductStatus, QualityGateV2, get_quality_gate_v2
 from crawler.services.enrichment_orchestrator_v2 import (
@@ -161,6 +163,10 @@ class DiscoveryOrchestratorV2:
         # V3: Status progression tracking
         self._status_progression: Dict[str, List[str]] = {}
 
+        # Event loop shared by the extractions of one run(), so the shared
+        # fetchers (bound to their loop) keep warm connections across URLs
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Initialize SerpAPI client if not provided
         if self.serpapi_client is None and self.schedule is not None:
             self._init_serpapi_client()
@@ -234,8 +240,28 @@ class DiscoveryOrchestratorV2:
             self.job.save()
             raise
 
+        finally:
+            self._close_event_loop()
+
         return self.job
 
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the run's event loop, creating it on first use."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        return self._loop
+
+    def _close_event_loop(self) -> None:
+        """Close the shared fetchers bound to the run's event loop, then the loop."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.run_until_complete(close_fetchers())
+        finally:
+            self._loop.close()
+            self._loop = None
+
     def _get_search_terms(self) -> List:
         """Get search terms from schedule."""
         # Check if schedule has direct search_terms
@@ -435,44 +461,39 @@ class DiscoveryOrchestratorV2:
             product_type = "whiskey"
 
         try:
-            # Use async extraction via V2
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Use async extraction via V2, on the loop shared across the run
+            loop = self._get_event_loop()
 
-            try:
-                result = loop.run_until_complete(
-                    self.extract_single_product(
-                        url=url,
-                        product_type=product_type,
-                        save_to_db=True,
-                    )
+            result = loop.run_until_complete(
+                self.extract_single_product(
+                    url=url,
+                    product_type=product_type,
+                    save_to_db=True,
                 )
+            )
 
-                if result.success:
-                    discovery_result.crawl_success = True
-                    discovery_result.extraction_success = True
-                    discovery_result.extracted_data = result.product_data or {}
-                    discovery_result.status = DiscoveryResultStatus.SUCCESS
-                    discovery_result.is_new_product = True
-
-                    if result.product_id:
-                        from crawler.models import DiscoveredProduct
-                        try:
-                            discovery_result.product = DiscoveredProduct.objects.get(id=result.product_id)
-                        except DiscoveredProduct.DoesNotExist:
-                            pass
-
-                    self.job.products_new += 1
-                    self.job.urls_crawled += 1
-                else:
-                    discovery_result.status = DiscoveryResultStatus.FAILED
-                    discovery_result.error_message = result.error
-                    self.job.products_failed += 1
-
-                discovery_result.save()
+            if result.success:
+                discovery_result.crawl_success = True
+                discovery_result.extraction_success = True
+                discovery_result.extracted_data = result.product_data or {}
+                discovery_result.status = DiscoveryResultStatus.SUCCESS
+                discovery_result.is_new_product = True
+
+                if result.product_id:
+                    from crawler.models import DiscoveredProduct
+                    try:
+                        discovery_result.product = DiscoveredProduct.objects.get(id=result.product_id)
+                    except DiscoveredProduct.DoesNotExist:
+                        pass
+
+                self.job.products_new += 1
+                self.job.urls_crawled += 1
+            else:
+                discovery_result.status = DiscoveryResultStatus.FAILED
+                discovery_result.error_message = result.error
+                self.job.products_failed += 1
 
-            finally:
-                loop.close()
+            discovery_result.save()
 
         except Exception as e:
             logger.error(f"Extraction failed for {url}: {e}")
@@ -691,10 +712,10 @@ class DiscoveryOrchestratorV2:
         Returns:
             HTML content or None if failed
         """
-        router = None
         try:
-            # Use SmartRouter for fetching - it handles JavaScript rendering
-            router = SmartRouter(timeout=self.DEFAULT_TIMEOUT)
+            # Use the shared SmartRouter - it handles JavaScript rendering and
+            # keeps warm connections/browser contexts across pages
+            router = get_smart_router(timeout=self.DEFAULT_TIMEOUT)
 
             # For JavaScript-heavy pages (like competition sites), use Tier 3
             # which has ScrapingBee with render_js and wait capabilities
@@ -714,27 +735,20 @@ class DiscoveryOrchestratorV2:
                     url, result.error, result.tier_used
                 )
                 # Fallback to httpx for simple pages
-                async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT) as client:
-                    response = await client.get(
-                        url,
-                        follow_redirects=True,
-                        headers={
-                            "User-Agent": "Mozilla/5.0 (compatible; SpiritswiseCrawler/2.0)"
-                        }
-                    )
-                    response.raise_for_status()
-                    return response.text
+                response = await get_http_client().get(
+                    url,
+                    timeout=self.DEFAULT_TIMEOUT,
+                    follow_redirects=True,
+                    headers={
+                        "User-Agent": "Mozilla/5.0 (compatible; SpiritswiseCrawler/2.0)"
+                    }
+                )
+                response.raise_for_status()
+                return response.text
 
         except Exception as e:
             logger.error("Failed to fetch %s: %s", url, e)
             raise
-        finally:
-            # Clean up SmartRouter connections
-            if router:
-                try:
-                    await router.close()
-                except Exception:
-                    pass
 
     def _assess_quality(
         self,
@@ -58,6 +58,7 @@ Usage:
 
 import logging
 import time
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
@@ -65,7 +66,7 @@ from urllib.parse import urlparse
 import httpx
 from asgiref.sync import sync_to_async
 
-from crawler.fetchers.smart_router import SmartRouter
+from crawler.fetchers.smart_router import FetchResult, SmartRouter
 from crawler.models import EnrichmentConfig, ProductTypeConfig
 from crawler.services.ai_client_v2 import AIClientV2, get_ai_client_v2
 from crawler.services.confidence_merger import ConfidenceBasedMerger, get_confidence_merger
@@ -690,7 +691,8 @@ class EnrichmentPipelineV3:
         Process:
         1. Load EnrichmentConfigs by priority
         2. For each config: build search query from template, execute search
-        3. For each URL: fetch, extract, validate product match
+        3. Fetch the result URLs concurrently (SmartRouter.fetch_many); as each
+           completes: extract, validate product match
         4. If match: merge by confidence (0.75 for review sites)
         5. Stop when COMPLETE or limits reached
 
@@ -750,73 +752,80 @@ class EnrichmentPipelineV3:
             urls = await self._search_sources(query, session)
             session.searches_performed += 1
 
-            for url in urls:
-                # Check limits for each URL
-                if not self._check_limits(session):
-                    break
-
-                if url in session.sources_searched:
-                    continue
-                session.sources_searched.append(url)
-
-                try:
-                    # Get target fields from config if available
-                    target_fields = (
-                        config.target_fields
-                        if hasattr(config, "target_fields") and config.target_fields
-                        else []
-                    )
-
-                    extracted, confidences = await self._fetch_and_extract(
-                        url, product_type, target_fields, target_product=merged_data
-                    )
-
-                    if extracted:
-                        # Validate product match
-                        is_match, reason = self._validate_and_track(
-                            merged_data, extracted
+            # Get target fields from config if available
+            target_fields = (
+                config.target_fields
+                if hasattr(config, "target_fields") and config.target_fields
+                else []
+            )
+            candidates = list(dict.fromkeys(
+                url for url in urls if url not in session.sources_searched
+            ))
+
+            fetches = self._get_smart_router().fetch_many(candidates)
+            async with aclosing(fetches):
+                async for url, fetch_result in fetches:
+                    # Check limits for each URL (closing cancels pending fetches)
+                    if not self._check_limits(session):
+                        break
+
+                    session.sources_searched.append(url)
+
+                    try:
+                        extracted, confidences = await self._fetch_and_extract(
+                            url,
+                            product_type,
+                            target_fields,
+                            target_product=merged_data,
+                            fetch_result=fetch_result,
                         )
 
-                        if not is_match:
-                            logger.warning(
-                                "Step 2: Rejecting enrichment from %s: %s",
-                                url,
-                                reason,
+                        if extracted:
+                            # Validate product match
+                            is_match, reason = self._validate_and_track(
+                                merged_data, extracted
                             )
-                            session.sources_rejected.append({
-                                "url": url,
-                                "reason": reason,
-                            })
-                            continue
-
-                        # Merge with review site confidence
-                        review_confidence = self._get_review_site_confidence()
-                        new_data, enriched = self._merge_with_confidence(
-                            merged_data,
-                            merged_confidences,
-                            extracted,
-                            review_confidence,
-                        )
 
-                        if enriched:
-                            merged_data = new_data
-                            merged_confidences = self._get_merger().get_updated_confidences()
-                            session.sources_used.append(url)
-                            all_enriched_fields.extend(enriched)
+                            if not is_match:
+                                logger.warning(
+                                    "Step 2: Rejecting enrichment from %s: %s",
+                                    url,
+                                    reason,
+                                )
+                                session.sources_rejected.append({
+                                    "url": url,
+                                    "reason": reason,
+                                })
+                                continue
+
+                            # Merge with review site confidence
+                            review_confidence = self._get_review_site_confidence()
+                            new_data, enriched = self._merge_with_confidence(
+                                merged_data,
+                                merged_confidences,
+                                extracted,
+                                review_confidence,
+                            )
 
-                            # Track field provenance
-                            for field_name in enriched:
-                                session.field_provenance[field_name] = url
+                            if enriched:
+                                merged_data = new_data
+                                merged_confidences = self._get_merger().get_updated_confidences()
+                                session.sources_used.append(url)
+                                all_enriched_fields.extend(enriched)
 
-                            logger.debug(
-                                "Step 2: Enriched %d fields from %s: %s",
-                                len(enriched),
-                                url,
-                                enriched,
-                            )
+                                # Track field provenance
+                                for field_name in enriched:
+                                    session.field_provenance[field_name] = url
 
-                except Exception as e:
-                    logger.warning("Step 2: Failed to extract from %s: %s", url, str(e))
+                                logger.debug(
+                                    "Step 2: Enriched %d fields from %s: %s",
+                                    len(enriched),
+                                    url,
+                                    enriched,
+                                )
+
+                    except Exception as e:
+                        logger.warning("Step 2: Failed to extract from %s: %s", url, str(e))
 
         session.fields_enriched.extend(all_enriched_fields)
         return merged_data, merged_confidences
@@ -1373,6 +1382,7 @@ class EnrichmentPipelineV3:
         product_type: str,
         target_fields: List[str],
         target_product: Optional[Dict[str, Any]] = None,
+        fetch_result: Optional[FetchResult] = None,
     ) -> Tuple[Dict[str, Any], Dict[str, float]]:
         """
         Fetch URL content and extract product data.
@@ -1387,14 +1397,17 @@ class EnrichmentPipelineV3:
             target_fields: Fields to prioritize in extraction (from EnrichmentConfig).
             target_product: Target product data for matching (name, brand, category).
                 If provided and multiple products extracted, selects best match.
+            fetch_result: Result of an earlier fetch of url (e.g. from
+                SmartRouter.fetch_many); skips fetching when provided.
 
         Returns:
             Tuple of (extracted_data, field_confidences). Returns empty dicts
             on any error or if no products are found.
         """
         # Use SmartRouter for 3-tier fetching (httpx -> Playwright -> ScrapingBee)
-        smart_router = self._get_smart_router()
-        result = await smart_router.fetch(url)
+        result = fetch_result
+        if result is None:
+            result = await self._get_smart_router().fetch(url)
 
         if not result.success:
             logger.warning(
@@ -0,0 +1,313 @@
+"""
+Extraction Result Cache for AI Service V2 requests.
+
+Recrawls, mirrors and syndicated listings often produce preprocessed
+content that is byte-identical to a page already extracted. The cache
+stores AI service responses keyed by a hash of the preprocessed content,
+the product type/category and a hash of the extraction schema (built from
+FieldDefinition), so AIClientV2.extract() can skip the AI round trip. A
+schema change produces new keys; old entries age out.
+
+Entries live in the database (ExtractionCacheEntry) and are evicted when
+they expire (CRAWLER_EXTRACTION_CACHE_TTL_DAYS) or, least recently used
+first, when there are more than CRAWLER_EXTRACTION_CACHE_MAX_ENTRIES.
+
+Components:
+- ExtractionCacheKey: Hashes identifying one extraction request
+- ExtractionCache: Database-backed storage with TTL/size eviction and
+  hit/miss counters
+
+Usage:
+    cache = get_extraction_cache()
+    key = cache.make_key(payload)
+    response = await cache.aget(key)
+    if response is None:
+        ...
+        await cache.aset(key, response_data)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_json(value: Any) -> str:
+    """Compute SHA-256 hash of a value's canonical JSON form."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExtractionCacheKey:
+    """
+    Identifies one AI extraction request.
+
+    Attributes:
+        cache_key: Hash of all the fields below (the lookup key)
+        content_hash: Hash of the preprocessed content, type, headings and
+            truncation flag (source URL excluded)
+        product_type: Product type extracted
+        product_category: Optional category hint
+        schema_hash: Hash of the field names, full schema and request options
+    """
+
+    cache_key: str
+    content_hash: str
+    product_type: str
+    product_category: str
+    schema_hash: str
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> ExtractionCacheKey:
+        """
+        Build the key for an AI Service V2 request payload.
+
+        Args:
+            payload: Payload from AIClientV2._build_request()
+
+        Returns:
+            ExtractionCacheKey for the request
+        """
+        source_data = {
+            k: v for k, v in payload.get("source_data", {}).items() if k != "source_url"
+        }
+        content_hash = _hash_json(source_data)
+        schema_hash = _hash_json([
+            payload.get("extraction_schema"),
+            payload.get("schema"),
+            payload.get("options"),
+        ])
+        product_type = payload.get("product_type") or ""
+        product_category = payload.get("product_category") or ""
+        return cls(
+            cache_key=_hash_json([content_hash, product_type, product_category, schema_hash]),
+            content_hash=content_hash,
+            product_type=product_type,
+            product_category=product_category,
+            schema_hash=schema_hash,
+        )
+
+
+class ExtractionCache:
+    """
+    Database-backed cache of AI extraction responses.
+
+    Failures (e.g. no database) are logged and treated as misses so a
+    broken cache never fails an extraction.
+
+    Attributes:
+        EVICTION_INTERVAL: Stores between eviction passes
+    """
+
+    EVICTION_INTERVAL = 100
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            enabled: Whether lookups and stores happen (default:
+                CRAWLER_EXTRACTION_CACHE_ENABLED)
+            ttl_seconds: Entry lifetime (default: CRAWLER_EXTRACTION_CACHE_TTL_DAYS)
+            max_entries: Entries kept (default: CRAWLER_EXTRACTION_CACHE_MAX_ENTRIES)
+        """
+        if enabled is None:
+            enabled = getattr(settings, "CRAWLER_EXTRACTION_CACHE_ENABLED", True)
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds or (
+            getattr(settings, "CRAWLER_EXTRACTION_CACHE_TTL_DAYS", 30) * 24 * 60 * 60
+        )
+        self.max_entries = max_entries or getattr(
+            settings, "CRAWLER_EXTRACTION_CACHE_MAX_ENTRIES", 50000
+        )
+        self._lock = threading.Lock()
+        self._stores_since_eviction = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def make_key(self, payload: Dict[str, Any]) -> ExtractionCacheKey:
+        """Build the key for an AI Service V2 request payload."""
+        return ExtractionCacheKey.from_payload(payload)
+
+    def get(self, key: ExtractionCacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached response for a request.
+
+        Args:
+            key: Request key
+
+        Returns:
+            AI service response body, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        from crawler.models import ExtractionCacheEntry
+
+        now = timezone.now()
+        try:
+            entry = (
+                ExtractionCacheEntry.objects.filter(cache_key=key.cache_key, expires_at__gt=now)
+                .only("id", "response")
+                .first()
+            )
+            if entry is not None:
+                ExtractionCacheEntry.objects.filter(id=entry.id).update(
+                    hit_count=F("hit_count") + 1, last_used_at=now
+                )
+        except Exception as e:
+            logger.warning("Failed to read extraction cache: %s", str(e))
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if entry is None:
+            return None
+        logger.info(
+            "Extraction cache hit (type=%s, content=%s)", key.product_type, key.content_hash[:12]
+        )
+        return entry.response
+
+    def set(self, key: ExtractionCacheKey, response: Dict[str, Any]) -> bool:
+        """
+        Store the response for a request.
+
+        Args:
+            key: Request key
+            response: AI service response body
+
+        Returns:
+            True if stored successfully, False otherwise
+        """
+        if not self.enabled:
+            return False
+
+        from crawler.models import ExtractionCacheEntry
+
+        now = timezone.now()
+        try:
+            ExtractionCacheEntry.objects.update_or_create(
+                cache_key=key.cache_key,
+                defaults={
+                    "content_hash": key.content_hash,
+                    "product_type": key.product_type,
+                    "schema_hash": key.schema_hash,
+                    "response": response,
+                    "last_used_at": now,
+                    "expires_at": now + timedelta(seconds=self.ttl_seconds),
+                },
+            )
+        except Exception as e:
+            logger.warning("Failed to write extraction cache: %s", str(e))
+            return False
+
+        with self._lock:
+            self.stores += 1
+            self._stores_since_eviction += 1
+            evict = self._stores_since_eviction >= self.EVICTION_INTERVAL
+            if evict:
+                self._stores_since_eviction = 0
+        if evict:
+            self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        Delete expired entries, then the least recently used beyond max_entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        from crawler.models import ExtractionCacheEntry
+
+        try:
+            deleted, _ = ExtractionCacheEntry.objects.filter(
+                expires_at__lte=timezone.now()
+            ).delete()
+
+            excess = ExtractionCacheEntry.objects.count() - self.max_entries
+            if excess > 0:
+                oldest = ExtractionCacheEntry.objects.order_by("last_used_at").values_list(
+                    "id", flat=True
+                )[:excess]
+                trimmed, _ = ExtractionCacheEntry.objects.filter(id__in=list(oldest)).delete()
+                deleted += trimmed
+        except Exception as e:
+            logger.warning("Failed to evict extraction cache entries: %s", str(e))
+            return 0
+
+        with self._lock:
+            self.evictions += deleted
+        if deleted:
+            logger.info("Evicted %d extraction cache entries", deleted)
+        return deleted
+
+    async def aget(self, key: ExtractionCacheKey) -> Optional[Dict[str, Any]]:
+        """Async version of get()."""
+        if not self.enabled:
+            return None
+        return await sync_to_async(self.get, thread_sensitive=True)(key)
+
+    async def aset(self, key: ExtractionCacheKey, response: Dict[str, Any]) -> bool:
+        """Async version of set()."""
+        if not self.enabled:
+            return False
+        return await sync_to_async(self.set, thread_sensitive=True)(key, response)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters for this process.
+
+        Returns:
+            Dict with hits, misses, stores, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Singleton instance
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Get the shared extraction cache.
+
+    Returns:
+        ExtractionCache instance
+    """
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache()
+    return _extraction_cache
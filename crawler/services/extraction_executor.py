@@ -0,0 +1,270 @@
+"""
+Extraction executor for CPU-heavy page processing.
+
+Trafilatura extraction, HTML cleaning and truncation are pure CPU work.
+Run inside a coroutine they block every other fetch on the event loop, a
+2 MB page for hundreds of milliseconds. ExtractionExecutor runs them in a
+bounded pool of warm worker processes instead, so the async pipelines
+(ContentProcessor.process, AIClientV2.extract) await the result while
+fetches continue and pages are processed on several cores.
+
+Functions and arguments must be picklable: module-level functions such as
+content_processor.extract_main_content, or bound methods of picklable
+objects such as ContentPreprocessor.preprocess. Anything else, pages below
+CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES and every call when
+CRAWLER_EXTRACTION_WORKERS is 0 run inline on the calling thread. If the
+pool cannot be started (e.g. inside a daemonic Celery prefork child) the
+executor runs large pages in the event loop's default thread pool for the
+rest of the process, so they still stay off the loop.
+
+Usage:
+    from crawler.services.extraction_executor import get_extraction_executor
+
+    text = await get_extraction_executor().run(extract_main_content, html)
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, TypeVar
+
+import django
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Small page run through the extraction stack when a worker starts
+_WARMUP_HTML = (
+    "<html><head><title>Warm up</title></head><body><main><h1>Warm up</h1>"
+    "<p>Worker warm-up page with enough text for trafilatura to extract.</p>"
+    "</main></body></html>"
+)
+
+
+def _warm_worker() -> int:
+    """
+    Warm a worker process's extraction stack.
+
+    Imports lxml/trafilatura and runs one small page through extraction and
+    preprocessing so the first real page does not pay for module loading.
+
+    Returns:
+        The worker's process id
+    """
+    try:
+        from crawler.services.content_preprocessor import ContentPreprocessor
+        from crawler.services.content_processor import extract_main_content
+
+        extract_main_content(_WARMUP_HTML)
+        ContentPreprocessor().preprocess(_WARMUP_HTML)
+    except Exception as e:
+        logger.warning(f"Extraction worker warm-up failed: {e}")
+    return os.getpid()
+
+
+class ExtractionExecutor:
+    """
+    Runs CPU-heavy extraction functions in a bounded process pool.
+
+    The pool is started lazily on first use, or ahead of time with warm().
+    Workers are spawned fresh (no fork of a process running an event loop),
+    set up Django before unpickling any crawler code and are warmed as soon
+    as the pool starts.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_offload_bytes: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Worker processes (default CRAWLER_EXTRACTION_WORKERS;
+                0 runs everything inline)
+            min_offload_bytes: Smallest page sent to a worker (default
+                CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES)
+        """
+        if max_workers is None:
+            max_workers = getattr(settings, "CRAWLER_EXTRACTION_WORKERS", 0)
+        if min_offload_bytes is None:
+            min_offload_bytes = getattr(settings, "CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES", 100000)
+
+        self.max_workers = max(0, max_workers)
+        self.min_offload_bytes = min_offload_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._warming: List[Future] = []
+        self._inline = self.max_workers == 0
+        self._threaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def inline(self) -> bool:
+        """Whether every call runs inline."""
+        return self._inline
+
+    @property
+    def threaded(self) -> bool:
+        """Whether offloaded calls run in threads because the pool is unavailable."""
+        return self._threaded
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the worker pool, starting it if needed.
+
+        Returns:
+            The pool, or None if running inline or in threads
+        """
+        with self._lock:
+            if self._inline or self._threaded:
+                return None
+            if self._pool is None:
+                pool = None
+                try:
+                    # django.setup is the initializer because crawler modules
+                    # (including this one) need the app registry to import
+                    pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=django.setup,
+                    )
+                    self._warming = [
+                        pool.submit(_warm_worker) for _ in range(self.max_workers)
+                    ]
+                    self._pool = pool
+                except Exception as e:
+                    logger.warning(f"Extraction process pool unavailable, using threads: {e}")
+                    self._pool = None
+                    self._warming = []
+                    self._threaded = True
+                    if pool is not None:
+                        pool.shutdown(wait=False, cancel_futures=True)
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool so the next call starts a new one."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+                self._warming = []
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def should_offload(self, func: Callable[..., Any], *args: Any) -> bool:
+        """
+        Decide whether a call is worth sending to a worker process.
+
+        Args:
+            func: Function to run
+            *args: Its arguments; str arguments count towards the page size
+
+        Returns:
+            True if the pool is enabled, the page is large enough and func
+            can be pickled
+        """
+        if self._inline:
+            return False
+
+        size = sum(len(arg) for arg in args if isinstance(arg, str))
+        if size < self.min_offload_bytes:
+            return False
+
+        try:
+            pickle.dumps(func)
+        except Exception:
+            return False
+        return True
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run func(*args, **kwargs), in a worker process when worthwhile.
+
+        Args:
+            func: Picklable function to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's result
+        """
+        if not self.should_offload(func, *args):
+            return func(*args, **kwargs)
+
+        pool = self._get_pool()
+        if pool is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(pool, functools.partial(func, *args, **kwargs))
+        except (RuntimeError, AssertionError, OSError) as e:
+            # Pool shut down, or workers cannot be started in this process
+            # (daemonic processes may not have children)
+            logger.warning(f"Extraction process pool unavailable, using threads: {e}")
+            self._discard_pool(pool)
+            with self._lock:
+                self._threaded = True
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        try:
+            return await future
+        except BrokenProcessPool as e:
+            logger.warning(f"Extraction worker died, running {func!r} in a thread: {e}")
+            self._discard_pool(pool)
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    def warm(self) -> None:
+        """Start the worker processes and wait until they are warm."""
+        pool = self._get_pool()
+        if pool is None:
+            return
+        try:
+            for future in self._warming:
+                future.result()
+        except Exception as e:
+            logger.warning(f"Extraction worker warm-up failed, using threads: {e}")
+            self._discard_pool(pool)
+            with self._lock:
+                self._threaded = True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Wait for running tasks to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._warming = []
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Singleton instance
+_extraction_executor: Optional[ExtractionExecutor] = None
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """
+    Get the shared extraction executor.
+
+    Returns:
+        ExtractionExecutor instance
+    """
+    global _extraction_executor
+    if _extraction_executor is None:
+        _extraction_executor = ExtractionExecutor()
+    return _extraction_executor
+
+
+def shutdown_extraction_executor() -> None:
+    """Stop the shared executor's worker processes (worker shutdown)."""
+    global _extraction_executor
+    if _extraction_executor is not None:
+        _extraction_executor.shutdown()
+        _extraction_executor = None
@@ -0,0 +1,258 @@
+"""
+HTML Document - one parse of a page, shared by every processing stage.
+
+ContentProcessor.extract_content, ContentPreprocessor.preprocess and
+LinkExtractor.extract_links each parsed the same page with BeautifulSoup's
+html.parser, and trafilatura then parsed it once more. HTMLDocument parses
+a page once with lxml and memoizes the views the stages need: title,
+headings, links, JSON-LD and trafilatura's main-content text.
+
+The tree is built with trafilatura's own loader when trafilatura is
+installed, so main_text is exactly what trafilatura.extract(html) returns.
+
+get_html_document() keeps the most recently parsed pages, keyed by their
+HTML, so stages handed the same page string share one parse without
+passing the document along.
+
+Usage:
+    doc = get_html_document(html)
+    doc.title, doc.headings, doc.links, doc.main_text
+"""
+
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Iterable, List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Optional dependency: trafilatura for main-content extraction
+try:
+    import trafilatura
+    from trafilatura.utils import load_html
+    TRAFILATURA_AVAILABLE = True
+except ImportError:
+    TRAFILATURA_AVAILABLE = False
+
+
+def element_text(element: etree._Element, separator: str = "") -> str:
+    """
+    Get the text of an element, like BeautifulSoup's get_text(separator, strip=True).
+
+    Text pieces are stripped and empty ones dropped before joining;
+    comments are skipped.
+
+    Args:
+        element: lxml element
+        separator: String placed between text pieces
+
+    Returns:
+        Element text
+    """
+    return separator.join(
+        piece for piece in (text.strip() for text in element.itertext()) if piece
+    )
+
+
+class HTMLDocument:
+    """
+    A parsed HTML page with memoized views.
+
+    The tree is shared by every caller and must not be modified; stages
+    that rewrite the page work on copy_tree().
+    """
+
+    def __init__(self, html: str):
+        """
+        Initialize the document (parsing happens on first use).
+
+        Args:
+            html: Raw HTML content
+        """
+        self.html = html
+        # trafilatura accepted the page as HTML (else extract() returns None)
+        self._extractable = False
+
+    @cached_property
+    def tree(self) -> Optional[lxml.html.HtmlElement]:
+        """Root element of the parsed page, or None if it cannot be parsed."""
+        if not self.html:
+            return None
+
+        if TRAFILATURA_AVAILABLE:
+            try:
+                tree = load_html(self.html)
+            except Exception as e:
+                logger.debug("trafilatura could not load HTML: %s", str(e))
+                tree = None
+            if tree is not None:
+                self._extractable = True
+                return tree
+
+        try:
+            return lxml.html.document_fromstring(self.html)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug("lxml could not parse HTML: %s", str(e))
+            return None
+
+    def iter(self, *tags: str) -> Iterable[lxml.html.HtmlElement]:
+        """
+        Iterate over elements with the given tags in document order.
+
+        Args:
+            tags: Tag names (all elements if none given)
+
+        Returns:
+            Iterator of elements (empty if the page could not be parsed)
+        """
+        if self.tree is None:
+            return iter(())
+        return self.tree.iter(*tags) if tags else self.tree.iter(etree.Element)
+
+    def copy_tree(self) -> Optional[lxml.html.HtmlElement]:
+        """Get a private copy of the tree for callers that modify it."""
+        if self.tree is None:
+            return None
+        return copy.deepcopy(self.tree)
+
+    @cached_property
+    def title(self) -> Optional[str]:
+        """Text of the first <title>, or None if missing or empty."""
+        for element in self.iter("title"):
+            return element_text(element, " ") or None
+        return None
+
+    @cached_property
+    def h1(self) -> Optional[str]:
+        """Text of the first <h1> (pieces joined without spaces), or None."""
+        for element in self.iter("h1"):
+            return element_text(element) or None
+        return None
+
+    @cached_property
+    def headings(self) -> List[str]:
+        """Non-empty texts of all h1, h2 and h3 elements in document order."""
+        texts = (element_text(element, " ") for element in self.iter("h1", "h2", "h3"))
+        return [text for text in texts if text]
+
+    @cached_property
+    def links(self) -> List[Tuple[str, str]]:
+        """(href, anchor text) for every <a> with an href, in document order."""
+        return [
+            (element.get("href").strip(), element_text(element))
+            for element in self.iter("a")
+            if element.get("href") is not None
+        ]
+
+    @cached_property
+    def json_ld(self) -> List[Any]:
+        """Parsed JSON-LD blocks; blocks that are not valid JSON are skipped."""
+        blocks = []
+        for element in self.iter("script"):
+            if (element.get("type") or "").strip().lower() != "application/ld+json":
+                continue
+            if not element.text:
+                continue
+            try:
+                blocks.append(json.loads(element.text))
+            except ValueError as e:
+                logger.debug("Skipping invalid JSON-LD block: %s", str(e))
+        return blocks
+
+    @cached_property
+    def main_text(self) -> Optional[str]:
+        """
+        Main content as plain text, extracted by trafilatura.
+
+        Same options the processing stages always used: no links or images,
+        tables included. None if trafilatura is unavailable or finds nothing.
+        """
+        if not TRAFILATURA_AVAILABLE or self.tree is None or not self._extractable:
+            return None
+
+        # trafilatura cleans the tree it is given in place
+        return trafilatura.extract(
+            self.copy_tree(),
+            include_links=False,
+            include_images=False,
+            include_tables=True,
+            output_format="txt",
+        )
+
+
+class HTMLDocumentCache:
+    """
+    Small LRU of parsed documents keyed by their HTML.
+
+    Looking a page up hashes its HTML once (Python caches string hashes),
+    so stages handed the same string find the document cheaply.
+
+    Attributes:
+        DEFAULT_SIZE: Number of documents kept
+    """
+
+    DEFAULT_SIZE = 16
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            size: Number of documents kept
+        """
+        self.size = size
+        self._documents: "OrderedDict[str, HTMLDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, html: str) -> HTMLDocument:
+        """
+        Get the document for a page, creating it if not cached.
+
+        Args:
+            html: Raw HTML content
+
+        Returns:
+            HTMLDocument for the page
+        """
+        with self._lock:
+            document = self._documents.get(html)
+            if document is not None:
+                self._documents.move_to_end(html)
+                return document
+
+            document = HTMLDocument(html)
+            self._documents[html] = document
+            if len(self._documents) > self.size:
+                self._documents.popitem(last=False)
+            return document
+
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        with self._lock:
+            self._documents.clear()
+
+
+# Singleton cache shared by all processing stages
+_document_cache: Optional[HTMLDocumentCache] = None
+
+
+def get_html_document(html: str) -> HTMLDocument:
+    """
+    Get the shared parsed document for a page.
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        HTMLDocument (parsed on first use of any view)
+    """
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = HTMLDocumentCache()
+    return _document_cache.get(html)
@@ -11,7 +11,7 @@ from enum import Enum
 from typing import List, Optional, Set
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from crawler.services.html_document import get_html_document
 
 logger = logging.getLogger(__name__)
 
@@ -142,7 +142,7 @@ class LinkExtractor:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        document = get_html_document(html)
         base_domain = urlparse(base_url).netloc
 
         # Compile product patterns
@@ -155,9 +155,7 @@ class LinkExtractor:
         links: List[ExtractedLink] = []
         seen_urls: Set[str] = set()
 
-        for anchor in soup.find_all("a", href=True):
-            href = anchor.get("href", "").strip()
-
+        for href, anchor_text in document.links:
             if not href:
                 continue
 
@@ -180,7 +178,7 @@ class LinkExtractor:
                 continue
 
             # Extract link text
-            link_text = anchor.get_text(strip=True)[:200]
+            link_text = anchor_text[:200]
 
             # Determine if internal
             link_domain = parsed.netloc
@@ -133,19 +133,20 @@ def _track_crawled_url(
     Returns:
         CrawledURL: The created or updated CrawledURL record
     """
+    from crawler.queue.recrawl_scheduler import RecrawlScheduler
+
     url_hash = CrawledURL.compute_url_hash(source_url)
+    scheduler = RecrawlScheduler()
 
     # Try to get existing record
     crawled_url = CrawledURL.objects.filter(url_hash=url_hash).first()
 
     if crawled_url:
-        # Update existing record
-        old_content_hash = crawled_url.content_hash
+        # Update existing record (change detection + recrawl scheduling)
         if raw_content:
-            new_content_hash = CrawledURL.compute_content_hash(raw_content)
-            crawled_url.content_changed = old_content_hash != new_content_hash
-            crawled_url.content_hash = new_content_hash
-        crawled_url.last_crawled_at = timezone.now()
+            scheduler.observe(crawled_url, CrawledURL.compute_content_hash(raw_content))
+        else:
+            crawled_url.last_crawled_at = timezone.now()
         crawled_url.was_processed = True
         crawled_url.is_product_page = is_product_page
         crawled_url.processing_status = processing_status
@@ -164,6 +165,7 @@ def _track_crawled_url(
             last_crawled_at=timezone.now(),
             content_hash=content_hash,
             content_changed=False,
+            next_recrawl_at=timezone.now() + scheduler.next_interval(None),
         )
 
     return crawled_url
@@ -11,12 +11,23 @@ Features:
 
 This is currently a stub/mock implementation that defines the interface.
 Actual ScrapingBee API calls can be enabled by providing a valid API key.
+
+Async callers use afetch()/afetch_with_retry()/aget(), which share one
+pooled httpx client per event loop and back off with asyncio.sleep. Async
+requests run under a process-wide ScrapingBeeCreditBudget: at most
+CRAWLER_SCRAPINGBEE_CONCURRENCY are in flight, fewer when the remaining
+credits only pay for fewer.
 """
 
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +65,10 @@ class ScrapingBeeResponse:
     error: Optional[str] = None
 
 
+class ScrapingBeeBudgetExhausted(Exception):
+    """Raised when the remaining credits do not pay for another request."""
+
+
 class ScrapingBeeClient:
     """
     Client wrapper for ScrapingBee API.
@@ -66,8 +81,12 @@ class ScrapingBeeClient:
     ScrapingBee API integration.
     """
 
-    # ScrapingBee API endpoint
+    # ScrapingBee API endpoints
     API_URL = "https://app.scrapingbee.com/api/v1/"
+    USAGE_URL = "https://app.scrapingbee.com/api/v1/usage"
+
+    # Name of the shared httpx pool used by async requests
+    HTTP_CLIENT_NAME = "scrapingbee"
 
     # Default parameters for each mode
     MODE_PARAMS = {
@@ -229,7 +248,7 @@ class ScrapingBeeClient:
             import requests
 
             response = requests.get(
-                "https://app.scrapingbee.com/api/v1/usage",
+                self.USAGE_URL,
                 params={"api_key": self.api_key},
                 timeout=10,
             )
@@ -281,8 +300,6 @@ class ScrapingBeeClient:
         Returns:
             HTML content string if successful, None if all retries fail
         """
-        import time
-
         last_error = None
         base_delay = 2  # seconds
 
@@ -334,3 +351,393 @@ class ScrapingBeeClient:
             f"ScrapingBee gave up after {max_retries} retries for {url}: {last_error}"
         )
         return None
+
+    @staticmethod
+    def estimate_cost(params: Dict[str, Any]) -> int:
+        """
+        Estimate the credits a request with these parameters costs.
+
+        Based on ScrapingBee pricing: 1 credit for a plain request, 5 with
+        JavaScript rendering, 10/25 with premium proxies (without/with
+        rendering), 75 with stealth proxies.
+
+        Args:
+            params: ScrapingBee request parameters
+
+        Returns:
+            Estimated credit cost
+        """
+        render_js = params.get("render_js", True)
+        if params.get("stealth_proxy"):
+            return 75
+        if params.get("premium_proxy"):
+            return 25 if render_js else 10
+        return 5 if render_js else 1
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 60.0,
+    ) -> httpx.Response:
+        """
+        Send one ScrapingBee API request on the shared connection pool.
+
+        Waits for a slot in the credit budget first, and charges the
+        request's Spb-Cost to the budget when it completes.
+
+        Args:
+            url: URL to fetch
+            params: ScrapingBee request parameters
+            timeout: HTTP timeout in seconds
+
+        Returns:
+            Raw API response (the page content is the response body)
+
+        Raises:
+            ScrapingBeeBudgetExhausted: If the remaining credits do not pay
+                for the request
+            httpx.HTTPError: On transport errors
+        """
+        params = params or {}
+        cost = self.estimate_cost(params)
+        budget = get_credit_budget()
+
+        async with budget.slot(self, cost):
+            if self._mock_mode:
+                result = self._mock_fetch(url, ScrapingBeeMode.JS_RENDER, params)
+                response = httpx.Response(
+                    result["status_code"],
+                    text=result["content"],
+                    headers={"Spb-Cost": str(result["cost"])},
+                )
+            else:
+                from crawler.fetchers.client_registry import get_http_client
+
+                client = get_http_client(self.HTTP_CLIENT_NAME)
+                response = await client.get(
+                    self.API_URL,
+                    params={"api_key": self.api_key, "url": url, **params},
+                    timeout=timeout,
+                )
+            budget.spend(int(response.headers.get("Spb-Cost", cost)))
+
+        return response
+
+    async def afetch(
+        self,
+        url: str,
+        mode: ScrapingBeeMode = ScrapingBeeMode.JS_RENDER,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async version of fetch().
+
+        Args:
+            url: URL to fetch
+            mode: Crawling mode to use
+            extra_params: Additional parameters to pass to ScrapingBee
+
+        Returns:
+            Dictionary with success, content, status_code, and optional error
+        """
+        params = self.get_params_for_mode(mode)
+
+        if extra_params:
+            params.update(extra_params)
+
+        logger.info(
+            f"ScrapingBee async fetch: url={url}, mode={mode.value}, params={params}"
+        )
+
+        try:
+            response = await self.aget(url, params)
+        except (ScrapingBeeBudgetExhausted, httpx.HTTPError) as e:
+            logger.error(f"ScrapingBee API error: {e}")
+            return {
+                "success": False,
+                "content": "",
+                "status_code": 0,
+                "error": str(e),
+            }
+
+        return {
+            "success": response.status_code == 200,
+            "content": response.text,
+            "status_code": response.status_code,
+            "cost": int(response.headers.get("Spb-Cost", 1)),
+        }
+
+    async def aget_remaining_credits(self) -> Optional[int]:
+        """
+        Async version of get_remaining_credits().
+
+        Returns:
+            Number of remaining credits, or None if unable to check
+        """
+        if self._mock_mode:
+            return 10000  # Mock unlimited credits
+
+        try:
+            from crawler.fetchers.client_registry import get_http_client
+
+            client = get_http_client(self.HTTP_CLIENT_NAME)
+            response = await client.get(
+                self.USAGE_URL,
+                params={"api_key": self.api_key},
+                timeout=10.0,
+            )
+
+            if response.status_code == 200:
+                return response.json().get("remaining_credits")
+
+        except Exception as e:
+            logger.error(f"Error checking ScrapingBee credits: {e}")
+
+        return None
+
+    async def afetch_with_retry(
+        self,
+        url: str,
+        max_retries: int = 3,
+        mode: ScrapingBeeMode = ScrapingBeeMode.JS_RENDER,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Async version of fetch_with_retry().
+
+        Same retry policy (2s, 4s, 8s backoff on 5xx and exceptions, no
+        retry on 4xx), but waits with asyncio.sleep so other fetches keep
+        running. A request the credit budget refuses is not retried.
+
+        Args:
+            url: URL to fetch
+            max_retries: Maximum number of retry attempts (default: 3)
+            mode: ScrapingBee crawling mode
+            extra_params: Additional parameters for ScrapingBee
+
+        Returns:
+            HTML content string if successful, None if all retries fail
+        """
+        last_error = None
+        base_delay = 2  # seconds
+
+        for attempt in range(max_retries):
+            try:
+                result = await self.afetch(url, mode=mode, extra_params=extra_params)
+
+                if result.get("success") and result.get("status_code") == 200:
+                    return result.get("content")
+
+                status_code = result.get("status_code", 0)
+
+                # Retry on server errors (5xx)
+                if 500 <= status_code < 600:
+                    last_error = f"HTTP {status_code}"
+                    if attempt < max_retries - 1:
+                        delay = base_delay * (2 ** attempt)  # 2, 4, 8 seconds
+                        logger.warning(
+                            f"ScrapingBee retry {attempt + 1}/{max_retries} for {url}, "
+                            f"status={status_code}, waiting {delay}s"
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+
+                # Don't retry on client errors (4xx)
+                if 400 <= status_code < 500:
+                    logger.warning(
+                        f"ScrapingBee client error for {url}: HTTP {status_code}"
+                    )
+                    return None
+
+                # Unknown error - don't retry
+                last_error = result.get("error", f"HTTP {status_code}")
+                logger.warning(f"ScrapingBee error for {url}: {last_error}")
+                return None
+
+            except Exception as e:
+                last_error = str(e)
+                if attempt < max_retries - 1:
+                    delay = base_delay * (2 ** attempt)
+                    logger.warning(
+                        f"ScrapingBee exception retry {attempt + 1}/{max_retries} for {url}: {e}, "
+                        f"waiting {delay}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+        logger.error(
+            f"ScrapingBee gave up after {max_retries} retries for {url}: {last_error}"
+        )
+        return None
+
+
+class ScrapingBeeCreditBudget:
+    """
+    Caps concurrent ScrapingBee requests by concurrency limit and credits.
+
+    A request may start while fewer than
+    min(CRAWLER_SCRAPINGBEE_CONCURRENCY, requests the remaining credits pay
+    for, QuotaManager's remaining scrapingbee quota) are in flight. The
+    remaining credits are read from the usage endpoint at most every
+    CRAWLER_SCRAPINGBEE_CREDIT_REFRESH_SECONDS and reduced by each
+    request's cost in between.
+    """
+
+    def __init__(self):
+        """Initialize with unknown credits and no requests in flight."""
+        self._credits: Optional[int] = None
+        self._quota: Optional[int] = None
+        self._refreshed_at: Optional[float] = None
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self._in_flight
+
+    def limit(self, cost: int) -> int:
+        """
+        Get the number of concurrent requests of this cost allowed now.
+
+        Args:
+            cost: Estimated credit cost per request
+
+        Returns:
+            Concurrency limit (0 when the budget is exhausted)
+        """
+        from django.conf import settings
+
+        limit = getattr(settings, "CRAWLER_SCRAPINGBEE_CONCURRENCY", 5)
+        if self._credits is not None:
+            limit = min(limit, self._credits // max(1, cost))
+        if self._quota is not None:
+            limit = min(limit, self._quota)
+        return max(0, limit)
+
+    def spend(self, cost: int) -> None:
+        """
+        Charge a completed request to the cached budget.
+
+        Args:
+            cost: Credits the request used
+        """
+        if self._credits is not None:
+            self._credits = max(0, self._credits - cost)
+        if self._quota is not None:
+            self._quota = max(0, self._quota - 1)
+
+    async def refresh(self, client: ScrapingBeeClient, force: bool = False) -> None:
+        """
+        Re-read remaining credits and quota if the cached values are stale.
+
+        Concurrent callers wait for one refresh instead of each querying.
+        Unknown values (API or database unavailable) leave that cap off.
+
+        Args:
+            client: Client used to query the usage endpoint
+            force: Refresh even if the cached values are fresh
+        """
+        from django.conf import settings
+
+        interval = getattr(settings, "CRAWLER_SCRAPINGBEE_CREDIT_REFRESH_SECONDS", 60.0)
+
+        def _stale() -> bool:
+            return (
+                self._refreshed_at is None
+                or time.monotonic() - self._refreshed_at >= interval
+            )
+
+        if not force and not _stale():
+            return
+
+        refreshed_at = self._refreshed_at
+        async with self._loop_state()[1]:
+            # Another caller refreshed while this one waited for the lock
+            if self._refreshed_at != refreshed_at and not _stale():
+                return
+            self._credits = await client.aget_remaining_credits()
+            self._quota = await self._get_quota_remaining()
+            self._refreshed_at = time.monotonic()
+
+        logger.debug(
+            f"ScrapingBee budget refreshed: credits={self._credits}, quota={self._quota}"
+        )
+
+    async def _get_quota_remaining(self) -> Optional[int]:
+        """Get QuotaManager's remaining scrapingbee quota, or None if unavailable."""
+        try:
+            from asgiref.sync import sync_to_async
+            from crawler.services.quota_manager import get_quota_manager
+
+            return await sync_to_async(
+                get_quota_manager().get_remaining, thread_sensitive=True
+            )("scrapingbee")
+        except Exception as e:
+            logger.debug(f"ScrapingBee quota unavailable: {e}")
+            return None
+
+    def _loop_state(self) -> Tuple[asyncio.Condition, asyncio.Lock]:
+        """Get the slot condition and refresh lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._refresh_lock = asyncio.Lock()
+            self._loop = loop
+            self._in_flight = 0
+        return self._condition, self._refresh_lock
+
+    @asynccontextmanager
+    async def slot(self, client: ScrapingBeeClient, cost: int) -> AsyncIterator[None]:
+        """
+        Hold one request slot.
+
+        Waits while the limit is reached. If the budget pays for no request
+        and none is in flight, gives up unless the credits have not been
+        re-read since the request started waiting.
+
+        Args:
+            client: Client used to refresh remaining credits
+            cost: Estimated credit cost of the request
+
+        Raises:
+            ScrapingBeeBudgetExhausted: If the budget pays for no request
+        """
+        requested_at = time.monotonic()
+        await self.refresh(client)
+        condition = self._loop_state()[0]
+
+        async with condition:
+            while self._in_flight >= self.limit(cost):
+                if self._in_flight == 0:
+                    if self._refreshed_at is not None and self._refreshed_at >= requested_at:
+                        raise ScrapingBeeBudgetExhausted(
+                            f"ScrapingBee credit budget exhausted "
+                            f"(credits={self._credits}, quota={self._quota}, cost={cost})"
+                        )
+                    await self.refresh(client, force=True)
+                    continue
+                await condition.wait()
+            self._in_flight += 1
+
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+
+# Singleton budget shared by all clients (credits belong to the account)
+_credit_budget: Optional[ScrapingBeeCreditBudget] = None
+
+
+def get_credit_budget() -> ScrapingBeeCreditBudget:
+    """Get singleton ScrapingBeeCreditBudget instance."""
+    global _credit_budget
+    if _credit_budget is None:
+        _credit_budget = ScrapingBeeCreditBudget()
+    return _credit_budget
@@ -23,8 +23,6 @@ from io import BytesIO
 from typing import List, Optional
 from xml.etree import ElementTree as ET
 
-import httpx
-
 logger = logging.getLogger(__name__)
 
 
@@ -276,24 +274,27 @@ class SitemapParser:
             "Accept": "application/xml, text/xml, application/gzip, */*",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
+        from crawler.fetchers.client_registry import get_http_client
+
+        response = await get_http_client().get(
+            url, headers=headers, follow_redirects=True, timeout=self.timeout
+        )
 
-            if response.status_code == 404:
-                raise SitemapParseError(f"HTTP 404: Not Found - {url}")
-            if response.status_code >= 400:
-                raise SitemapParseError(
-                    f"HTTP {response.status_code}: {response.reason_phrase}"
-                )
+        if response.status_code == 404:
+            raise SitemapParseError(f"HTTP 404: Not Found - {url}")
+        if response.status_code >= 400:
+            raise SitemapParseError(
+                f"HTTP {response.status_code}: {response.reason_phrase}"
+            )
 
-            # Check content length
-            content_length = response.headers.get("content-length")
-            if content_length and int(content_length) > self.max_size_bytes:
-                raise SitemapParseError(
-                    f"Sitemap too large: {content_length} bytes exceeds {self.max_size_bytes}"
-                )
+        # Check content length
+        content_length = response.headers.get("content-length")
+        if content_length and int(content_length) > self.max_size_bytes:
+            raise SitemapParseError(
+                f"Sitemap too large: {content_length} bytes exceeds {self.max_size_bytes}"
+            )
 
-            return response.content
+        return response.content
 
     async def _fetch_robots_txt(self, url: str) -> str:
         """
@@ -310,10 +311,13 @@ class SitemapParser:
             "Accept": "text/plain, */*",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            return response.text
+        from crawler.fetchers.client_registry import get_http_client
+
+        response = await get_http_client().get(
+            url, headers=headers, follow_redirects=True, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.text
 
     def _is_gzipped(self, content: bytes) -> bool:
         """Check if content is gzip compressed by magic bytes."""
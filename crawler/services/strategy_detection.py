@@ -20,6 +20,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any
 
+import httpx
+from asgiref.sync import sync_to_async
+
 from crawler.models import (
     DiscoverySourceConfig,
     CrawlStrategyChoices,
@@ -266,6 +269,18 @@ class EscalationResult:
     error: Optional[str] = None
 
 
+# Browser-like headers for the simple (non-ScrapingBee) strategy
+SIMPLE_CRAWL_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+
 class StrategyEscalationService:
     """
     Service for managing crawl strategy escalation.
@@ -353,6 +368,9 @@ class StrategyEscalationService:
         """
         Attempt to crawl a URL with automatic strategy escalation.
 
+        Blocks on every request and retry; from async code use
+        aescalate_and_crawl() instead.
+
         Args:
             url: URL to crawl
             source: Optional DiscoverySourceConfig to update on success
@@ -369,68 +387,175 @@ class StrategyEscalationService:
             logger.info(f"Escalation step {step}: Trying strategy '{strategy}' for {url}")
 
             if strategy == CrawlStrategyChoices.MANUAL:
-                # Cannot auto-crawl with manual strategy
-                logger.warning(f"Escalation reached manual step for {url}")
-                return EscalationResult(
-                    success=False,
-                    escalation_steps=step,
-                    detected_obstacles=all_obstacles,
-                    error="Escalation exhausted, manual intervention required",
-                )
+                return self._manual_result(url, step, all_obstacles)
 
             try:
                 result = self._attempt_crawl(url, strategy)
 
-                if result.get("success"):
-                    content = result.get("content", "")
-                    status_code = result.get("status_code", 200)
-
-                    # Detect obstacles in the result
-                    obstacles = detect_obstacles(content, status_code, expected_elements)
-
-                    # Log obstacles
-                    for obstacle in obstacles:
-                        all_obstacles.append({
-                            "step": step,
-                            "strategy": strategy,
-                            "type": obstacle.obstacle_type.value,
-                            "pattern": obstacle.detected_pattern,
-                            "confidence": obstacle.confidence,
-                        })
-
-                    # Check if content is valid
-                    if self._is_content_valid(content, status_code, expected_elements):
-                        # Success - update source strategy if provided
-                        if source:
-                            self._update_source_strategy(source, strategy, all_obstacles)
-
-                        logger.info(
-                            f"Crawl successful with strategy '{strategy}' after {step} step(s)"
-                        )
-                        return EscalationResult(
-                            success=True,
-                            content=content,
-                            final_strategy=strategy,
-                            escalation_steps=step,
-                            detected_obstacles=all_obstacles,
-                        )
+                if self._check_attempt(result, step, strategy, expected_elements, all_obstacles):
+                    # Success - update source strategy if provided
+                    if source:
+                        self._update_source_strategy(source, strategy, all_obstacles)
+                    return self._success_result(result, step, strategy, all_obstacles)
 
-                    # Content not valid, continue escalation
-                    logger.info(
-                        f"Strategy '{strategy}' returned content but obstacles detected, escalating"
-                    )
+            except Exception as e:
+                self._record_attempt_error(e, step, strategy, all_obstacles)
+
+        return self._exhausted_result(max_steps, all_obstacles)
+
+    async def aescalate_and_crawl(
+        self,
+        url: str,
+        source: Optional[DiscoverySourceConfig] = None,
+        expected_elements: Optional[List[str]] = None,
+        max_steps: int = 4,
+    ) -> EscalationResult:
+        """
+        Async version of escalate_and_crawl().
+
+        The simple step goes through the shared httpx client and the
+        ScrapingBee steps through ScrapingBeeClient.afetch(), so no request
+        blocks the event loop.
+
+        Args:
+            url: URL to crawl
+            source: Optional DiscoverySourceConfig to update on success
+            expected_elements: Elements to check for valid content
+            max_steps: Maximum escalation steps (default 4)
+
+        Returns:
+            EscalationResult with crawl outcome
+        """
+        all_obstacles: List[Dict[str, Any]] = []
+
+        for step in range(1, max_steps + 1):
+            strategy = self.get_strategy_for_step(step)
+            logger.info(f"Escalation step {step}: Trying strategy '{strategy}' for {url}")
+
+            if strategy == CrawlStrategyChoices.MANUAL:
+                return self._manual_result(url, step, all_obstacles)
+
+            try:
+                result = await self._aattempt_crawl(url, strategy)
+
+                if self._check_attempt(result, step, strategy, expected_elements, all_obstacles):
+                    if source:
+                        await sync_to_async(self._update_source_strategy)(
+                            source, strategy, all_obstacles
+                        )
+                    return self._success_result(result, step, strategy, all_obstacles)
 
             except Exception as e:
-                logger.error(f"Error during crawl attempt with strategy '{strategy}': {e}")
-                all_obstacles.append({
-                    "step": step,
-                    "strategy": strategy,
-                    "type": "error",
-                    "pattern": str(e),
-                    "confidence": 1.0,
-                })
-
-        # All steps exhausted
+                self._record_attempt_error(e, step, strategy, all_obstacles)
+
+        return self._exhausted_result(max_steps, all_obstacles)
+
+    def _check_attempt(
+        self,
+        result: Dict[str, Any],
+        step: int,
+        strategy: str,
+        expected_elements: Optional[List[str]],
+        all_obstacles: List[Dict[str, Any]],
+    ) -> bool:
+        """
+        Record the obstacles of a crawl attempt and check its content.
+
+        Args:
+            result: Dict from the crawl attempt
+            step: Escalation step number
+            strategy: Strategy used
+            expected_elements: Elements to check for valid content
+            all_obstacles: Obstacle log to append to
+
+        Returns:
+            True if the attempt returned valid content
+        """
+        if not result.get("success"):
+            return False
+
+        content = result.get("content", "")
+        status_code = result.get("status_code", 200)
+
+        # Detect obstacles in the result
+        obstacles = detect_obstacles(content, status_code, expected_elements)
+
+        # Log obstacles
+        for obstacle in obstacles:
+            all_obstacles.append({
+                "step": step,
+                "strategy": strategy,
+                "type": obstacle.obstacle_type.value,
+                "pattern": obstacle.detected_pattern,
+                "confidence": obstacle.confidence,
+            })
+
+        if self._is_content_valid(content, status_code, expected_elements):
+            logger.info(
+                f"Crawl successful with strategy '{strategy}' after {step} step(s)"
+            )
+            return True
+
+        # Content not valid, continue escalation
+        logger.info(
+            f"Strategy '{strategy}' returned content but obstacles detected, escalating"
+        )
+        return False
+
+    @staticmethod
+    def _record_attempt_error(
+        error: Exception,
+        step: int,
+        strategy: str,
+        all_obstacles: List[Dict[str, Any]],
+    ) -> None:
+        """Log a failed crawl attempt and add it to the obstacle log."""
+        logger.error(f"Error during crawl attempt with strategy '{strategy}': {error}")
+        all_obstacles.append({
+            "step": step,
+            "strategy": strategy,
+            "type": "error",
+            "pattern": str(error),
+            "confidence": 1.0,
+        })
+
+    @staticmethod
+    def _success_result(
+        result: Dict[str, Any],
+        step: int,
+        strategy: str,
+        all_obstacles: List[Dict[str, Any]],
+    ) -> EscalationResult:
+        """Build the result of a successful crawl attempt."""
+        return EscalationResult(
+            success=True,
+            content=result.get("content", ""),
+            final_strategy=strategy,
+            escalation_steps=step,
+            detected_obstacles=all_obstacles,
+        )
+
+    @staticmethod
+    def _manual_result(
+        url: str,
+        step: int,
+        all_obstacles: List[Dict[str, Any]],
+    ) -> EscalationResult:
+        """Build the result for reaching the manual step (cannot auto-crawl)."""
+        logger.warning(f"Escalation reached manual step for {url}")
+        return EscalationResult(
+            success=False,
+            escalation_steps=step,
+            detected_obstacles=all_obstacles,
+            error="Escalation exhausted, manual intervention required",
+        )
+
+    @staticmethod
+    def _exhausted_result(
+        max_steps: int,
+        all_obstacles: List[Dict[str, Any]],
+    ) -> EscalationResult:
+        """Build the result for all steps failing."""
         return EscalationResult(
             success=False,
             escalation_steps=max_steps,
@@ -458,6 +583,26 @@ class StrategyEscalationService:
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
 
+    async def _aattempt_crawl(self, url: str, strategy: str) -> Dict[str, Any]:
+        """
+        Async version of _attempt_crawl().
+
+        Args:
+            url: URL to crawl
+            strategy: Crawl strategy to use
+
+        Returns:
+            Dict with success, content, and status_code
+        """
+        if strategy == CrawlStrategyChoices.SIMPLE:
+            return await self._asimple_crawl(url)
+        elif strategy == CrawlStrategyChoices.JS_RENDER:
+            return await self.client.afetch(url, mode=ScrapingBeeMode.JS_RENDER)
+        elif strategy == CrawlStrategyChoices.STEALTH:
+            return await self.client.afetch(url, mode=ScrapingBeeMode.STEALTH)
+        else:
+            raise ValueError(f"Unknown strategy: {strategy}")
+
     def _simple_crawl(self, url: str) -> Dict[str, Any]:
         """
         Perform a simple HTTP crawl without ScrapingBee.
@@ -471,16 +616,7 @@ class StrategyEscalationService:
         import requests
 
         try:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            }
-            response = requests.get(url, headers=headers, timeout=30)
+            response = requests.get(url, headers=SIMPLE_CRAWL_HEADERS, timeout=30)
 
             return {
                 "success": True,
@@ -495,6 +631,36 @@ class StrategyEscalationService:
                 "error": str(e),
             }
 
+    async def _asimple_crawl(self, url: str) -> Dict[str, Any]:
+        """
+        Perform a simple HTTP crawl through the shared httpx client.
+
+        Args:
+            url: URL to crawl
+
+        Returns:
+            Dict with success, content, and status_code
+        """
+        from crawler.fetchers.client_registry import get_http_client
+
+        try:
+            response = await get_http_client().get(
+                url, headers=SIMPLE_CRAWL_HEADERS, timeout=30.0, follow_redirects=True
+            )
+
+            return {
+                "success": True,
+                "content": response.text,
+                "status_code": response.status_code,
+            }
+        except httpx.HTTPError as e:
+            return {
+                "success": False,
+                "content": "",
+                "status_code": 0,
+                "error": str(e),
+            }
+
     def _update_source_strategy(
         self,
         source: DiscoverySourceConfig,
@@ -8,7 +8,8 @@ Features:
 - Parse response for archived URL (format: https://web.archive.org/web/{timestamp}/{url})
 - Update CrawledSource.wayback_url and wayback_saved_at
 - Update wayback_status to 'saved' or 'failed'
-- Raw content cleanup utility after successful archive
+- Raw content cleanup utility after successful archive (keeps a local copy
+  in the response archive when CRAWLER_RESPONSE_ARCHIVE_ENABLED)
 """
 
 import logging
@@ -16,6 +17,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 import requests
+from django.conf import settings
 from django.utils import timezone
 
 from crawler.models import CrawledSource, WaybackStatusChoices
@@ -199,6 +201,15 @@ def cleanup_raw_content(crawled_source: CrawledSource) -> bool:
         )
         return False
 
+    # Keep a local copy for re-extraction before dropping it from the database
+    if crawled_source.raw_content and getattr(
+        settings, "CRAWLER_RESPONSE_ARCHIVE_ENABLED", False
+    ):
+        try:
+            _archive_raw_content(crawled_source)
+        except Exception as e:
+            logger.error(f"Failed to archive raw_content for {crawled_source.url}: {e}")
+
     # Clear raw_content but keep content_hash for deduplication
     crawled_source.raw_content = None
     crawled_source.raw_content_cleared = True
@@ -208,6 +219,28 @@ def cleanup_raw_content(crawled_source: CrawledSource) -> bool:
     return True
 
 
+def _archive_raw_content(crawled_source: CrawledSource) -> None:
+    """Store raw_content in the response archive unless already archived."""
+    from crawler.fetchers.response_archive import ResponseArchive
+
+    archive = ResponseArchive()
+    content_hash = ResponseArchive.compute_hash(crawled_source.raw_content)
+    if any(
+        record.content_hash == content_hash
+        for record in archive.history(crawled_source.url)
+    ):
+        return
+
+    # Tier 0: the fetching tier is not recorded on CrawledSource
+    archive.store(
+        crawled_source.url,
+        crawled_source.raw_content,
+        status_code=200,
+        tier=0,
+        fetched_at=crawled_source.crawled_at,
+    )
+
+
 def get_pending_wayback_sources(limit: int = 100) -> list:
     """
     Get CrawledSource records pending Wayback archiving.
@@ -55,6 +55,39 @@ logger = logging.getLogger(__name__)
 WHISKEY_KEYWORDS = ['whisky', 'whiskey', 'bourbon', 'scotch', 'malt', 'rye']
 
 
+def _close_task_loop(loop) -> None:
+    """
+    Close a task-owned event loop.
+
+    The shared fetchers bound to the loop (see crawler.fetchers.client_registry)
+    are closed on it first, so each task releases its pooled connections.
+    """
+    from crawler.fetchers.client_registry import close_fetchers
+
+    try:
+        loop.run_until_complete(close_fetchers())
+    finally:
+        loop.close()
+
+
+def _run_async(coro):
+    """
+    Run a coroutine on a fresh event loop and close that loop.
+
+    Used instead of asyncio.run() so the shared fetchers bound to the loop are
+    closed before it goes away.
+    """
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        _close_task_loop(loop)
+        asyncio.set_event_loop(None)
+
+
 @shared_task(name="crawler.tasks.check_due_sources")
 def check_due_sources() -> Dict[str, Any]:
     """
@@ -230,6 +263,9 @@ def crawl_source(self, source_id: str, job_id: str) -> Dict[str, Any]:
         # Get URL frontier
         frontier = get_url_frontier()
 
+        # Recover URLs leased by crawls that died mid-fetch
+        frontier.reap_expired_leases(source.slug)
+
         # Initialize with base URL if queue is empty
         if frontier.is_empty(source.slug):
             frontier.add_url(
@@ -253,7 +289,7 @@ def crawl_source(self, source_id: str, job_id: str) -> Dict[str, Any]:
         finally:
             # Cleanup router resources on the SAME event loop
             loop.run_until_complete(router.close())
-            loop.close()
+            _close_task_loop(loop)
 
         # Update job metrics
         job.pages_crawled = metrics["pages_crawled"]
@@ -484,7 +520,7 @@ def _crawl_competition_source(source: CrawlerSource, job: CrawlJob) -> Dict[str,
 
         finally:
             loop.run_until_complete(router.close())
-            loop.close()
+            _close_task_loop(loop)
 
         # Update job metrics
         job.pages_crawled = metrics["pages_crawled"]
@@ -528,12 +564,22 @@ async def _process_source_urls(
     frontier,
     metrics: Dict[str, int],
     max_pages: int = 100,
+    concurrency: Optional[int] = None,
 ) -> Dict[str, int]:
     """
     Process URLs from the frontier for a source.
 
     Uses ContentProcessor for AI Enhancement Service integration.
 
+    Up to ``concurrency`` URLs are processed at the same time. Each in-flight
+    URL reserves one slot of the ``max_pages`` budget before it is dequeued,
+    and the slot is released again if the fetch fails, so the number of
+    successfully crawled pages never exceeds ``max_pages``. Fetches against a
+    single domain are additionally limited by the router to the domain's
+    learned concurrency window, and URLs are dequeued via the frontier's
+    politeness scheduler so each host's crawl delay is respected; AI
+    processing of fetched pages is not domain-limited.
+
     Args:
         source: CrawlerSource to process
         job: CrawlJob tracking this crawl
@@ -541,70 +587,141 @@ async def _process_source_urls(
         frontier: URLFrontier instance
         metrics: Metrics dictionary to update
         max_pages: Maximum pages to process per crawl
+        concurrency: Maximum URLs in flight (default: CRAWLER_SOURCE_CONCURRENCY)
 
     Returns:
         Updated metrics dictionary
     """
+    import asyncio
+    from django.conf import settings
+    from asgiref.sync import sync_to_async
+    from crawler.queue.url_frontier import FrontierPrefetcher
+
     # Import ContentProcessor for AI Enhancement integration
     from crawler.services.content_processor import ContentProcessor
 
-    pages_processed = 0
+    if concurrency is None:
+        concurrency = getattr(settings, "CRAWLER_SOURCE_CONCURRENCY", 4)
+    concurrency = max(1, int(concurrency))
+
     content_processor = ContentProcessor()
 
-    while pages_processed < max_pages:
-        # Get next URL from frontier
-        url_entry = frontier.get_next_url(source.slug)
+    # Budget accounting. All mutation happens between awaits on a single
+    # event loop, so plain counters are safe without locks.
+    budget = {"processed": 0, "in_flight": 0}
+
+    def _log_crawl_error(url: str, error: Exception, stack_trace: str) -> None:
+        CrawlError.objects.create(
+            source=source,
+            url=url,
+            error_type=ErrorType.UNKNOWN,
+            message=str(error),
+            stack_trace=stack_trace,
+        )
 
-        if url_entry is None:
-            # Queue is empty
-            break
+    async def _fetch_url(url: str):
+        """Fetch a single URL. Returns the FetchResult, or None if the fetch failed."""
+        # Fetch the URL via Smart Router, conditional on stored validators;
+        # the router holds it to the domain's concurrency window
+        result = await router.fetch(
+            url, source=source, crawl_job=job, conditional=True
+        )
 
-        url = url_entry["url"]
-        logger.debug(f"Processing URL: {url}")
+        if not result.success:
+            metrics["errors_count"] += 1
+            logger.warning(f"Failed to fetch {url}: {result.error}")
+            return None
 
-        try:
-            # Fetch the URL via Smart Router
-            result = await router.fetch(url, source=source, crawl_job=job)
-
-            if result.success:
-                metrics["pages_crawled"] += 1
-                pages_processed += 1
-
-                # Process content through AI Enhancement pipeline
-                processing_result = await content_processor.process(
-                    url=url,
-                    raw_content=result.content,
-                    source=source,
-                    crawl_job=job,
-                )
+        metrics["pages_crawled"] += 1
+        return result
 
-                if processing_result.success:
-                    metrics["products_found"] += 1
-                    if processing_result.is_new:
-                        metrics["products_new"] += 1
-                    else:
-                        metrics["products_updated"] += 1
-                else:
-                    logger.warning(
-                        f"AI processing failed for {url}: {processing_result.error}"
-                    )
+    async def _process_url(url: str, result) -> None:
+        """Process a fetched page through the AI Enhancement pipeline."""
+        # Skipped by the processor if the page is unchanged
+        processing_result = await content_processor.process(
+            url=url,
+            raw_content=result.content,
+            source=source,
+            crawl_job=job,
+            not_modified=result.not_modified,
+        )
 
+        if result.not_modified:
+            return
+
+        if processing_result.success:
+            # Only a processed page becomes the baseline for conditional
+            # re-fetches; a failed extraction is retried on the next crawl
+            if result.validators is not None:
+                router.save_validators(result)
+            metrics["products_found"] += 1
+            if processing_result.is_new:
+                metrics["products_new"] += 1
             else:
+                metrics["products_updated"] += 1
+        else:
+            logger.warning(
+                f"AI processing failed for {url}: {processing_result.error}"
+            )
+
+    # Leases URLs in batches from hosts outside their crawl delay and keeps
+    # a local buffer topped up, so workers never wait on Redis between pages
+    prefetcher = FrontierPrefetcher(
+        frontier, source.slug, batch_size=concurrency, ready_only=True
+    )
+
+    async def _worker() -> None:
+        while budget["processed"] + budget["in_flight"] < max_pages:
+            # Reserve a budget slot before waiting for the next URL
+            budget["in_flight"] += 1
+            try:
+                url_entry = await prefetcher.get()
+            except Exception:
+                budget["in_flight"] -= 1
+                raise
+
+            if url_entry is None:
+                # Queue is empty
+                budget["in_flight"] -= 1
+                break
+
+            url = url_entry["url"]
+            logger.debug(f"Processing URL: {url}")
+
+            # A successfully fetched page uses its budget slot whatever
+            # processing does, so failing pages cannot exceed max_pages
+            fetched = None
+            try:
+                fetched = await _fetch_url(url)
+                if fetched is not None:
+                    await _process_url(url, fetched)
+            except asyncio.CancelledError:
+                # Cancelled mid-attempt (soft time limit, worker shutdown):
+                # return the URL to the queue instead of acking it
+                frontier.nack(source.slug, url_entry["url_hash"])
+                raise
+            except Exception as e:
                 metrics["errors_count"] += 1
-                logger.warning(f"Failed to fetch {url}: {result.error}")
+                logger.error(f"Error processing {url}: {e}")
 
-        except Exception as e:
-            metrics["errors_count"] += 1
-            logger.error(f"Error processing {url}: {e}")
+                # Log error to database
+                await sync_to_async(_log_crawl_error, thread_sensitive=True)(
+                    url, e, traceback.format_exc()
+                )
+            finally:
+                budget["in_flight"] -= 1
+                if fetched is not None:
+                    budget["processed"] += 1
 
-            # Log error to database
-            CrawlError.objects.create(
-                source=source,
-                url=url,
-                error_type=ErrorType.UNKNOWN,
-                message=str(e),
-                stack_trace=traceback.format_exc(),
-            )
+            # Only a finished attempt is acked; URLs of a crawl that dies
+            # without reaching here are recovered by reap_expired_leases
+            frontier.ack(source.slug, url_entry["url_hash"])
+
+    try:
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    finally:
+        # Return URLs prefetched beyond the page budget to the queue
+        await prefetcher.close()
 
     return metrics
 
@@ -665,7 +782,7 @@ def keyword_search(self, keyword_id: str) -> Dict[str, Any]:
                     urls_queued += 1
 
         finally:
-            loop.close()
+            _close_task_loop(loop)
 
         # Update keyword tracking
         keyword.total_results_found += urls_found
@@ -775,7 +892,7 @@ def enrich_skeletons(self, limit: int = 50) -> Dict[str, Any]:
                 orchestrator.process_skeletons_for_enrichment(limit=limit)
             )
         finally:
-            loop.close()
+            _close_task_loop(loop)
 
         logger.info(
             f"Skeleton enrichment complete: {result.skeletons_processed} processed, "
@@ -818,10 +935,11 @@ def process_enrichment_queue(self, max_urls: int = 100) -> Dict[str, Any]:
 
     import asyncio
     from crawler.fetchers.smart_router import SmartRouter
-    from crawler.queue.url_frontier import get_url_frontier
+    from crawler.queue.url_frontier import FrontierPrefetcher, get_url_frontier
     from crawler.services.content_processor import ContentProcessor
 
     frontier = get_url_frontier()
+    frontier.reap_expired_leases("enrichment")
     queue_size = frontier.get_queue_size("enrichment")
 
     if queue_size == 0:
@@ -843,11 +961,14 @@ def process_enrichment_queue(self, max_urls: int = 100) -> Dict[str, Any]:
 
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        prefetcher = FrontierPrefetcher(
+            frontier, "enrichment", batch_size=min(max_urls, 10), ready_only=False
+        )
 
         try:
             while urls_processed < max_urls:
-                # Get next URL from enrichment queue
-                url_entry = frontier.get_next_url("enrichment")
+                # Lease next URL from enrichment queue (prefetched in batches)
+                url_entry = loop.run_until_complete(prefetcher.get())
 
                 if url_entry is None:
                     break
@@ -904,9 +1025,13 @@ def process_enrichment_queue(self, max_urls: int = 100) -> Dict[str, Any]:
                     errors += 1
                     logger.error(f"Error processing enrichment URL {url}: {e}")
 
+                finally:
+                    frontier.ack("enrichment", url_entry["url_hash"])
+
         finally:
+            loop.run_until_complete(prefetcher.close())
             loop.run_until_complete(router.close())
-            loop.close()
+            _close_task_loop(loop)
 
         logger.info(
             f"Enrichment queue processing complete: {urls_processed} URLs, "
@@ -930,6 +1055,47 @@ def process_enrichment_queue(self, max_urls: int = 100) -> Dict[str, Any]:
         }
 
 
+@shared_task(name="crawler.tasks.reap_frontier_leases")
+def reap_frontier_leases() -> Dict[str, Any]:
+    """
+    Periodic task to return expired URL frontier leases to their queues.
+
+    Leases expire when a worker dies or hits the task time limit before
+    acknowledging a URL; reaping puts those URLs back so they are crawled.
+
+    Returns:
+        Dict with number of URLs re-queued
+    """
+    from crawler.queue.url_frontier import get_url_frontier
+
+    requeued = get_url_frontier().reap_all_expired_leases()
+    if requeued:
+        logger.info(f"Reaped {requeued} expired frontier leases")
+
+    return {"requeued": requeued}
+
+
+@shared_task(name="crawler.tasks.schedule_recrawls")
+def schedule_recrawls(limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Periodic task to re-admit URLs whose change-rate-driven recrawl is due.
+
+    Runs every 15 minutes via Celery Beat. Each CrawledURL carries its own
+    next_recrawl_at (see crawler.queue.recrawl_scheduler); due URLs are put
+    back into their source's frontier queue and the source is made due.
+
+    Args:
+        limit: Maximum URLs to re-admit (default: CRAWLER_RECRAWL_BATCH_SIZE)
+
+    Returns:
+        Dict with due/admitted counts and per-queue admissions
+    """
+    from crawler.queue.recrawl_scheduler import RecrawlScheduler
+    from crawler.queue.url_frontier import get_url_frontier
+
+    return RecrawlScheduler().admit_due_urls(get_url_frontier(), limit=limit)
+
+
 # Legacy placeholder tasks - kept for backward compatibility
 @shared_task(name="crawler.tasks.process_source", bind=True)
 def process_source(self, source_id: str) -> Dict[str, Any]:
@@ -1342,7 +1508,7 @@ def run_competition_flow(schedule, job) -> Dict[str, Any]:
             logger.info(f"Fetching competition URL: {url}")
 
             # router.fetch() returns FetchResult object, extract .content
-            fetch_result = asyncio.run(router.fetch(url))
+            fetch_result = _run_async(router.fetch(url))
             if not fetch_result.success:
                 logger.error(f"Failed to fetch {url}: {fetch_result.error}")
                 results["errors"] = results.get("errors", []) + [f"Fetch failed: {fetch_result.error}"]
@@ -1351,7 +1517,7 @@ def run_competition_flow(schedule, job) -> Dict[str, Any]:
             html_content = fetch_result.content
 
             # Run competition discovery with product type filtering
-            comp_result = asyncio.run(
+            comp_result = _run_async(
                 orchestrator.run_competition_discovery(
                     competition_url=url,
                     crawl_job=job,
@@ -1421,7 +1587,7 @@ def run_competition_flow(schedule, job) -> Dict[str, Any]:
                     except Exception as e:
                         logger.error(f"  Search failed for '{skeleton.name}': {e}")
 
-            asyncio.run(search_all_skeletons())
+            _run_async(search_all_skeletons())
 
             results["enrichment"]["skeletons_processed"] = len(skeletons)
             results["enrichment"]["urls_discovered"] = len(url_queue)
@@ -1442,137 +1608,147 @@ def run_competition_flow(schedule, job) -> Dict[str, Any]:
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
 
-                try:
-                    for skeleton_id, url, metadata in url_queue:
-                        # Skip if skeleton already enriched
-                        if skeleton_id in enriched_skeleton_ids:
-                            continue
-
-                        if not url:
-                            continue
+                # Each skeleton's URLs are fetched concurrently and processed
+                # as they complete; remaining fetches are cancelled once the
+                # skeleton is enriched
+                urls_by_skeleton = {}
+                for skeleton_id, url, metadata in url_queue:
+                    if url:
+                        urls_by_skeleton.setdefault(skeleton_id, []).append(url)
 
+                try:
+                    for skeleton_id, skeleton_urls in urls_by_skeleton.items():
+                        fetches = router.fetch_many(dict.fromkeys(skeleton_urls))
                         try:
-                            # Fetch URL content
-                            fetch_result = loop.run_until_complete(router.fetch(url))
-
-                            if fetch_result.success:
-                                urls_processed += 1
+                            while skeleton_id not in enriched_skeleton_ids:
+                                try:
+                                    url, fetch_result = loop.run_until_complete(
+                                        fetches.__anext__()
+                                    )
+                                except StopAsyncIteration:
+                                    break
 
-                                # Extract content using trafilatura
                                 try:
-                                    import trafilatura
-                                    extracted_content = trafilatura.extract(fetch_result.content) or fetch_result.content[:50000]
-                                except ImportError:
-                                    # Fall back to raw content if trafilatura not available
-                                    extracted_content = fetch_result.content[:50000]
+                                    if fetch_result.success:
+                                        urls_processed += 1
+
+                                        # Extract content using trafilatura
+                                        try:
+                                            import trafilatura
+                                            extracted_content = trafilatura.extract(fetch_result.content) or fetch_result.content[:50000]
+                                        except ImportError:
+                                            # Fall back to raw content if trafilatura not available
+                                            extracted_content = fetch_result.content[:50000]
+
+                                        # Get skeleton's product type for hint
+                                        skeleton = DiscoveredProduct.objects.get(id=skeleton_id)
+                                        product_type_hint = skeleton.product_type
+
+                                        # Call AI Enhancement V2 to get extracted data
+                                        extract_result = loop.run_until_complete(
+                                            ai_client.extract(
+                                                content=extracted_content,
+                                                source_url=url,
+                                                product_type=product_type_hint,
+                                            )
+                                        )
+
+                                        if extract_result.success and extract_result.products:
+                                            # Get the primary product's extracted data
+                                            enriched = extract_result.products[0].extracted_data
+                                            update_fields = []
+
+                                            # Map enrichment data to skeleton fields
+                                            if enriched.get('abv') and not skeleton.abv:
+                                                skeleton.abv = enriched['abv']
+                                                update_fields.append('abv')
+                                            if enriched.get('age_statement') and not skeleton.age_statement:
+                                                skeleton.age_statement = str(enriched['age_statement'])
+                                                update_fields.append('age_statement')
+                                            if enriched.get('description') and not skeleton.description:
+                                                skeleton.description = enriched['description']
+                                                update_fields.append('description')
+                                            if enriched.get('region') and not skeleton.region:
+                                                skeleton.region = enriched['region']
+                                                update_fields.append('region')
+                                            if enriched.get('country') and not skeleton.country:
+                                                skeleton.country = enriched['country']
+                                                update_fields.append('country')
+
+                                            # Tasting notes - check nested structure first
+                                            tasting_notes = enriched.get('tasting_notes', {})
+                                            if isinstance(tasting_notes, dict):
+                                                if tasting_notes.get('nose') and not skeleton.nose_description:
+                                                    skeleton.nose_description = tasting_notes['nose']
+                                                    update_fields.append('nose_description')
+                                                if tasting_notes.get('palate') and not skeleton.palate_description:
+                                                    skeleton.palate_description = tasting_notes['palate']
+                                                    update_fields.append('palate_description')
+                                                if tasting_notes.get('finish') and not skeleton.finish_description:
+                                                    skeleton.finish_description = tasting_notes['finish']
+                                                    update_fields.append('finish_description')
+
+                                            # Also check top-level tasting note fields
+                                            if enriched.get('nose_description') and not skeleton.nose_description:
+                                                skeleton.nose_description = enriched['nose_description']
+                                                if 'nose_description' not in update_fields:
+                                                    update_fields.append('nose_description')
+                                            if enriched.get('palate_description') and not skeleton.palate_description:
+                                                skeleton.palate_description = enriched['palate_description']
+                                                if 'palate_description' not in update_fields:
+                                                    update_fields.append('palate_description')
+                                            if enriched.get('finish_description') and not skeleton.finish_description:
+                                                skeleton.finish_description = enriched['finish_description']
+                                                if 'finish_description' not in update_fields:
+                                                    update_fields.append('finish_description')
+
+                                            # Flavor arrays from flavor_profile
+                                            flavor_profile = enriched.get('flavor_profile', {})
+                                            if isinstance(flavor_profile, dict):
+                                                if flavor_profile.get('primary_flavors') and not skeleton.palate_flavors:
+                                                    skeleton.palate_flavors = flavor_profile['primary_flavors']
+                                                    update_fields.append('palate_flavors')
+
+                                            # Update source URL if not set
+                                            if url and not skeleton.source_url:
+                                                skeleton.source_url = url
+                                                update_fields.append('source_url')
+
+                                            # Mark as partial/complete if we got significant data
+                                            if len(update_fields) >= 2:  # At least 2 fields enriched
+                                                # Use PARTIAL for now (COMPLETE requires palate per model docs)
+                                                skeleton.status = DiscoveredProductStatus.PARTIAL
+                                                update_fields.append('status')
+
+                                                # Add serpapi_enrichment to discovery_sources
+                                                sources = skeleton.discovery_sources or []
+                                                if 'serpapi_enrichment' not in sources:
+                                                    sources.append('serpapi_enrichment')
+                                                    skeleton.discovery_sources = sources
+                                                    update_fields.append('discovery_sources')
+
+                                                skeleton.save(update_fields=update_fields)
+                                                products_enriched += 1
+                                                enriched_skeleton_ids.add(skeleton_id)
+                                                logger.info(f"Enriched '{skeleton.name}': {update_fields}")
+                                            else:
+                                                logger.debug(f"Not enough data from {url}: got fields {list(enriched.keys())}")
+                                        else:
+                                            logger.debug(f"AI Enhancement V2 failed for {url}: {extract_result.error}")
 
-                                # Get skeleton's product type for hint
-                                skeleton = DiscoveredProduct.objects.get(id=skeleton_id)
-                                product_type_hint = skeleton.product_type
-
-                                # Call AI Enhancement V2 to get extracted data
-                                extract_result = loop.run_until_complete(
-                                    ai_client.extract(
-                                        content=extracted_content,
-                                        source_url=url,
-                                        product_type=product_type_hint,
-                                    )
-                                )
-
-                                if extract_result.success and extract_result.products:
-                                    # Get the primary product's extracted data
-                                    enriched = extract_result.products[0].extracted_data
-                                    update_fields = []
-
-                                    # Map enrichment data to skeleton fields
-                                    if enriched.get('abv') and not skeleton.abv:
-                                        skeleton.abv = enriched['abv']
-                                        update_fields.append('abv')
-                                    if enriched.get('age_statement') and not skeleton.age_statement:
-                                        skeleton.age_statement = str(enriched['age_statement'])
-                                        update_fields.append('age_statement')
-                                    if enriched.get('description') and not skeleton.description:
-                                        skeleton.description = enriched['description']
-                                        update_fields.append('description')
-                                    if enriched.get('region') and not skeleton.region:
-                                        skeleton.region = enriched['region']
-                                        update_fields.append('region')
-                                    if enriched.get('country') and not skeleton.country:
-                                        skeleton.country = enriched['country']
-                                        update_fields.append('country')
-
-                                    # Tasting notes - check nested structure first
-                                    tasting_notes = enriched.get('tasting_notes', {})
-                                    if isinstance(tasting_notes, dict):
-                                        if tasting_notes.get('nose') and not skeleton.nose_description:
-                                            skeleton.nose_description = tasting_notes['nose']
-                                            update_fields.append('nose_description')
-                                        if tasting_notes.get('palate') and not skeleton.palate_description:
-                                            skeleton.palate_description = tasting_notes['palate']
-                                            update_fields.append('palate_description')
-                                        if tasting_notes.get('finish') and not skeleton.finish_description:
-                                            skeleton.finish_description = tasting_notes['finish']
-                                            update_fields.append('finish_description')
-
-                                    # Also check top-level tasting note fields
-                                    if enriched.get('nose_description') and not skeleton.nose_description:
-                                        skeleton.nose_description = enriched['nose_description']
-                                        if 'nose_description' not in update_fields:
-                                            update_fields.append('nose_description')
-                                    if enriched.get('palate_description') and not skeleton.palate_description:
-                                        skeleton.palate_description = enriched['palate_description']
-                                        if 'palate_description' not in update_fields:
-                                            update_fields.append('palate_description')
-                                    if enriched.get('finish_description') and not skeleton.finish_description:
-                                        skeleton.finish_description = enriched['finish_description']
-                                        if 'finish_description' not in update_fields:
-                                            update_fields.append('finish_description')
-
-                                    # Flavor arrays from flavor_profile
-                                    flavor_profile = enriched.get('flavor_profile', {})
-                                    if isinstance(flavor_profile, dict):
-                                        if flavor_profile.get('primary_flavors') and not skeleton.palate_flavors:
-                                            skeleton.palate_flavors = flavor_profile['primary_flavors']
-                                            update_fields.append('palate_flavors')
-
-                                    # Update source URL if not set
-                                    if url and not skeleton.source_url:
-                                        skeleton.source_url = url
-                                        update_fields.append('source_url')
-
-                                    # Mark as partial/complete if we got significant data
-                                    if len(update_fields) >= 2:  # At least 2 fields enriched
-                                        # Use PARTIAL for now (COMPLETE requires palate per model docs)
-                                        skeleton.status = DiscoveredProductStatus.PARTIAL
-                                        update_fields.append('status')
-
-                                        # Add serpapi_enrichment to discovery_sources
-                                        sources = skeleton.discovery_sources or []
-                                        if 'serpapi_enrichment' not in sources:
-                                            sources.append('serpapi_enrichment')
-                                            skeleton.discovery_sources = sources
-                                            update_fields.append('discovery_sources')
-
-                                        skeleton.save(update_fields=update_fields)
-                                        products_enriched += 1
-                                        enriched_skeleton_ids.add(skeleton_id)
-                                        logger.info(f"Enriched '{skeleton.name}': {update_fields}")
                                     else:
-                                        logger.debug(f"Not enough data from {url}: got fields {list(enriched.keys())}")
-                                else:
-                                    logger.debug(f"AI Enhancement V2 failed for {url}: {extract_result.error}")
-
-                            else:
-                                logger.debug(f"Failed to fetch URL {url}: {fetch_result.error}")
+                                        logger.debug(f"Failed to fetch URL {url}: {fetch_result.error}")
 
-                        except DiscoveredProduct.DoesNotExist:
-                            logger.warning(f"Skeleton {skeleton_id} not found")
-                        except Exception as e:
-                            logger.error(f"Error processing URL {url}: {e}")
+                                except DiscoveredProduct.DoesNotExist:
+                                    logger.warning(f"Skeleton {skeleton_id} not found")
+                                except Exception as e:
+                                    logger.error(f"Error processing URL {url}: {e}")
+                        finally:
+                            loop.run_until_complete(fetches.aclose())
 
                 finally:
                     loop.run_until_complete(router.close())
-                    loop.close()
+                    _close_task_loop(loop)
 
                 results["enrichment"]["urls_processed"] = urls_processed
                 results["enrichment"]["products_enriched"] = products_enriched
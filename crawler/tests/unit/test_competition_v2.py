@@ -318,6 +318,7 @@ class TestAsyncExtractionFlow:
     @pytest.mark.asyncio
     async def test_batch_processing(self):
         """Test batch URL processing."""
+        from crawler.fetchers.smart_router import FetchResult
         from crawler.services.competition_orchestrator_v2 import CompetitionOrchestratorV2
 
         orchestrator = CompetitionOrchestratorV2()
@@ -328,9 +329,19 @@ class TestAsyncExtractionFlow:
         ]
 
         mock_data = {"name": "Test", "brand": "Brand", "abv": 40.0}
+        fetch_result = FetchResult(
+            content="<html>content</html>",
+            status_code=200,
+            headers={},
+            success=True,
+            tier_used=1,
+        )
 
-        with patch.object(orchestrator.ai_extractor, '_fetch_content', new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = "<html>content</html>"
+        with patch(
+            "crawler.fetchers.smart_router.SmartRouter.fetch",
+            new_callable=AsyncMock,
+            return_value=fetch_result,
+        ) as mock_fetch:
 
             with patch.object(orchestrator.ai_extractor.ai_client, 'extract', new_callable=AsyncMock) as mock_extract:
                 mock_result = Mock()
@@ -352,3 +363,46 @@ class TestAsyncExtractionFlow:
         assert result.total_processed == 2
         assert result.successful == 2
         assert len(result.results) == 2
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.django_db
+    @pytest.mark.asyncio
+    async def test_batch_failed_fetch_is_not_refetched(self):
+        """A failed batch fetch is recorded without fetching the page again."""
+        from crawler.fetchers.smart_router import FetchResult
+        from crawler.services.competition_orchestrator_v2 import CompetitionOrchestratorV2
+
+        orchestrator = CompetitionOrchestratorV2()
+
+        urls = [
+            {"url": "https://test.com/product1", "medal_hint": "Gold"},
+            {"url": "https://test.com/product2", "medal_hint": "Silver"},
+        ]
+
+        fetch_result = FetchResult(
+            content="",
+            status_code=403,
+            headers={},
+            success=False,
+            tier_used=3,
+            error="blocked",
+        )
+
+        with patch(
+            "crawler.fetchers.smart_router.SmartRouter.fetch",
+            new_callable=AsyncMock,
+            return_value=fetch_result,
+        ) as mock_fetch:
+
+            with patch.object(orchestrator.ai_extractor, 'extract', new_callable=AsyncMock) as mock_extract:
+                result = await orchestrator.process_competition_batch(
+                    urls=urls,
+                    source="test",
+                    year=2024,
+                    product_type="whiskey",
+                )
+
+        assert result.total_processed == 2
+        assert result.failed == 2
+        assert mock_fetch.await_count == 2
+        mock_extract.assert_not_called()
@@ -0,0 +1,240 @@
+"""
+Unit tests for the AI extraction result cache.
+
+Tests cover:
+1. Cache keys (content, product type and schema; not the source URL)
+2. ExtractionCache storage, hit/miss counters, TTL and size eviction
+3. AIClientV2.extract() skipping the AI service on cache hits
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from django.utils import timezone
+
+SCHEMA = [
+    {"name": "name", "type": "string"},
+    {"name": "abv", "type": "number"},
+]
+
+AI_RESPONSE = {
+    "products": [
+        {
+            "extracted_data": {"name": "Ardbeg 10", "abv": 46.0},
+            "product_type": "whiskey",
+            "confidence": 0.9,
+        }
+    ],
+    "processing_time_ms": 1800.0,
+    "token_usage": {"input": 900, "output": 120},
+}
+
+
+def _payload(content="<p>Ardbeg 10, 46% ABV</p>", url="https://shop.com/ardbeg-10", **overrides):
+    payload = {
+        "source_data": {"content": content, "source_url": url, "type": "cleaned_text"},
+        "product_type": "whiskey",
+        "extraction_schema": ["name", "abv"],
+        "options": {"detect_multi_product": True, "max_products": 10},
+        "schema": SCHEMA,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _cache(**kwargs):
+    from crawler.services.extraction_cache import ExtractionCache
+
+    return ExtractionCache(enabled=True, **kwargs)
+
+
+class TestCacheKey:
+    """Tests for ExtractionCacheKey.from_payload."""
+
+    def test_source_url_is_not_part_of_key(self):
+        """Mirrors and syndicated copies of a page share a key."""
+        from crawler.services.extraction_cache import ExtractionCacheKey
+
+        key = ExtractionCacheKey.from_payload(_payload())
+        mirror = ExtractionCacheKey.from_payload(_payload(url="https://mirror.com/p/123"))
+
+        assert key == mirror
+
+    @pytest.mark.parametrize("overrides", [
+        {"content": "<p>Ardbeg 10, 40% ABV</p>"},
+        {"product_type": "port_wine"},
+        {"product_category": "single_malt"},
+        {"schema": SCHEMA + [{"name": "region", "type": "string"}]},
+        {"extraction_schema": ["name"]},
+    ])
+    def test_request_changes_change_key(self, overrides):
+        """Content, product type/category and schema changes give new keys."""
+        from crawler.services.extraction_cache import ExtractionCacheKey
+
+        key = ExtractionCacheKey.from_payload(_payload())
+        changed = ExtractionCacheKey.from_payload(_payload(**overrides))
+
+        assert changed.cache_key != key.cache_key
+
+    def test_schema_change_keeps_content_hash(self):
+        """A schema change only changes the schema hash."""
+        from crawler.services.extraction_cache import ExtractionCacheKey
+
+        key = ExtractionCacheKey.from_payload(_payload())
+        changed = ExtractionCacheKey.from_payload(_payload(schema=SCHEMA[:1]))
+
+        assert changed.content_hash == key.content_hash
+        assert changed.schema_hash != key.schema_hash
+
+
+@pytest.mark.django_db
+class TestExtractionCache:
+    """Tests for ExtractionCache storage and eviction."""
+
+    def test_round_trip_and_counters(self):
+        """A stored response is returned and counted as a hit."""
+        from crawler.models import ExtractionCacheEntry
+
+        cache = _cache()
+        key = cache.make_key(_payload())
+
+        assert cache.get(key) is None
+        assert cache.set(key, AI_RESPONSE) is True
+        assert cache.get(key) == AI_RESPONSE
+
+        assert cache.get_stats() == {
+            "hits": 1, "misses": 1, "stores": 1, "evictions": 0, "hit_rate": 0.5,
+        }
+        entry = ExtractionCacheEntry.objects.get(cache_key=key.cache_key)
+        assert entry.hit_count == 1
+        assert entry.product_type == "whiskey"
+
+    def test_expired_entries_miss(self):
+        """Entries past their TTL are not served."""
+        from crawler.models import ExtractionCacheEntry
+
+        cache = _cache()
+        key = cache.make_key(_payload())
+        cache.set(key, AI_RESPONSE)
+        ExtractionCacheEntry.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        assert cache.get(key) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_evict_expired_then_least_recently_used(self):
+        """Eviction drops expired entries, then the oldest beyond max_entries."""
+        from crawler.models import ExtractionCacheEntry
+
+        cache = _cache(max_entries=2)
+        keys = [cache.make_key(_payload(content=f"<p>page {i}</p>")) for i in range(4)]
+        for key in keys:
+            cache.set(key, AI_RESPONSE)
+        now = timezone.now()
+        for i, key in enumerate(keys):
+            ExtractionCacheEntry.objects.filter(cache_key=key.cache_key).update(
+                last_used_at=now - timedelta(minutes=10 - i)
+            )
+        ExtractionCacheEntry.objects.filter(cache_key=keys[3].cache_key).update(expires_at=now)
+        cache.get(keys[0])
+
+        assert cache.evict() == 2
+        remaining = set(ExtractionCacheEntry.objects.values_list("cache_key", flat=True))
+        assert remaining == {keys[0].cache_key, keys[2].cache_key}
+        assert cache.get_stats()["evictions"] == 2
+
+    def test_stores_trigger_eviction(self):
+        """Every EVICTION_INTERVAL stores run an eviction pass."""
+        from crawler.models import ExtractionCacheEntry
+
+        cache = _cache(max_entries=2)
+        cache.EVICTION_INTERVAL = 3
+
+        for i in range(3):
+            cache.set(cache.make_key(_payload(content=f"<p>page {i}</p>")), AI_RESPONSE)
+
+        assert ExtractionCacheEntry.objects.count() == 2
+
+    def test_disabled_cache_does_nothing(self):
+        """A disabled cache never reads or writes."""
+        from crawler.models import ExtractionCacheEntry
+        from crawler.services.extraction_cache import ExtractionCache
+
+        cache = ExtractionCache(enabled=False)
+        key = cache.make_key(_payload())
+
+        assert cache.set(key, AI_RESPONSE) is False
+        assert cache.get(key) is None
+        assert not ExtractionCacheEntry.objects.exists()
+
+
+class TestCacheFailures:
+    """Tests for a cache whose database is unavailable."""
+
+    def test_database_errors_are_misses(self):
+        """Without database access the cache reports misses and failed stores."""
+        cache = _cache()
+        key = cache.make_key(_payload())
+
+        assert cache.set(key, AI_RESPONSE) is False
+        assert cache.get(key) is None
+        assert cache.get_stats()["misses"] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAIClientCaching:
+    """Tests for AIClientV2.extract() using the cache."""
+
+    @pytest.fixture
+    def client(self):
+        from crawler.services.ai_client_v2 import AIClientV2
+
+        client = AIClientV2(base_url="https://ai.example.com", api_key="key")
+        send = AsyncMock(side_effect=lambda payload: httpx.Response(200, json=AI_RESPONSE))
+        with patch("crawler.services.ai_client_v2.get_extraction_cache", return_value=_cache()), \
+                patch.object(client, "_aget_default_schema", AsyncMock(return_value=SCHEMA)), \
+                patch.object(client, "_send_request", send):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_identical_content_skips_ai_service(self, client):
+        """A recrawl or mirror of extracted content is served from the cache."""
+        html = "<html><body><h1>Ardbeg 10</h1><p>Islay single malt, 46% ABV.</p></body></html>"
+
+        first = await client.extract(html, source_url="https://shop.com/ardbeg-10")
+        second = await client.extract(html, source_url="https://mirror.com/ardbeg-10")
+
+        assert client._send_request.await_count == 1
+        assert first.cached is False
+        assert first.token_usage == {"input": 900, "output": 120}
+        assert second.success is True
+        assert second.cached is True
+        assert second.token_usage is None
+        assert second.products[0].extracted_data == {"name": "Ardbeg 10", "abv": 46.0}
+
+    @pytest.mark.asyncio
+    async def test_schema_change_misses(self, client):
+        """Changed FieldDefinitions produce a fresh extraction."""
+        html = "<html><body><h1>Ardbeg 10</h1><p>Islay single malt, 46% ABV.</p></body></html>"
+
+        await client.extract(html, source_url="https://shop.com/ardbeg-10")
+        client._aget_default_schema.return_value = SCHEMA + [{"name": "region", "type": "string"}]
+        result = await client.extract(html, source_url="https://shop.com/ardbeg-10")
+
+        assert client._send_request.await_count == 2
+        assert result.cached is False
+
+    @pytest.mark.asyncio
+    async def test_failed_extractions_are_not_cached(self, client):
+        """Only successful responses are stored."""
+        html = "<html><body><h1>Ardbeg 10</h1></body></html>"
+        client._send_request.side_effect = lambda payload: httpx.Response(
+            200, json={"error": "model overloaded"}
+        )
+
+        await client.extract(html, source_url="https://shop.com/ardbeg-10")
+        result = await client.extract(html, source_url="https://shop.com/ardbeg-10")
+
+        assert client._send_request.await_count == 2
+        assert result.success is False
@@ -0,0 +1,216 @@
+"""
+Unit tests for the extraction executor.
+
+Tests cover:
+1. Inline mode (no workers, small pages, unpicklable functions)
+2. Offloading to warm worker processes
+3. Falling back to threads when the pool breaks or cannot start
+4. ContentProcessor and AIClientV2 awaiting the executor
+"""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+LARGE_PAGE_HTML = (
+    "<html><head><title>Ardbeg 10 | Shop</title></head><body><main>"
+    "<h1>Ardbeg 10 Year Old</h1>"
+    + "<p>A powerful Islay single malt with intense smoky character.</p>" * 400
+    + "</main></body></html>"
+)
+
+
+@pytest.fixture(scope="module")
+def process_executor():
+    """A real two-worker executor offloading every call."""
+    from crawler.services.extraction_executor import ExtractionExecutor
+
+    executor = ExtractionExecutor(max_workers=2, min_offload_bytes=0)
+    executor.warm()
+    yield executor
+    executor.shutdown()
+
+
+class TestInlineMode:
+    """Tests for calls that run on the calling process."""
+
+    @pytest.mark.asyncio
+    async def test_no_workers_runs_inline(self):
+        """With zero workers no pool is started."""
+        from crawler.services.extraction_executor import ExtractionExecutor
+
+        executor = ExtractionExecutor(max_workers=0, min_offload_bytes=0)
+
+        assert await executor.run(os.getpid) == os.getpid()
+        assert executor.inline is True
+        assert executor._pool is None
+
+    @pytest.mark.asyncio
+    async def test_small_pages_run_inline(self):
+        """Pages below the offload threshold are not worth the round trip."""
+        from crawler.services.extraction_executor import ExtractionExecutor
+
+        executor = ExtractionExecutor(max_workers=2, min_offload_bytes=1000)
+        func = MagicMock(return_value="text")
+
+        assert await executor.run(func, "<p>small</p>") == "text"
+        assert executor._pool is None
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_function_runs_inline(self):
+        """Functions that cannot be sent to a worker run inline."""
+        from crawler.services.extraction_executor import ExtractionExecutor
+
+        executor = ExtractionExecutor(max_workers=2, min_offload_bytes=0)
+        func = MagicMock(return_value="text")
+
+        assert await executor.run(func, LARGE_PAGE_HTML, url="https://shop.com/p") == "text"
+        func.assert_called_once_with(LARGE_PAGE_HTML, url="https://shop.com/p")
+        assert executor._pool is None
+
+    def test_shared_executor_uses_settings(self, settings):
+        """get_extraction_executor() reads its size from settings."""
+        from crawler.services.extraction_executor import get_extraction_executor
+
+        settings.CRAWLER_EXTRACTION_WORKERS = 3
+        settings.CRAWLER_EXTRACTION_OFFLOAD_MIN_BYTES = 500
+
+        with patch("crawler.services.extraction_executor._extraction_executor", None):
+            executor = get_extraction_executor()
+
+            assert get_extraction_executor() is executor
+        assert executor.max_workers == 3
+        assert executor.min_offload_bytes == 500
+
+
+class TestProcessPool:
+    """Tests for offloading to worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self, process_executor):
+        """Offloaded calls run outside the calling process."""
+        assert await process_executor.run(os.getpid) != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_content_extraction_matches_inline(self, process_executor):
+        """extract_main_content gives the same text in a worker."""
+        from crawler.services.content_processor import extract_main_content
+
+        result = await process_executor.run(extract_main_content, LARGE_PAGE_HTML)
+
+        assert result == extract_main_content(LARGE_PAGE_HTML)
+        assert result.startswith("Ardbeg 10 Year Old")
+
+    @pytest.mark.asyncio
+    async def test_preprocessing_matches_inline(self, process_executor):
+        """ContentPreprocessor results come back from a worker intact."""
+        from crawler.services.content_preprocessor import ContentPreprocessor
+
+        preprocessor = ContentPreprocessor(max_tokens=500)
+
+        result = await process_executor.run(
+            preprocessor.preprocess, LARGE_PAGE_HTML, url="https://shop.com/ardbeg-10"
+        )
+
+        assert result == preprocessor.preprocess(LARGE_PAGE_HTML, url="https://shop.com/ardbeg-10")
+        assert result.truncated is True
+
+
+class TestFallback:
+    """Tests for falling back to threads."""
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_runs_in_thread_and_restarts(self):
+        """A dead worker's call runs in a thread; the next call gets a new pool."""
+        from crawler.services.extraction_executor import ExtractionExecutor
+
+        executor = ExtractionExecutor(max_workers=2, min_offload_bytes=0)
+        broken = MagicMock()
+        broken.submit.side_effect = lambda *args: _failed_future(BrokenProcessPool("worker died"))
+        executor._pool = broken
+
+        assert await executor.run(os.getpid) == os.getpid()
+        broken.shutdown.assert_called_once()
+        assert executor._pool is None
+        assert executor.threaded is False
+
+    @pytest.mark.asyncio
+    async def test_pool_that_cannot_start_switches_to_threads(self):
+        """Daemonic processes cannot start workers, so calls run in threads."""
+        import threading
+        from crawler.services.extraction_executor import ExtractionExecutor
+
+        executor = ExtractionExecutor(max_workers=2, min_offload_bytes=0)
+        pool = MagicMock()
+        pool.submit.side_effect = AssertionError("daemonic processes are not allowed to have children")
+        executor._pool = pool
+
+        assert await executor.run(os.getpid) == os.getpid()
+        assert executor.threaded is True
+        assert await executor.run(threading.get_ident) != threading.get_ident()
+        assert pool.submit.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_pool_start_is_not_kept(self):
+        """A pool whose warm-up submission fails is shut down and dropped."""
+        from crawler.services.extraction_executor import ExtractionExecutor
+
+        executor = ExtractionExecutor(max_workers=2, min_offload_bytes=0)
+        pool = MagicMock()
+        pool.submit.side_effect = RuntimeError("cannot start workers")
+
+        with patch(
+            "crawler.services.extraction_executor.ProcessPoolExecutor", return_value=pool
+        ):
+            assert executor._get_pool() is None
+
+        assert executor._pool is None
+        assert executor.threaded is True
+        pool.shutdown.assert_called_once()
+
+
+def _failed_future(error):
+    from concurrent.futures import Future
+
+    future = Future()
+    future.set_exception(error)
+    return future
+
+
+class TestPipelines:
+    """Tests for the async pipelines awaiting the executor."""
+
+    @pytest.mark.asyncio
+    async def test_content_processor_awaits_extraction(self):
+        """ContentProcessor.process extracts page text through the executor."""
+        from crawler.services.content_processor import ContentProcessor, extract_main_content
+
+        executor = MagicMock(run=AsyncMock(side_effect=RuntimeError("stop")))
+        processor = ContentProcessor(ai_client=MagicMock())
+
+        with patch("crawler.services.extraction_executor.get_extraction_executor",
+                   return_value=executor), pytest.raises(RuntimeError):
+            await processor.process("https://shop.com/p", LARGE_PAGE_HTML)
+
+        executor.run.assert_awaited_once_with(extract_main_content, LARGE_PAGE_HTML)
+
+    @pytest.mark.asyncio
+    async def test_ai_client_awaits_preprocessing(self):
+        """AIClientV2 preprocesses through the executor."""
+        from crawler.services.ai_client_v2 import AIClientV2
+        from crawler.services.content_preprocessor import ContentPreprocessor
+
+        executor = MagicMock(run=AsyncMock(return_value="preprocessed"))
+        client = AIClientV2(base_url="https://ai.example.com", api_key="key")
+
+        with patch("crawler.services.extraction_executor.get_extraction_executor",
+                   return_value=executor):
+            result = await client._apreprocess_content(LARGE_PAGE_HTML, "https://shop.com/p")
+
+        assert result == "preprocessed"
+        func = executor.run.await_args.args[0]
+        assert isinstance(func.__self__, ContentPreprocessor)
+        assert executor.run.await_args.args[1:] == (LARGE_PAGE_HTML,)
+        assert executor.run.await_args.kwargs == {"url": "https://shop.com/p"}
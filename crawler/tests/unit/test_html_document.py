@@ -0,0 +1,186 @@
+"""
+Unit tests for the shared parsed HTML document.
+
+Tests cover:
+1. HTMLDocument views (title, headings, links, JSON-LD, main text)
+2. The document cache shared by processing stages
+3. ContentProcessor, ContentPreprocessor and LinkExtractor parsing a page once
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+PRODUCT_PAGE_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Ardbeg 10 Year Old | The Whisky Exchange</title>
+    <script type="application/ld+json">{"@type": "Product", "name": "Ardbeg 10"}</script>
+    <script type="application/ld+json">{not json</script>
+</head>
+<body>
+    <nav><a href="/">Home</a><a href="/whisky"> Whisky <!-- menu --> <b>Shop</b></a><a>No href</a></nav>
+    <main>
+        <h1>Ardbeg <em>10</em> Year Old</h1>
+        <h2>  Tasting Notes  </h2>
+        <p>A powerful Islay single malt with intense smoky character and a long finish.</p>
+        <p>Notes of espresso, chocolate, lime and peat smoke. Bottled at 46% ABV.</p>
+        <h3></h3>
+    </main>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_document_cache():
+    """Each test starts with an empty document cache."""
+    with patch("crawler.services.html_document._document_cache", None):
+        yield
+
+
+class TestHTMLDocumentViews:
+    """Tests for the memoized document views."""
+
+    def test_title_and_h1(self):
+        """Title pieces join with spaces, h1 pieces without, like get_text()."""
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument(PRODUCT_PAGE_HTML)
+
+        assert document.title == "Ardbeg 10 Year Old | The Whisky Exchange"
+        assert document.h1 == "Ardbeg10Year Old"
+
+    def test_headings_in_document_order(self):
+        """h1-h3 texts are stripped, space-joined and empty ones dropped."""
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument(PRODUCT_PAGE_HTML)
+
+        assert document.headings == ["Ardbeg 10 Year Old", "Tasting Notes"]
+
+    def test_links(self):
+        """Only anchors with an href are returned, with comment-free text."""
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument(PRODUCT_PAGE_HTML)
+
+        assert document.links == [("/", "Home"), ("/whisky", "WhiskyShop")]
+
+    def test_json_ld_skips_invalid_blocks(self):
+        """Valid JSON-LD blocks are parsed; broken ones are skipped."""
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument(PRODUCT_PAGE_HTML)
+
+        assert document.json_ld == [{"@type": "Product", "name": "Ardbeg 10"}]
+
+    def test_main_text_matches_trafilatura(self):
+        """main_text is what trafilatura.extract returns for the raw HTML."""
+        import trafilatura
+
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument(PRODUCT_PAGE_HTML)
+
+        expected = trafilatura.extract(
+            PRODUCT_PAGE_HTML,
+            include_links=False,
+            include_images=False,
+            include_tables=True,
+            output_format="txt",
+        )
+        assert document.main_text == expected
+        # The shared tree is not modified by trafilatura's cleaning
+        assert document.tree.find(".//nav") is not None
+
+    def test_views_are_memoized(self):
+        """The page is parsed once however many views are read."""
+        import lxml.html
+
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument("<html><body><p>just a paragraph</p></body></html>")
+        with patch("crawler.services.html_document.load_html", return_value=None), \
+                patch.object(
+                    lxml.html, "document_fromstring", wraps=lxml.html.document_fromstring
+                ) as parse:
+            document.headings
+            document.links
+            document.title
+
+        assert parse.call_count == 1
+
+    def test_empty_html(self):
+        """Empty pages have no tree and empty views."""
+        from crawler.services.html_document import HTMLDocument
+
+        document = HTMLDocument("")
+
+        assert document.tree is None
+        assert document.headings == []
+        assert document.links == []
+        assert document.title is None
+        assert document.main_text is None
+
+
+class TestDocumentCache:
+    """Tests for get_html_document() and HTMLDocumentCache."""
+
+    def test_same_html_shares_document(self):
+        """Equal HTML strings get the same document."""
+        from crawler.services.html_document import get_html_document
+
+        assert get_html_document(PRODUCT_PAGE_HTML) is get_html_document("" + PRODUCT_PAGE_HTML)
+
+    def test_least_recently_used_is_evicted(self):
+        """The cache keeps only the most recently used documents."""
+        from crawler.services.html_document import HTMLDocumentCache
+
+        cache = HTMLDocumentCache(size=2)
+        first = cache.get("<p>1</p>")
+        cache.get("<p>2</p>")
+        cache.get("<p>1</p>")
+        cache.get("<p>3</p>")
+
+        assert cache.get("<p>1</p>") is first
+        assert len(cache._documents) == 2
+        assert "<p>2</p>" not in cache._documents
+
+
+class TestStagesShareParse:
+    """Tests for processing stages reusing one parse of a page."""
+
+    def test_stages_parse_page_once(self):
+        """Content extraction, preprocessing and link extraction parse the page once."""
+        from crawler.services import html_document
+        from crawler.services.content_preprocessor import ContentPreprocessor
+        from crawler.services.content_processor import ContentProcessor
+        from crawler.services.link_extractor import LinkExtractor
+
+        with patch.object(html_document, "load_html", wraps=html_document.load_html) as load:
+            ContentProcessor.extract_content(None, PRODUCT_PAGE_HTML)
+            ContentPreprocessor().preprocess(PRODUCT_PAGE_HTML, url="https://shop.com/ardbeg-10")
+            links = LinkExtractor().extract_links(PRODUCT_PAGE_HTML, "https://shop.com/")
+
+        assert load.call_count == 1
+        assert [link.url for link in links] == ["https://shop.com/", "https://shop.com/whisky"]
+
+    def test_structured_cleaning_leaves_shared_tree_intact(self):
+        """Structured HTML cleaning works on a copy of the shared tree."""
+        from crawler.services.content_preprocessor import ContentPreprocessor
+        from crawler.services.html_document import get_html_document
+
+        html = (
+            '<html><body><nav>Menu</nav><ul>'
+            '<li class="product-card grid" style="x" onclick="y()" data-sku="1">'
+            '<a href="/p/1">Ardbeg</a></li></ul></body></html>'
+        )
+
+        cleaned = ContentPreprocessor()._clean_structured_html(html)
+
+        assert "Menu" not in cleaned
+        assert '<li class="product-card" data-sku="1">' in cleaned
+        assert get_html_document(html).tree.find(".//nav") is not None
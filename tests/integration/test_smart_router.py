@@ -198,7 +198,7 @@ class TestSmartRouterTierSelection:
         try:
             # Mock ScrapingBee client to avoid API costs
             mock_scrapingbee_response = MagicMock()
-            mock_scrapingbee_response.ok = True
+            mock_scrapingbee_response.is_success = True
             mock_scrapingbee_response.status_code = 200
             mock_scrapingbee_response.text = "<html><body>Scraped content from protected site</body></html>"
             mock_scrapingbee_response.headers = {"content-type": "text/html"}
@@ -206,7 +206,7 @@ class TestSmartRouterTierSelection:
             with patch.object(
                 router._get_tier3_fetcher(),
                 '_client',
-                MagicMock(get=MagicMock(return_value=mock_scrapingbee_response))
+                MagicMock(aget=AsyncMock(return_value=mock_scrapingbee_response))
             ):
                 # Force Tier 3
                 result = await router.fetch(
@@ -0,0 +1,166 @@
+"""
+Tests for the Redis-bitmap-backed Scalable Bloom Filter.
+
+These tests verify membership, no-false-negative behaviour, slice growth
+and the URLFrontier integration of the optional global seen filter.
+"""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+
+
+class _BitmapRedis:
+    """Minimal in-memory stand-in for the Redis bitmap/hash commands used."""
+
+    def __init__(self):
+        self.bitmaps = {}
+        self.hashes = {}
+
+    def getbit(self, key, offset):
+        return 1 if offset in self.bitmaps.get(key, set()) else 0
+
+    def setbit(self, key, offset, value):
+        self.bitmaps.setdefault(key, set()).add(offset)
+        return 0
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+        return 1
+
+    def hsetnx(self, key, field, value):
+        if field in self.hashes.get(key, {}):
+            return 0
+        return self.hset(key, field, value)
+
+    def hincrby(self, key, field, amount):
+        current = int(self.hashes.get(key, {}).get(field, 0)) + amount
+        self.hset(key, field, current)
+        return current
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.bitmaps.pop(key, None)
+            self.hashes.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return _BitmapPipeline(self)
+
+
+class _BitmapPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+        return queue
+
+    def execute(self):
+        return [getattr(self.client, name)(*args) for name, args in self.calls]
+
+
+def _hash(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class TestScalableBloomFilter:
+    """Tests for ScalableBloomFilter."""
+
+    def test_added_items_are_members(self):
+        """Every added item is reported as seen (no false negatives)."""
+        from crawler.queue.bloom_filter import ScalableBloomFilter
+
+        bloom = ScalableBloomFilter(_BitmapRedis(), "test:bloom", 0.01, 100)
+        items = [_hash(f"https://example.com/{i}") for i in range(50)]
+        bloom.add_many(items)
+
+        assert all(bloom.contains_many(items))
+        assert bloom.count() == 50
+
+    def test_unseen_items_are_mostly_rejected(self):
+        """False-positive rate stays near the configured target."""
+        from crawler.queue.bloom_filter import ScalableBloomFilter
+
+        bloom = ScalableBloomFilter(_BitmapRedis(), "test:bloom", 0.01, 500)
+        bloom.add_many([_hash(f"https://seen.com/{i}") for i in range(500)])
+
+        probes = [_hash(f"https://new.com/{i}") for i in range(2000)]
+        false_positives = sum(bloom.contains_many(probes))
+
+        assert false_positives < 2000 * 0.03
+
+    def test_filter_grows_new_slice_when_full(self):
+        """Reaching slice capacity adds a slice; old items stay members."""
+        from crawler.queue.bloom_filter import ScalableBloomFilter
+
+        client = _BitmapRedis()
+        bloom = ScalableBloomFilter(client, "test:bloom", 0.01, 10)
+        first = [_hash(f"a{i}") for i in range(10)]
+        bloom.add_many(first)
+
+        assert client.hget("test:bloom:meta", "slices") == "2"
+
+        second = [_hash(f"b{i}") for i in range(5)]
+        bloom.add_many(second)
+
+        assert all(bloom.contains_many(first + second))
+        assert client.hget("test:bloom:meta", "count:1") == "5"
+
+    def test_later_slices_are_tighter(self):
+        """Each slice uses a lower error rate (more hashes, more bits)."""
+        from crawler.queue.bloom_filter import ScalableBloomFilter
+
+        bloom = ScalableBloomFilter(MagicMock(), "test:bloom", 0.01, 1000)
+        bits_0, hashes_0 = bloom._slice_params(0)
+        bits_1, hashes_1 = bloom._slice_params(1)
+
+        assert hashes_1 > hashes_0
+        assert bits_1 > 2 * bits_0
+
+
+class TestFrontierGlobalSeenFilter:
+    """Tests for URLFrontier with the Bloom filter global seen backend."""
+
+    def test_bloom_hit_rejects_without_global_set(self):
+        """Filter hits are sent as globally seen; accepted hashes are added."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        redis_client = MagicMock()
+        redis_client.smismember.side_effect = lambda key, members: [0] * len(members)
+        bloom = MagicMock()
+        bloom.contains_many.return_value = [True, False]
+        frontier = URLFrontier(redis_client=redis_client, global_seen_filter=bloom)
+        script = redis_client.register_script.return_value
+        script.return_value = [0, 1]
+
+        with patch.object(frontier, "_find_known_urls", return_value=set()):
+            results = frontier.add_url_batch(
+                "q", ["https://old.com/p", "https://new.com/p"]
+            )
+
+        args = script.call_args.kwargs["args"]
+        assert args[2] == 0  # exact global set disabled
+        assert args[7] == URLFrontier.URL_GLOBALLY_SEEN
+        assert args[12] == URLFrontier.URL_NEW
+        assert results == [False, True]
+        bloom.add_many.assert_called_once_with([frontier._hash_url("https://new.com/p")])
+
+    def test_bloom_backend_selected_by_setting(self, settings):
+        """CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND=bloom builds the filter."""
+        from crawler.queue.bloom_filter import ScalableBloomFilter
+        from crawler.queue.url_frontier import URLFrontier
+
+        settings.CRAWLER_FRONTIER_GLOBAL_SEEN_BACKEND = "bloom"
+        redis_client = MagicMock()
+        redis_client.hget.return_value = None
+        frontier = URLFrontier(redis_client=redis_client)
+
+        assert isinstance(frontier._global_filter, ScalableBloomFilter)
+        assert frontier._global_filter.key == URLFrontier.GLOBAL_SEEN_BLOOM_KEY
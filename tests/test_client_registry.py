@@ -0,0 +1,167 @@
+"""
+Tests for the process-wide fetcher registry.
+
+Tests cover:
+1. Client and SmartRouter reuse within an event loop
+2. Separate instances per event loop
+3. Closing instances per loop, on closed loops and on worker shutdown
+4. Services using the shared clients
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+
+class TestFetcherRegistry:
+    """Tests for FetcherRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_instances_within_loop(self):
+        """Repeated lookups on one loop return the same pooled instances."""
+        from crawler.fetchers.client_registry import FetcherRegistry
+
+        registry = FetcherRegistry()
+
+        assert registry.get_http_client() is registry.get_http_client()
+        assert registry.get_http_client("ai_service") is not registry.get_http_client()
+        assert registry.get_smart_router(30.0) is registry.get_smart_router(30.0)
+        assert registry.get_smart_router(30.0) is not registry.get_smart_router(10.0)
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_and_forgets_loop_instances(self):
+        """aclose() closes clients and routers; the next lookup builds new ones."""
+        from crawler.fetchers.client_registry import FetcherRegistry
+
+        registry = FetcherRegistry()
+        client = registry.get_http_client()
+        router = registry.get_smart_router()
+        router.close = AsyncMock()
+
+        await registry.aclose()
+
+        assert client.is_closed is True
+        router.close.assert_called_once()
+        assert registry.get_http_client() is not client
+        await registry.aclose()
+
+    def test_instances_are_bound_to_their_loop(self):
+        """Each event loop gets its own clients; shutdown() closes open loops."""
+        from crawler.fetchers.client_registry import FetcherRegistry
+
+        registry = FetcherRegistry()
+
+        async def _get():
+            return registry.get_http_client()
+
+        loop_a = asyncio.new_event_loop()
+        loop_b = asyncio.new_event_loop()
+        try:
+            client_a = loop_a.run_until_complete(_get())
+            client_b = loop_b.run_until_complete(_get())
+            assert client_a is not client_b
+            assert loop_a.run_until_complete(_get()) is client_a
+
+            loop_b.close()
+            registry.shutdown()
+
+            assert client_a.is_closed is True
+            assert len(registry._by_loop) == 0
+        finally:
+            loop_a.close()
+            if not loop_b.is_closed():
+                loop_b.close()
+
+    def test_closed_loops_are_evicted_on_next_lookup(self):
+        """Loops closed without close_fetchers() do not stay in the registry."""
+        from crawler.fetchers.client_registry import FetcherRegistry
+
+        registry = FetcherRegistry()
+
+        async def _get():
+            return registry.get_http_client()
+
+        loops = []
+        for _ in range(5):
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(_get())
+            loop.close()
+            loops.append(loop)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(_get())
+            assert list(registry._by_loop.keys()) == [loop]
+        finally:
+            registry.shutdown()
+            loop.close()
+
+    def test_task_loops_close_shared_fetchers(self):
+        """Celery task loops close their shared clients before closing."""
+        from crawler.fetchers.client_registry import _registry, get_http_client
+        from crawler.tasks import _run_async
+
+        async def _get():
+            return get_http_client("ai_service")
+
+        clients = [_run_async(_get()) for _ in range(3)]
+
+        assert all(client.is_closed is True for client in clients)
+        assert len(_registry._by_loop) == 0
+
+
+class TestServicesUseSharedClients:
+    """Tests for services fetching through the registry."""
+
+    @pytest.mark.asyncio
+    async def test_sitemap_fetches_reuse_one_client(self):
+        """Consecutive sitemap fetches go through one pooled client."""
+        from crawler.fetchers.client_registry import close_fetchers
+        from crawler.services.sitemap_parser import SitemapParser
+
+        clients = []
+
+        def handler(request):
+            return httpx.Response(200, text="<urlset></urlset>")
+
+        real_client = httpx.AsyncClient
+
+        def make_client(**kwargs):
+            client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+            clients.append(client)
+            return client
+
+        parser = SitemapParser()
+        with patch("crawler.fetchers.client_registry.httpx.AsyncClient", side_effect=make_client):
+            await parser._fetch_sitemap_content("https://shop.com/sitemap.xml")
+            await parser._fetch_sitemap_content("https://shop.com/sitemap-2.xml")
+            await close_fetchers()
+
+        assert len(clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_discovery_fetch_page_keeps_shared_router_open(self):
+        """_fetch_page uses the shared SmartRouter and does not close it."""
+        from crawler.services.discovery_orchestrator_v2 import DiscoveryOrchestratorV2
+
+        router = MagicMock()
+        router.fetch = AsyncMock(return_value=MagicMock(
+            success=True, content="<html>page</html>", tier_used=1
+        ))
+        router.close = AsyncMock()
+        orchestrator = DiscoveryOrchestratorV2(ai_client=MagicMock())
+
+        with patch(
+            "crawler.services.discovery_orchestrator_v2.get_smart_router",
+            return_value=router,
+        ) as get_router:
+            for path in ("/a", "/b"):
+                content = await orchestrator._fetch_page(f"https://shop.com{path}")
+                assert content == "<html>page</html>"
+
+        assert get_router.call_count == 2
+        router.close.assert_not_called()
@@ -241,11 +241,15 @@ class TestProcessEnrichmentQueueTask:
             mock_frontier = MagicMock()
             mock_frontier_func.return_value = mock_frontier
             mock_frontier.get_queue_size.return_value = 5
-            mock_frontier.get_next_url.side_effect = [
-                {"url": "https://example.com/review1", "metadata": {"skeleton_id": "123"}},
-                {"url": "https://example.com/review2", "metadata": {"skeleton_id": "456"}},
-                None,  # End of queue
-            ]
+            leased = iter([[
+                {"url": "https://example.com/review1", "url_hash": "h1",
+                 "metadata": {"skeleton_id": "123"}},
+                {"url": "https://example.com/review2", "url_hash": "h2",
+                 "metadata": {"skeleton_id": "456"}},
+            ]])
+            # Later lease batches are empty (end of queue)
+            mock_frontier.lease_urls.side_effect = lambda *args: next(leased, [])
+            mock_frontier.seconds_until_ready.return_value = None
 
             # Mock SmartRouter at its source module
             with patch('crawler.fetchers.smart_router.SmartRouter') as mock_router_class:
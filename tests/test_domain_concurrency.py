@@ -0,0 +1,300 @@
+"""
+Tests for adaptive (AIMD) per-domain concurrency.
+
+Tests cover:
+1. FeedbackRecorder growing and shrinking the concurrency window
+2. DomainConcurrencyLimiter enforcing the window
+3. SmartRouter fetches sharing the limiter
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _profile(**kwargs):
+    from crawler.fetchers.domain_intelligence import DomainProfile
+
+    return DomainProfile(domain="shop.com", **kwargs)
+
+
+class TestConcurrencyWindow:
+    """Tests for FeedbackRecorder.update_concurrency_window."""
+
+    def test_additive_increase(self, settings):
+        """Clean successes add about one slot per window of fetches."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        settings.CRAWLER_DOMAIN_CONCURRENCY = 2
+        profile = _profile()
+
+        for _ in range(2):
+            FeedbackRecorder.record_fetch_result(profile, tier=1, success=True, response_time_ms=200)
+
+        assert 2.8 < profile.concurrency_window < 3.0
+
+    def test_increase_is_capped(self, settings):
+        """The window never exceeds CRAWLER_DOMAIN_CONCURRENCY_MAX."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        settings.CRAWLER_DOMAIN_CONCURRENCY_MAX = 4
+        profile = _profile(concurrency_window=3.9)
+
+        for _ in range(5):
+            FeedbackRecorder.record_fetch_result(profile, tier=1, success=True, response_time_ms=200)
+
+        assert profile.concurrency_window == 4.0
+
+    @pytest.mark.parametrize("kwargs", [
+        {"escalation_reason": "HTTP 429"},
+        {"escalation_reason": "HTTP 503 status code"},
+        {"timed_out": True, "escalation_reason": "Timeout: read timed out"},
+    ])
+    def test_multiplicative_decrease_on_congestion(self, kwargs):
+        """Rate limiting, overload and timeouts halve the window."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = _profile(concurrency_window=6.0)
+
+        FeedbackRecorder.record_fetch_result(
+            profile, tier=1, success=False, response_time_ms=500, **kwargs
+        )
+
+        assert profile.concurrency_window == 3.0
+
+    def test_burst_of_congestion_decreases_once(self):
+        """429s from fetches already in flight only count once per cooldown."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = _profile(concurrency_window=8.0)
+
+        for _ in range(4):
+            FeedbackRecorder.record_fetch_result(
+                profile, tier=1, success=False, response_time_ms=100, escalation_reason="HTTP 429"
+            )
+        assert profile.concurrency_window == 4.0
+
+        profile.concurrency_decreased_at -= FeedbackRecorder.CONCURRENCY_DECREASE_COOLDOWN_SECONDS
+        FeedbackRecorder.record_fetch_result(
+            profile, tier=1, success=False, response_time_ms=100, escalation_reason="HTTP 429"
+        )
+        assert profile.concurrency_window == 2.0
+
+    def test_window_floor_is_one(self):
+        """The window never drops below one fetch."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = _profile(concurrency_window=1.5)
+
+        FeedbackRecorder.record_fetch_result(
+            profile, tier=1, success=False, response_time_ms=100, timed_out=True
+        )
+
+        assert profile.concurrency_window == 1.0
+
+    def test_latency_inflation_decreases(self):
+        """A Tier 1 response far slower than the baseline counts as congestion."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = _profile(concurrency_window=4.0)
+        FeedbackRecorder.record_fetch_result(profile, tier=1, success=True, response_time_ms=200)
+        window = profile.concurrency_window
+
+        FeedbackRecorder.record_fetch_result(profile, tier=1, success=True, response_time_ms=900)
+
+        assert profile.concurrency_window == window / 2
+        assert 200 < profile.concurrency_baseline_ms < 900
+
+    def test_slow_tier2_render_is_not_inflation(self):
+        """Only Tier 1 latency is compared with the Tier 1 baseline."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = _profile(concurrency_window=4.0, concurrency_baseline_ms=200.0)
+
+        FeedbackRecorder.record_fetch_result(profile, tier=2, success=True, response_time_ms=5000)
+
+        assert profile.concurrency_window == 4.25
+        assert profile.concurrency_baseline_ms == 200.0
+
+    def test_unrelated_failures_leave_window(self):
+        """Blocks and JS escalations say nothing about load."""
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = _profile(concurrency_window=4.0)
+
+        FeedbackRecorder.record_fetch_result(
+            profile, tier=1, success=False, response_time_ms=100, escalation_reason="HTTP 403"
+        )
+        FeedbackRecorder.record_fetch_result(
+            profile, tier=1, success=False, response_time_ms=100,
+            escalation_reason="JavaScript placeholder page - requires JS rendering",
+        )
+
+        assert profile.concurrency_window == 4.0
+
+    def test_profile_round_trip(self):
+        """Concurrency fields survive JSON serialization."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+
+        profile = _profile(concurrency_window=3.5, concurrency_baseline_ms=180.0)
+
+        restored = DomainProfile.from_json(profile.to_json())
+
+        assert restored.concurrency_window == 3.5
+        assert restored.concurrency_baseline_ms == 180.0
+
+
+class TestDomainConcurrencyLimiter:
+    """Tests for DomainConcurrencyLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_enforces_window(self):
+        """At most int(window) fetches per domain are in flight."""
+        from crawler.fetchers.domain_concurrency import DomainConcurrencyLimiter
+
+        limiter = DomainConcurrencyLimiter()
+        profile = _profile(concurrency_window=2.7)
+        peak = 0
+
+        async def fetch():
+            nonlocal peak
+            async with limiter.slot("shop.com", profile):
+                peak = max(peak, limiter.in_flight("shop.com"))
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(fetch() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter._domains == {}
+
+    @pytest.mark.asyncio
+    async def test_waiters_see_window_changes(self):
+        """A window grown by a finishing fetch admits more waiters."""
+        from crawler.fetchers.domain_concurrency import DomainConcurrencyLimiter
+
+        limiter = DomainConcurrencyLimiter()
+        profile = _profile(concurrency_window=1.0)
+        peak = 0
+
+        async def fetch(grow):
+            nonlocal peak
+            async with limiter.slot("shop.com", profile):
+                peak = max(peak, limiter.in_flight("shop.com"))
+                await asyncio.sleep(0.01)
+                if grow:
+                    profile.concurrency_window = 3.0
+
+        await asyncio.gather(fetch(True), *(fetch(False) for _ in range(3)))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_slots_are_reentrant(self):
+        """A task already holding a domain's slot does not wait for another."""
+        from crawler.fetchers.domain_concurrency import DomainConcurrencyLimiter
+
+        limiter = DomainConcurrencyLimiter()
+        profile = _profile(concurrency_window=1.0)
+
+        async with limiter.slot("shop.com", profile):
+            async with limiter.slot("shop.com", profile):
+                assert limiter.in_flight("shop.com") == 1
+
+
+class TestRouterConcurrency:
+    """Tests for SmartRouter enforcing the window."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_respect_window(self, settings):
+        """Independent fetch() calls to one domain share its window."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        settings.CRAWLER_DOMAIN_CONCURRENCY_MAX = 1
+        profile = _profile(concurrency_window=1.0)
+        router = SmartRouter(timeout=30)
+        in_flight = 0
+        peak = 0
+
+        async def tier1(url, *args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(
+                content="<html>" + "<p>Product</p>" * 100 + "</html>",
+                status_code=200, headers={}, success=True, not_modified=False,
+            )
+
+        with patch.object(router, "_try_tier1", side_effect=tier1):
+            await asyncio.gather(*(
+                router.fetch(f"https://shop.com/p/{i}", profile=profile) for i in range(4)
+            ))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_shrinks_window_on_rate_limiting(self):
+        """429s during a batch shrink the window the batch is running under."""
+        from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+        from crawler.fetchers.smart_router import SmartRouter
+
+        profile = _profile(concurrency_window=4.0)
+        store = MagicMock(spec=DomainIntelligenceStore)
+        store.get_profile.return_value = profile
+        router = SmartRouter(timeout=30, domain_store=store)
+
+        tier1 = AsyncMock(return_value=MagicMock(
+            content="", status_code=429, headers={}, success=False, error="HTTP 429",
+            aborted=None,
+        ))
+        failed = MagicMock(content="", status_code=0, headers={}, success=False, error="failed")
+        with patch.object(router, "_try_tier1", tier1), \
+                patch.object(router, "_try_tier2", AsyncMock(return_value=failed)), \
+                patch.object(router, "_try_tier3", AsyncMock(return_value=failed)), \
+                patch("crawler.fetchers.smart_tier_selector.SmartTierSelector.should_hedge",
+                      return_value=False):
+            results = [r async for _, r in router.fetch_many(
+                [f"https://shop.com/p/{i}" for i in range(4)], force_tier=1
+            )]
+
+        assert len(results) == 4
+        assert profile.concurrency_window == 2.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limiting_lowers_window_of_next_fetch(self):
+        """A 429 halves the window seen by the next independent fetch()."""
+        from django.core.cache.backends.locmem import LocMemCache
+
+        from crawler.fetchers.domain_intelligence import (
+            CachedDomainIntelligenceStore,
+            DomainIntelligenceStore,
+        )
+        from crawler.fetchers.smart_router import SmartRouter
+
+        cache = LocMemCache(f"domain-intel-{uuid.uuid4()}", {})
+        with patch.object(DomainIntelligenceStore, "_cache", cache):
+            store = CachedDomainIntelligenceStore(flush_interval=3600, local_ttl=3600)
+            store.get_profile("shop.com").concurrency_window = 4.0
+            router = SmartRouter(timeout=30, domain_store=store)
+            limits = []
+
+            async def tier1(url, *args, **kwargs):
+                limits.append(router._concurrency.limit(store.get_profile("shop.com")))
+                return MagicMock(
+                    content="", status_code=429, headers={}, success=False,
+                    error="HTTP 429", aborted=None,
+                )
+
+            failed = MagicMock(content="", status_code=0, headers={}, success=False, error="failed")
+            with patch.object(router, "_try_tier1", side_effect=tier1), \
+                    patch.object(router, "_try_tier2", AsyncMock(return_value=failed)), \
+                    patch.object(router, "_try_tier3", AsyncMock(return_value=failed)), \
+                    patch("crawler.fetchers.smart_tier_selector.SmartTierSelector.should_hedge",
+                          return_value=False):
+                await router.fetch("https://shop.com/p/1", force_tier=1)
+                await router.fetch("https://shop.com/p/2", force_tier=1)
+
+        assert limits == [4, 2]
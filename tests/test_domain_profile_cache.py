@@ -0,0 +1,208 @@
+"""
+Tests for the write-behind domain profile cache (CachedDomainIntelligenceStore).
+
+Tests cover:
+1. Serving profiles from the local LRU
+2. Batched write-behind flushes
+3. Merge-safe flushes from concurrent workers
+4. LRU eviction and local TTL refresh
+5. SmartRouter using the shared store by default
+"""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def shared_cache():
+    """Private local-memory cache standing in for the shared Redis cache."""
+    from django.core.cache.backends.locmem import LocMemCache
+
+    from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+
+    cache = LocMemCache(f"domain-intel-{uuid.uuid4()}", {})
+    with patch.object(DomainIntelligenceStore, "_cache", cache):
+        yield cache
+
+
+def _store(**kwargs):
+    from crawler.fetchers.domain_intelligence import CachedDomainIntelligenceStore
+
+    kwargs.setdefault("flush_interval", 3600)
+    kwargs.setdefault("local_ttl", 3600)
+    return CachedDomainIntelligenceStore(**kwargs)
+
+
+class TestLocalCache:
+    """Tests for local reads and write-behind."""
+
+    def test_get_profile_is_served_locally(self, shared_cache):
+        """Repeated lookups return the shared profile without a cache read."""
+        store = _store()
+
+        profile = store.get_profile("Shop.com")
+        with patch.object(shared_cache, "get") as cache_get:
+            assert store.get_profile("shop.com") is profile
+        cache_get.assert_not_called()
+
+    def test_save_is_deferred_until_flush(self, shared_cache):
+        """save_profile() only writes once a flush runs."""
+        from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+
+        store = _store()
+        profile = store.get_profile("shop.com")
+        profile.success_count += 3
+        store.save_profile(profile)
+
+        assert DomainIntelligenceStore().get_profile("shop.com").success_count == 0
+        assert store.flush() == 1
+        assert DomainIntelligenceStore().get_profile("shop.com").success_count == 3
+        assert store.flush() == 0
+
+    def test_save_flushes_when_interval_elapsed(self, shared_cache):
+        """With a zero flush interval every save writes through."""
+        from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+
+        store = _store(flush_interval=0)
+        profile = store.get_profile("shop.com")
+        profile.failure_count += 1
+        store.save_profile(profile)
+
+        assert DomainIntelligenceStore().get_profile("shop.com").failure_count == 1
+
+
+class TestMergeSafeFlush:
+    """Tests for merging concurrent workers' updates."""
+
+    def test_concurrent_workers_do_not_clobber_counters(self, shared_cache):
+        """Counter deltas from two workers add up instead of overwriting."""
+        from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+
+        worker_a, worker_b = _store(), _store()
+        profile_a = worker_a.get_profile("shop.com")
+        profile_b = worker_b.get_profile("shop.com")
+
+        profile_a.success_count += 5
+        profile_a.tier1_success_rate = 0.8
+        worker_a.save_profile(profile_a)
+        profile_b.success_count += 2
+        profile_b.failure_count += 1
+        profile_b.tier1_success_rate = 0.9
+        worker_b.save_profile(profile_b)
+        worker_a.flush()
+        worker_b.flush()
+
+        stored = DomainIntelligenceStore().get_profile("shop.com")
+        assert stored.success_count == 7
+        assert stored.failure_count == 1
+        assert stored.tier1_success_rate == pytest.approx(0.7)
+        # The flushing worker sees the merged profile
+        assert profile_b.success_count == 7
+
+    def test_only_locally_changed_fields_overwrite(self, shared_cache):
+        """Unchanged local fields keep the value other workers stored."""
+        from crawler.fetchers.domain_intelligence import (
+            DomainIntelligenceStore,
+            DomainProfile,
+        )
+
+        worker = _store()
+        profile = worker.get_profile("shop.com")
+        DomainIntelligenceStore().save_profile(
+            DomainProfile(domain="shop.com", likely_js_heavy=True, recommended_tier=2)
+        )
+
+        profile.http2_compatible = True
+        worker.save_profile(profile)
+        worker.flush()
+
+        stored = DomainIntelligenceStore().get_profile("shop.com")
+        assert stored.likely_js_heavy is True
+        assert stored.recommended_tier == 2
+        assert stored.http2_compatible is True
+
+    def test_rates_are_clamped(self):
+        """Shifted success rates stay within 0..1."""
+        from crawler.fetchers.domain_intelligence import (
+            CachedDomainIntelligenceStore,
+            DomainProfile,
+        )
+
+        merged = CachedDomainIntelligenceStore.merge_profiles(
+            remote=DomainProfile(domain="a.com", tier2_success_rate=0.95),
+            base=DomainProfile(domain="a.com", tier2_success_rate=0.5),
+            local=DomainProfile(domain="a.com", tier2_success_rate=0.9),
+        )
+
+        assert merged.tier2_success_rate == 1.0
+
+
+class TestEvictionAndRefresh:
+    """Tests for LRU eviction and local TTL."""
+
+    def test_evicted_dirty_profile_is_flushed(self, shared_cache):
+        """Evicting a dirty profile writes it first."""
+        from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+
+        store = _store(max_profiles=1)
+        profile = store.get_profile("a.com")
+        profile.success_count += 1
+        store.save_profile(profile)
+
+        store.get_profile("b.com")
+
+        assert DomainIntelligenceStore().get_profile("a.com").success_count == 1
+        assert len(store._local) == 1
+
+    def test_stale_clean_profile_is_refreshed_in_place(self, shared_cache):
+        """After local_ttl a clean profile picks up other workers' changes."""
+        from crawler.fetchers.domain_intelligence import (
+            DomainIntelligenceStore,
+            DomainProfile,
+        )
+
+        store = _store(local_ttl=0)
+        profile = store.get_profile("shop.com")
+        DomainIntelligenceStore().save_profile(
+            DomainProfile(domain="shop.com", likely_bot_protected=True)
+        )
+
+        assert store.get_profile("shop.com") is profile
+        assert profile.likely_bot_protected is True
+
+
+class TestSmartRouterFlush:
+    """Tests for SmartRouter using and flushing the store."""
+
+    def test_router_uses_shared_store_by_default(self, shared_cache, settings):
+        """Routers built without a store share the process-wide cached store."""
+        from crawler.fetchers.domain_intelligence import get_domain_intelligence_store
+        from crawler.fetchers.smart_router import SmartRouter
+
+        settings.CRAWLER_DOMAIN_INTELLIGENCE_ENABLED = True
+
+        with patch("crawler.fetchers.domain_intelligence._domain_store", None):
+            first = SmartRouter(timeout=30)
+            second = SmartRouter(timeout=30)
+
+            assert first._domain_store is get_domain_intelligence_store()
+            assert first._get_domain_profile("shop.com") is second._get_domain_profile("shop.com")
+        assert SmartRouter(timeout=30, domain_intelligence=False)._domain_store is None
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_domain_store(self, shared_cache):
+        """Closing the router writes pending profile updates."""
+        from crawler.fetchers.domain_intelligence import DomainIntelligenceStore
+        from crawler.fetchers.smart_router import SmartRouter
+
+        store = _store()
+        router = SmartRouter(timeout=30, domain_store=store)
+        profile = router._get_domain_profile("shop.com")
+        profile.success_count += 1
+        router._save_domain_profile(profile)
+
+        await router.close()
+
+        assert DomainIntelligenceStore().get_profile("shop.com").success_count == 1
@@ -0,0 +1,224 @@
+"""
+Tests for conditional Tier 1 re-fetches (HTTP validator cache).
+
+Tests cover:
+1. URL canonicalization and validator storage
+2. Conditional headers and 304 handling in Tier1HttpxFetcher
+3. not_modified propagation through SmartRouter.FetchResult
+4. ContentProcessor skipping unchanged pages
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def store():
+    """ValidatorStore on a private local-memory cache."""
+    import uuid
+
+    from django.core.cache.backends.locmem import LocMemCache
+
+    from crawler.fetchers.validator_cache import ValidatorStore
+
+    cache = LocMemCache(f"validators-{uuid.uuid4()}", {})
+    store = ValidatorStore()
+    with patch.object(ValidatorStore, "_cache", cache):
+        yield store
+
+
+class TestValidatorStore:
+    """Tests for canonicalize_url and ValidatorStore."""
+
+    def test_canonicalize_url(self):
+        """Host case, default port, fragment and trailing slash are normalized."""
+        from crawler.fetchers.validator_cache import canonicalize_url
+
+        assert canonicalize_url("HTTPS://Shop.COM:443/Whisky/?a=1#top") == "https://shop.com/Whisky?a=1"
+        assert canonicalize_url("https://shop.com/p/") == canonicalize_url("https://shop.com/p")
+
+    def test_round_trip_by_canonical_url(self, store):
+        """Validators saved for a URL are found under its canonical form."""
+        from crawler.fetchers.validator_cache import HTTPValidators
+
+        validators = HTTPValidators.from_response(
+            "https://shop.com/p/1/",
+            {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+            "<html>v1</html>",
+        )
+        store.save_validators(validators)
+
+        loaded = store.get_validators("https://SHOP.com/p/1#reviews")
+
+        assert loaded == validators
+        assert loaded.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert store.get_validators("https://shop.com/p/2") is None
+
+
+class TestTier1Conditional:
+    """Tests for conditional requests in Tier1HttpxFetcher."""
+
+    def _fetcher(self, response):
+        from crawler.fetchers.tier1_httpx import Tier1HttpxFetcher
+
+        fetcher = Tier1HttpxFetcher(timeout=5, max_retries=1)
+        fetcher._http_client = MagicMock()
+        fetcher._http_client.get = AsyncMock(return_value=response)
+        return fetcher
+
+    @pytest.mark.asyncio
+    async def test_sends_validators_and_handles_304(self):
+        """A 304 answer is a successful, empty, not_modified response."""
+        from crawler.fetchers.validator_cache import HTTPValidators
+
+        fetcher = self._fetcher(httpx.Response(304, request=httpx.Request("GET", "https://shop.com/p")))
+        validators = HTTPValidators(url="https://shop.com/p", etag='"abc"', content_hash="x")
+
+        result = await fetcher.fetch("https://shop.com/p", validators=validators)
+
+        headers = fetcher._http_client.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert result.success is True
+        assert result.not_modified is True
+        assert result.status_code == 304
+        assert result.content == ""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_body_is_not_modified(self):
+        """A 200 with the stored content hash is flagged not_modified."""
+        from crawler.fetchers.validator_cache import HTTPValidators, compute_content_hash
+
+        body = "<html>same</html>"
+        fetcher = self._fetcher(httpx.Response(200, text=body, request=httpx.Request("GET", "https://shop.com/p")))
+        validators = HTTPValidators(url="https://shop.com/p", content_hash=compute_content_hash(body))
+
+        result = await fetcher.fetch("https://shop.com/p", validators=validators)
+
+        assert result.not_modified is True
+        assert result.content == body
+
+
+class TestRouterConditional:
+    """Tests for conditional fetching through SmartRouter."""
+
+    @pytest.mark.asyncio
+    async def test_304_surfaces_not_modified(self, store):
+        """A 304 skips soft-failure checks and returns not_modified."""
+        from crawler.fetchers.smart_router import SmartRouter
+        from crawler.fetchers.tier1_httpx import FetchResponse
+        from crawler.fetchers.validator_cache import HTTPValidators
+
+        router = SmartRouter(timeout=30)
+        router._validator_store = store
+        store.save_validators(HTTPValidators(url="https://shop.com/p", etag='"abc"'))
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=FetchResponse(
+            content="", status_code=304, headers={}, success=True, not_modified=True,
+        ))
+        router._tier1_fetcher = tier1
+
+        result = await router.fetch("https://shop.com/p", conditional=True)
+
+        assert result.success is True
+        assert result.not_modified is True
+        assert result.tier_used == 1
+        assert tier1.fetch.call_args.kwargs["validators"].etag == '"abc"'
+
+    @pytest.mark.asyncio
+    async def test_accepted_full_response_returns_validators(self, store):
+        """Validators of accepted Tier 1 pages are stored only when saved."""
+        from crawler.fetchers.smart_router import SmartRouter
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        content = "<html><body>" + "<p>Product details</p>" * 100 + "</body></html>"
+        router = SmartRouter(timeout=30)
+        router._validator_store = store
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=FetchResponse(
+            content=content, status_code=200, headers={"etag": '"v2"'}, success=True,
+        ))
+        router._tier1_fetcher = tier1
+
+        result = await router.fetch("https://shop.com/p", conditional=True)
+
+        assert result.not_modified is False
+        assert tier1.fetch.call_args.kwargs["validators"] is None
+        assert result.validators.etag == '"v2"'
+        assert store.get_validators("https://shop.com/p") is None
+
+        router.save_validators(result)
+        assert store.get_validators("https://shop.com/p").etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_unconditional_fetch_ignores_validators(self, store):
+        """Without conditional=True no validators are sent or stored."""
+        from crawler.fetchers.smart_router import SmartRouter
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        router = SmartRouter(timeout=30)
+        router._validator_store = store
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=FetchResponse(
+            content="<html>" + "x" * 1000 + "</html>", status_code=200,
+            headers={"etag": '"v1"'}, success=True,
+        ))
+        router._tier1_fetcher = tier1
+
+        result = await router.fetch("https://shop.com/p")
+
+        assert tier1.fetch.call_args.kwargs["validators"] is None
+        assert result.validators is None
+        assert store.get_validators("https://shop.com/p") is None
+
+
+class TestContentProcessorSkip:
+    """Tests for ContentProcessor skipping unchanged pages."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_skips_ai_extraction(self):
+        """Unchanged pages never reach the AI client."""
+        from crawler.services.content_processor import ContentProcessor
+
+        ai_client = MagicMock()
+        ai_client.enhance_from_crawler = AsyncMock()
+        processor = ContentProcessor(ai_client=ai_client)
+
+        with patch.object(processor, "_record_unchanged_fetch", AsyncMock()) as record:
+            result = await processor.process(
+                url="https://shop.com/p", raw_content="", not_modified=True
+            )
+
+        assert result.success is True
+        assert result.not_modified is True
+        ai_client.enhance_from_crawler.assert_not_called()
+        record.assert_called_once_with("https://shop.com/p")
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_unchanged_fetch_counts_as_recrawl_check(self):
+        """An unchanged re-fetch is a no-change observation for recrawls."""
+        from datetime import timedelta
+
+        from asgiref.sync import sync_to_async
+        from django.utils import timezone
+
+        from crawler.models import CrawledURL
+        from crawler.services.content_processor import ContentProcessor
+
+        crawled_url = await sync_to_async(CrawledURL.objects.create)(
+            url="https://shop.com/p/unchanged",
+            content_hash=CrawledURL.compute_content_hash("v1"),
+            last_crawled_at=timezone.now() - timedelta(days=1),
+        )
+
+        await ContentProcessor(ai_client=MagicMock())._record_unchanged_fetch(crawled_url.url)
+
+        await sync_to_async(crawled_url.refresh_from_db)()
+        assert crawled_url.recrawl_checks == 1
+        assert crawled_url.recrawl_changes == 0
+        assert crawled_url.content_changed is False
@@ -0,0 +1,159 @@
+"""
+Tests for change-rate-driven recrawl scheduling.
+
+Tests cover:
+1. Change rate estimation from hash comparison history
+2. Revisit interval clamping
+3. Observing fetches on CrawledURL
+4. Re-admitting due URLs into the frontier
+"""
+
+import math
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+
+@pytest.fixture
+def scheduler():
+    from crawler.queue.recrawl_scheduler import RecrawlScheduler
+
+    return RecrawlScheduler(
+        min_interval=timedelta(hours=6),
+        max_interval=timedelta(days=30),
+        default_interval=timedelta(days=7),
+    )
+
+
+@pytest.fixture
+def memory_frontier():
+    """URLFrontier on a private in-memory backend with DB checks disabled."""
+    from crawler.queue.memory_backend import InMemoryRedis
+    from crawler.queue.url_frontier import URLFrontier
+
+    frontier = URLFrontier(redis_client=InMemoryRedis(), crawl_delay=0)
+    with patch.object(frontier, "_find_known_urls", return_value=set()):
+        yield frontier
+
+
+class TestChangeRateEstimation:
+    """Tests for RecrawlScheduler.estimate_change_rate and next_interval."""
+
+    def test_no_history_has_no_rate(self, scheduler):
+        """Without compared fetches the rate is unknown."""
+        assert scheduler.estimate_change_rate(0, 0, 0) is None
+        assert scheduler.next_interval(None) == timedelta(days=7)
+
+    def test_never_changing_url_drifts_to_max_interval(self, scheduler):
+        """Zero detected changes gives a zero rate and the maximum interval."""
+        rate = scheduler.estimate_change_rate(10, 0, 10 * 86400)
+
+        assert rate == 0
+        assert scheduler.next_interval(rate) == timedelta(days=30)
+
+    def test_estimator_corrects_for_missed_changes(self, scheduler):
+        """A change on every daily fetch implies more than one change per day."""
+        rate = scheduler.estimate_change_rate(10, 10, 10 * 86400)
+
+        assert rate == pytest.approx(math.log(21))
+        assert rate > 1
+
+    def test_interval_is_inverse_rate_clamped(self, scheduler):
+        """Intervals follow 1/rate within [min, max]."""
+        assert scheduler.next_interval(0.5) == timedelta(days=2)
+        assert scheduler.next_interval(100) == timedelta(hours=6)
+        assert scheduler.next_interval(0.001) == timedelta(days=30)
+
+
+@pytest.mark.django_db
+class TestRecrawlObservation:
+    """Tests for recording fetches on CrawledURL."""
+
+    def test_update_content_tracks_changes_and_reschedules(self, db):
+        """Repeated fetches accumulate history and move next_recrawl_at."""
+        from crawler.models import CrawledURL
+
+        crawled_url = CrawledURL.objects.create(
+            url="https://shop.com/p/1",
+            content_hash=CrawledURL.compute_content_hash("v1"),
+            last_crawled_at=timezone.now() - timedelta(days=1),
+        )
+
+        crawled_url.update_content("v2")
+        crawled_url.refresh_from_db()
+
+        assert crawled_url.content_changed is True
+        assert crawled_url.recrawl_checks == 1
+        assert crawled_url.recrawl_changes == 1
+        assert crawled_url.recrawl_observed_seconds == pytest.approx(86400, rel=0.01)
+        assert crawled_url.change_rate > 0
+        assert crawled_url.next_recrawl_at > timezone.now()
+
+    def test_first_fetch_is_not_a_comparison(self, scheduler):
+        """A URL without a previous hash gets the default interval."""
+        from crawler.models import CrawledURL
+
+        crawled_url = CrawledURL(url="https://shop.com/p/2")
+        now = timezone.now()
+
+        scheduler.observe(crawled_url, "abc", fetched_at=now)
+
+        assert crawled_url.recrawl_checks == 0
+        assert crawled_url.change_rate is None
+        assert crawled_url.next_recrawl_at == now + timedelta(days=7)
+
+
+@pytest.mark.django_db
+class TestRecrawlAdmission:
+    """Tests for re-admitting due URLs to the frontier."""
+
+    def test_due_urls_are_readmitted_despite_seen_sets(self, db, scheduler, memory_frontier):
+        """Due URLs re-enter their source queue; others are left alone."""
+        from crawler.models import CrawledURL, CrawlerSource
+
+        now = timezone.now()
+        source = CrawlerSource.objects.create(
+            name="Recrawl Shop",
+            slug="recrawl-shop",
+            base_url="https://recrawl-shop.com",
+            category="retailer",
+            is_active=True,
+            next_crawl_at=now + timedelta(days=1),
+        )
+        due = CrawledURL.objects.create(
+            url="https://recrawl-shop.com/p/due",
+            source=source,
+            next_recrawl_at=now - timedelta(minutes=1),
+        )
+        CrawledURL.objects.create(
+            url="https://recrawl-shop.com/p/later",
+            source=source,
+            next_recrawl_at=now + timedelta(days=1),
+        )
+        memory_frontier.add_url(source.slug, due.url)
+        memory_frontier.get_next_url(source.slug)
+
+        result = scheduler.admit_due_urls(memory_frontier, now=now)
+
+        assert result["due"] == 1
+        assert result["queues"] == {"recrawl-shop": 1}
+        entry = memory_frontier.get_next_url(source.slug)
+        assert entry["url"] == due.url
+        assert entry["metadata"] == {"recrawl": True}
+        assert memory_frontier.is_empty(source.slug)
+
+        due.refresh_from_db()
+        source.refresh_from_db()
+        assert due.next_recrawl_at == now + timedelta(hours=6)
+        assert source.next_crawl_at == now
+
+    def test_leased_urls_are_not_readmitted(self, memory_frontier):
+        """A URL still held by a worker is not queued a second time."""
+        memory_frontier.add_url("q", "https://a.com/1")
+        memory_frontier.lease_urls("q", 1)
+
+        assert memory_frontier.readmit_urls("q", ["https://a.com/1", "https://a.com/2"]) == 1
+        assert memory_frontier.get_next_url("q")["url"] == "https://a.com/2"
+        assert memory_frontier.is_url_seen("q", "https://a.com/2")
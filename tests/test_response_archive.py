@@ -0,0 +1,209 @@
+"""
+Tests for the content-addressed response archive and SmartRouter replay mode.
+
+Tests cover:
+1. Storing, deduplicating and looking up archived responses
+2. SmartRouter archiving accepted fetches
+3. Replay mode serving from the archive without network access
+4. Archiving raw_content before Wayback cleanup clears it
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+PAGE = "<html><body>" + "<p>Product details</p>" * 100 + "</body></html>"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    from crawler.fetchers.response_archive import ResponseArchive
+
+    return ResponseArchive(root=str(tmp_path / "archive"))
+
+
+class TestResponseArchive:
+    """Tests for ResponseArchive storage."""
+
+    def test_store_and_lookup_latest(self, archive):
+        """lookup() returns the latest fetch with its decompressed body."""
+        archive.store("https://shop.com/p/1", "<html>v1</html>", status_code=200, tier=1)
+        archive.store(
+            "https://shop.com/p/1/", "<html>v2</html>", status_code=200,
+            headers={"etag": '"v2"'}, tier=2,
+        )
+
+        latest = archive.lookup("https://SHOP.com/p/1")
+
+        assert latest.content == "<html>v2</html>"
+        assert latest.tier == 2
+        assert latest.headers == {"etag": '"v2"'}
+        assert [r.content_hash for r in archive.history("https://shop.com/p/1")] == [
+            archive.compute_hash("<html>v1</html>"),
+            archive.compute_hash("<html>v2</html>"),
+        ]
+        assert archive.lookup("https://shop.com/p/2") is None
+
+    def test_identical_bodies_are_stored_once(self, archive):
+        """Bodies are content-addressed and gzip-compressed on sharded paths."""
+        archive.store("https://a.com/1", PAGE, status_code=200)
+        archive.store("https://b.com/1", PAGE, status_code=200)
+
+        bodies = list((archive.root / "bodies").rglob("*.html.gz"))
+        assert len(bodies) == 1
+        assert bodies[0].stat().st_size < len(PAGE)
+        assert bodies[0].parent.parent.name == archive.compute_hash(PAGE)[:2]
+
+    def test_iter_latest_yields_one_record_per_url(self, archive):
+        """iter_latest() streams the latest record of every URL."""
+        archive.store("https://a.com/1", "old", status_code=200)
+        archive.store("https://a.com/1", "new", status_code=200)
+        archive.store("https://b.com/1", "other", status_code=200)
+
+        latest = {r.url: r for r in archive.iter_latest()}
+
+        assert set(latest) == {"https://a.com/1", "https://b.com/1"}
+        assert archive.load_body(latest["https://a.com/1"].content_hash) == "new"
+
+    def test_lookup_uses_latest_fetch_time(self, archive):
+        """An older fetch archived later does not replace the latest one."""
+        now = datetime.now(timezone.utc)
+        archive.store("https://a.com/1", "new", status_code=200, fetched_at=now)
+        archive.store("https://a.com/1", "old", status_code=200, fetched_at=now - timedelta(days=7))
+
+        assert archive.lookup("https://a.com/1").content == "new"
+        assert archive.load_body(next(archive.iter_latest()).content_hash) == "new"
+
+    def test_torn_index_line_is_skipped(self, archive):
+        """A partially written index line does not break lookups."""
+        archive.store("https://a.com/1", "body", status_code=200)
+        with open(archive._index_path("https://a.com/1"), "a") as f:
+            f.write('{"url": "https://a.com/1", "cont')
+
+        assert archive.lookup("https://a.com/1").content == "body"
+
+
+class TestSmartRouterArchive:
+    """Tests for archiving and replay in SmartRouter."""
+
+    @pytest.mark.asyncio
+    async def test_accepted_fetch_is_archived(self, archive):
+        """Successful fetches are written to the archive with their tier."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30, archive=archive, replay=False)
+        tier1 = AsyncMock(return_value=MagicMock(
+            content=PAGE, status_code=200, headers={"content-type": "text/html"},
+            success=True, error=None,
+        ))
+        router._try_tier1 = tier1
+
+        result = await router.fetch("https://shop.com/p/1")
+
+        assert result.success is True
+        archived = archive.lookup("https://shop.com/p/1")
+        assert archived.content == PAGE
+        assert archived.tier == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_serves_archive_without_fetching(self, archive):
+        """Replay mode returns archived pages and never calls a tier."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        archive.store("https://shop.com/p/1", PAGE, status_code=200, tier=3)
+        router = SmartRouter(timeout=30, archive=archive, replay=True)
+        router._try_tier1 = AsyncMock()
+
+        hit = await router.fetch("https://shop.com/p/1")
+        miss = await router.fetch("https://shop.com/p/2")
+
+        assert hit.success is True
+        assert hit.replayed is True
+        assert hit.content == PAGE
+        assert hit.tier_used == 3
+        assert miss.success is False
+        assert miss.error == "Not in response archive"
+        router._try_tier1.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestWaybackCleanupArchive:
+    """Tests for keeping a local copy of raw_content before cleanup."""
+
+    def test_cleanup_archives_raw_content_once(self, settings, tmp_path):
+        """Raw content is archived before being cleared, without duplicates."""
+        from crawler.fetchers.response_archive import ResponseArchive
+        from crawler.models import CrawledSource, WaybackStatusChoices
+        from crawler.services.wayback import cleanup_raw_content
+
+        settings.CRAWLER_RESPONSE_ARCHIVE_ENABLED = True
+        settings.CRAWLER_RESPONSE_ARCHIVE_DIR = str(tmp_path / "archive")
+        archive = ResponseArchive()
+        archive.store("https://shop.com/review", PAGE, status_code=200, tier=2)
+
+        crawled = CrawledSource.objects.create(
+            url="https://shop.com/review",
+            title="Review",
+            raw_content=PAGE,
+            wayback_status=WaybackStatusChoices.SAVED,
+        )
+        other = CrawledSource.objects.create(
+            url="https://shop.com/other",
+            title="Other",
+            raw_content="<html>other</html>",
+            wayback_status=WaybackStatusChoices.SAVED,
+        )
+
+        assert cleanup_raw_content(crawled) is True
+        assert cleanup_raw_content(other) is True
+
+        assert len(archive.history("https://shop.com/review")) == 1
+        assert archive.lookup("https://shop.com/other").content == "<html>other</html>"
+        crawled.refresh_from_db()
+        assert crawled.raw_content is None
+
+    def test_cleanup_skips_content_archived_earlier(self, settings, tmp_path):
+        """Raw content matching any archived fetch of the URL is not re-archived."""
+        from crawler.fetchers.response_archive import ResponseArchive
+        from crawler.models import CrawledSource, WaybackStatusChoices
+        from crawler.services.wayback import cleanup_raw_content
+
+        settings.CRAWLER_RESPONSE_ARCHIVE_ENABLED = True
+        settings.CRAWLER_RESPONSE_ARCHIVE_DIR = str(tmp_path / "archive")
+        archive = ResponseArchive()
+        archive.store("https://shop.com/review", PAGE, status_code=200, tier=1)
+        archive.store("https://shop.com/review", "<html>newer</html>", status_code=200, tier=1)
+
+        crawled = CrawledSource.objects.create(
+            url="https://shop.com/review",
+            title="Review",
+            raw_content=PAGE,
+            wayback_status=WaybackStatusChoices.SAVED,
+        )
+
+        assert cleanup_raw_content(crawled) is True
+
+        assert len(archive.history("https://shop.com/review")) == 2
+        assert archive.lookup("https://shop.com/review").content == "<html>newer</html>"
+
+    def test_cleanup_survives_archive_errors(self, settings, tmp_path):
+        """A failing archive write is logged and cleanup still completes."""
+        from crawler.fetchers.response_archive import ResponseArchive
+        from crawler.models import CrawledSource, WaybackStatusChoices
+        from crawler.services.wayback import cleanup_raw_content
+
+        settings.CRAWLER_RESPONSE_ARCHIVE_ENABLED = True
+        settings.CRAWLER_RESPONSE_ARCHIVE_DIR = str(tmp_path / "archive")
+        crawled = CrawledSource.objects.create(
+            url="https://shop.com/review",
+            title="Review",
+            raw_content=PAGE,
+            wayback_status=WaybackStatusChoices.SAVED,
+        )
+
+        with patch.object(ResponseArchive, "store", side_effect=OSError("disk full")):
+            assert cleanup_raw_content(crawled) is True
+
+        crawled.refresh_from_db()
+        assert crawled.raw_content is None
@@ -0,0 +1,181 @@
+"""
+Tests for the single-pass ResponseClassifier.
+
+Tests cover:
+1. Agreement with the individual EscalationHeuristics, age gate and
+   members-only checks
+2. Early-exit sparse-text checks
+3. should_escalate() and SmartRouter reusing precomputed signals
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+PRODUCT_TEXT = "<p>Single malt matured in sherry casks with notes of dried fruit.</p>" * 40
+
+SAMPLE_PAGES = {
+    "product": f"<html><body><h1>Glen Example 12</h1>{PRODUCT_TEXT}</body></html>",
+    "cloudflare": "<html><title>Just a moment...</title><body>Checking your browser</body></html>",
+    "cloudflare_ray": "<html><body><p>Error 1020</p><p>Cloudflare Ray ID: 7a1b</p></body></html>",
+    "cloudflare_ray_long_text": (
+        "<html><body>" + "<p>" + "word " * 300 + "</p>" + "Cloudflare Ray ID: 7a1b</body></html>"
+    ),
+    "captcha": f'<html><body><div class="g-recaptcha"></div>{PRODUCT_TEXT}</body></html>',
+    "angular_shell": "<html><body><app-root></app-root><script src='main.js'></script></body></html>",
+    "angular_rendered": f"<html><body><app-root></app-root>{PRODUCT_TEXT}</body></html>",
+    "react_shell": '<html><body><div id="root"></div></body></html>',
+    "noscript": f"<html><body>{PRODUCT_TEXT}<noscript>Please enable JavaScript</noscript></body></html>",
+    "loading": "<html><body><div class='loading-spinner'>Loading...</div>" + "<b>x</b>" * 60 + "</body></html>",
+    "empty": "<html><head><title>Shop</title></head><body>   </body></html>",
+    "age_gate": (
+        "<html><body><h2>Are you of legal drinking age?</h2>"
+        "<p>Please enter your date of birth to continue.</p></body></html>"
+    ),
+    "members_only": f"<html><body>{PRODUCT_TEXT}<p>Members Only pricing - Sign in to view</p></body></html>",
+    "login_form": f'<html><body>{PRODUCT_TEXT}<form id="login"><input type="password"></form></body></html>',
+}
+
+
+@pytest.fixture
+def classifier():
+    from crawler.fetchers.response_classifier import ResponseClassifier
+
+    return ResponseClassifier()
+
+
+class TestClassifierAgreement:
+    """The combined pass gives the same answers as the separate checks."""
+
+    @pytest.mark.parametrize("name", sorted(SAMPLE_PAGES))
+    def test_matches_individual_checks(self, classifier, name):
+        """Every signal equals the result of its original check."""
+        from crawler.fetchers.age_gate import detect_age_gate
+        from crawler.fetchers.escalation_heuristics import EscalationHeuristics
+        from crawler.services.members_only_detector import MembersOnlyDetector
+
+        content = SAMPLE_PAGES[name]
+
+        signals = classifier.classify(content)
+
+        assert signals.cloudflare_challenge == EscalationHeuristics.is_cloudflare_challenge(content)
+        assert signals.captcha == EscalationHeuristics.is_captcha_page(content)
+        assert signals.javascript_placeholder == EscalationHeuristics.is_javascript_placeholder(content)
+        assert signals.empty_or_loading == EscalationHeuristics.is_empty_or_loading(content)
+        assert signals.age_gate == detect_age_gate(content)
+        assert signals.members_only == MembersOnlyDetector().is_members_only(content)
+
+    def test_expected_signals(self, classifier):
+        """Sample pages raise the signal they were written for."""
+        assert classifier.classify(SAMPLE_PAGES["cloudflare"]).cloudflare_challenge is True
+        assert classifier.classify(SAMPLE_PAGES["cloudflare_ray"]).cloudflare_challenge is True
+        assert classifier.classify(SAMPLE_PAGES["angular_shell"]).javascript_placeholder is True
+        assert classifier.classify(SAMPLE_PAGES["angular_rendered"]).javascript_placeholder is False
+        assert classifier.classify(SAMPLE_PAGES["age_gate"]).age_gate.is_age_gate is True
+        assert classifier.classify(SAMPLE_PAGES["login_form"]).members_only is True
+
+        product = classifier.classify(SAMPLE_PAGES["product"])
+        assert not any([
+            product.cloudflare_challenge,
+            product.captcha,
+            product.javascript_placeholder,
+            product.empty_or_loading,
+            product.members_only,
+            product.age_gate.is_age_gate,
+        ])
+
+    def test_large_cloudflare_page_is_not_a_challenge(self, classifier):
+        """Challenge patterns on pages over 50KB are ignored, as before."""
+        from crawler.fetchers.escalation_heuristics import EscalationHeuristics
+
+        content = SAMPLE_PAGES["cloudflare"] + PRODUCT_TEXT * 30
+
+        assert classifier.classify(content).cloudflare_challenge is False
+        assert EscalationHeuristics.is_cloudflare_challenge(content) is False
+
+    def test_empty_content(self, classifier):
+        """None and empty strings classify as empty pages."""
+        signals = classifier.classify(None)
+
+        assert signals.empty_or_loading is True
+        assert signals.members_only is False
+
+    def test_matched_patterns(self, classifier):
+        """Matched patterns are reported per category."""
+        signals = classifier.classify(SAMPLE_PAGES["members_only"])
+
+        assert signals.matched_patterns["members_only"]
+
+
+class TestHasText:
+    """Tests for the early-exit sparse-text check."""
+
+    @pytest.mark.parametrize("content,min_chars,expected", [
+        ("<p>abc</p>", 3, True),
+        ("<p>abc</p>", 4, False),
+        ("<p>ab cd</p>", 5, True),
+        ("<p>a \n\n b</p>", 4, False),
+        ("<div>" + "x" * 500 + "</div>", 100, True),
+    ])
+    def test_matches_stripped_text_length(self, content, min_chars, expected):
+        """Agrees with measuring the normalized tag-stripped text."""
+        from crawler.fetchers.response_classifier import _has_text
+
+        assert _has_text(content, min_chars) is expected
+
+    def test_raw_whitespace_counts_without_normalization(self):
+        """Whitespace runs count in full when normalization is off."""
+        from crawler.fetchers.response_classifier import _has_text
+
+        assert _has_text("<p>a \n\n b</p>", 6, normalize_whitespace=False) is True
+
+
+class TestSignalReuse:
+    """Tests for callers passing precomputed signals."""
+
+    def test_should_escalate_uses_given_signals(self):
+        """should_escalate() does not reclassify when signals are given."""
+        from crawler.fetchers.escalation_heuristics import EscalationHeuristics
+        from crawler.fetchers.response_classifier import ResponseSignals
+
+        profile = MagicMock()
+        profile.tier1_success_rate = 1.0
+
+        with patch("crawler.fetchers.response_classifier.get_response_classifier") as get_classifier:
+            result = EscalationHeuristics.should_escalate(
+                status_code=200,
+                content=SAMPLE_PAGES["product"],
+                domain_profile=profile,
+                current_tier=1,
+                signals=ResponseSignals(captcha=True),
+            )
+
+        assert result.should_escalate is True
+        assert "CAPTCHA" in result.reason
+        get_classifier.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_router_classifies_once(self):
+        """SmartRouter classifies a response once for escalation and age gate checks."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.response_classifier import ResponseClassifier
+        from crawler.fetchers.smart_router import SmartRouter
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        router = SmartRouter(timeout=30)
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=FetchResponse(
+            content=SAMPLE_PAGES["product"], status_code=200, headers={}, success=True,
+        ))
+        router._tier1_fetcher = tier1
+
+        with patch.object(
+            ResponseClassifier, "classify", autospec=True, side_effect=ResponseClassifier.classify
+        ) as classify:
+            result = await router.fetch(
+                "https://shop.com/p", profile=DomainProfile(domain="shop.com")
+            )
+
+        assert result.success is True
+        assert result.tier_used == 1
+        assert classify.call_count == 1
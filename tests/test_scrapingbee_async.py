@@ -0,0 +1,252 @@
+"""
+Tests for the async ScrapingBee client and its credit budget.
+
+Tests cover:
+1. afetch()/afetch_with_retry() over the shared connection pool
+2. ScrapingBeeCreditBudget capping concurrent requests
+3. Tier3ScrapingBeeFetcher using the async client
+4. StrategyEscalationService escalating through the async client
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+STEALTH = {"render_js": True, "premium_proxy": True, "stealth_proxy": True}
+
+
+class FakeScrapingBee:
+    """ScrapingBee API served through httpx.MockTransport."""
+
+    def __init__(self, credits=10000, status=200, cost=5, delay=0.0):
+        self.credits = credits
+        self.status = status
+        self.cost = cost
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handler(self, request):
+        if request.url.path.endswith("/usage"):
+            return httpx.Response(200, json={"remaining_credits": self.credits})
+
+        self.requests.append(request)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        self.credits -= self.cost
+        return httpx.Response(
+            self.status,
+            text=f"<html><body>{request.url.params['url']}</body></html>",
+            headers={"Spb-Cost": str(self.cost)},
+        )
+
+    def client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+@pytest.fixture
+def api(settings):
+    """Fake API behind the shared pool, with a fresh credit budget."""
+    from crawler.services.scrapingbee_client import ScrapingBeeCreditBudget
+
+    settings.CRAWLER_SCRAPINGBEE_CONCURRENCY = 5
+    fake = FakeScrapingBee()
+    client = fake.client()
+    with patch("crawler.fetchers.client_registry.get_http_client", return_value=client), \
+            patch("crawler.services.scrapingbee_client._credit_budget", ScrapingBeeCreditBudget()), \
+            patch.object(ScrapingBeeCreditBudget, "_get_quota_remaining",
+                         AsyncMock(return_value=None)):
+        yield fake
+
+
+def _client():
+    from crawler.services.scrapingbee_client import ScrapingBeeClient
+
+    return ScrapingBeeClient(api_key="live_key")
+
+
+class TestAsyncClient:
+    """Tests for ScrapingBeeClient.afetch and afetch_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_afetch(self, api):
+        """afetch() sends the mode parameters and reports the cost."""
+        from crawler.services.scrapingbee_client import ScrapingBeeMode
+
+        result = await _client().afetch("https://shop.com/p", mode=ScrapingBeeMode.STEALTH)
+
+        assert result["success"] is True
+        assert result["content"] == "<html><body>https://shop.com/p</body></html>"
+        assert result["cost"] == 5
+        params = api.requests[0].url.params
+        assert params["api_key"] == "live_key"
+        assert params["stealth_proxy"] == "true"
+
+    @pytest.mark.asyncio
+    async def test_retry_sleeps_without_blocking(self, api):
+        """5xx responses are retried with asyncio.sleep backoff."""
+        api.status = 500
+
+        with patch("asyncio.sleep", AsyncMock()) as sleep, patch("time.sleep") as blocking_sleep:
+            result = await _client().afetch_with_retry("https://shop.com/p", max_retries=3)
+
+        assert result is None
+        assert len(api.requests) == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [2, 4]
+        blocking_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_retry_on_client_error(self, api):
+        """4xx responses are not retried."""
+        api.status = 404
+
+        result = await _client().afetch_with_retry("https://shop.com/p", max_retries=3)
+
+        assert result is None
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_mock_mode(self):
+        """Mock-mode clients answer without calling the API."""
+        from crawler.services.scrapingbee_client import ScrapingBeeClient
+
+        content = await ScrapingBeeClient(api_key="test_key").afetch_with_retry("https://shop.com/p")
+
+        assert "Mock content for https://shop.com/p" in content
+
+
+class TestCreditBudget:
+    """Tests for ScrapingBeeCreditBudget."""
+
+    @pytest.mark.asyncio
+    async def test_requests_overlap_up_to_concurrency(self, api, settings):
+        """Concurrent fetches run together, up to the concurrency setting."""
+        settings.CRAWLER_SCRAPINGBEE_CONCURRENCY = 3
+        api.delay = 0.02
+        client = _client()
+
+        results = await asyncio.gather(*(client.afetch(f"https://shop.com/{i}") for i in range(6)))
+
+        assert all(r["success"] for r in results)
+        assert api.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_credits_cap_concurrency(self, api):
+        """Only as many requests overlap as the remaining credits pay for."""
+        from crawler.services.scrapingbee_client import get_credit_budget
+
+        api.credits = 160
+        api.cost = 75
+        api.delay = 0.02
+        client = _client()
+
+        results = await asyncio.gather(*(
+            client.aget(f"https://shop.com/{i}", params=STEALTH) for i in range(2)
+        ))
+
+        assert all(r.status_code == 200 for r in results)
+        assert api.peak == 2
+        assert get_credit_budget().limit(75) == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_fails_fast(self, api):
+        """With too few credits left the request is refused without calling the API."""
+        from crawler.services.scrapingbee_client import ScrapingBeeBudgetExhausted
+
+        api.credits = 50
+
+        with pytest.raises(ScrapingBeeBudgetExhausted):
+            await _client().aget("https://shop.com/p", params=STEALTH)
+        result = await _client().afetch_with_retry("https://shop.com/p", extra_params=STEALTH)
+
+        assert result is None
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_quota_caps_concurrency(self, api):
+        """QuotaManager's remaining scrapingbee quota also caps concurrency."""
+        from crawler.services.scrapingbee_client import ScrapingBeeCreditBudget
+
+        api.delay = 0.02
+        client = _client()
+
+        quota = AsyncMock(side_effect=[2, 0, 0, 0])
+        with patch.object(ScrapingBeeCreditBudget, "_get_quota_remaining", quota):
+            results = await asyncio.gather(*(client.afetch(f"https://shop.com/{i}") for i in range(4)))
+
+        assert api.peak == 2
+        assert [r["success"] for r in results] == [True, True, False, False]
+        assert quota.await_count == 2
+
+    def test_estimate_cost(self):
+        """Credit estimates follow ScrapingBee pricing."""
+        from crawler.services.scrapingbee_client import ScrapingBeeClient
+
+        assert ScrapingBeeClient.estimate_cost({"render_js": False}) == 1
+        assert ScrapingBeeClient.estimate_cost({"render_js": True}) == 5
+        assert ScrapingBeeClient.estimate_cost({"render_js": True, "premium_proxy": True}) == 25
+        assert ScrapingBeeClient.estimate_cost(STEALTH) == 75
+
+
+class TestTier3Fetcher:
+    """Tests for Tier3ScrapingBeeFetcher on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_overlap(self, api, settings):
+        """Tier 3 fetches run concurrently on the event loop."""
+        from crawler.fetchers.tier3_scrapingbee import Tier3ScrapingBeeFetcher
+
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        api.delay = 0.02
+        fetcher = Tier3ScrapingBeeFetcher(api_key="live_key", timeout=30)
+
+        results = await asyncio.gather(*(
+            fetcher.fetch(f"https://shop.com/{i}", cookies={"age_verified": "1"}) for i in range(3)
+        ))
+
+        assert all(r.success is True and r.tier == 3 for r in results)
+        assert api.peak == 3
+        params = api.requests[0].url.params
+        assert params["cookies"] == "age_verified=1"
+        assert params["timeout"] == "30000"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_is_a_failed_fetch(self, api, settings):
+        """A refused request comes back as a failed FetchResponse."""
+        from crawler.fetchers.tier3_scrapingbee import Tier3ScrapingBeeFetcher
+
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        api.credits = 0
+        fetcher = Tier3ScrapingBeeFetcher(api_key="live_key", timeout=30)
+
+        result = await fetcher.fetch("https://shop.com/p")
+
+        assert result.success is False
+        assert "budget exhausted" in result.error
+
+
+class TestStrategyEscalation:
+    """Tests for StrategyEscalationService.aescalate_and_crawl."""
+
+    @pytest.mark.asyncio
+    async def test_escalation_uses_async_client(self, api):
+        """ScrapingBee steps go through afetch(), never the blocking fetch()."""
+        from crawler.services.scrapingbee_client import ScrapingBeeClient
+        from crawler.services.strategy_detection import StrategyEscalationService
+
+        service = StrategyEscalationService(scrapingbee_api_key="live_key")
+        blocked = {"success": True, "content": "Too many requests", "status_code": 429}
+
+        with patch.object(service, "_asimple_crawl", AsyncMock(return_value=blocked)), \
+                patch.object(ScrapingBeeClient, "fetch", side_effect=AssertionError("blocking fetch")):
+            result = await service.aescalate_and_crawl("https://shop.com/p", max_steps=3)
+
+        assert len(api.requests) == result.escalation_steps - 1
+        assert api.requests[0].url.params["render_js"] == "true"
+        assert not any(o["type"] == "error" for o in result.detected_obstacles)
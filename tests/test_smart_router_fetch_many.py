@@ -0,0 +1,156 @@
+"""
+Tests for SmartRouter.fetch_many concurrent multi-URL fetching.
+
+These tests verify global and per-domain concurrency limits, shared
+per-domain profile loading, completion-order streaming and cancellation of
+pending fetches when the consumer stops early.
+"""
+
+import asyncio
+from contextlib import aclosing
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _result(content="<html>ok</html>", success=True, error=None):
+    from crawler.fetchers.smart_router import FetchResult
+
+    return FetchResult(
+        content=content,
+        status_code=200 if success else 0,
+        headers={},
+        success=success,
+        tier_used=1,
+        error=error,
+    )
+
+
+class TestSmartRouterFetchMany:
+    """Tests for SmartRouter.fetch_many()."""
+
+    @pytest.mark.asyncio
+    async def test_respects_global_and_domain_limits(self):
+        """In-flight fetches never exceed the global or per-domain caps."""
+        from crawler.fetchers.smart_router import SmartRouter, extract_domain
+
+        router = SmartRouter(timeout=30, domain_store=MagicMock())
+        in_flight = {"total": 0, "max_total": 0}
+        per_domain = {}
+        max_domain = {}
+
+        async def fake_fetch(url, **kwargs):
+            domain = extract_domain(url)
+            in_flight["total"] += 1
+            per_domain[domain] = per_domain.get(domain, 0) + 1
+            in_flight["max_total"] = max(in_flight["max_total"], in_flight["total"])
+            max_domain[domain] = max(max_domain.get(domain, 0), per_domain[domain])
+            await asyncio.sleep(0.01)
+            in_flight["total"] -= 1
+            per_domain[domain] -= 1
+            return _result()
+
+        urls = [f"https://site{i % 3}.com/p/{i}" for i in range(12)]
+        with patch.object(router, "fetch", side_effect=fake_fetch):
+            fetched = [url async for url, _ in router.fetch_many(
+                urls, concurrency=4, domain_concurrency=1
+            )]
+
+        assert sorted(fetched) == sorted(urls)
+        assert in_flight["max_total"] <= 3
+        assert max(max_domain.values()) == 1
+
+    @pytest.mark.asyncio
+    async def test_loads_profile_once_per_domain(self):
+        """Each domain's profile is loaded once and shared by its fetches."""
+        from crawler.fetchers.domain_intelligence import (
+            DomainIntelligenceStore,
+            DomainProfile,
+        )
+        from crawler.fetchers.smart_router import SmartRouter
+
+        mock_store = MagicMock(spec=DomainIntelligenceStore)
+        mock_store.get_profile.side_effect = lambda domain: DomainProfile(domain=domain)
+        router = SmartRouter(timeout=30, domain_store=mock_store)
+
+        tier1 = AsyncMock(return_value=MagicMock(
+            content="<html>Test content</html>" + "x" * 1000,
+            status_code=200,
+            headers={},
+            success=True,
+            error=None,
+        ))
+        urls = ["https://a.com/1", "https://a.com/2", "https://b.com/1"]
+        with patch.object(router, "_try_tier1", tier1):
+            results = {url: r async for url, r in router.fetch_many(urls)}
+
+        assert all(r.success for r in results.values())
+        assert mock_store.get_profile.call_count == 2
+        saved = [call.args[0] for call in mock_store.save_profile.call_args_list]
+        a_profiles = {id(p) for p in saved if p.domain == "a.com"}
+        assert len(a_profiles) == 1
+        assert saved[-1].success_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_streams_results_in_completion_order(self):
+        """Faster fetches are yielded before slower ones."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30, domain_store=MagicMock())
+        delays = {"https://a.com/slow": 0.05, "https://b.com/fast": 0.0}
+
+        async def fake_fetch(url, **kwargs):
+            await asyncio.sleep(delays[url])
+            return _result()
+
+        with patch.object(router, "fetch", side_effect=fake_fetch):
+            order = [url async for url, _ in router.fetch_many(list(delays))]
+
+        assert order == ["https://b.com/fast", "https://a.com/slow"]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_pending_fetches(self):
+        """Stopping iteration cancels fetches that have not completed."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30, domain_store=MagicMock())
+        cancelled = []
+
+        async def fake_fetch(url, **kwargs):
+            try:
+                await asyncio.sleep(0 if url.endswith("/0") else 10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+            return _result()
+
+        urls = [f"https://a{i}.com/{i}" for i in range(3)]
+        with patch.object(router, "fetch", side_effect=fake_fetch):
+            fetches = router.fetch_many(urls)
+            async with aclosing(fetches):
+                async for url, _ in fetches:
+                    break
+
+        assert url == "https://a0.com/0"
+        assert sorted(cancelled) == sorted(urls[1:])
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_becomes_failed_result(self):
+        """An exception in one fetch does not abort the batch."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30, domain_store=MagicMock())
+
+        async def fake_fetch(url, **kwargs):
+            if "bad" in url:
+                raise RuntimeError("boom")
+            return _result()
+
+        with patch.object(router, "fetch", side_effect=fake_fetch):
+            results = {url: r async for url, r in router.fetch_many(
+                ["https://ok.com/1", "https://bad.com/1"]
+            )}
+
+        assert results["https://ok.com/1"].success is True
+        assert results["https://bad.com/1"].success is False
+        assert results["https://bad.com/1"].error == "boom"
@@ -0,0 +1,173 @@
+"""
+Tests for hedged Tier 1/Tier 2 fetching in SmartRouter.
+
+These tests verify when SmartTierSelector chooses to hedge, that the first
+usable response wins the race, that the losing attempt is cancelled, and
+that Tier 3 is only reached when both racing tiers fail.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+GOOD_CONTENT = "<html><body><h1>Product</h1>" + "<p>Details</p>" * 100 + "</body></html>"
+
+
+def _response(content=GOOD_CONTENT, success=True, error=None):
+    return MagicMock(
+        content=content,
+        status_code=200 if success else 0,
+        headers={},
+        success=success,
+        error=error,
+    )
+
+
+def _delayed(delay, response, cancelled=None, tier=None):
+    """Build a fake tier fetch that answers after delay seconds."""
+
+    async def _fetch(url, cookies, *args):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(tier)
+            raise
+        return response
+
+    return AsyncMock(side_effect=_fetch)
+
+
+def _uncertain_profile(domain="example.com"):
+    from crawler.fetchers.domain_intelligence import DomainProfile
+
+    return DomainProfile(domain=domain, tier1_success_rate=0.7)
+
+
+class TestShouldHedge:
+    """Tests for SmartTierSelector.should_hedge()."""
+
+    def test_hedges_uncertain_tier1_history(self):
+        """Tier 1 rates between viable and reliable are hedged."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.smart_tier_selector import SmartTierSelector
+
+        assert SmartTierSelector.should_hedge(_uncertain_profile(), 1) is True
+        assert SmartTierSelector.should_hedge(DomainProfile(domain="a.com"), 1) is False
+        assert SmartTierSelector.should_hedge(
+            DomainProfile(domain="a.com", tier1_success_rate=0.3), 1
+        ) is False
+
+    def test_no_hedge_for_higher_start_or_override(self):
+        """Hedging only applies to Tier 1 starts without a manual override."""
+        from crawler.fetchers.smart_tier_selector import SmartTierSelector
+
+        profile = _uncertain_profile()
+        assert SmartTierSelector.should_hedge(profile, 2) is False
+
+        profile.manual_override_tier = 1
+        assert SmartTierSelector.should_hedge(profile, 1) is False
+
+
+class TestHedgedFetch:
+    """Tests for the Tier 1/Tier 2 race in SmartRouter.fetch()."""
+
+    @pytest.fixture(autouse=True)
+    def hedge_settings(self, settings):
+        settings.CRAWLER_HEDGED_FETCH_ENABLED = True
+        settings.CRAWLER_HEDGE_DELAY_MS = 20
+        return settings
+
+    @pytest.mark.asyncio
+    async def test_fast_tier1_wins_without_starting_tier2(self):
+        """Tier 1 answering within the hedge delay never starts Tier 2."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30)
+        tier1 = _delayed(0, _response())
+        tier2 = _delayed(0, _response())
+
+        with patch.object(router, "_try_tier1", tier1), patch.object(router, "_try_tier2", tier2):
+            result = await router.fetch("https://example.com/p", profile=_uncertain_profile())
+
+        assert result.success is True
+        assert result.tier_used == 1
+        tier2.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_tier1_is_hedged_and_cancelled(self):
+        """A slow Tier 1 is raced by Tier 2 and cancelled when Tier 2 wins."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30)
+        cancelled = []
+        profile = _uncertain_profile()
+        tier1 = _delayed(5, _response(), cancelled, tier=1)
+        tier2 = _delayed(0, _response())
+
+        with patch.object(router, "_try_tier1", tier1), patch.object(router, "_try_tier2", tier2):
+            result = await router.fetch("https://example.com/p", profile=profile)
+
+        assert result.success is True
+        assert result.tier_used == 2
+        assert cancelled == [1]
+        # The cancelled loser is not recorded as a Tier 1 failure
+        assert profile.failure_count == 0
+        assert profile.tier1_success_rate == 0.7
+
+    @pytest.mark.asyncio
+    async def test_tier1_failure_starts_tier2_immediately(self, hedge_settings):
+        """A Tier 1 failure before the delay starts Tier 2 without waiting."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30)
+        profile = _uncertain_profile()
+        tier1 = _delayed(0, _response(content="", success=False, error="HTTP 403"))
+        tier2 = _delayed(0, _response())
+
+        hedge_settings.CRAWLER_HEDGE_DELAY_MS = 5000
+
+        with patch.object(router, "_try_tier1", tier1), patch.object(router, "_try_tier2", tier2):
+            result = await asyncio.wait_for(
+                router.fetch("https://example.com/p", profile=profile), timeout=1
+            )
+
+        assert result.tier_used == 2
+        assert profile.failure_count == 1
+        assert profile.success_count == 1
+
+    @pytest.mark.asyncio
+    async def test_both_tiers_failing_escalates_to_tier3(self):
+        """Tier 3 runs only after both racing tiers fail."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30)
+        failed = _response(content="", success=False, error="HTTP 403")
+        tier3 = AsyncMock(return_value=_response())
+
+        with patch.object(router, "_try_tier1", _delayed(0, failed)), \
+                patch.object(router, "_try_tier2", _delayed(0, failed)), \
+                patch.object(router, "_try_tier3", tier3):
+            result = await router.fetch("https://example.com/p", profile=_uncertain_profile())
+
+        assert result.success is True
+        assert result.tier_used == 3
+        tier3.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_force_tier_disables_hedging(self):
+        """force_tier=1 fetches sequentially even for uncertain domains."""
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30)
+        tier1 = _delayed(0.05, _response())
+        tier2 = _delayed(0, _response())
+
+        with patch.object(router, "_try_tier1", tier1), patch.object(router, "_try_tier2", tier2):
+            result = await router.fetch(
+                "https://example.com/p", force_tier=1, profile=_uncertain_profile()
+            )
+
+        assert result.tier_used == 1
+        tier2.assert_not_called()
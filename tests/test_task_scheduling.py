@@ -19,6 +19,7 @@ def mock_redis():
     """Create a mock Redis client for testing."""
     mock = MagicMock()
     mock.sismember.return_value = False
+    mock.smismember.side_effect = lambda key, members: [0] * len(members)
     mock.sadd.return_value = True
     mock.zadd.return_value = True
     mock.zcard.return_value = 0
@@ -172,18 +173,22 @@ class TestURLFrontierPriorityOrdering:
         from crawler.queue.url_frontier import URLFrontier
 
         frontier = URLFrontier(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
+        script.return_value = [1]
 
         # Add URLs with different priorities
         frontier.add_url("test-queue", "https://high-priority.com", priority=10)
         frontier.add_url("test-queue", "https://low-priority.com", priority=1)
 
-        # Verify zadd was called with inverted scores
-        calls = mock_redis.zadd.call_args_list
+        # Verify the add script was called with inverted scores
+        calls = script.call_args_list
         assert len(calls) == 2
 
-        # Extract scores from calls
+        # ARGV layout: now, host prefix, use_global, url_hash, entry, score, ...
         # Score for priority 10 should be 0 (10 - 10)
         # Score for priority 1 should be 9 (10 - 1)
+        assert calls[0].kwargs["args"][5] == 0
+        assert calls[1].kwargs["args"][5] == 9
 
     def test_higher_priority_url_retrieved_first(self, mock_redis):
         """Test that URLs are retrieved in priority order (highest first)."""
@@ -213,13 +218,14 @@ class TestURLFrontierPriorityOrdering:
         from crawler.queue.url_frontier import URLFrontier
 
         frontier = URLFrontier(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
 
         # First URL should be added
-        mock_redis.sismember.return_value = False
+        script.return_value = [1]
         result1 = frontier.add_url("test-queue", "https://example.com")
 
-        # Second URL with same hash should be rejected
-        mock_redis.sismember.return_value = True
+        # Second URL with same hash should be rejected by the seen-set check
+        script.return_value = [0]
         result2 = frontier.add_url("test-queue", "https://example.com")
 
         assert result1 is True
@@ -245,3 +251,560 @@ class TestURLFrontierPriorityOrdering:
         retrieved = frontier.get_domain_cookies("example.com")
 
         assert retrieved == cookies
+
+
+class TestConcurrentSourceProcessing:
+    """Tests for the concurrent per-source crawl loop."""
+
+    class _ListFrontier:
+        """Minimal frontier stand-in backed by a list."""
+
+        def __init__(self, urls):
+            self.urls = list(urls)
+            self.acked = []
+            self.nacked = []
+
+        def lease_ready_urls(self, queue_id, n, ttl=None):
+            batch, self.urls = self.urls[:n], self.urls[n:]
+            return [{"url": url, "url_hash": url} for url in batch]
+
+        def nack(self, queue_id, url_hash):
+            self.urls.insert(0, url_hash)
+            self.nacked.append(url_hash)
+            return True
+
+        def ack(self, queue_id, url_hash):
+            self.acked.append(url_hash)
+            return True
+
+        def seconds_until_ready(self, queue_id):
+            return 0.0 if self.urls else None
+
+    class _TrackingRouter:
+        """Router stand-in that records peak in-flight fetches."""
+
+        def __init__(self, fail_urls=()):
+            self.fail_urls = set(fail_urls)
+            self.in_flight = 0
+            self.peak = 0
+
+        async def fetch(self, url, source=None, crawl_job=None, conditional=False):
+            import asyncio
+            from crawler.fetchers.smart_router import FetchResult
+
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            success = url not in self.fail_urls
+            return FetchResult(
+                content="<html></html>" if success else "",
+                status_code=200 if success else 0,
+                headers={},
+                success=success,
+                tier_used=1,
+                error=None if success else "boom",
+            )
+
+    @staticmethod
+    def _metrics():
+        return {
+            "pages_crawled": 0,
+            "products_found": 0,
+            "products_new": 0,
+            "products_updated": 0,
+            "errors_count": 0,
+        }
+
+    @staticmethod
+    def _mock_processor():
+        from unittest.mock import AsyncMock
+
+        processor = MagicMock()
+        processor.process = AsyncMock(
+            return_value=MagicMock(success=True, is_new=True, error=None)
+        )
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_max_pages_budget_is_exact_with_failures(self):
+        """Failed fetches release their slot; successes never exceed max_pages."""
+        from crawler.tasks import _process_source_urls
+
+        urls = [f"https://site{i}.com/p" for i in range(20)]
+        frontier = self._ListFrontier(urls)
+        router = self._TrackingRouter(fail_urls=urls[:3])
+        source = MagicMock(slug="test-source")
+
+        with patch(
+            "crawler.services.content_processor.ContentProcessor",
+            return_value=self._mock_processor(),
+        ):
+            metrics = await _process_source_urls(
+                source, MagicMock(), router, frontier, self._metrics(),
+                max_pages=5, concurrency=4,
+            )
+
+        assert metrics["pages_crawled"] == 5
+        assert metrics["products_new"] == 5
+        assert metrics["errors_count"] == 3
+        assert router.peak > 1
+        # Every processed URL is acknowledged, failed or not; prefetched
+        # URLs beyond the budget go back to the queue
+        assert len(frontier.acked) == 8
+        assert len(frontier.acked) + len(frontier.urls) == 20
+        assert set(frontier.nacked) <= set(frontier.urls)
+
+    @pytest.mark.asyncio
+    async def test_processing_errors_still_use_budget(self):
+        """A fetched page counts towards max_pages even if processing raises."""
+        from unittest.mock import AsyncMock
+        from crawler.tasks import _process_source_urls
+
+        urls = [f"https://site{i}.com/p" for i in range(10)]
+        frontier = self._ListFrontier(urls)
+        router = self._TrackingRouter()
+        source = MagicMock(slug="test-source")
+        processor = MagicMock(process=AsyncMock(side_effect=RuntimeError("AI down")))
+
+        with patch(
+            "crawler.services.content_processor.ContentProcessor",
+            return_value=processor,
+        ), patch("crawler.tasks.CrawlError.objects.create"):
+            metrics = await _process_source_urls(
+                source, MagicMock(), router, frontier, self._metrics(),
+                max_pages=3, concurrency=2,
+            )
+
+        assert processor.process.await_count == 3
+        assert metrics["pages_crawled"] == 3
+        assert metrics["errors_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_fetch_is_returned_not_acked(self):
+        """A URL whose fetch is cancelled goes back to the queue unacked."""
+        import asyncio
+        from crawler.tasks import _process_source_urls
+
+        class _SlowRouter(self._TrackingRouter):
+            async def fetch(self, url, source=None, crawl_job=None, conditional=False):
+                await asyncio.sleep(10)
+
+        frontier = self._ListFrontier(["https://example.com/p"])
+        source = MagicMock(slug="test-source")
+
+        with patch(
+            "crawler.services.content_processor.ContentProcessor",
+            return_value=self._mock_processor(),
+        ):
+            crawl = asyncio.ensure_future(_process_source_urls(
+                source, MagicMock(), _SlowRouter(), frontier, self._metrics(),
+                max_pages=1, concurrency=1,
+            ))
+            await asyncio.sleep(0.05)
+            crawl.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await crawl
+
+        assert frontier.acked == []
+        assert frontier.nacked == ["https://example.com/p"]
+
+    @pytest.mark.asyncio
+    async def test_validators_saved_only_after_successful_processing(self):
+        """A failed first extraction never becomes the conditional baseline."""
+        from unittest.mock import AsyncMock
+        from crawler.fetchers.validator_cache import HTTPValidators
+        from crawler.tasks import _process_source_urls
+
+        class _ValidatorRouter(self._TrackingRouter):
+            def __init__(self):
+                super().__init__()
+                self.saved = []
+
+            async def fetch(self, url, source=None, crawl_job=None, conditional=False):
+                result = await super().fetch(url, source, crawl_job, conditional)
+                result.validators = HTTPValidators(url=url, etag='"v1"')
+                return result
+
+            def save_validators(self, result):
+                self.saved.append(result.validators.url)
+
+        router = _ValidatorRouter()
+        processor = MagicMock()
+        processor.process = AsyncMock(side_effect=[
+            MagicMock(success=False, error="extraction failed"),
+            MagicMock(success=True, is_new=True, error=None),
+        ])
+        source = MagicMock(slug="test-source")
+
+        with patch(
+            "crawler.services.content_processor.ContentProcessor",
+            return_value=processor,
+        ):
+            await _process_source_urls(
+                source, MagicMock(), router,
+                self._ListFrontier(["https://example.com/p"]), self._metrics(),
+                max_pages=1, concurrency=1,
+            )
+            assert router.saved == []
+
+            await _process_source_urls(
+                source, MagicMock(), router,
+                self._ListFrontier(["https://example.com/p"]), self._metrics(),
+                max_pages=1, concurrency=1,
+            )
+
+        assert router.saved == ["https://example.com/p"]
+
+    @pytest.mark.asyncio
+    async def test_domain_concurrency_is_left_to_the_router(self, settings):
+        """The crawl loop adds no fixed per-domain cap below the router's window."""
+        from crawler.tasks import _process_source_urls
+
+        settings.CRAWLER_DOMAIN_CONCURRENCY = 2
+
+        frontier = self._ListFrontier(
+            [f"https://example.com/p{i}" for i in range(8)]
+        )
+        router = self._TrackingRouter()
+        source = MagicMock(slug="test-source")
+
+        with patch(
+            "crawler.services.content_processor.ContentProcessor",
+            return_value=self._mock_processor(),
+        ):
+            metrics = await _process_source_urls(
+                source, MagicMock(), router, frontier, self._metrics(),
+                max_pages=100, concurrency=6,
+            )
+
+        assert metrics["pages_crawled"] == 8
+        assert router.peak == 6
+
+
+class TestURLFrontierPolitenessScheduling:
+    """Tests for per-host ready-heap scheduling in the URL frontier."""
+
+    def test_add_url_registers_host_sub_queue(self, mock_redis):
+        """Adding a URL passes its host and host sub-queue prefix to the script."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis, crawl_delay=2.0)
+        script = mock_redis.register_script.return_value
+        script.return_value = [1]
+        with patch.object(frontier, "_find_known_urls", return_value=set()):
+            frontier.add_url("q", "https://Shop.example.com:443/item")
+
+        call = script.call_args
+        assert call.kwargs["keys"] == [
+            "crawler:seen:q",
+            "crawler:seen:global",
+            "crawler:frontier:q",
+            "crawler:frontier:q:ready",
+        ]
+        args = call.kwargs["args"]
+        assert args[1] == "crawler:frontier:q:host:"
+        assert args[6] == "shop.example.com"
+        assert args[7] == URLFrontier.URL_NEW
+
+    def test_ready_pop_is_one_script_call(self, mock_redis):
+        """The ready-heap claim, host pop and reschedule run as one script."""
+        import json
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis, crawl_delay=2.0)
+        script = mock_redis.register_script.return_value
+        entry = json.dumps({"url": "https://example.com/a"})
+        script.return_value = [entry, "5", "0"]
+
+        result = frontier.get_next_ready_url("q")
+
+        assert result == {"url": "https://example.com/a"}
+        mock_redis.register_script.assert_called_once_with(URLFrontier.POP_READY_LUA)
+        call = script.call_args
+        assert call.kwargs["keys"] == [
+            "crawler:frontier:q:ready",
+            "crawler:frontier:q",
+            "crawler:crawl_delay",
+        ]
+        assert call.kwargs["args"][1:] == ["crawler:frontier:q:host:", 2.0]
+        mock_redis.zpopmin.assert_not_called()
+        mock_redis.zadd.assert_not_called()
+
+    def test_host_in_crawl_delay_is_not_returned(self):
+        """A host whose next allowed time is in the future yields nothing."""
+        from crawler.queue.memory_backend import InMemoryRedis
+        from crawler.queue.url_frontier import URLFrontier
+
+        backend = InMemoryRedis()
+        frontier = URLFrontier(redis_client=backend, crawl_delay=60.0)
+        with patch.object(frontier, "_find_known_urls", return_value=set()):
+            frontier.add_url("q", "https://example.com/a")
+            frontier.add_url("q", "https://example.com/b")
+
+        assert frontier.get_next_ready_url("q") is not None
+        assert frontier.get_next_ready_url("q") is None
+        assert frontier.get_queue_size("q") == 1
+
+    def test_ready_host_is_rescheduled_after_dequeue(self):
+        """Dequeuing from a ready host pushes it back by its crawl delay."""
+        import time
+        from crawler.queue.memory_backend import InMemoryRedis
+        from crawler.queue.url_frontier import URLFrontier
+
+        backend = InMemoryRedis()
+        frontier = URLFrontier(redis_client=backend, crawl_delay=2.0)
+        frontier.set_host_crawl_delay("example.com", 5.0)
+        with patch.object(frontier, "_find_known_urls", return_value=set()):
+            frontier.add_url("q", "https://example.com/a")
+        # A drained host left in the heap is skipped
+        backend.zadd("crawler:frontier:q:ready", {"drained.com": 0})
+
+        before = time.time()
+        result = frontier.get_next_ready_url("q")
+
+        assert result["url"] == "https://example.com/a"
+        assert frontier.get_queue_size("q") == 0
+        heap = dict(backend.zrange("crawler:frontier:q:ready", 0, -1, withscores=True))
+        assert "drained.com" not in heap
+        assert heap["example.com"] >= before + 5.0
+
+    def test_legacy_entries_pop_without_ready_heap(self):
+        """Entries queued before the ready heap existed are still served."""
+        import json
+        from crawler.queue.memory_backend import InMemoryRedis
+        from crawler.queue.url_frontier import URLFrontier
+
+        backend = InMemoryRedis()
+        frontier = URLFrontier(redis_client=backend, crawl_delay=2.0)
+        entry = json.dumps({"url": "https://example.com/a"})
+        backend.zadd("crawler:frontier:q", {entry: 3})
+        backend.zadd("crawler:frontier:q:host:example.com", {entry: 3})
+
+        assert frontier.get_next_ready_url("q") == {"url": "https://example.com/a"}
+        assert backend.zrange("crawler:frontier:q:host:example.com", 0, -1) == []
+
+    def test_host_crawl_delay_override(self, mock_redis):
+        """Per-host crawl delay overrides the frontier default."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis, crawl_delay=1.0)
+        mock_redis.hget.return_value = "5"
+        assert frontier.get_host_crawl_delay("Example.com") == 5.0
+
+        mock_redis.hget.return_value = None
+        assert frontier.get_host_crawl_delay("example.com") == 1.0
+
+
+class TestURLFrontierLeases:
+    """Tests for lease-based dequeue and crash recovery."""
+
+    def test_lease_records_expiry_and_entry(self, mock_redis):
+        """Leasing pops the entry and records it with its original score."""
+        import json
+        import time
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis, lease_ttl=30)
+        entry_json = json.dumps({"url": "https://example.com/a", "url_hash": "h1"})
+        mock_redis.zpopmin.return_value = [(entry_json, 3.0)]
+
+        leased = frontier.lease_urls("q", 1)
+
+        assert len(leased) == 1
+        assert leased[0]["url_hash"] == "h1"
+        assert leased[0]["lease_expires_at"] >= time.time() + 29
+        key, field, data = mock_redis.pipeline.return_value.hset.call_args.args
+        assert key == "crawler:frontier:q:lease_data"
+        assert field == "h1"
+        assert json.loads(data) == {"entry": entry_json, "score": 3.0}
+
+    def test_ack_releases_lease(self, mock_redis):
+        """Ack removes the lease without re-queueing."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        mock_redis.zrem.return_value = 1
+
+        assert frontier.ack("q", "h1") is True
+        mock_redis.zrem.assert_called_once_with("crawler:frontier:q:leases", "h1")
+        mock_redis.zadd.assert_not_called()
+
+    def test_reaper_requeues_expired_leases(self, mock_redis):
+        """Expired leases go back to the queue with their original score."""
+        import json
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        entry_json = json.dumps({"url": "https://example.com/a", "url_hash": "h1"})
+        mock_redis.zrangebyscore.return_value = ["h1"]
+        mock_redis.zrem.return_value = 1
+        mock_redis.hget.return_value = json.dumps({"entry": entry_json, "score": 3.0})
+
+        assert frontier.reap_expired_leases("q") == 1
+        mock_redis.zadd.assert_any_call("crawler:frontier:q", {entry_json: 3.0})
+
+    def test_reaper_skips_lease_acked_concurrently(self, mock_redis):
+        """A lease claimed by a concurrent ack is not re-queued."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        mock_redis.zrangebyscore.return_value = ["h1"]
+        mock_redis.zrem.return_value = 0
+
+        assert frontier.reap_expired_leases("q") == 0
+        mock_redis.zadd.assert_not_called()
+
+
+class TestURLFrontierBatchAdd:
+    """Tests for single-round-trip batch adds."""
+
+    def test_batch_add_uses_one_script_call(self, mock_redis):
+        """A batch of URLs is checked and inserted in one script call."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
+        script.return_value = [1, 0, 1]
+
+        with patch.object(frontier, "_find_known_urls", return_value=set()):
+            results = frontier.add_url_batch(
+                "q", ["https://a.com/1", "https://a.com/1", "https://b.com/2"]
+            )
+
+        assert results == [True, False, True]
+        assert script.call_count == 1
+        assert mock_redis.register_script.call_count == 1
+
+    def test_database_known_urls_are_flagged(self, mock_redis):
+        """URLs found in the database are sent as known (mark seen, no enqueue)."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
+        script.return_value = [2, 1]
+
+        with patch.object(
+            frontier, "_find_known_urls", return_value={"https://old.com/p"}
+        ):
+            results = frontier.add_url_batch(
+                "q", ["https://old.com/p", "https://new.com/p"]
+            )
+
+        args = script.call_args.kwargs["args"]
+        assert args[7] == URLFrontier.URL_KNOWN
+        assert args[12] == URLFrontier.URL_NEW
+        assert results == [False, True]
+
+    def test_redis_seen_urls_skip_database_check(self, mock_redis):
+        """Only URLs missing from the seen sets are looked up in the database."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        seen_hash = frontier._hash_url("https://old.com/p")
+        mock_redis.smismember.side_effect = lambda key, members: [
+            int(key == "crawler:seen:q" and member == seen_hash) for member in members
+        ]
+        script = mock_redis.register_script.return_value
+        script.return_value = [0, 1]
+
+        with patch.object(frontier, "_find_known_urls", return_value=set()) as find_known:
+            results = frontier.add_url_batch(
+                "q", ["https://old.com/p", "https://new.com/p"]
+            )
+
+        find_known.assert_called_once_with(["https://new.com/p"])
+        args = script.call_args.kwargs["args"]
+        assert args[7] == URLFrontier.URL_GLOBALLY_SEEN
+        assert args[12] == URLFrontier.URL_NEW
+        assert results == [False, True]
+
+    def test_all_seen_batch_skips_database(self, mock_redis):
+        """A batch Redis has fully seen never queries the database."""
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        mock_redis.smismember.side_effect = lambda key, members: [1] * len(members)
+        mock_redis.register_script.return_value.return_value = [0]
+
+        with patch.object(frontier, "_find_known_urls") as find_known:
+            assert frontier.add_url("q", "https://old.com/p") is False
+
+        find_known.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_find_known_urls_matches_normalized_form(self):
+        """Bulk DB lookup matches URLs stored in normalized form."""
+        from crawler.models import CrawledSource
+        from crawler.queue.url_frontier import URLFrontier
+
+        CrawledSource.objects.create(
+            url="https://example.com/product",
+            title="Product",
+            content_hash="a" * 64,
+        )
+        frontier = URLFrontier(redis_client=MagicMock())
+
+        known = frontier._find_known_urls(
+            ["https://Example.com/Product/", "https://example.com/other"]
+        )
+
+        assert known == {"https://Example.com/Product/"}
+
+
+class TestURLFrontierBatchDequeue:
+    """Tests for batched dequeue and the async prefetcher."""
+
+    def test_get_next_urls_pops_batch(self, mock_redis):
+        """get_next_urls pops N entries with one ZPOPMIN."""
+        import json
+        from crawler.queue.url_frontier import URLFrontier
+
+        frontier = URLFrontier(redis_client=mock_redis)
+        entries = [json.dumps({"url": f"https://example.com/{i}"}) for i in range(3)]
+        mock_redis.zpopmin.return_value = [(e, 5) for e in entries]
+
+        result = frontier.get_next_urls("q", 3)
+
+        assert [e["url"] for e in result] == [f"https://example.com/{i}" for i in range(3)]
+        mock_redis.zpopmin.assert_called_once_with("crawler:frontier:q", count=3)
+        assert mock_redis.pipeline.return_value.zrem.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetcher_batches_and_returns_leftovers(self):
+        """The prefetcher refills in batches and nacks unconsumed entries."""
+        from crawler.queue.url_frontier import FrontierPrefetcher
+
+        frontier = MagicMock()
+        batches = [
+            [{"url": f"https://a.com/{i}", "url_hash": f"h{i}"} for i in range(4)],
+            [],
+        ]
+        frontier.lease_urls.side_effect = lambda *args: batches.pop(0) if batches else []
+        frontier.seconds_until_ready.return_value = None
+
+        prefetcher = FrontierPrefetcher(frontier, "q", batch_size=4, ready_only=False)
+        first = await prefetcher.get()
+        second = await prefetcher.get()
+        returned = await prefetcher.close()
+
+        assert (first["url_hash"], second["url_hash"]) == ("h0", "h1")
+        assert frontier.lease_urls.call_args_list[0].args == ("q", 4, None)
+        assert returned == 2
+        assert [c.args for c in frontier.nack.call_args_list] == [("q", "h2"), ("q", "h3")]
+
+    @pytest.mark.asyncio
+    async def test_prefetcher_waits_for_ready_host(self):
+        """With ready_only, get() sleeps until a host leaves its crawl delay."""
+        from crawler.queue.url_frontier import FrontierPrefetcher
+
+        frontier = MagicMock()
+        batches = [[], [{"url": "https://a.com/1", "url_hash": "h1"}]]
+        frontier.lease_ready_urls.side_effect = lambda *args: batches.pop(0) if batches else []
+        frontier.seconds_until_ready.side_effect = [0.01, None]
+
+        prefetcher = FrontierPrefetcher(frontier, "q", batch_size=2)
+        entry = await prefetcher.get()
+
+        assert entry["url_hash"] == "h1"
+        assert await prefetcher.get() is None
@@ -0,0 +1,121 @@
+"""
+Tests for brotli/zstd transfer decoding in Tier1HttpxFetcher.
+
+Responses are served through httpx.MockTransport so the real httpx decoders
+run on the compressed bodies.
+"""
+
+import gzip
+
+import brotli
+import httpx
+import pytest
+import zstandard
+
+PAGE = "<html><body>" + "<p>Single malt, 18 years</p>" * 200 + "</body></html>"
+
+
+def _fetcher(body: bytes, headers: dict):
+    """Tier 1 fetcher whose client answers every request with the given body."""
+    from crawler.fetchers.tier1_httpx import Tier1HttpxFetcher
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, headers=headers, content=body)
+
+    fetcher = Tier1HttpxFetcher(timeout=5, max_retries=1)
+    fetcher._http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        headers=fetcher.DEFAULT_HEADERS,
+    )
+    return fetcher, requests
+
+
+class TestAcceptEncoding:
+    """Tests for the advertised encodings."""
+
+    def test_offers_zstd_and_brotli_when_decodable(self):
+        """zstd and br are offered first when httpx has their decoders."""
+        from crawler.fetchers.tier1_httpx import supported_content_encodings
+
+        assert supported_content_encodings() == "zstd, br, gzip, deflate"
+
+    def test_omits_encodings_without_decoder(self, monkeypatch):
+        """Encodings httpx cannot decode are never offered."""
+        from httpx import _decoders
+
+        from crawler.fetchers.tier1_httpx import supported_content_encodings
+
+        decoders = dict(_decoders.SUPPORTED_DECODERS)
+        decoders.pop("br")
+        decoders.pop("zstd")
+        monkeypatch.setattr(_decoders, "SUPPORTED_DECODERS", decoders)
+
+        assert supported_content_encodings() == "gzip, deflate"
+
+
+class TestTransferDecoding:
+    """Tests for decoding compressed bodies."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding,compress", [
+        ("br", brotli.compress),
+        ("zstd", zstandard.ZstdCompressor().compress),
+        ("gzip", gzip.compress),
+    ])
+    async def test_decodes_compressed_body(self, encoding, compress):
+        """Compressed bodies are decoded to the original HTML."""
+        body = compress(PAGE.encode())
+        fetcher, requests = _fetcher(body, {
+            "content-type": "text/html; charset=utf-8",
+            "content-encoding": encoding,
+        })
+
+        result = await fetcher.fetch("https://shop.com/whisky")
+
+        assert result.success is True
+        assert result.content == PAGE
+        assert len(body) < len(PAGE)
+        assert encoding in requests[0].headers["accept-encoding"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unannounced_compressed_body(self):
+        """A compressed body without Content-Encoding fails instead of passing garbage."""
+        fetcher, _ = _fetcher(brotli.compress(PAGE.encode()) + b"\x00", {
+            "content-type": "text/html",
+        })
+
+        result = await fetcher.fetch("https://shop.com/whisky")
+
+        assert result.success is False
+        assert result.content == ""
+        assert result.error.startswith("Undecoded binary body")
+
+    @pytest.mark.asyncio
+    async def test_rejects_unsupported_content_encoding(self, monkeypatch):
+        """A body in an encoding httpx cannot decode is rejected."""
+        from httpx import _decoders
+
+        decoders = dict(_decoders.SUPPORTED_DECODERS)
+        decoders.pop("br")
+        monkeypatch.setattr(_decoders, "SUPPORTED_DECODERS", decoders)
+        fetcher, _ = _fetcher(brotli.compress(PAGE.encode()), {
+            "content-type": "text/html",
+            "content-encoding": "br",
+        })
+
+        result = await fetcher.fetch("https://shop.com/whisky")
+
+        assert result.success is False
+        assert result.error == "Undecoded body (unsupported content-encoding: br)"
+
+    @pytest.mark.asyncio
+    async def test_allows_binary_non_text_content(self):
+        """Non-text content types are not sniffed for binary data."""
+        fetcher, _ = _fetcher(b"%PDF-1.4\x00\x01\x02", {"content-type": "application/pdf"})
+
+        result = await fetcher.fetch("https://shop.com/brochure.pdf")
+
+        assert result.success is True
@@ -0,0 +1,211 @@
+"""
+Tests for learned per-domain HTTP/2 in Tier 1.
+
+Tests cover:
+1. Tier1HttpxFetcher HTTP/2 attempts and HTTP/1.1 fallback
+2. FeedbackRecorder learning HTTP/2 compatibility
+3. SmartRouter choosing the protocol from the domain profile
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+PAGE = "<html><body>" + "<p>Product details</p>" * 100 + "</body></html>"
+
+
+def _response(status=200, http_version=b"HTTP/2"):
+    return httpx.Response(
+        status,
+        text=PAGE,
+        request=httpx.Request("GET", "https://shop.com/p"),
+        extensions={"http_version": http_version},
+    )
+
+
+def _fetcher(h2_result, h1_result=None):
+    """Tier 1 fetcher with mocked HTTP/1.1 and HTTP/2 clients."""
+    from crawler.fetchers.tier1_httpx import Tier1HttpxFetcher
+
+    fetcher = Tier1HttpxFetcher(timeout=5, max_retries=1)
+    fetcher._http2_client = MagicMock()
+    if isinstance(h2_result, Exception):
+        fetcher._http2_client.get = AsyncMock(side_effect=h2_result)
+    else:
+        fetcher._http2_client.get = AsyncMock(return_value=h2_result)
+    fetcher._http_client = MagicMock()
+    fetcher._http_client.get = AsyncMock(
+        return_value=h1_result or _response(http_version=b"HTTP/1.1")
+    )
+    return fetcher
+
+
+class TestTier1Http2:
+    """Tests for HTTP/2 attempts in Tier1HttpxFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_http2_success(self):
+        """A response multiplexed over HTTP/2 never touches the HTTP/1.1 client."""
+        fetcher = _fetcher(_response())
+
+        result = await fetcher.fetch("https://shop.com/p", http2=True)
+
+        assert result.success is True
+        assert result.http2_outcome == "ok"
+        fetcher._http_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_server_without_http2(self):
+        """A server negotiating HTTP/1.1 is reported as unsupported."""
+        fetcher = _fetcher(_response(http_version=b"HTTP/1.1"))
+
+        result = await fetcher.fetch("https://shop.com/p", http2=True)
+
+        assert result.success is True
+        assert result.http2_outcome == "unsupported"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("h2_result", [
+        httpx.RemoteProtocolError("GOAWAY received"),
+        _response(status=421),
+        _response(status=505),
+    ])
+    async def test_falls_back_to_http1(self, h2_result):
+        """Protocol errors and H2-specific statuses retry on HTTP/1.1."""
+        fetcher = _fetcher(h2_result)
+
+        result = await fetcher.fetch("https://shop.com/p", http2=True)
+
+        assert result.success is True
+        assert result.content == PAGE
+        assert result.http2_outcome == "fallback"
+        fetcher._http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_on_both_protocols_is_inconclusive(self):
+        """If HTTP/1.1 fails too, nothing is learned about HTTP/2."""
+        fetcher = _fetcher(_response(status=421), _response(status=404, http_version=b"HTTP/1.1"))
+
+        result = await fetcher.fetch("https://shop.com/p", http2=True)
+
+        assert result.success is False
+        assert result.http2_outcome is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [403, 404, 410, 429, 503])
+    async def test_application_errors_are_not_resent(self, status):
+        """Ordinary error statuses over HTTP/2 come back without an HTTP/1.1 retry."""
+        fetcher = _fetcher(_response(status=status))
+
+        result = await fetcher.fetch("https://shop.com/p", http2=True)
+
+        assert result.success is False
+        assert result.status_code == status
+        assert result.http2_outcome == "ok"
+        fetcher._http_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_http1_by_default(self):
+        """Without http2=True only the HTTP/1.1 client is used."""
+        fetcher = _fetcher(_response())
+
+        result = await fetcher.fetch("https://shop.com/p")
+
+        assert result.http2_outcome is None
+        fetcher._http2_client.get.assert_not_called()
+
+
+class TestHttp2Learning:
+    """Tests for FeedbackRecorder.record_http2_result."""
+
+    def test_probe_outcomes(self):
+        """A probe marks the domain compatible or incompatible."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        ok = FeedbackRecorder.record_http2_result(DomainProfile(domain="a.com"), "ok")
+        unsupported = FeedbackRecorder.record_http2_result(
+            DomainProfile(domain="b.com"), "unsupported"
+        )
+        failed_probe = FeedbackRecorder.record_http2_result(
+            DomainProfile(domain="c.com"), "fallback"
+        )
+
+        assert ok.http2_compatible is True
+        assert unsupported.http2_compatible is False
+        assert failed_probe.http2_compatible is False
+
+    def test_compatible_domain_downgraded_after_consecutive_fallbacks(self):
+        """Isolated fallbacks are tolerated; consecutive ones downgrade the domain."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.feedback_recorder import FeedbackRecorder
+
+        profile = DomainProfile(domain="a.com", http2_compatible=True)
+
+        FeedbackRecorder.record_http2_result(profile, "fallback")
+        FeedbackRecorder.record_http2_result(profile, "ok")
+        FeedbackRecorder.record_http2_result(profile, "fallback")
+        assert profile.http2_compatible is True
+
+        FeedbackRecorder.record_http2_result(profile, "fallback")
+        assert profile.http2_compatible is False
+
+    def test_profile_round_trip(self):
+        """HTTP/2 fields survive JSON serialization."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+
+        profile = DomainProfile(domain="a.com", http2_compatible=False, http2_fallback_count=2)
+
+        restored = DomainProfile.from_json(profile.to_json())
+
+        assert restored.http2_compatible is False
+        assert restored.http2_fallback_count == 2
+
+
+class TestRouterHttp2:
+    """Tests for SmartRouter protocol selection."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compatible,expected", [(None, True), (True, True), (False, False)])
+    async def test_protocol_follows_profile(self, compatible, expected):
+        """Unknown and compatible domains use HTTP/2; incompatible ones do not."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.smart_router import SmartRouter
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        router = SmartRouter(timeout=30)
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=FetchResponse(
+            content=PAGE, status_code=200, headers={}, success=True,
+            http2_outcome="ok" if expected else None,
+        ))
+        router._tier1_fetcher = tier1
+        profile = DomainProfile(domain="shop.com", http2_compatible=compatible)
+
+        result = await router.fetch("https://shop.com/p", profile=profile)
+
+        assert result.success is True
+        assert tier1.fetch.call_args.kwargs["http2"] is expected
+        assert profile.http2_compatible is (True if expected else False)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, settings):
+        """CRAWLER_TIER1_HTTP2_ENABLED=False keeps every domain on HTTP/1.1."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.smart_router import SmartRouter
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        settings.CRAWLER_TIER1_HTTP2_ENABLED = False
+        router = SmartRouter(timeout=30)
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=FetchResponse(
+            content=PAGE, status_code=200, headers={}, success=True,
+        ))
+        router._tier1_fetcher = tier1
+        profile = DomainProfile(domain="shop.com")
+
+        await router.fetch("https://shop.com/p", profile=profile)
+
+        assert tier1.fetch.call_args.kwargs["http2"] is False
+        assert profile.http2_compatible is None
@@ -0,0 +1,187 @@
+"""
+Tests for streamed Tier 1 reads with a body size cap and early abort.
+
+Bodies are served chunk by chunk through httpx.MockTransport so the tests
+can see how much of a response was actually read.
+"""
+
+import gzip
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+CHUNK = b"<p>" + b"Single malt, sherry cask. " * 40 + b"</p>"
+
+
+def _fetcher(chunks, headers=None, status=200):
+    """Tier 1 fetcher serving a streamed body; returns (fetcher, chunks_sent)."""
+    from crawler.fetchers.tier1_httpx import Tier1HttpxFetcher
+
+    sent = []
+
+    async def body():
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(
+            status,
+            headers=headers or {"content-type": "text/html; charset=utf-8"},
+            content=body(),
+        )
+
+    fetcher = Tier1HttpxFetcher(timeout=5, max_retries=1)
+    fetcher._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher, sent
+
+
+class TestStreamedReads:
+    """Tests for Tier1HttpxFetcher.fetch(max_bytes=...)."""
+
+    @pytest.mark.asyncio
+    async def test_small_page_is_read_in_full(self):
+        """A page under the cap is returned complete."""
+        chunks = [b"<html><body>", CHUNK * 3, b"</body></html>"]
+        fetcher, _ = _fetcher(chunks)
+
+        result = await fetcher.fetch("https://shop.com/p", max_bytes=1024 * 1024)
+
+        assert result.success is True
+        assert result.content == b"".join(chunks).decode()
+        assert result.truncated is False
+
+    @pytest.mark.asyncio
+    async def test_body_is_capped(self):
+        """Reading stops at the cap and the result is flagged truncated."""
+        fetcher, sent = _fetcher([b"<html><body>"] + [CHUNK] * 1000)
+
+        result = await fetcher.fetch("https://shop.com/category", max_bytes=20000)
+
+        assert result.success is True
+        assert result.truncated is True
+        assert len(result.content) == 20000
+        assert len(sent) < 30
+
+    @pytest.mark.asyncio
+    async def test_cap_applies_to_decoded_body(self):
+        """The cap counts decompressed bytes, not bytes on the wire."""
+        page = b"<html><body>" + CHUNK * 500 + b"</body></html>"
+        fetcher, _ = _fetcher(
+            [gzip.compress(page)],
+            headers={"content-type": "text/html", "content-encoding": "gzip"},
+        )
+
+        result = await fetcher.fetch("https://shop.com/category", max_bytes=50000)
+
+        assert result.truncated is True
+        assert result.content == page[:50000].decode()
+
+    @pytest.mark.asyncio
+    async def test_non_html_is_not_read(self):
+        """A binary download is abandoned before its body is read."""
+        fetcher, sent = _fetcher(
+            [b"%PDF-1.7"] + [b"\x00" * 4096] * 100,
+            headers={"content-type": "application/pdf"},
+        )
+
+        result = await fetcher.fetch("https://shop.com/brochure", max_bytes=1024 * 1024)
+
+        assert result.success is False
+        assert result.aborted == "not_html"
+        assert result.error == "Non-HTML content type: application/pdf"
+        assert len(sent) <= 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("marker,reason", [
+        (b'<div class="g-recaptcha"></div>', "challenge"),
+        (b"<h2>Please verify your age</h2>", "age_gate"),
+    ])
+    async def test_early_abort_on_markers(self, marker, reason):
+        """CAPTCHA and age gate markers in the first chunks abort the read."""
+        fetcher, sent = _fetcher([b"<html><body>" + marker] + [CHUNK] * 1000)
+
+        result = await fetcher.fetch("https://shop.com/p", max_bytes=10 * 1024 * 1024)
+
+        assert result.success is False
+        assert result.aborted == reason
+        assert len(sent) < 100
+
+    @pytest.mark.asyncio
+    async def test_markers_after_prefix_are_left_to_router(self):
+        """Markers beyond the checked prefix do not abort the read."""
+        fetcher, _ = _fetcher([b"<html><body>"] + [CHUNK] * 40 + [b'<div class="g-recaptcha">'])
+
+        result = await fetcher.fetch("https://shop.com/p", max_bytes=10 * 1024 * 1024)
+
+        assert result.success is True
+        assert "g-recaptcha" in result.content
+
+
+class TestRouterStreaming:
+    """Tests for SmartRouter streaming settings and non-HTML handling."""
+
+    def _router(self, response):
+        from crawler.fetchers.smart_router import SmartRouter
+
+        router = SmartRouter(timeout=30)
+        tier1 = MagicMock()
+        tier1.fetch = AsyncMock(return_value=response)
+        router._tier1_fetcher = tier1
+        router._tier2_fetcher = MagicMock()
+        router._tier2_fetcher.fetch = AsyncMock()
+        return router, tier1
+
+    @pytest.mark.asyncio
+    async def test_domain_cap_overrides_default(self, settings):
+        """The profile's byte cap takes precedence over the setting."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        settings.CRAWLER_TIER1_MAX_BODY_BYTES = 1000
+        router, tier1 = self._router(FetchResponse(
+            content="<html>" + "x" * 5000 + "</html>", status_code=200, headers={}, success=True,
+        ))
+
+        await router.fetch("https://a.com/p", profile=DomainProfile(domain="a.com"))
+        await router.fetch(
+            "https://b.com/p",
+            profile=DomainProfile(domain="b.com", manual_override_max_body_bytes=20000),
+        )
+
+        caps = [call.kwargs["max_bytes"] for call in tier1.fetch.call_args_list]
+        assert caps == [1000, 20000]
+
+    @pytest.mark.asyncio
+    async def test_streaming_disabled(self, settings):
+        """With streaming disabled Tier 1 reads bodies in full."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        settings.CRAWLER_TIER1_STREAMING_ENABLED = False
+        router, tier1 = self._router(FetchResponse(
+            content="<html>" + "x" * 5000 + "</html>", status_code=200, headers={}, success=True,
+        ))
+
+        await router.fetch("https://a.com/p", profile=DomainProfile(domain="a.com"))
+
+        assert tier1.fetch.call_args.kwargs["max_bytes"] is None
+
+    @pytest.mark.asyncio
+    async def test_non_html_does_not_escalate(self):
+        """A non-HTML response fails without trying higher tiers."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.tier1_httpx import FetchResponse
+
+        router, _ = self._router(FetchResponse(
+            content="", status_code=200, headers={"content-type": "application/pdf"},
+            success=False, error="Non-HTML content type: application/pdf", aborted="not_html",
+        ))
+
+        result = await router.fetch("https://a.com/file.pdf", profile=DomainProfile(domain="a.com"))
+
+        assert result.success is False
+        assert result.tier_used == 1
+        assert result.error == "Non-HTML content type: application/pdf"
+        router._tier2_fetcher.fetch.assert_not_called()
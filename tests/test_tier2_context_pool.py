@@ -0,0 +1,168 @@
+"""
+Tests for warm Tier 2 browser contexts (BrowserContextPool).
+
+These tests use a fake Playwright browser to verify per-domain reuse, LRU
+eviction, max-uses recycling, overflow contexts and the Tier 2 fetcher's
+use of the pool.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _fake_browser():
+    """Fake Playwright browser whose contexts record close() calls."""
+    browser = MagicMock()
+    browser.contexts = []
+
+    async def new_context():
+        context = MagicMock()
+        context.add_cookies = AsyncMock()
+        context.route = AsyncMock()
+        context.close = AsyncMock()
+        context.cookies = AsyncMock(return_value=[])
+        page = MagicMock()
+        page.goto = AsyncMock(return_value=MagicMock(status=200, headers={}))
+        page.wait_for_load_state = AsyncMock()
+        page.content = AsyncMock(return_value="<html>rendered</html>")
+        context.new_page = AsyncMock(return_value=page)
+        browser.contexts.append(context)
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+class TestBrowserContextPool:
+    """Tests for BrowserContextPool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_context_for_same_domain(self):
+        """A released context is reused for its domain without setup."""
+        from crawler.fetchers.context_pool import BrowserContextPool
+
+        pool = BrowserContextPool(max_contexts=4, max_uses=10)
+        browser = _fake_browser()
+        setup = AsyncMock()
+
+        first = await pool.acquire(browser, "a.com", setup=setup)
+        await pool.release(first)
+        second = await pool.acquire(browser, "a.com", setup=setup)
+
+        assert second is first
+        assert browser.new_context.call_count == 1
+        setup.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_idle_context(self):
+        """A new domain at capacity evicts the LRU idle context."""
+        from crawler.fetchers.context_pool import BrowserContextPool
+
+        pool = BrowserContextPool(max_contexts=2, max_uses=10)
+        browser = _fake_browser()
+
+        a = await pool.acquire(browser, "a.com")
+        b = await pool.acquire(browser, "b.com")
+        await pool.release(a)
+        await pool.release(b)
+        await pool.acquire(browser, "c.com")
+
+        a.context.close.assert_called_once()
+        b.context.close.assert_not_called()
+        assert pool.size == 2
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_uses(self):
+        """A context is closed once it reaches max_uses."""
+        from crawler.fetchers.context_pool import BrowserContextPool
+
+        pool = BrowserContextPool(max_contexts=2, max_uses=2)
+        browser = _fake_browser()
+
+        entry = await pool.acquire(browser, "a.com")
+        await pool.release(entry)
+        entry = await pool.acquire(browser, "a.com")
+        await pool.release(entry)
+
+        entry.context.close.assert_called_once()
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_overflow_and_unhealthy_contexts_are_closed(self):
+        """Busy pools hand out transient contexts; failed ones are discarded."""
+        from crawler.fetchers.context_pool import BrowserContextPool
+
+        pool = BrowserContextPool(max_contexts=1, max_uses=10)
+        browser = _fake_browser()
+
+        busy = await pool.acquire(browser, "a.com")
+        overflow = await pool.acquire(browser, "a.com")
+        assert overflow.pooled is False
+        await pool.release(overflow)
+        overflow.context.close.assert_called_once()
+
+        await pool.release(busy, reusable=False)
+        busy.context.close.assert_called_once()
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_close_discards_idle_and_later_released_contexts(self):
+        """close() empties the pool; contexts busy at close are not re-pooled."""
+        from crawler.fetchers.context_pool import BrowserContextPool
+
+        pool = BrowserContextPool(max_contexts=4, max_uses=10)
+        browser = _fake_browser()
+
+        idle = await pool.acquire(browser, "a.com")
+        await pool.release(idle)
+        busy = await pool.acquire(browser, "b.com")
+        await pool.close()
+        await pool.release(busy)
+
+        idle.context.close.assert_called_once()
+        busy.context.close.assert_called_once()
+        assert pool.size == 0
+
+
+class TestTier2FetcherPooling:
+    """Tests for Tier2PlaywrightFetcher's use of the context pool."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_fetches_skip_context_setup(self):
+        """Fetches for one domain share a context primed once with cookies."""
+        from crawler.fetchers.tier2_playwright import Tier2PlaywrightFetcher
+
+        fetcher = Tier2PlaywrightFetcher(timeout=5)
+        fetcher._browser = _fake_browser()
+        fetcher._load_cookies_from_redis = AsyncMock(return_value=[{"name": "age", "value": "1"}])
+
+        for path in ("/p/1", "/p/2"):
+            result = await fetcher.fetch(
+                f"https://shop.com{path}", cookies={"gate": "ok"}, solve_age_gate=False
+            )
+            assert result.success is True
+
+        assert fetcher._browser.new_context.call_count == 1
+        context = fetcher._browser.contexts[0]
+        # Cached cookies once at creation, source cookies once while unchanged
+        assert context.add_cookies.call_count == 2
+        fetcher._load_cookies_from_redis.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_page_error_discards_context(self):
+        """A navigation error closes the context instead of pooling it."""
+        from crawler.fetchers.tier2_playwright import Tier2PlaywrightFetcher
+
+        fetcher = Tier2PlaywrightFetcher(timeout=5)
+        fetcher._browser = _fake_browser()
+
+        entry = await fetcher._context_pool.acquire(fetcher._browser, "shop.com")
+        entry.page.goto.side_effect = RuntimeError("Timeout 5000ms exceeded")
+        await fetcher._context_pool.release(entry)
+
+        result = await fetcher.fetch("https://shop.com/p/1", solve_age_gate=False)
+
+        assert result.success is False
+        entry.context.close.assert_called_once()
+        assert fetcher._context_pool.size == 0
@@ -0,0 +1,145 @@
+"""
+Tests for Tier 2 resource blocking (ResourceBlocker).
+
+Tests cover:
+1. Blocking decisions for resource types and tracker hosts
+2. Per-domain allowlists stored on DomainProfile
+3. Route handling and installation on Tier 2 browser contexts
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _route(resource_type, url):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+class TestResourceBlocker:
+    """Tests for ResourceBlocker.should_block()."""
+
+    def test_blocks_heavy_types_but_not_page_resources(self):
+        """Images, fonts and media are blocked; documents, scripts and CSS are not."""
+        from crawler.fetchers.resource_blocking import ResourceBlocker
+
+        blocker = ResourceBlocker()
+
+        assert blocker.should_block("image", "https://shop.com/a.jpg") is True
+        assert blocker.should_block("font", "https://shop.com/a.woff2") is True
+        assert blocker.should_block("media", "https://shop.com/a.mp4") is True
+        assert blocker.should_block("document", "https://shop.com/p/1") is False
+        assert blocker.should_block("script", "https://shop.com/app.js") is False
+        assert blocker.should_block("stylesheet", "https://shop.com/a.css") is False
+        assert blocker.should_block("xhr", "https://shop.com/api/price") is False
+
+    def test_blocks_tracker_hosts_and_subdomains(self):
+        """Known tracker hosts are blocked for any resource type."""
+        from crawler.fetchers.resource_blocking import ResourceBlocker
+
+        blocker = ResourceBlocker()
+
+        assert blocker.should_block("script", "https://www.googletagmanager.com/gtm.js") is True
+        assert blocker.should_block("xhr", "https://region1.google-analytics.com/g/collect") is True
+        assert blocker.should_block("script", "https://notgoogletagmanager.com/x.js") is False
+
+    def test_profile_allowlist_overrides_blocking(self):
+        """DomainProfile allowlists re-enable resource types and hosts."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+        from crawler.fetchers.resource_blocking import ResourceBlocker
+
+        profile = DomainProfile(
+            domain="shop.com",
+            tier2_allowed_resource_types=["image"],
+            tier2_allowed_hosts=["klaviyo.com"],
+        )
+        blocker = ResourceBlocker.for_profile(profile)
+
+        assert blocker.should_block("image", "https://shop.com/a.jpg") is False
+        assert blocker.should_block("font", "https://shop.com/a.woff2") is True
+        assert blocker.should_block("script", "https://static.klaviyo.com/onsite.js") is False
+
+    def test_allowlist_round_trips_through_profile_json(self):
+        """Allowlists persist with the rest of the domain profile."""
+        from crawler.fetchers.domain_intelligence import DomainProfile
+
+        profile = DomainProfile(domain="shop.com", tier2_allowed_resource_types=["font"])
+
+        restored = DomainProfile.from_json(profile.to_json())
+
+        assert restored.tier2_allowed_resource_types == ["font"]
+        assert restored.tier2_allowed_hosts == []
+
+    @pytest.mark.asyncio
+    async def test_handle_route_aborts_or_continues(self):
+        """The route handler aborts blocked requests and continues others."""
+        from crawler.fetchers.resource_blocking import ResourceBlocker
+
+        blocker = ResourceBlocker()
+        blocked = _route("image", "https://shop.com/a.jpg")
+        allowed = _route("document", "https://shop.com/p/1")
+
+        await blocker.handle_route(blocked)
+        await blocker.handle_route(allowed)
+
+        blocked.abort.assert_called_once()
+        blocked.continue_.assert_not_called()
+        allowed.continue_.assert_called_once()
+
+
+class TestTier2FetcherBlocking:
+    """Tests for resource blocking in Tier2PlaywrightFetcher."""
+
+    def _fetcher(self, block_resources):
+        from crawler.fetchers.tier2_playwright import Tier2PlaywrightFetcher
+
+        fetcher = Tier2PlaywrightFetcher(timeout=5)
+        fetcher.block_resources = block_resources
+        context = MagicMock()
+        context.route = AsyncMock()
+        context.add_cookies = AsyncMock()
+        context.cookies = AsyncMock(return_value=[])
+        context.close = AsyncMock()
+        page = MagicMock()
+        page.goto = AsyncMock(return_value=MagicMock(status=200, headers={}))
+        page.wait_for_load_state = AsyncMock()
+        page.content = AsyncMock(return_value="<html>rendered</html>")
+        context.new_page = AsyncMock(return_value=page)
+        fetcher._browser = MagicMock()
+        fetcher._browser.new_context = AsyncMock(return_value=context)
+        return fetcher, context
+
+    @pytest.mark.asyncio
+    async def test_context_routes_through_current_domain_blocker(self):
+        """New contexts install a route that applies the latest blocker for the domain."""
+        from crawler.fetchers.resource_blocking import ResourceBlocker
+
+        fetcher, context = self._fetcher(block_resources=True)
+
+        await fetcher.fetch("https://shop.com/p/1", solve_age_gate=False)
+        await fetcher.fetch(
+            "https://shop.com/p/2",
+            solve_age_gate=False,
+            resource_blocker=ResourceBlocker(allowed_resource_types=["image"]),
+        )
+
+        context.route.assert_called_once()
+        handler = context.route.call_args.args[1]
+        image = _route("image", "https://shop.com/a.jpg")
+        await handler(image)
+        image.continue_.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_blocking_disabled_installs_no_route(self):
+        """With CRAWLER_TIER2_BLOCK_RESOURCES off, no requests are intercepted."""
+        fetcher, context = self._fetcher(block_resources=False)
+
+        result = await fetcher.fetch("https://shop.com/p/1", solve_age_gate=False)
+
+        assert result.success is True
+        context.route.assert_not_called()
@@ -0,0 +1,188 @@
+"""
+Behavioural tests for URLFrontier against its storage backends.
+
+Every test runs against the in-process InMemoryRedis backend, and also
+against a real Redis server (db 3) when one is reachable on localhost, so
+both backends are held to the same priority, politeness, dedup and lease
+semantics.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import patch
+
+
+def _redis_available() -> bool:
+    try:
+        import redis
+
+        client = redis.Redis(host="localhost", port=6379, db=3)
+        client.ping()
+        client.close()
+        return True
+    except Exception:
+        return False
+
+
+BACKENDS = ["memory"]
+if _redis_available():
+    BACKENDS.append("redis")
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Yield a clean backend client for each parametrized store."""
+    if request.param == "memory":
+        from crawler.queue.memory_backend import InMemoryRedis
+
+        yield InMemoryRedis()
+        return
+
+    import redis
+
+    client = redis.Redis(host="localhost", port=6379, db=3, decode_responses=True)
+    client.flushdb()
+    yield client
+    client.flushdb()
+    client.close()
+
+
+@pytest.fixture
+def frontier(backend):
+    """URLFrontier with no crawl delay and database checks disabled."""
+    from crawler.queue.url_frontier import URLFrontier
+
+    frontier = URLFrontier(redis_client=backend, crawl_delay=0, lease_ttl=60)
+    with patch.object(frontier, "_find_known_urls", return_value=set()), \
+         patch.object(frontier, "_check_crawled_source", return_value=False), \
+         patch.object(frontier, "_check_discovered_product", return_value=False):
+        yield frontier
+
+
+class TestFrontierBackendSemantics:
+    """Tests shared by all frontier backends."""
+
+    def test_priority_order(self, frontier):
+        """Higher priority URLs are dequeued first."""
+        frontier.add_url("q", "https://a.com/low", priority=1)
+        frontier.add_url("q", "https://a.com/high", priority=10)
+        frontier.add_url("q", "https://a.com/mid", priority=5)
+
+        urls = [frontier.get_next_url("q")["url"] for _ in range(3)]
+
+        assert urls == ["https://a.com/high", "https://a.com/mid", "https://a.com/low"]
+        assert frontier.get_next_url("q") is None
+
+    def test_dedup_per_queue_and_global(self, frontier):
+        """A URL is accepted once per queue and once globally."""
+        assert frontier.add_url("q1", "https://a.com/p") is True
+        assert frontier.add_url("q1", "https://A.com/p/") is False
+        assert frontier.add_url("q2", "https://a.com/p") is False
+        assert frontier.is_url_seen("q2", "https://a.com/p") is True
+        assert frontier.get_seen_count("q1") == 1
+        assert frontier.get_global_seen_count() == 1
+
+    def test_batch_add_results(self, frontier):
+        """Batch add reports per-URL results including in-batch duplicates."""
+        results = frontier.add_url_batch(
+            "q", ["https://a.com/1", "https://b.com/1", "https://a.com/1"]
+        )
+
+        assert results == [True, True, False]
+        assert frontier.get_queue_size("q") == 2
+        assert [e["url"] for e in frontier.get_next_urls("q", 5)] == [
+            "https://a.com/1", "https://b.com/1",
+        ]
+        assert frontier.get_queue_size("q") == 0
+
+    def test_ready_url_respects_crawl_delay(self, frontier):
+        """A host is not served again until its crawl delay has passed."""
+        frontier.crawl_delay = 0.2
+        frontier.add_urls("q", ["https://a.com/1", "https://a.com/2", "https://b.com/1"])
+
+        first = frontier.get_next_ready_url("q")
+        second = frontier.get_next_ready_url("q")
+
+        assert {first["url"], second["url"]} == {"https://a.com/1", "https://b.com/1"}
+        assert frontier.get_next_ready_url("q") is None
+        assert 0 < frontier.seconds_until_ready("q") <= 0.2
+
+        time.sleep(0.25)
+        assert frontier.get_next_ready_url("q")["url"] == "https://a.com/2"
+        assert frontier.get_queue_size("q") == 0
+
+    def test_lease_ack_and_reap(self, frontier):
+        """Unacked leases return to the queue once expired."""
+        frontier.add_urls("q", ["https://a.com/1", "https://a.com/2"])
+
+        leased = frontier.lease_urls("q", 2, ttl=0)
+        assert frontier.get_queue_size("q") == 0
+        assert frontier.get_leased_count("q") == 2
+
+        assert frontier.ack("q", leased[0]["url_hash"]) is True
+        assert frontier.reap_all_expired_leases() == 1
+        assert frontier.get_leased_count("q") == 0
+        assert frontier.get_next_url("q")["url"] == leased[1]["url"]
+
+    def test_readmit_skips_queued_urls(self, frontier):
+        """Re-admitting a URL that is still queued does not enqueue it again."""
+        assert frontier.readmit_urls("q", ["https://a.com/1"]) == 1
+        assert frontier.readmit_urls("q", ["https://a.com/1", "https://a.com/2"]) == 1
+
+        assert frontier.get_queue_size("q") == 2
+        assert frontier.get_next_url("q") is not None
+        assert frontier.get_next_url("q") is not None
+        assert frontier.get_next_url("q") is None
+
+    def test_clear_queue_removes_all_structures(self, frontier, backend):
+        """clear_queue drops main, host, ready and lease keys."""
+        frontier.add_urls("q", ["https://a.com/1", "https://b.com/1"])
+        frontier.lease_urls("q", 1)
+
+        frontier.clear_queue("q")
+
+        assert backend.keys("crawler:frontier:q*") == []
+
+    def test_domain_cookies_round_trip(self, frontier):
+        """Cookies are cached per domain."""
+        frontier.set_domain_cookies("a.com", {"age_verified": "true"})
+        assert frontier.get_domain_cookies("a.com") == {"age_verified": "true"}
+
+        frontier.delete_domain_cookies("a.com")
+        assert frontier.get_domain_cookies("a.com") is None
+
+    def test_prefetcher_drains_queue(self, frontier):
+        """The async prefetcher yields every queued URL exactly once."""
+        from crawler.queue.url_frontier import FrontierPrefetcher
+
+        urls = [f"https://h{i % 3}.com/{i}" for i in range(9)]
+        frontier.add_urls("q", urls)
+
+        async def drain():
+            prefetcher = FrontierPrefetcher(frontier, "q", batch_size=4)
+            seen = []
+            async for entry in prefetcher:
+                seen.append(entry["url"])
+                frontier.ack("q", entry["url_hash"])
+            await prefetcher.close()
+            return seen
+
+        assert sorted(asyncio.run(drain())) == sorted(urls)
+        assert frontier.get_leased_count("q") == 0
+
+
+class TestMemoryBackendSelection:
+    """Tests for selecting the in-memory backend by setting."""
+
+    def test_memory_backend_selected_by_setting(self, settings):
+        """CRAWLER_FRONTIER_BACKEND=memory uses the shared in-process store."""
+        from crawler.queue.memory_backend import InMemoryRedis, get_memory_backend
+        from crawler.queue.url_frontier import URLFrontier
+
+        settings.CRAWLER_FRONTIER_BACKEND = "memory"
+        frontier = URLFrontier()
+
+        assert isinstance(frontier._redis, InMemoryRedis)
+        assert frontier._redis is get_memory_backend()